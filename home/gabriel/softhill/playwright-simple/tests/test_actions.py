@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for typed step actions.
+"""
+
+import uuid
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from playwright_simple.core.recorder.actions import (
+    ClickAction,
+    TypeAction,
+    SubmitAction,
+    WaitAction,
+    action_from_step,
+)
+from playwright_simple.core.recorder.command_server import CommandServer
+
+
+def test_action_from_step_keeps_quotes():
+    """YAML values reach the action untouched (no string round trip)."""
+    click = action_from_step({'action': 'click', 'text': 'Diga "oi"', 'description': 'ignored'})
+    assert click == ClickAction(text='Diga "oi"')
+
+    type_action = action_from_step({'action': 'type', 'text': "d'Ávila", 'field_text': 'Nome'})
+    assert type_action == TypeAction(text="d'Ávila", into='Nome')
+    assert type_action.field == 'Nome'
+
+    assert action_from_step({'action': 'submit', 'text': 'Entrar'}) == SubmitAction(button_text='Entrar')
+    assert action_from_step({'action': 'wait', 'seconds': 2}) == WaitAction(seconds=2)
+    assert action_from_step({'action': 'unknown'}) is None
+
+
+def test_action_coerce_parses_cli_strings():
+    """CLI strings are still accepted at the boundary."""
+    assert ClickAction.coerce('selector "#save"') == ClickAction(selector='#save')
+    assert ClickAction.coerce('role button [2]') == ClickAction(role='button', index=2)
+    assert TypeAction.coerce('"admin" into "E-mail"') == TypeAction(text='admin', into='E-mail')
+    assert SubmitAction.coerce('') == SubmitAction()
+    action = ClickAction(text='Entrar')
+    assert ClickAction.coerce(action) is action
+
+
+@pytest.mark.asyncio
+async def test_command_server_accepts_structured_args():
+    """Structured args go straight to the cursor controller."""
+    recorder = MagicMock()
+    recorder.cursor_controller.is_active = True
+    recorder.cursor_controller.type_text = AsyncMock(return_value=True)
+    server = CommandServer(recorder, session_id=f"test_{uuid.uuid4().hex[:8]}")
+    server._get_page = MagicMock(return_value=MagicMock())
+
+    response = await server._handle_type({'text': 'a "quoted" value', 'selector': '#name'})
+
+    assert response == {'success': True}
+    recorder.cursor_controller.type_text.assert_awaited_once_with('a "quoted" value', '#name', mode=None)
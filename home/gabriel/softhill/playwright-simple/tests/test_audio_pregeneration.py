@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for background narration pre-generation.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from playwright_simple.core.tts.pre_generation import pre_generate_audios, start_pre_generation
+from playwright_simple.core.tts.scheduler import SynthesisScheduler
+
+
+STEPS = [
+    {'action': 'go_to', 'audio': 'Abrindo a página'},
+    {'action': 'click', 'text': 'Entrar'},  # continues the first clip
+    {'action': 'type', 'audio': 'Digitando o usuário'},
+    {'action': 'wait', 'audio': ''},
+    {'action': 'click', 'audio': 'Confirmando'},
+]
+
+
+def _slow_synthesis(release: asyncio.Event):
+    """Fake engine: the first clip is immediate, the others wait for `release`."""
+    async def generate(text, output_path):
+        if text != 'Abrindo a página':
+            await release.wait()
+        output_path.write_bytes(b'mp3')
+        return True
+    return generate
+
+
+@pytest.mark.asyncio
+async def test_first_clip_ready_while_later_clips_synthesize(tmp_path):
+    """A step waits only for its own group; the others keep synthesizing."""
+    release = asyncio.Event()
+    with patch('playwright_simple.core.tts.pre_generation.get_audio_duration', return_value=1.5):
+        pending = start_pre_generation(STEPS, tmp_path, 'demo', _slow_synthesis(release),
+                                       scheduler=SynthesisScheduler(concurrency=2))
+
+        first = await asyncio.wait_for(pending.clip(1), timeout=1)
+        assert first == (tmp_path / 'demo_tts_pregen' / 'group_1.mp3', 1.5)
+        assert await pending.clip(2) == first  # same narration group
+        assert not pending.is_ready(3)
+        assert not pending.has_audio(4) and await pending.clip(4) is None
+
+        release.set()
+        result = await pending.result()
+
+    assert set(result['audio_data']) == {1, 2, 3, 5}
+    assert result['adjusted_timestamps'][3] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_cancel_drops_clips_not_generated(tmp_path):
+    """Cancelling (test stopped early) leaves unfinished clips as missing audio."""
+    release = asyncio.Event()
+    with patch('playwright_simple.core.tts.pre_generation.get_audio_duration', return_value=1.0):
+        pending = start_pre_generation(STEPS, tmp_path, 'demo', _slow_synthesis(release))
+        await pending.clip(1)
+        pending.cancel()
+        assert await pending.clip(5) is None
+        assert set((await pending.result())['audio_data']) == {1, 2}
+
+
+@pytest.mark.asyncio
+async def test_clips_use_the_engine_suffix(tmp_path):
+    """Engines writing WAV natively (pyttsx3) get .wav clips, with no MP3 conversion."""
+    release = asyncio.Event()
+    release.set()
+    with patch('playwright_simple.core.tts.pre_generation.get_audio_duration', return_value=1.0):
+        pending = start_pre_generation(STEPS, tmp_path, 'demo', _slow_synthesis(release), suffix='.wav')
+        assert await pending.clip(3) == (tmp_path / 'demo_tts_pregen' / 'group_2.wav', 1.0)
+        await pending.result()
+
+
+@pytest.mark.asyncio
+async def test_pre_generate_audios_still_waits_for_everything(tmp_path):
+    """The blocking API returns the full timeline, as before."""
+    release = asyncio.Event()
+    release.set()
+    with patch('playwright_simple.core.tts.pre_generation.get_audio_duration', return_value=3.0):
+        result = await pre_generate_audios(STEPS, tmp_path, 'demo', _slow_synthesis(release))
+
+    assert set(result['audio_data']) == {1, 2, 3, 5}
+    # Second clip was estimated at 2s but the first one lasts 3s
+    assert result['adjusted_timestamps'][3] == 3.0
+    assert result['audio_end_times'][5] == 9.0
+    assert await pre_generate_audios([], tmp_path, 'demo', _slow_synthesis(release)) == {
+        'audio_data': {}, 'adjusted_timestamps': {}, 'audio_end_times': {}
+    }
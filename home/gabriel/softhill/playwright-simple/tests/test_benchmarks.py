@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the offline benchmark harness (fixture app and baselines).
+"""
+
+import json
+import time
+from urllib.request import urlopen
+
+import pytest
+
+from playwright_simple.cli.parser import create_parser
+from playwright_simple.core.performance.benchmarks import (
+    BenchmarkResult,
+    FixtureServer,
+    compare_to_baseline,
+    format_results,
+    load_baseline,
+    save_baseline,
+)
+
+
+def test_fixture_server_serves_synthetic_pages():
+    """Pages are generated from query parameters; the slow endpoint honours its delay."""
+    with FixtureServer() as server:
+        dom = urlopen(server.url('/dom', nodes=250)).read().decode('utf-8')
+        assert dom.count("class='item'") == 249
+        assert "Target 249" in dom
+
+        form = urlopen(server.url('/form', fields=3)).read().decode('utf-8')
+        assert form.count('<label') == 3 and "Campo 2" in form
+        assert "/api/submit" in form
+
+        assert json.loads(urlopen(server.url('/api/submit', field_2='valor')).read())['ok']
+        assert server.submissions == [{'field_2': 'valor'}]
+
+        started = time.perf_counter()
+        data = json.loads(urlopen(server.url('/api/slow', delay=100)).read())
+        assert data['ok'] and time.perf_counter() - started >= 0.09
+
+        with pytest.raises(Exception):
+            urlopen(server.url('/missing'))
+
+
+def test_regressions_need_relative_and_absolute_slowdown(tmp_path):
+    """Noise below min_delta and metrics without a baseline are not regressions."""
+    path = save_baseline([
+        BenchmarkResult('finder.find_by_text', [0.100, 0.120, 0.110]),
+        BenchmarkResult('selectors.find_element.css', [0.002]),
+    ], tmp_path / 'baseline.json')
+    baseline = load_baseline(path)
+    assert baseline['finder.find_by_text']['median'] == 0.11
+
+    current = [
+        BenchmarkResult('finder.find_by_text', [0.20, 0.21, 0.19]),
+        BenchmarkResult('selectors.find_element.css', [0.004]),
+        BenchmarkResult('playback.yaml', [3.0]),
+    ]
+    regressions = compare_to_baseline(current, baseline, threshold=0.25)
+    assert [regression.name for regression in regressions] == ['finder.find_by_text']
+    assert "+82%" in str(regressions[0])
+    assert "+82%" in format_results(current, baseline)
+
+    # Updating keeps metrics of other suites
+    save_baseline([BenchmarkResult('playback.yaml', [2.5])], path)
+    assert set(load_baseline(path)) == {'finder.find_by_text', 'selectors.find_element.css', 'playback.yaml'}
+
+
+def test_benchmark_command_arguments():
+    """The benchmark subcommand defaults to the browser suite."""
+    args = create_parser().parse_args(['benchmark', '--only', 'finder', '--update-baseline'])
+    assert args.suite == 'browser'
+    assert args.only == ['finder'] and args.update_baseline and args.headless
+    assert args.threshold == 0.25
+
+
+def test_media_timeline_and_probe():
+    """The synthetic timeline covers the video; the probe reports all resource metrics."""
+    from playwright_simple.core.performance.benchmarks.media_suite import probe, synthetic_timeline
+
+    timeline = synthetic_timeline(duration=12.0, steps=6)
+    assert [step['start_time'] for step in timeline] == [0.0, 2.0, 4.0, 6.0, 8.0, 10.0]
+    assert timeline[-1]['end_time'] == 12.0
+    assert any(step['audio_duration'] > step['duration'] for step in timeline)
+
+    with probe() as stats:
+        sum(range(10000))
+    assert set(stats) == {'wall', 'cpu', 'peak_rss'}
+    assert stats['wall'] >= 0 and stats['cpu'] >= 0
+
+    args = create_parser().parse_args(['benchmark', 'media', '--resolution', '640x360', '--duration', '5'])
+    assert (args.suite, args.resolution, args.duration, args.steps) == ('media', '640x360', 5.0, 8)
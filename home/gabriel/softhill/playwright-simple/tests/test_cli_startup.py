@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for lazy package imports and CLI startup time.
+"""
+
+import importlib.util
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import playwright_simple
+from playwright_simple.core.performance.benchmarks.startup_suite import (
+    CLICK_HELP_TARGET,
+    STARTUP_BENCHMARKS,
+    imported_heavy_modules,
+    interpreter_overhead,
+)
+
+
+def _recorder_modules():
+    package_dir = Path(importlib.util.find_spec('playwright_simple.core.recorder').origin).parent
+    for path in sorted(package_dir.rglob('*.py')):
+        parts = path.relative_to(package_dir).with_suffix('').parts
+        if parts[-1] == '__init__':
+            parts = parts[:-1]
+        yield '.'.join(('playwright_simple.core.recorder',) + parts)
+
+
+def test_session_commands_do_not_import_playwright():
+    """`click --help` only needs the parser; the runner, recorder and Playwright stay unloaded."""
+    assert imported_heavy_modules(['click', '--help']) == []
+
+
+def test_click_help_stays_under_target():
+    """Startup cost added by `playwright-simple click --help` stays under the target."""
+    samples = interpreter_overhead(STARTUP_BENCHMARKS['click_help'], repeat=3)
+    assert statistics.median(samples) < CLICK_HELP_TARGET
+
+
+def test_lazy_attributes_resolve_public_names():
+    """Public names still resolve from the package and appear in dir()."""
+    assert 'TestRunner' in dir(playwright_simple)
+    assert playwright_simple.TestConfig().base_url
+    assert playwright_simple.core.runner.TestRunner is playwright_simple.TestRunner
+
+
+@pytest.mark.parametrize('module', list(_recorder_modules()))
+def test_recorder_submodule_imports_in_fresh_interpreter(module):
+    """Each core.recorder module imports first in a new process (lazy __init__ hides no cycle)."""
+    completed = subprocess.run(
+        [sys.executable, '-c', f'import {module}'], capture_output=True, text=True, timeout=60
+    )
+    missing = re.search(r"ModuleNotFoundError: No module named '([^'.]+)", completed.stderr)
+    if completed.returncode and missing and missing.group(1) != 'playwright_simple':
+        pytest.skip(f"optional dependency not installed: {missing.group(1)}")
+    assert completed.returncode == 0, completed.stderr
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the Unix socket transport of the recorder CommandServer.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from unittest.mock import MagicMock
+
+from playwright_simple.core.ipc_server import IPCServer, IPCClient
+from playwright_simple.core.recorder import command_server
+from playwright_simple.core.recorder.command_server import CommandServer, send_command
+
+
+@pytest.mark.asyncio
+async def test_ipc_concurrent_requests_on_single_connection(tmp_path):
+    """Slow and fast requests share one connection; responses match by id."""
+    async def handler(message):
+        await asyncio.sleep(message['delay'])
+        return {'success': True, 'echo': message['value']}
+
+    server = IPCServer(tmp_path / "test.sock", handler)
+    await server.start()
+    client = IPCClient(tmp_path / "test.sock")
+    try:
+        slow = asyncio.create_task(client.send_message({'delay': 0.3, 'value': 'slow'}))
+        fast = asyncio.create_task(client.send_message({'delay': 0.0, 'value': 'fast'}))
+
+        done, _ = await asyncio.wait({slow, fast}, return_when=asyncio.FIRST_COMPLETED)
+        assert fast in done
+        assert (await fast)['echo'] == 'fast'
+        assert (await slow)['echo'] == 'slow'
+    finally:
+        await client.close()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_ipc_sync_client_keeps_connection(tmp_path):
+    """The sync client reuses its socket between calls."""
+    async def handler(message):
+        return {'success': True, 'value': message['value']}
+
+    server = IPCServer(tmp_path / "test.sock", handler)
+    await server.start()
+    client = IPCClient(tmp_path / "test.sock")
+    loop = asyncio.get_running_loop()
+    try:
+        first = await loop.run_in_executor(None, client.send_message_sync, {'value': 1})
+        sock = client._sync_sock
+        second = await loop.run_in_executor(None, client.send_message_sync, {'value': 2})
+
+        assert first['value'] == 1
+        assert second['value'] == 2
+        assert sock is not None and client._sync_sock is sock
+    finally:
+        client.close_sync()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_closes_keep_alive_connections(tmp_path):
+    """stop() returns while a client is still connected and closes its connection."""
+    started = asyncio.Event()
+
+    async def handler(message):
+        started.set()
+        await asyncio.sleep(10)
+
+    server = IPCServer(tmp_path / "test.sock", handler)
+    await server.start()
+    client = IPCClient(tmp_path / "test.sock")
+    try:
+        request = asyncio.create_task(client.send_message({'value': 1}, timeout=10))
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+        await asyncio.wait_for(server.stop(), timeout=2)
+
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(request, timeout=2)
+        assert not server._client_tasks and not server._client_writers
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_send_command_uses_socket_transport():
+    """send_command talks to CommandServer over the socket, with request ids."""
+    recorder = MagicMock()
+    server = CommandServer(recorder, session_id=f"test_{uuid.uuid4().hex[:8]}")
+
+    async def handle_echo(args):
+        return {'args': args}
+
+    server.register_handler('echo', handle_echo)
+    await server.start()
+    try:
+        assert server.ipc_server is not None
+        assert server.socket_file.exists()
+
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            None, lambda: send_command('echo', 'hello', session_id=server.session_id)
+        )
+
+        assert response['success'] is True
+        assert response['result'] == {'args': 'hello'}
+        assert response['id']
+        # Command never went through the file protocol
+        assert not server.command_file.exists() or not server.command_file.read_text()
+    finally:
+        client = command_server._ipc_clients.pop(str(server.socket_file), None)
+        if client is not None:
+            client.close_sync()
+        await server.stop()
+
+    assert not server.socket_file.exists()
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_in_order_and_stops_on_error():
+    """Batch executes commands server-side in order and stops at the first failure."""
+    server = CommandServer(MagicMock(), session_id=f"test_{uuid.uuid4().hex[:8]}")
+    calls = []
+
+    async def handle_ok(args):
+        calls.append(('ok', args))
+        return {'success': True}
+
+    async def handle_fail(args):
+        calls.append(('fail', args))
+        return {'success': False, 'error': 'element not found'}
+
+    server.register_handler('ok', handle_ok)
+    server.register_handler('fail', handle_fail)
+
+    response = await server._process_command({
+        'command': 'batch',
+        'args': ['ok first', {'command': 'fail', 'args': 'second'}, 'ok third'],
+    })
+
+    assert response['success'] is True
+    batch = response['result']
+    assert batch['success'] is False
+    assert batch['failed_at'] == 1
+    assert batch['completed'] == 2
+    assert batch['total'] == 3
+    assert calls == [('ok', 'first'), ('fail', 'second')]
+
+
+@pytest.mark.asyncio
+async def test_batch_continue_on_error():
+    """stop_on_error=False runs every command and reports the first failure."""
+    server = CommandServer(MagicMock(), session_id=f"test_{uuid.uuid4().hex[:8]}")
+
+    async def handle_ok(args):
+        return {'success': True}
+
+    server.register_handler('ok', handle_ok)
+
+    response = await server._process_command({
+        'command': 'batch',
+        'args': {'commands': ['unknown', 'ok', {'command': 'batch'}], 'stop_on_error': False},
+    })
+
+    batch = response['result']
+    assert batch['completed'] == 3
+    assert batch['failed_at'] == 0
+    assert [r['success'] for r in batch['results']] == [False, True, False]
+
+
+def test_cli_batch_rejects_malformed_json(tmp_path, capsys):
+    """A malformed JSON batch file prints an error instead of a traceback."""
+    from types import SimpleNamespace
+    from playwright_simple.cli.command_handlers import _handle_batch
+
+    batch_file = tmp_path / "batch.json"
+    batch_file.write_text('[{"command": "click",', encoding='utf-8')
+
+    with pytest.raises(SystemExit) as exit_info:
+        _handle_batch(SimpleNamespace(file=str(batch_file), timeout=5.0, continue_on_error=False))
+
+    assert exit_info.value.code == 1
+    assert "JSON inválido" in capsys.readouterr().out
+
+
+def _sync_socket(chunks):
+    """Blocking socket stand-in: recv returns chunks in order (exceptions are raised)."""
+    sock = MagicMock()
+    replies = list(chunks)
+
+    def recv(size):
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    sock.recv.side_effect = recv
+    return sock
+
+
+def _sync_client(tmp_path, *sockets):
+    client = IPCClient(tmp_path / "test.sock")
+    client._sync_sock = sockets[0]  # idle connection kept from an earlier call
+    fresh = list(sockets[1:])
+
+    def connect(timeout):
+        if client._sync_sock is None:
+            client._sync_sock = fresh.pop(0)
+        return client._sync_sock
+
+    client._get_sync_socket = connect
+    return client
+
+
+def test_sync_send_retries_only_a_stale_idle_connection(tmp_path):
+    """EOF before any reply on a reused socket is resent; a failure after sending is not."""
+    import json
+
+    payload = json.dumps({'id': 'm1', 'success': True}).encode('utf-8')
+    stale, fresh = _sync_socket([b'']), _sync_socket([len(payload).to_bytes(4, 'big'), payload])
+    client = _sync_client(tmp_path, stale, fresh)
+    assert client.send_message_sync({'id': 'm1'}) == {'id': 'm1', 'success': True}
+    assert stale.sendall.call_count == 1 and fresh.sendall.call_count == 1
+
+    # The command reached the server: resending it could click or type twice
+    broken, spare = _sync_socket([b'\x00\x00', ConnectionResetError("reset")]), _sync_socket([])
+    client = _sync_client(tmp_path, broken, spare)
+    with pytest.raises(ConnectionError):
+        client.send_message_sync({'id': 'm2'})
+    spare.sendall.assert_not_called()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the post-production cursor overlay.
+"""
+
+import struct
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from playwright_simple.core.recorder.cursor_controller import CursorController
+from playwright_simple.core.recorder.video.cursor_overlay import (
+    CursorEvent,
+    CursorOverlay,
+    CursorTrack,
+    cursor_sprite,
+    position_expr,
+)
+
+
+class _Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_position_expr_glides_into_logged_time():
+    """Each move adds one eased term that ends at the time it was logged."""
+    moves = [
+        CursorEvent(0.0, 10, 20),
+        CursorEvent(2.0, 110, 20, duration=0.3),
+        CursorEvent(2.1, 50, 20),
+    ]
+    assert position_expr(moves, 'x') == "10+100*(1-pow(1-clip((t-1.7)/0.3,0,1),2))+-60*gte(t,2.1)"
+    assert position_expr(moves, 'y') == "20"
+    assert position_expr([], 'x') == "0"
+
+
+def test_filter_graph_and_sprite():
+    """Halo and ripple are only enabled around clicks; the cursor is drawn last."""
+    track = CursorTrack.from_dict({'start_time': 0.0, 'events': [
+        {'t': 0.0, 'x': 960, 'y': 540, 'kind': 'move'},
+        {'t': 1.0, 'x': 300, 'y': 200, 'kind': 'move', 'duration': 0.3},
+        {'t': 1.0, 'x': 300, 'y': 200, 'kind': 'click'},
+    ]})
+    graph = CursorOverlay(track).build_filter()
+
+    assert "enable='between(t,1,1.3)'" in graph
+    assert "enable='between(t,0.85,1.3)'" in graph
+    assert graph.endswith("[ripple][1:v]overlay=x='960+-660*(1-pow(1-clip((t-0.7)/0.3,0,1),2))'"
+                          ":y='540+-340*(1-pow(1-clip((t-0.7)/0.3,0,1),2))':eval=frame:shortest=1[v]")
+
+    png, width, height = cursor_sprite()
+    assert png.startswith(b'\x89PNG\r\n\x1a\n')
+    assert struct.unpack('>II', png[16:24]) == (width, height)
+
+
+@pytest.mark.asyncio
+async def test_controller_logs_track_without_touching_page():
+    """With a track, moves and clicks are logged instead of drawn in the page."""
+    clock = _Clock()
+    page = MagicMock()
+    page.evaluate = AsyncMock()
+    page.mouse.click = AsyncMock()
+    page.viewport_size = {'width': 1280, 'height': 720}
+    track = CursorTrack(start_time=clock.now, clock=clock)
+    controller = CursorController(page, visual=False, cursor_track=track)
+
+    await controller.start()
+    clock.now += 1.5
+    await controller.click(100, 200)
+
+    page.evaluate.assert_not_awaited()
+    assert [(e.kind, e.t, e.x, e.y) for e in track.events] == [
+        ('move', 0.0, 640, 360),
+        ('move', 1.5, 100, 200),
+        ('click', 1.5, 100, 200),
+    ]
+    assert track.moves[1].duration > 0
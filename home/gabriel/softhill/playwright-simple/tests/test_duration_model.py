@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the narration duration predictor.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from playwright_simple.core.tts.duration_model import (
+    MIN_SAMPLES,
+    DurationModel,
+    DurationPredictor,
+    heuristic_duration,
+    text_features,
+)
+from playwright_simple.core.tts.pre_generation import start_pre_generation
+
+
+TEXTS = [
+    "Abrindo a página inicial.",
+    "Clicando em entrar, depois em confirmar.",
+    "Digitando o nome do usuário no campo de login",
+    "Pronto! O pedido foi salvo; agora vamos conferir o relatório.",
+    "Selecionando o cliente",
+    "Preenchendo endereço, cidade, estado e CEP.",
+    "Salvando.",
+    "Agora vamos abrir o menu de configurações e alterar o idioma para inglês.",
+    "Conferindo o total: cento e vinte reais.",
+    "Fim da demonstração. Obrigado!",
+]
+
+
+def speech_seconds(text):
+    """Synthetic voice: 0.3s lead-in, 0.4s per word, 0.2s per comma, 0.5s per sentence end."""
+    words, _, short, long = text_features(text)
+    return 0.3 + 0.4 * words + 0.2 * short + 0.5 * long
+
+
+def test_text_features():
+    """Words, characters, short pauses and sentence ends are counted."""
+    assert text_features("  Olá, mundo! Tudo bem?  ") == (4, 21, 1, 2)
+
+
+def test_model_uses_heuristic_until_calibrated_then_fits():
+    """Predictions fall back to chars/sec until MIN_SAMPLES clips were observed."""
+    model = DurationModel('edge-tts|pt-BR-FranciscaNeural|')
+    text = "Clicando no botão de salvar e aguardando a confirmação."
+    assert model.predict(text) == heuristic_duration(text)
+
+    for sample in TEXTS[:MIN_SAMPLES]:
+        model.observe(sample, speech_seconds(sample))
+    assert model.calibrated
+    assert model.predict(text) == pytest.approx(speech_seconds(text), abs=0.15)
+    assert model.predict("") == 0.0
+
+
+def test_predictor_persists_probe_cache_and_reports_accuracy(tmp_path):
+    """Samples survive across processes per (engine, voice, rate); accuracy covers predicted clips."""
+    cache_path = tmp_path / 'durations.json'
+    predictor = DurationPredictor(cache_path)
+    model = predictor.model('edge-tts', 'pt-BR-FranciscaNeural', '+10%')
+    for text in TEXTS:
+        model.observe(text, speech_seconds(text), predicted=speech_seconds(text) + 0.5)
+    predictor.save()
+
+    report = predictor.format_accuracy()
+    assert "edge-tts|pt-BR-FranciscaNeural|+10%" in report and "0.50s" in report and "10 clipes" in report
+
+    reloaded = DurationPredictor(cache_path)
+    assert reloaded.model('edge-tts', 'pt-BR-FranciscaNeural', '+10%').calibrated
+    assert not reloaded.model('edge-tts', 'pt-BR-FranciscaNeural').calibrated  # another rate
+    assert reloaded.format_accuracy() == ""
+
+
+@pytest.mark.asyncio
+async def test_pre_generation_predicts_then_observes(tmp_path):
+    """Pending clips expose a calibrated prediction; probed durations feed the model."""
+    model = DurationModel('gtts|pt-br|', [[*text_features(t), speech_seconds(t)] for t in TEXTS])
+    release = asyncio.Event()
+
+    async def generate(text, output_path):
+        await release.wait()
+        output_path.write_bytes(b'mp3')
+        return True
+
+    steps = [{'action': 'click', 'audio': TEXTS[0]}, {'action': 'click', 'audio': TEXTS[3]}]
+    with patch('playwright_simple.core.tts.pre_generation.get_audio_duration', return_value=2.5):
+        pending = start_pre_generation(steps, tmp_path, 'demo', generate, duration_model=model)
+        audio_file, predicted = pending.prediction(2)
+        assert audio_file == tmp_path / 'demo_tts_pregen' / 'group_2.mp3'
+        assert predicted == pytest.approx(speech_seconds(TEXTS[3]), abs=0.15)
+
+        release.set()
+        assert await pending.clip(2) == (audio_file, 2.5)
+        await pending.result()
+
+    assert len(model.samples) == len(TEXTS) + 2
+    assert model.accuracy()['clips'] == 2
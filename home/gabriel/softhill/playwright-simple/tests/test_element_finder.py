@@ -11,6 +11,7 @@ import asyncio
 from playwright.async_api import async_playwright, Page
 
 from playwright_simple.core.playwright_commands.element_interactions.element_finder import ElementFinder
+from playwright_simple.core.playwright_commands.element_index import get_element_index_stats
 
 
 @pytest.fixture
@@ -85,3 +86,42 @@ async def test_find_submit_button(browser_page: Page):
     assert 'x' in result and 'y' in result, "Result should contain coordinates"
     assert 'text' in result, "Result should contain button text"
 
+
+@pytest.mark.asyncio
+async def test_element_index_tracks_dom_mutations(browser_page: Page):
+    """Test that the shared element index is built once and updated incrementally."""
+    await browser_page.set_content("""
+        <html>
+            <body>
+                <form id="form">
+                    <label for="name">Nome</label>
+                    <input id="name" type="text" />
+                </form>
+            </body>
+        </html>
+    """)
+    
+    finder = ElementFinder(browser_page)
+    assert await finder.find_input_by_label("Nome") is not None
+    assert await finder.find_by_text("Salvar") is None
+    
+    # Add a button after the index was built
+    await browser_page.evaluate("""
+        () => {
+            const button = document.createElement('button');
+            button.type = 'submit';
+            button.textContent = 'Salvar';
+            document.getElementById('form').appendChild(button);
+        }
+    """)
+    result = await finder.find_by_text("Salvar")
+    assert result is not None, "Should find element added after index build"
+    assert result.get('isSubmit') is True
+    
+    # Rename it: old text must no longer match
+    await browser_page.evaluate("() => { document.querySelector('button').textContent = 'Enviar'; }")
+    assert await finder.find_by_text("Salvar") is None
+    assert await finder.find_by_text("Enviar") is not None
+    
+    stats = await get_element_index_stats(browser_page)
+    assert stats['builds'] == 1, "Index should be built only once per document"
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the headless execution profile.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from playwright_simple.core.execution_profile import (
+    ExecutionProfile,
+    RoundTripSavings,
+    get_round_trip_savings,
+    visual_enabled,
+)
+from playwright_simple.core.recorder.cursor_controller import CursorController
+
+
+def _page():
+    """Mock page that records every evaluate call."""
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=None)
+    page.mouse.click = AsyncMock()
+    return page
+
+
+def test_profile_from_config():
+    """The profile is read from the 'step' section of the config."""
+    from playwright_simple.core.config import TestConfig
+    
+    assert visual_enabled(TestConfig())
+    config = TestConfig.from_dict({'step': {'execution_profile': 'headless'}})
+    assert not visual_enabled(config)
+    assert not ExecutionProfile.parse('HEADLESS').visual
+    with pytest.raises(ValueError):
+        ExecutionProfile.parse('turbo')
+
+
+def test_savings_report_per_step():
+    """Skips before the first step go to 'setup'; totals add up."""
+    savings = RoundTripSavings()
+    savings.skip('effects', sleep=0.2)
+    savings.start_step('1. click')
+    savings.skip('position')
+    savings.skip('animation', sleep=0.3)
+
+    report = savings.report()
+    assert [step['step'] for step in report['steps']] == ['setup', '1. click']
+    assert report['steps'][1]['round_trips'] == 2
+    assert report['steps'][1]['by_kind']['animation'] == {'round_trips': 1, 'sleep': 0.3}
+    assert report['total_round_trips'] == 3
+    assert report['total_sleep'] == 0.5
+    assert 'TOTAL' in savings.format_report()
+
+
+@pytest.mark.asyncio
+async def test_headless_cursor_makes_no_visual_round_trips():
+    """Start, move, show and click effects never reach the page."""
+    page = _page()
+    controller = CursorController(page, visual=False)
+    assert get_round_trip_savings(page) is controller.savings
+
+    await controller.start()
+    await controller.move(100, 200)
+    await controller.click(100, 200)
+    controller.setup_navigation_listener()
+
+    page.evaluate.assert_not_awaited()
+    page.on.assert_not_called()
+    page.mouse.click.assert_awaited_once_with(100, 200)
+    assert (controller.current_x, controller.current_y) == (100, 200)
+    assert controller.savings.total_round_trips > 0
+    assert controller.savings.total_sleep > 0
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for lookahead locator prefetch.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from playwright_simple.core.recorder.locator_prefetch import (
+    LocatorPrefetcher,
+    get_locator_prefetcher,
+    step_targets,
+)
+
+
+STEPS = [
+    {'action': 'type', 'text': 'admin', 'field_text': 'Email'},
+    {'action': 'click', 'text': 'Lembrar'},
+    {'action': 'click', 'selector': '#remember'},
+    {'action': 'submit', 'button_text': 'Entrar'},
+    {'action': 'click', 'text': 'Depois do submit'},
+]
+
+
+def _page(url="http://localhost/login"):
+    """Mock page whose prefetch call resolves every target."""
+    page = MagicMock()
+    page.url = url
+
+    async def evaluate(script, arg=None):
+        if isinstance(arg, list):
+            return [{'info': {'found': True, 'text': t['query']}, 'box': {'x': 0, 'y': 0, 'width': 10, 'height': 10}}
+                    for t in arg]
+        return {'x': 5, 'y': 5, 'box': {'x': 0, 'y': 0, 'width': 10, 'height': 10}}
+
+    page.evaluate = AsyncMock(side_effect=evaluate)
+    return page
+
+
+def test_step_targets():
+    """Targets mirror the lookups each action performs."""
+    assert step_targets(STEPS[0]) == [('text', 'Email'), ('field', 'Email')]
+    assert step_targets(STEPS[1]) == [('text', 'Lembrar')]
+    assert step_targets(STEPS[2]) == [('selector', '#remember')]
+    assert step_targets({'action': 'click', 'text': 'input senha'}) == []
+    assert step_targets({'action': 'wait', 'seconds': 1}) == []
+
+
+@pytest.mark.asyncio
+async def test_prefetch_batches_same_page_steps():
+    """One in-page call resolves the window; it stops after submit."""
+    page = _page()
+    prefetcher = LocatorPrefetcher(page)
+    assert get_locator_prefetcher(page) is prefetcher
+
+    resolved = await prefetcher.prefetch_ahead(STEPS, 0, lookahead=5)
+
+    assert resolved == 4
+    assert page.evaluate.await_count == 1
+    queries = [t['query'] for t in page.evaluate.await_args.args[1]]
+    assert 'Depois do submit' not in queries
+
+    # Cached targets: no new batch, validation only
+    assert await prefetcher.prefetch_ahead(STEPS, 1, lookahead=5) == 0
+    info = await prefetcher.resolve('text', 'Lembrar')
+    assert info == {'found': True, 'text': 'Lembrar', 'x': 5, 'y': 5}
+    assert page.evaluate.await_count == 2
+    assert prefetcher.stats['hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_invalidated_on_navigation_and_mutation():
+    """Navigation drops the cache; a mutated target is a miss."""
+    page = _page()
+    prefetcher = LocatorPrefetcher(page)
+    await prefetcher.prefetch_ahead(STEPS, 0, lookahead=5)
+
+    # Page reports the target as dirty (subtree mutated)
+    page.evaluate = AsyncMock(return_value=None)
+    assert await prefetcher.resolve('selector', '#remember') is None
+
+    page.url = "http://localhost/web"
+    assert await prefetcher.resolve('text', 'Lembrar') is None
+    assert prefetcher.stats['invalidations'] == 1
+    assert prefetcher.stats['misses'] == 2
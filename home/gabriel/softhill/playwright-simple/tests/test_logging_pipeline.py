@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for level-gated, lazily rendered logging with background file sinks.
+"""
+
+import json
+import logging
+import uuid
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from playwright_simple.core.logger import DeferredQueueHandler, JSONFormatter, LazyMessage, StructuredLogger
+from playwright_simple.core.recorder.recorder_logger import RecorderLogger
+from playwright_simple.core import runner
+
+
+def test_lazy_message_renders_once():
+    """The payload is only built when a handler writes it."""
+    render = MagicMock(return_value="rendered")
+    message = LazyMessage(render, 1, key="value")
+    render.assert_not_called()
+    assert str(message) == "rendered"
+    assert f"{message}" == "rendered"
+    render.assert_called_once_with(1, key="value")
+
+
+def test_disabled_levels_build_nothing(monkeypatch):
+    """Below the logger level, neither the structured payload nor the JSON is built."""
+    recorder_logger = RecorderLogger(name=f"test_{uuid.uuid4().hex[:8]}", console_level="WARNING")
+    build = MagicMock(wraps=recorder_logger._build_log_data)
+    monkeypatch.setattr(recorder_logger, '_build_log_data', build)
+
+    recorder_logger.info("skipped")
+    recorder_logger.log_screen_event('page_loaded', page_state={'url': 'http://x'})
+    build.assert_not_called()
+
+    dumps = MagicMock(side_effect=json.dumps)
+    monkeypatch.setattr(runner.json, 'dumps', dumps)
+    monkeypatch.setattr(runner.logger, 'level', logging.WARNING)
+    runner._log_action("click", "test", {"selector": "#a"})
+    dumps.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_page_state_fetches_title_only_when_written():
+    """The title round trip is only paid for detailed entries that will be written."""
+    page = MagicMock(url='http://localhost/web')
+    page.title = AsyncMock(return_value='Odoo')
+    recorder_logger = RecorderLogger(name=f"test_{uuid.uuid4().hex[:8]}", console_level="INFO")
+
+    assert await recorder_logger.page_state(page, 'DEBUG') is None
+    assert await recorder_logger.page_state(page) == {'url': 'http://localhost/web'}
+    page.title.assert_not_awaited()
+
+    assert await recorder_logger.page_state(page, 'ERROR') == {'url': 'http://localhost/web', 'title': 'Odoo'}
+    page.title.assert_awaited_once()
+
+
+def test_file_sink_written_by_background_thread(tmp_path):
+    """File records go through a queue and are flushed when the logger closes."""
+    log_file = tmp_path / "run.log"
+    structured = StructuredLogger(
+        name=f"test_{uuid.uuid4().hex[:8]}",
+        log_file=log_file,
+        json_log=True,
+        console_output=False
+    )
+    assert any(isinstance(handler, DeferredQueueHandler) for handler in structured.logger.handlers)
+
+    structured.info("hello", step=3)
+    structured.debug("filtered out")
+    structured.close()
+
+    lines = log_file.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 1
+    entry = json.loads(json.loads(lines[0])['message'])
+    assert entry['message'] == 'hello' and entry['step'] == 3
+
+
+def test_deferred_records_keep_event_time_and_state(monkeypatch):
+    """Rendering later does not change the timestamp or show state mutated after the call."""
+    record = logging.LogRecord('x', logging.INFO, __file__, 1, "msg", None, None)
+    record.created -= 60
+    entry = json.loads(JSONFormatter().format(record))
+    assert entry['timestamp'] == datetime.fromtimestamp(record.created).isoformat()
+
+    recorder_logger = RecorderLogger(name=f"test_{uuid.uuid4().hex[:8]}", console_level="INFO", json_format=True)
+    written = MagicMock()
+    monkeypatch.setattr(recorder_logger.structured_logger, '_log', written)
+    element_info = {'text': 'Salvar', 'coordinates': (10, 20)}
+    recorder_logger.error("clique falhou", element_info=element_info)
+    element_info['text'] = 'Cancelar'
+
+    message = written.call_args.args[1]
+    assert json.loads(str(message))['element_info']['text'] == 'Salvar'
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for per-test memory sampling and bounded profiler metrics.
+"""
+
+import tracemalloc
+
+from playwright_simple.core.performance import MemoryMonitor, MemorySample, PerformanceProfiler
+
+
+def test_sample_lists_growing_allocation_sites():
+    """Allocations kept alive by a test show up in the next sample's diff."""
+    monitor = MemoryMonitor(top=5)
+    was_tracing = tracemalloc.is_tracing()
+    monitor.start()
+    try:
+        leaked = [bytearray(1024) for _ in range(2000)]
+        sample = monitor.sample('01_leak')
+        assert sample.python_mb is not None and sample.python_peak_mb >= sample.python_mb
+        assert any('test_memory_monitor.py' in allocation.location and allocation.size_diff >= 2000 * 1024
+                   for allocation in sample.top_allocations)
+
+        # Nothing new retained: the leak is no longer reported as growth
+        second = monitor.sample('02_idle')
+        assert not any('test_memory_monitor.py' in allocation.location for allocation in second.top_allocations)
+        assert [entry['test_name'] for entry in monitor.report()] == ['01_leak', '02_idle']
+        assert '01_leak' in monitor.format_report()
+        del leaked
+    finally:
+        monitor.stop()
+    assert tracemalloc.is_tracing() == was_tracing
+
+
+def test_budget_and_bounded_profiler_metrics():
+    """The budget applies to browser RSS; folded profiler samples still count in the summary."""
+    monitor = MemoryMonitor(trace=False, budget_mb=500)
+    assert monitor.over_budget(MemorySample('a', browser_rss_mb=620.0))
+    assert not monitor.over_budget(MemorySample('b', browser_rss_mb=300.0))
+    assert not monitor.over_budget(MemorySample('c'))  # psutil unavailable
+
+    profiler = PerformanceProfiler(max_samples=3)
+    for value in (0.1, 0.4, 0.2, 0.3, 0.5, 0.05, 0.6):
+        profiler.record('op', value)
+    assert len(profiler.metrics['op']) < 3
+    summary = profiler.get_summary()['op']
+    assert summary['count'] == 7
+    assert (summary['min'], summary['max']) == (0.05, 0.6)
+    assert abs(summary['total'] - 2.15) < 1e-9
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the offline (pyttsx3) synthesis pool.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from playwright_simple.core.tts.engines import offline_pool
+from playwright_simple.core.tts.engines.offline_pool import OfflineSynthesisPool
+
+
+def _fake_engine():
+    """pyttsx3 engine stand-in: runAndWait writes every queued file."""
+    engine = MagicMock()
+    queued = []
+    engine.save_to_file.side_effect = lambda text, path: queued.append((text, path))
+
+    def run_and_wait():
+        for text, path in queued:
+            Path(path).write_bytes(text.encode('utf-8'))
+        queued.clear()
+
+    engine.runAndWait.side_effect = run_and_wait
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_pool_batches_clips(tmp_path):
+    """Full batches are sent at once; a partial batch leaves after the batch window."""
+    batches = []
+
+    def record_batch(jobs):
+        batches.append([Path(output).name for _, output in jobs])
+        return [True] * len(jobs)
+
+    pool = OfflineSynthesisPool(batch_size=2, batch_window=0.01, executor=ThreadPoolExecutor(2))
+    with patch.object(offline_pool, '_synthesize_batch', record_batch):
+        results = await asyncio.gather(*(
+            pool.synthesize(f"clip {i}", tmp_path / f"clip{i}.wav") for i in range(5)
+        ))
+    pool.close()
+
+    assert results == [True] * 5
+    assert sorted(batches) == [['clip0.wav', 'clip1.wav'], ['clip2.wav', 'clip3.wav'], ['clip4.wav']]
+
+
+@pytest.mark.asyncio
+async def test_pool_propagates_worker_errors(tmp_path):
+    """A failing batch fails every clip in it."""
+    def broken(jobs):
+        raise RuntimeError("driver crashed")
+
+    pool = OfflineSynthesisPool(batch_size=2, executor=ThreadPoolExecutor(1))
+    with patch.object(offline_pool, '_synthesize_batch', broken):
+        with pytest.raises(RuntimeError):
+            await pool.synthesize("Olá", tmp_path / 'a.wav')
+    pool.close()
+
+
+def test_pool_survives_event_loop_change(tmp_path):
+    """A partial batch left by one asyncio.run() does not block the next run."""
+    pool = OfflineSynthesisPool(batch_size=4, batch_window=0.01, executor=ThreadPoolExecutor(1))
+
+    async def abandon():
+        task = asyncio.ensure_future(pool.synthesize("abandonado", tmp_path / 'a.wav'))
+        await asyncio.sleep(0)
+        task.cancel()
+
+    async def run():
+        return await asyncio.wait_for(pool.synthesize("um", tmp_path / 'b.wav'), timeout=2)
+
+    with patch.object(offline_pool, '_synthesize_batch', lambda jobs: [True] * len(jobs)):
+        asyncio.run(abandon())
+        assert asyncio.run(run()) is True
+    pool.close()
+
+
+def test_batch_writes_wav_directly_and_converts_mp3_in_one_call(tmp_path):
+    """WAV outputs skip ffmpeg; MP3 outputs of a batch share one ffmpeg process."""
+    def fake_ffmpeg(cmd, **kwargs):
+        for index in range(cmd.count('-map')):
+            Path(cmd[cmd.index('-map') + 2 + 3 * index]).write_bytes(b'mp3')
+        return MagicMock(returncode=0)
+
+    with patch.object(offline_pool, '_engine', _fake_engine()), \
+            patch.object(offline_pool.subprocess, 'run', side_effect=fake_ffmpeg) as run:
+        assert offline_pool._synthesize_batch([("um", str(tmp_path / 'a.wav'))]) == [True]
+        run.assert_not_called()
+
+        results = offline_pool._synthesize_batch([
+            ("dois", str(tmp_path / 'b.mp3')),
+            ("três", str(tmp_path / 'c.mp3')),
+        ])
+
+    assert results == [True, True]
+    assert run.call_count == 1
+    cmd = run.call_args[0][0]
+    assert cmd.count('-i') == 2 and cmd[-1] == str(tmp_path / 'c.mp3')
+    assert not (tmp_path / 'b.wav').exists()  # intermediate WAVs removed
+    assert (tmp_path / 'a.wav').read_bytes() == b'um'
+
+
+def test_wav_clips_are_mixed_without_stream_copy(tmp_path):
+    """pyttsx3 clips stay WAV; the mixers decode them next to MP3 silence instead of stream-copying."""
+    from playwright_simple.core.tts.audio_processing import concat_command
+    from playwright_simple.core.tts.engines.pyttsx3_engine import Pyttsx3Engine
+
+    assert Pyttsx3Engine.audio_suffix == '.wav'
+    file_list, output = tmp_path / 'concat_list.txt', tmp_path / 'narration.mp3'
+
+    mp3_only = concat_command([tmp_path / 'silence.mp3', tmp_path / 'group_1.mp3'], file_list, output)
+    assert 'copy' in mp3_only and str(file_list) in mp3_only
+
+    mixed = concat_command([tmp_path / 'silence.mp3', tmp_path / 'group_1.wav'], file_list, output)
+    assert 'copy' not in mixed and mixed.count('-i') == 2
+    assert mixed[mixed.index('-filter_complex') + 1].endswith('[a0][a1]concat=n=2:v=0:a=1[out]')
+    assert mixed[-1] == str(output)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the single-round-trip page snapshot behind state capture.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from playwright_simple.core import helpers as helpers_module
+from playwright_simple.core.recorder.action_state_capture import ActionStateCapture
+from playwright_simple.core.state import PAGE_SNAPSHOT_SCRIPT, WebState
+
+
+def _page(**overrides):
+    snapshot = {
+        'title': 'Pedidos',
+        'scroll_x': 0,
+        'scroll_y': 240,
+        'ready_state': 'complete',
+        'focused_element': '#search',
+        'dom_hash': '1f4-9a3c0e11',
+        'visible_interactive_elements': 12,
+        'elements': [{'tag': 'button', 'text': 'Salvar', 'id': 'save', 'className': ''}],
+    }
+    snapshot.update(overrides)
+    page = MagicMock()
+    page.url = 'http://localhost:8000/pedidos'
+    page.viewport_size = {'width': 1280, 'height': 720}
+    page.evaluate = AsyncMock(side_effect=lambda script, options: dict(snapshot))
+    page.title = AsyncMock()
+    page.content = AsyncMock()
+    return page
+
+
+@pytest.mark.asyncio
+async def test_web_state_capture_uses_one_evaluate():
+    """WebState.capture fills every field from one evaluate, without serializing the DOM."""
+    page = _page()
+    state = await WebState.capture(page, step_number=3, action_type='click')
+
+    page.evaluate.assert_awaited_once_with(PAGE_SNAPSHOT_SCRIPT, [False, True])
+    page.title.assert_not_awaited()
+    page.content.assert_not_awaited()
+    assert (state.title, state.scroll_y, state.html_hash) == ('Pedidos', 240, '1f4-9a3c0e11')
+    assert state.dom_ready and state.focused_element == '#search'
+    assert state.metadata['visible_interactive_elements'] == 12
+    assert state.viewport_width == 1280
+
+
+@pytest.mark.asyncio
+async def test_action_state_and_helpers_share_the_snapshot():
+    """ActionStateCapture lists elements; detect_state_change reports DOM changes."""
+    page = _page()
+    state = await ActionStateCapture.capture_state(page)
+    page.evaluate.assert_awaited_once_with(PAGE_SNAPSHOT_SCRIPT, [True, True])
+    assert state['html_hash'] == '1f4-9a3c0e11' and state['load_state'] == 'complete'
+    assert state['element_count'] == 1 and state['visible_elements'][0]['text'] == 'Salvar'
+
+    helpers = helpers_module.TestBaseHelpers(page, MagicMock(), MagicMock())
+    before = await helpers.detect_state_change({})
+    assert page.evaluate.await_args.args[1] == [False, False]  # no visibility scan per click
+    assert before == {'url': page.url, 'title': 'Pedidos', 'html_hash': '1f4-9a3c0e11'}
+
+    swapped = _page(dom_hash='1f6-0b77d2a4')
+    helpers.page = swapped
+    after = await helpers.detect_state_change(before)
+    assert after['html_changed'] and after['state_changed'] and not after['url_changed']
+    swapped.title.assert_not_awaited()
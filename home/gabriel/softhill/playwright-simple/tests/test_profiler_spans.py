@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for hierarchical spans and Chrome trace export.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from playwright_simple.core.performance import PerformanceProfiler
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_awaits_and_tasks():
+    """Parents follow the task that opened the span; concurrent tasks get their own track."""
+    profiler = PerformanceProfiler(trace=True)
+
+    async def phase(name):
+        with profiler.span(name, url="http://localhost"):
+            await asyncio.sleep(0)
+
+    with profiler.span("suite", category="suite"):
+        with profiler.span("1. click", category="step", step=1, selector="#save") as step:
+            step.set(found=True)
+            await asyncio.gather(
+                asyncio.create_task(phase("locate"), name="locate-task"),
+                asyncio.create_task(phase("cursor_move"), name="move-task"),
+            )
+
+    spans = {span.name: span for span in profiler.spans}
+    assert spans["suite"].parent_id is None
+    assert spans["1. click"].parent_id == spans["suite"].span_id
+    assert spans["locate"].parent_id == spans["1. click"].span_id
+    assert spans["cursor_move"].parent_id == spans["1. click"].span_id
+    assert spans["1. click"].attributes == {"step": 1, "selector": "#save", "found": True}
+    assert spans["locate"].track != spans["cursor_move"].track
+    assert "step:1. click" in profiler.get_summary()
+
+
+def test_error_is_recorded_and_chrome_trace_export(tmp_path):
+    """Failing spans carry the error; the export is valid trace-event JSON."""
+    profiler = PerformanceProfiler(trace=True)
+    with pytest.raises(ValueError):
+        with profiler.span("test_login", category="test"):
+            with profiler.span("action", step=2):
+                raise ValueError("boom")
+
+    path = profiler.export_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads(path.read_text())
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in complete] == ["test_login", "action"]
+    assert complete[1]["args"]["error"] == "ValueError: boom"
+    assert complete[1]["args"]["parent_id"] == complete[0]["args"]["span_id"]
+    outer, inner = complete
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1
+    assert any(event["ph"] == "M" for event in trace["traceEvents"])
+
+
+def test_spans_are_noop_without_trace():
+    """Without tracing nothing is recorded (default global profiler)."""
+    profiler = PerformanceProfiler()
+    with profiler.span("step", category="step") as span:
+        span.set(selector="#a")
+    assert profiler.spans == []
+    assert profiler.metrics == {}
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for browser protocol round-trip accounting.
+"""
+
+import pytest
+
+from playwright_simple.core.performance import (
+    PerformanceProfiler,
+    RoundTripCounter,
+    StepTimingReport,
+    get_round_trip_counter,
+    instrument_page,
+    set_profiler,
+)
+from playwright_simple.core.performance.round_trips import step_summary
+
+
+class _Locator:
+    """Minimal stand-in for a Playwright Locator."""
+
+    def __init__(self, selector):
+        self.selector = selector
+
+    def __repr__(self):
+        return f"<Locator selector={self.selector!r}>"
+
+    async def text_content(self):
+        return "text"
+
+    def nth(self, index):
+        return _Locator(f"{self.selector} >> nth={index}")
+
+
+class _Mouse:
+    async def click(self, x, y):
+        return None
+
+
+class _Page:
+    """Minimal stand-in for a Playwright Page."""
+
+    def __init__(self):
+        self.mouse = _Mouse()
+        self.keyboard = None
+
+    def __repr__(self):
+        return "<Page url='http://localhost'>"
+
+    async def title(self):
+        return "Odoo"
+
+    async def evaluate(self, script, arg=None):
+        return None
+
+    def locator(self, selector):
+        return _Locator(selector)
+
+
+@pytest.fixture
+def profiler():
+    profiler = PerformanceProfiler()
+    set_profiler(profiler)
+    yield profiler
+    set_profiler(None)
+
+
+@pytest.mark.asyncio
+async def test_calls_counted_per_step_and_call_site(profiler):
+    """Page, mouse and locator calls are attributed to the step and the caller."""
+    page = _Page()
+    counter = instrument_page(page)
+    assert instrument_page(page) is counter
+    assert get_round_trip_counter(page) is counter
+    assert isinstance(page, _Page)
+
+    await page.evaluate("1")
+    counter.start_step("1. click")
+    await page.locator("#save").nth(0).text_content()
+    await page.mouse.click(10, 20)
+
+    report = counter.report()
+    assert [step["step"] for step in report["steps"]] == [RoundTripCounter.SETUP_STEP, "1. click"]
+    step = report["steps"][1]
+    assert step["calls"] == 2
+    assert set(step["by_method"]) == {"locator.text_content", "mouse.click"}
+    assert all(site.startswith("test_round_trips.py:") for site in step["by_site"])
+    assert report["total_calls"] == 3
+    assert profiler.get_summary()["round_trip:mouse.click"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_flagged_until_page_changes(profiler):
+    """A second identical read in a step is redundant unless something ran in between."""
+    page = _Page()
+    counter = instrument_page(page)
+    counter.start_step("1. go_to")
+
+    await page.title()
+    await page.title()
+    await page.locator("#a").text_content()
+    await page.locator("#a").text_content()
+    await page.evaluate("document.body.click()")
+    await page.title()
+
+    entry = counter.current
+    assert [call["method"] for call in entry["redundant"]] == ["page.title", "locator.text_content"]
+    assert "Redundant" in counter.format_report()
+
+    report = StepTimingReport("login")
+    report.add_step(1, "go_to", 0.5, {}, step_summary(entry))
+    assert report.round_trips == 6
+    assert report.redundant_round_trips == 2
+    assert report.to_dict()["steps"][0]["round_trips"]["calls"] == 6
@@ -40,3 +40,21 @@ async def test_runner_get_results():
     assert results == []
 
 
+
+
+@pytest.mark.asyncio
+async def test_runner_reports_setup_failure_without_profiles(tmp_path, monkeypatch):
+    """A test failing before the page exists still gets a result, without profile reports."""
+    monkeypatch.chdir(tmp_path)
+    config = TestConfig()
+    config.video.enabled = False
+    runner = TestRunner(config=config)
+
+    async def never_runs(page, test):
+        raise AssertionError("test body must not run")
+
+    result = await runner.run_test("setup_failure", never_runs)
+
+    assert result["status"] == "failed"
+    assert "browser must be provided" in result["error"]
+    assert "visual_savings" not in result and "round_trips" not in result
@@ -151,3 +151,207 @@ def test_selector_generate_alternatives():
     alternatives = manager._generate_alternatives("a.link")
     assert '[role="link"]' in alternatives
 
+
+
+def _memo_page(visible_selectors):
+    """Mock page where only the given selectors resolve."""
+    page = MagicMock()
+    requested = []
+
+    def make_locator(selector):
+        requested.append(selector)
+        first_locator = MagicMock()
+        if selector in visible_selectors:
+            first_locator.wait_for = AsyncMock()
+        else:
+            first_locator.wait_for = AsyncMock(side_effect=Exception("timeout"))
+        first_locator.count = AsyncMock(return_value=1)
+        first_locator.is_visible = AsyncMock(return_value=True)
+        locator = MagicMock()
+        locator.first = first_locator
+        return locator
+
+    page.locator = MagicMock(side_effect=make_locator)
+    return page, requested
+
+
+@pytest.mark.asyncio
+async def test_selector_memo_tries_previous_resolution_first(tmp_path):
+    """A target resolved by a fallback strategy is found directly on the next run."""
+    from playwright_simple.core.selector_memo import SelectorMemo
+
+    memo_file = tmp_path / "memo.json"
+    page, requested = _memo_page({'a:has-text("Entrar")'})
+
+    manager = SelectorManager(page, retry_count=0, memo=SelectorMemo(memo_file, autosave=False), test_name="login")
+    assert await manager.find_element("Entrar") is not None
+    assert manager.memo.lookup("login", "#1", "Entrar")['selector'] == 'a:has-text("Entrar")'
+    assert not memo_file.exists()  # written once, at the end of the test
+    manager.save_memo()
+    assert memo_file.exists()
+
+    # New run: memo is loaded from disk and the winning selector is tried first
+    requested.clear()
+    memo = SelectorMemo(memo_file, autosave=False)
+    manager = SelectorManager(page, retry_count=0, memo=memo, test_name="login")
+    assert await manager.find_element("Entrar") is not None
+    assert requested == ['a:has-text("Entrar")']
+    assert memo.hit_rates()['memo']['hits'] == 1
+    assert memo.hit_rates()['text']['attempts'] == 1
+
+
+@pytest.mark.asyncio
+async def test_selector_memo_steps_restart_per_test(tmp_path):
+    """Occurrence-based step keys start over when the test changes; stale entries get a short probe."""
+    from playwright_simple.core.selector_memo import SelectorMemo
+
+    memo = SelectorMemo(tmp_path / "memo.json", autosave=False)
+    memo.remember("checkout", "#1", "#pay", "alternative", "[data-testid='old']")
+    page, requested = _memo_page({'#pay'})
+
+    manager = SelectorManager(page, retry_count=0, memo=memo, test_name="login")
+    await manager.find_element("#pay")
+    await manager.find_element("#pay")
+    assert memo.lookup("login", "#2", "#pay") is not None
+
+    manager.set_test_name("checkout")
+    requested.clear()
+    await manager.find_element("#pay")
+    assert requested[0] == "[data-testid='old']"  # checkout's step #1, not #3
+    assert memo.lookup("checkout", "#1", "#pay")['selector'] == '#pay'
+
+
+@pytest.mark.asyncio
+async def test_selector_memo_probe_is_short(tmp_path):
+    """A stale memo entry is probed with MEMO_PROBE_TIMEOUT, not the fallback timeout."""
+    from playwright_simple.core.selector_memo import SelectorMemo
+
+    memo = SelectorMemo(tmp_path / "memo.json", autosave=False)
+    memo.remember("login", "#1", "#submit", "alternative", "[data-testid='old']")
+    page, _ = _memo_page({'#submit'})
+    probes = []
+    original = page.locator.side_effect
+
+    def tracking_locator(selector):
+        locator = original(selector)
+        if selector == "[data-testid='old']":
+            probes.append(locator.first.wait_for)
+        return locator
+
+    page.locator.side_effect = tracking_locator
+    manager = SelectorManager(page, retry_count=0, memo=memo, test_name="login")
+    await manager.find_element("#submit")
+
+    assert probes[0].call_args.kwargs['timeout'] == SelectorManager.MEMO_PROBE_TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_selector_memo_forgets_stale_resolution(tmp_path):
+    """A memoized selector that stops matching is dropped and the cascade runs again."""
+    from playwright_simple.core.selector_memo import SelectorMemo
+
+    memo = SelectorMemo(tmp_path / "memo.json", autosave=False)
+    memo.remember("login", "#1", "#submit", "alternative", "[data-testid='old']")
+    page, requested = _memo_page({'#submit'})
+
+    manager = SelectorManager(page, retry_count=0, memo=memo, test_name="login")
+    assert await manager.find_element("#submit") is not None
+    assert requested == ["[data-testid='old']", '#submit']
+    assert memo.lookup("login", "#1", "#submit")['strategy'] == 'primary'
+    assert memo.hit_rates()['memo']['hit_rate'] == 0.0
+
+
+def _timed_page(delays):
+    """Page whose selectors appear after delays[selector] seconds (others never match)."""
+    import asyncio
+
+    cancelled = []
+    locators = {}
+
+    def make_locator(selector):
+        async def wait_for(**kwargs):
+            try:
+                await asyncio.sleep(delays.get(selector, kwargs['timeout'] / 1000))
+            except asyncio.CancelledError:
+                cancelled.append(selector)
+                raise
+            if selector not in delays:
+                raise Exception("Timeout")
+
+        first_locator = MagicMock()
+        first_locator.wait_for = AsyncMock(side_effect=wait_for)
+        first_locator.count = AsyncMock(return_value=1)
+        first_locator.is_visible = AsyncMock(return_value=True)
+        locators[selector] = first_locator
+        locator = MagicMock()
+        locator.first = first_locator
+        return locator
+
+    page = MagicMock()
+    page.locator = MagicMock(side_effect=make_locator)
+    return page, locators, cancelled
+
+
+@pytest.mark.asyncio
+async def test_find_element_prefers_late_primary_over_broad_fallback():
+    """A broad alternative that matches at once does not beat a primary selector appearing later."""
+    page, locators, _ = _timed_page({'button.submit': 0.3, '[role="button"]': 0.0})
+    manager = SelectorManager(page, timeout=2000, retry_count=0)
+
+    result = await manager.find_element("button.submit")
+
+    assert result is locators['button.submit']
+
+
+@pytest.mark.asyncio
+async def test_find_element_falls_back_after_broad_grace():
+    """A primary selector that never matches costs BROAD_GRACE before a broad alternative wins, not its timeout."""
+    import asyncio
+
+    page, locators, cancelled = _timed_page({'[role="button"]': 0.0})
+    manager = SelectorManager(page, timeout=30000, retry_count=0)
+    manager.BROAD_GRACE = 200
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await manager.find_element("button.submit")
+    elapsed = loop.time() - started
+
+    assert result is locators['[role="button"]']
+    assert 0.2 <= elapsed < 0.6
+    assert 'button.submit' in cancelled
+
+
+@pytest.mark.asyncio
+async def test_find_element_races_strategies():
+    """A slow primary selector does not delay an equivalent text match; the loser is cancelled."""
+    import asyncio
+
+    page, locators, cancelled = _timed_page({'a:has-text("Entrar")': 0.0, 'Entrar': 10})
+    manager = SelectorManager(page, retry_count=0)
+
+    result = await asyncio.wait_for(manager.find_element("Entrar"), timeout=1)
+
+    assert result is locators['a:has-text("Entrar")']
+    assert 'Entrar' in cancelled
+
+
+@pytest.mark.asyncio
+async def test_find_element_race_tie_break_by_priority():
+    """When several strategies match, the highest-priority one wins."""
+    page, requested = _memo_page({'button:has-text("Salvar")', '*:has-text("Salvar")', 'Salvar'})
+    results = {}
+
+    original = page.locator.side_effect
+
+    def tracking_locator(selector):
+        locator = original(selector)
+        results[selector] = locator.first
+        return locator
+
+    page.locator = MagicMock(side_effect=tracking_locator)
+    manager = SelectorManager(page, retry_count=0)
+
+    result = await manager.find_element("Salvar")
+
+    assert result is results['button:has-text("Salvar")']
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for storage-state based session persistence.
+"""
+
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from playwright_simple.core.session import SessionManager
+
+
+def _context(pages=()):
+    context = MagicMock()
+    context.pages = list(pages)
+    context.storage_state = AsyncMock(return_value={
+        'cookies': [{'name': 'session_id', 'value': 'abc', 'domain': 'localhost', 'path': '/'}],
+        'origins': [{'origin': 'http://localhost:8000', 'localStorage': [{'name': 'theme', 'value': 'dark'}]}],
+    })
+    context.add_cookies = AsyncMock()
+    context.add_init_script = AsyncMock()
+    context.new_page = AsyncMock()
+    context.route = AsyncMock()
+    context.unroute = AsyncMock()
+    return context
+
+
+def _navigation(url, top_level=True):
+    request = MagicMock()
+    request.url = url
+    request.is_navigation_request.return_value = True
+    request.frame.parent_frame = None if top_level else MagicMock()
+    route = MagicMock()
+    route.continue_ = AsyncMock()
+    return route, request
+
+
+@pytest.mark.asyncio
+async def test_save_and_restore_with_new_context(tmp_path):
+    """Saved state goes to new_context; sessionStorage to an init script; no page is opened."""
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={'origin': 'http://localhost:8000', 'data': {'tab': 'orders'}})
+    manager = SessionManager(tmp_path)
+    path = await manager.save_session(_context([page]), 'login')
+    saved = json.loads(path.read_text())
+    assert saved['sessionStorage'] == {'http://localhost:8000': {'tab': 'orders'}}
+
+    session = manager.get_session('login')
+    assert manager.get_session('login') is session  # cached while the file is unchanged
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert manager.get_session('login') is not session
+
+    browser = MagicMock()
+    browser.new_context = AsyncMock(return_value=_context())
+    context = await manager.new_context(browser, 'login', locale='pt-BR')
+    options = browser.new_context.await_args.kwargs
+    assert options['locale'] == 'pt-BR' and options['storage_state'] == saved['storage_state']
+    script = context.add_init_script.await_args.kwargs['script']
+    assert '"tab": "orders"' in script and 'theme' not in script  # localStorage comes with the context
+    context.new_page.assert_not_awaited()
+    assert await manager.new_context(browser, 'missing') is None
+
+
+@pytest.mark.asyncio
+async def test_load_legacy_session_into_existing_context(tmp_path):
+    """Old cookie + storage files load without evaluates or navigation."""
+    (tmp_path / 'old.json').write_text(json.dumps({
+        'cookies': [{'name': 'sid', 'value': '1', 'domain': 'localhost', 'path': '/'}],
+        'localStorage': {'token': 'xyz'},
+        'sessionStorage': {},
+    }))
+    manager = SessionManager(tmp_path)
+    context = _context()
+    assert await manager.load_session(context, 'old')
+    context.add_cookies.assert_awaited_once()
+    context.add_init_script.assert_not_awaited()  # nothing is written before an origin is known
+    context.new_page.assert_not_awaited()
+
+    # The first top-level navigation claims the legacy storage; iframes before it do not
+    claim = context.route.await_args.args[1]
+    await claim(*_navigation('https://widgets.example.com/frame', top_level=False))
+    context.add_init_script.assert_not_awaited()
+    route, request = _navigation('http://localhost:8069/web')
+    await claim(route, request)
+    route.continue_.assert_awaited_once()
+    script = context.add_init_script.await_args.kwargs['script']
+    assert '"http://localhost:8069": {"localStorage": {"token": "xyz"}}' in script and '"*"' not in script
+    context.unroute.assert_awaited_once_with('**/*', claim)
+
+    # Without storage only cookies are applied
+    context = _context()
+    assert await manager.load_session(context, 'old', apply_storage=False)
+    context.add_init_script.assert_not_awaited()
+    assert not await manager.load_session(context, 'missing')
+
+
+def test_local_storage_is_restored_once_per_context(tmp_path):
+    """localStorage is marked with a per-context token, so new tabs keep the test's changes."""
+    manager = SessionManager(tmp_path)
+    (tmp_path / 'login.json').write_text(json.dumps({
+        'storage_state': _context().storage_state.return_value, 'sessionStorage': {},
+    }))
+    session = manager.get_session('login')
+    first, second = session.init_script(include_local_storage=True), session.init_script(include_local_storage=True)
+    assert '"theme": "dark"' in first
+    assert "localStorage.getItem(marker) !== token" in first
+    assert first != second  # each context gets its own token
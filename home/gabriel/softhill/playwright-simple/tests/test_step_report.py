@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the per-step timing breakdown.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from playwright_simple.core.performance import PerformanceProfiler, StepTimingReport, SuiteTimingReport
+
+
+@pytest.mark.asyncio
+async def test_collect_phases_without_trace_uses_self_time():
+    """Phase time excludes nested phases and is collected with tracing off."""
+    profiler = PerformanceProfiler()
+
+    with profiler.collect_phases() as phases:
+        with profiler.span("1. click", category="step"):
+            with profiler.span("action"):
+                with profiler.span("stability_wait"):
+                    await asyncio.sleep(0.05)
+                await asyncio.sleep(0.01)
+
+    assert phases["stability_wait"] >= 0.04
+    assert phases["action"] < phases["stability_wait"]
+    assert "1. click" not in phases
+    assert profiler.spans == [] and profiler.metrics == {}
+
+    collected = dict(phases)
+    with profiler.span("action"):
+        await asyncio.sleep(0.01)
+    assert phases == collected
+
+
+def test_step_and_suite_reports_rank_slowest(tmp_path):
+    """Unattributed time goes to 'other'; suites rank steps across tests."""
+    login = StepTimingReport("login")
+    login.add_step(1, "go_to", 2.0, {"dom_ready_wait": 0.5, "stability_wait": 1.0})
+    login.add_step(2, "click", 0.5, {"locate": 0.1, "action": 0.3, "custom": 0.05})
+    checkout = StepTimingReport("checkout")
+    checkout.add_step(1, "type", 3.0, {"action": 2.0, "audio_wait": 0.9})
+
+    assert login.steps[0]["phases"]["other"] == pytest.approx(0.5)
+    assert login.steps[1]["phases"]["custom"] == 0.05
+    assert [step["step"] for step in login.slowest_steps(1)] == [1]
+    assert next(iter(login.phase_totals())) == "stability_wait"
+    assert "TOTAL" in login.format_table()
+
+    suite = SuiteTimingReport()
+    suite.add(login)
+    suite.add(checkout)
+    data = json.loads(suite.save_json(tmp_path / "steps.json").read_text(encoding="utf-8"))
+    assert data["total"] == 5.5
+    assert data["slowest"][0] == {"test": "checkout", "step": 1, "action": "type", "duration": 3.0}
+    assert next(iter(data["phases"])) == "action"
+    assert [test["test"] for test in data["tests"]] == ["login", "checkout"]
+    assert "Passos mais lentos" in suite.format_table()
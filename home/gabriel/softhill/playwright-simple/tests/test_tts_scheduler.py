@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the TTS synthesis scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from playwright_simple.core.exceptions import TTSGenerationError
+from playwright_simple.core.tts.pre_generation import pre_generate_audios
+from playwright_simple.core.tts.scheduler import (
+    SynthesisScheduler,
+    TokenBucket,
+    is_transient,
+)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_bounds_concurrency_and_prefers_low_priority():
+    """No more than `concurrency` calls run at once; queued calls start lowest priority first."""
+    scheduler = SynthesisScheduler(concurrency=2)
+    running = 0
+    peak = 0
+    started = []
+
+    async def synthesize(name):
+        nonlocal running, peak
+        started.append(name)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return name
+
+    results = await asyncio.gather(*(
+        scheduler.submit(synthesize, f"clip{priority}", priority=priority)
+        for priority in [9, 8, 5, 1, 3]
+    ))
+
+    assert results == ['clip9', 'clip8', 'clip5', 'clip1', 'clip3']
+    assert peak == 2
+    # The first two took free slots; the rest waited and ran in priority order
+    assert started == ['clip9', 'clip8', 'clip1', 'clip3', 'clip5']
+    assert scheduler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_retries_only_transient_errors():
+    """Network errors wrapped by the engines are retried; other errors are raised at once."""
+    scheduler = SynthesisScheduler(retries=2, backoff=0.001)
+    calls = []
+
+    async def flaky():
+        calls.append('flaky')
+        if len(calls) < 3:
+            try:
+                raise ConnectionResetError("reset by peer")
+            except ConnectionResetError as e:
+                raise TTSGenerationError(f"edge-tts generation failed: {e}") from e
+        return True
+
+    assert await scheduler.submit(flaky) is True
+    assert len(calls) == 3
+
+    async def broken():
+        calls.append('broken')
+        raise ValueError("Language not supported: xx")
+
+    with pytest.raises(ValueError):
+        await scheduler.submit(broken)
+    assert calls.count('broken') == 1
+
+    assert is_transient(Exception("429 (Too Many Requests) from TTS API"))
+    assert not is_transient(TTSGenerationError("gTTS generation failed: bad text"))
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_after_burst():
+    """A bucket allows `capacity` tokens back to back, then `rate` per second."""
+    bucket = TokenBucket(rate=50.0, capacity=2)
+    loop = asyncio.get_event_loop()
+    started = loop.time()
+    for _ in range(4):
+        await bucket.acquire()
+    assert loop.time() - started >= 0.035  # two paced tokens at 20ms each
+
+
+@pytest.mark.asyncio
+async def test_pre_generation_uses_scheduler_priorities(tmp_path):
+    """Groups are submitted with their index as priority, earliest first."""
+    submitted = []
+
+    class RecordingScheduler(SynthesisScheduler):
+        async def submit(self, func, *args, priority=0, **kwargs):
+            submitted.append(priority)
+            return await super().submit(func, *args, priority=priority, **kwargs)
+
+    async def generate(text, output_path):
+        return False  # no audio files: only scheduling is checked
+
+    steps = [{'audio': 'um'}, {'audio': 'dois'}, {'audio': ''}, {'audio': 'tres'}]
+    result = await pre_generate_audios(steps, tmp_path, 'demo', generate, scheduler=RecordingScheduler(concurrency=1))
+
+    assert sorted(submitted) == [1, 2, 3]
+    assert result['audio_data'] == {}
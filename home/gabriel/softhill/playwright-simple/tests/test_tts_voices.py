@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the edge-tts voice registry.
+"""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+from unittest.mock import AsyncMock
+
+from playwright_simple.core.tts.voices import VoiceRegistry, select_voice
+
+
+CATALOGUE = [
+    {'ShortName': 'en-US-GuyNeural', 'Locale': 'en-US', 'Gender': 'Male'},
+    {'ShortName': 'pt-BR-AntonioNeural', 'Locale': 'pt-BR', 'Gender': 'Male'},
+    {'ShortName': 'pt-BR-FranciscaNeural', 'Locale': 'pt-BR', 'Gender': 'Female'},
+]
+
+
+def test_select_voice_keeps_engine_preferences():
+    """Requested voice wins; pt-BR prefers female voices; unknown locales fall back to the first voice."""
+    assert select_voice(CATALOGUE, 'pt-BR', gender='Female') == 'pt-BR-FranciscaNeural'
+    assert select_voice(CATALOGUE, 'pt-BR') == 'pt-BR-AntonioNeural'
+    assert select_voice(CATALOGUE, 'pt-BR', voice='en-US-GuyNeural') == 'en-US-GuyNeural'
+    assert select_voice(CATALOGUE, 'ja-JP', voice='missing') == 'en-US-GuyNeural'
+    assert select_voice([], 'pt-BR') is None
+
+
+@pytest.mark.asyncio
+async def test_registry_fetches_once_and_memoizes(tmp_path):
+    """Concurrent clips share one fetch; the catalogue is persisted for later processes."""
+    loader = AsyncMock(return_value=CATALOGUE)
+    cache_path = tmp_path / 'voices.json'
+    registry = VoiceRegistry(cache_path=cache_path, loader=loader)
+
+    voices = await asyncio.gather(*(registry.resolve('pt-br') for _ in range(5)))
+    assert voices == ['pt-BR-FranciscaNeural'] * 5
+    assert await registry.resolve('en') == 'en-US-GuyNeural'
+    assert loader.await_count == 1
+    assert json.loads(cache_path.read_text()) == CATALOGUE
+
+    # A new process reads the fresh disk copy instead of the network
+    offline = AsyncMock(side_effect=OSError("no network"))
+    assert await VoiceRegistry(cache_path=cache_path, loader=offline).resolve('pt-br') == 'pt-BR-FranciscaNeural'
+    offline.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_registry_refreshes_stale_cache_and_falls_back_offline(tmp_path):
+    """After the TTL the catalogue is refetched, and the stale copy is used if that fails."""
+    cache_path = tmp_path / 'voices.json'
+    cache_path.write_text(json.dumps(CATALOGUE[:1]))
+    old = time.time() - 3600
+    os.utime(cache_path, (old, old))
+
+    loader = AsyncMock(return_value=CATALOGUE)
+    assert await VoiceRegistry(cache_path=cache_path, ttl=60, loader=loader).resolve('pt-br') == 'pt-BR-FranciscaNeural'
+    loader.assert_awaited_once()
+
+    os.utime(cache_path, (old, old))
+    offline = AsyncMock(side_effect=OSError("no network"))
+    assert await VoiceRegistry(cache_path=cache_path, ttl=60, loader=offline).resolve('en') == 'en-US-GuyNeural'
+
+    with pytest.raises(OSError):
+        await VoiceRegistry(cache_path=tmp_path / 'missing.json', loader=offline).voices()
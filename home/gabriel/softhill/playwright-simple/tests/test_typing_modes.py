@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for typing modes (instant, chunked, realistic).
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from playwright_simple.core.typing_modes import (
+    FILL_FOCUSED_SCRIPT,
+    TypingMode,
+    resolve_typing_mode,
+    type_fast,
+)
+from playwright_simple.core.recorder.actions import TypeAction
+from playwright_simple.core.recorder.cursor_controller.interaction import CursorInteraction
+
+
+def _page(filled=True):
+    """Mock page whose fill script reports success."""
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=filled)
+    page.keyboard.insert_text = AsyncMock()
+    page.keyboard.type = AsyncMock()
+    return page
+
+
+def test_resolve_typing_mode():
+    """Auto types char by char only when recording video."""
+    assert resolve_typing_mode(None) == TypingMode.INSTANT
+    assert resolve_typing_mode('auto', recording_video=True) == TypingMode.REALISTIC
+    assert resolve_typing_mode('CHUNKED', recording_video=True) == TypingMode.CHUNKED
+    with pytest.raises(ValueError):
+        resolve_typing_mode('slowly')
+
+
+def test_type_action_reads_step_typing_mode():
+    """Per-step mode comes from the YAML ``typing_mode`` key."""
+    action = TypeAction.from_step({'action': 'type', 'text': 'x', 'field_text': 'Nome', 'typing_mode': 'chunked'})
+    assert action.mode == 'chunked'
+    assert TypeAction.from_step({'action': 'type', 'text': 'x'}).mode is None
+
+
+@pytest.mark.asyncio
+async def test_type_fast_instant_and_chunked():
+    """Instant is one evaluate; chunked inserts text in blocks; realistic is left to the caller."""
+    page = _page()
+    assert await type_fast(page, "Azure Interior", TypingMode.INSTANT)
+    page.evaluate.assert_awaited_once_with(FILL_FOCUSED_SCRIPT, "Azure Interior")
+    page.keyboard.insert_text.assert_not_awaited()
+
+    # Not a plain field: falls back to insert_text
+    page = _page(filled=False)
+    assert await type_fast(page, "abc", TypingMode.INSTANT)
+    page.keyboard.insert_text.assert_awaited_once_with("abc")
+
+    page = _page()
+    assert await type_fast(page, "a" * 20, TypingMode.CHUNKED)
+    assert [c.args[0] for c in page.keyboard.insert_text.await_args_list] == ["a" * 8, "a" * 8, "a" * 4]
+
+    assert not await type_fast(_page(), "abc", TypingMode.REALISTIC)
+
+
+@pytest.mark.asyncio
+async def test_cursor_interaction_uses_controller_mode():
+    """Without video the controller's auto mode fills instantly; a step can override it."""
+    page = _page()
+    controller = MagicMock(typing_mode=TypingMode.AUTO, recording_video=False, speed_level=None, fast_mode=True)
+    interaction = CursorInteraction(page, controller)
+
+    await interaction._enter_text("admin")
+    page.evaluate.assert_awaited_once_with(FILL_FOCUSED_SCRIPT, "admin")
+    page.keyboard.type.assert_not_awaited()
+
+    await interaction._enter_text("admin", mode='realistic')
+    page.keyboard.type.assert_awaited()
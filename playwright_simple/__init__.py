@@ -18,39 +18,49 @@ while maintaining flexibility for advanced use cases.
 
 __version__ = "0.1.0"
 
-# Import from core to maintain backward compatibility
-from .core import (
-    TestConfig,
-    SimpleTestBase,
-    TestRunner,
-    CursorManager,
-    ScreenshotManager,
-    SelectorManager,
-)
+import importlib
+from importlib.util import find_spec
+
+# Public names are resolved on first access (PEP 562), so importing the
+# package (e.g. for the CLI) does not load Playwright, the runner or the
+# extensions until they are used.
+_LAZY = {
+    "TestConfig": ".core",
+    "SimpleTestBase": ".core",
+    "TestRunner": ".core",
+    "CursorManager": ".core",
+    "ScreenshotManager": ".core",
+    "SelectorManager": ".core",
+    "ForgeERPTestBase": ".forgeerp",
+}
 # YAMLParser removed - use Recorder for playback or parse_yaml_file from yaml_resolver for parsing
 # VideoManager moved to extensions/video
 
-# Optional extensions (import only if available)
-try:
-    from .forgeerp import ForgeERPTestBase
-    __all__ = [
-        "TestConfig",
-        "SimpleTestBase",
-        "TestRunner",
-        "CursorManager",
-        "ScreenshotManager",
-        "SelectorManager",
-        "ForgeERPTestBase",
-        "__version__",
-    ]
-except ImportError:
-    __all__ = [
-        "TestConfig",
-        "SimpleTestBase",
-        "TestRunner",
-        "CursorManager",
-        "ScreenshotManager",
-        "SelectorManager",
-        "__version__",
-    ]
+__all__ = [
+    "TestConfig",
+    "SimpleTestBase",
+    "TestRunner",
+    "CursorManager",
+    "ScreenshotManager",
+    "SelectorManager",
+    "__version__",
+]
+# Optional extensions (listed only if available)
+if find_spec(f"{__name__}.forgeerp") is not None:
+    __all__.insert(-1, "ForgeERPTestBase")
+
+
+def __getattr__(name):
+    """Import public names and subpackages on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        if name.startswith('_') or find_spec(f"{__name__}.{name}") is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        return importlib.import_module(f"{__name__}.{name}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -6,7 +6,13 @@ Refactored into smaller, more maintainable modules.
 
 from .main import main
 from .parser import create_parser
-from .command_handlers import handle_command_commands
 
 __all__ = ['main', 'create_parser', 'handle_command_commands']
 
+
+def __getattr__(name):
+    """Import the session command handler on first access (PEP 562)."""
+    if name == 'handle_command_commands':
+        from .command_handlers import handle_command_commands
+        return handle_command_commands
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark Command Handlers.
+
+Handles execution of 'benchmark' command.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from playwright_simple.core.performance.benchmarks import (
+    compare_to_baseline,
+    format_results,
+    load_baseline,
+    save_baseline,
+)
+
+
+async def _run_suite(args: argparse.Namespace):
+    """Run the selected benchmark suite."""
+    if args.suite == 'media':
+        from playwright_simple.core.performance.benchmarks.media_suite import run_media_benchmarks
+        return await run_media_benchmarks(
+            repeat=args.repeat,
+            duration=args.duration,
+            resolution=args.resolution,
+            steps=args.steps,
+            only=args.only
+        )
+    if args.suite == 'startup':
+        from playwright_simple.core.performance.benchmarks.startup_suite import run_startup_benchmarks
+        return run_startup_benchmarks(repeat=args.repeat, only=args.only)
+    from playwright_simple.core.performance.benchmarks.browser_suite import run_browser_benchmarks
+    return await run_browser_benchmarks(repeat=args.repeat, headless=args.headless, only=args.only)
+
+
+async def run_benchmarks(args: argparse.Namespace) -> int:
+    """
+    Run benchmarks and compare them with the baseline.
+    
+    Returns:
+        Exit code: 1 if a metric regressed, 0 otherwise
+    """
+    print(f"⏱️  Rodando benchmarks '{args.suite}' ({args.repeat} amostra(s) por métrica)...")
+    try:
+        results = await _run_suite(args)
+    except RuntimeError as e:
+        print(f"❌ Benchmark falhou: {e}")
+        return 1
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+    
+    print(format_results(results, baseline))
+    
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(
+            json.dumps({result.name: result.to_dict() for result in results}, indent=2),
+            encoding='utf-8'
+        )
+        print(f"💾 Resultados salvos em: {output}")
+    
+    if args.update_baseline:
+        save_baseline(results, baseline_path)
+        print(f"📌 Baseline atualizada: {baseline_path}")
+        return 0
+    
+    if not baseline:
+        print(f"⚠️  Baseline não encontrada em {baseline_path} (use --update-baseline para criar)")
+        return 0
+    
+    regressions = compare_to_baseline(results, baseline, threshold=args.threshold)
+    if regressions:
+        print(f"❌ {len(regressions)} métrica(s) pioraram mais que {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+    
+    print("✅ Nenhuma regressão em relação à baseline")
+    return 0
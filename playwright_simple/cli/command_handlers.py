@@ -7,8 +7,10 @@ Handles execution of command commands (find, click, type, submit, etc.)
 that interact with an active recording session.
 """
 
+import json
 import sys
-from playwright_simple.core.recorder.command_server import send_command
+from pathlib import Path
+from playwright_simple.core.recorder.command_server import send_command, send_batch
 
 
 def handle_command_commands(args) -> None:
@@ -63,6 +65,8 @@ def handle_command_commands(args) -> None:
         _handle_video_subtitles(args)
     elif args.command == 'video-audio':
         _handle_video_audio(args)
+    elif args.command == 'batch':
+        _handle_batch(args)
 
 
 def _handle_find(args):
@@ -92,12 +96,13 @@ def _handle_find(args):
 
 def _handle_click(args):
     """Handle click command."""
+    # Structured args: the server builds the ClickAction without re-parsing a string
     if args.selector:
-        cmd_args = f'selector {args.selector}'
+        cmd_args = {'selector': args.selector}
     elif args.role:
-        cmd_args = f'role {args.role} [{args.index}]'
+        cmd_args = {'role': args.role, 'index': args.index}
     elif args.text:
-        cmd_args = args.text
+        cmd_args = {'text': args.text}
     else:
         print("❌ Especifique --selector, --role ou texto")
         sys.exit(1)
@@ -117,9 +122,9 @@ def _handle_type(args):
         sys.exit(1)
     
     if args.selector:
-        cmd_args = f'{args.text} into selector {args.selector}'
+        cmd_args = {'text': args.text, 'selector': args.selector}
     else:
-        cmd_args = f'{args.text} into {args.into}'
+        cmd_args = {'text': args.text, 'into': args.into}
     
     result = send_command('type', cmd_args)
     if result.get('success') and result.get('result', {}).get('success'):
@@ -132,7 +137,7 @@ def _handle_type(args):
 def _handle_submit(args):
     """Handle submit command."""
     button_text = args.button_text if args.button_text else ''
-    result = send_command('submit', button_text)
+    result = send_command('submit', {'button_text': button_text or None})
     if result.get('success') and result.get('result', {}).get('success'):
         if button_text:
             print(f"✅ Formulário submetido (botão: '{button_text}')")
@@ -431,3 +436,41 @@ def _handle_video_audio(args):
         print(f"❌ Erro: {result.get('error', 'Unknown error')}")
         sys.exit(1)
 
+
+def _handle_batch(args):
+    """Handle batch command."""
+    try:
+        content = sys.stdin.read() if args.file == '-' else Path(args.file).read_text(encoding='utf-8')
+    except OSError as e:
+        print(f"❌ Erro ao ler arquivo: {e}")
+        sys.exit(1)
+    
+    if content.lstrip().startswith('['):
+        try:
+            commands = json.loads(content)
+        except json.JSONDecodeError as e:
+            print(f"❌ JSON inválido no arquivo de comandos: {e}")
+            sys.exit(1)
+    else:
+        commands = [
+            line.strip() for line in content.splitlines()
+            if line.strip() and not line.strip().startswith('#')
+        ]
+    
+    result = send_batch(commands, timeout=args.timeout, stop_on_error=not args.continue_on_error)
+    if not result.get('success'):
+        print(f"❌ Erro: {result.get('error', 'Unknown error')}")
+        sys.exit(1)
+    
+    batch = result.get('result', {})
+    for index, item in enumerate(batch.get('results', [])):
+        item_result = item.get('result') if isinstance(item.get('result'), dict) else {}
+        error = item.get('error') or item_result.get('error')
+        if error or item_result.get('success') is False or not item.get('success'):
+            print(f"❌ [{index + 1}] {item.get('command')}: {error or 'falhou'}")
+        else:
+            print(f"✅ [{index + 1}] {item.get('command')}")
+    
+    print(f"{batch.get('completed', 0)}/{batch.get('total', 0)} comandos executados")
+    if not batch.get('success'):
+        sys.exit(1)
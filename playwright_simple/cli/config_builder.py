@@ -71,6 +71,12 @@ def create_config_from_args(args: argparse.Namespace) -> TestConfig:
         setattr(config.step, 'speed_level', SpeedLevel.FAST)
         config.step.fast_mode = True
     
+    if getattr(args, 'typing_mode', None):
+        config.step.typing_mode = args.typing_mode
+    
+    if getattr(args, 'execution_profile', None):
+        config.step.execution_profile = args.execution_profile
+    
     # Video
     if args.video:
         config.video.enabled = True
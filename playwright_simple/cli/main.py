@@ -4,6 +4,10 @@
 Main CLI Entry Point.
 
 Coordinates command execution and delegates to appropriate handlers.
+
+Handlers are imported inside their branch: session commands (find, click,
+...) only talk to a running recorder and must not pay for loading
+Playwright, the runner or the extensions.
 """
 
 import asyncio
@@ -11,10 +15,6 @@ import sys
 import argparse
 
 from .parser import create_parser
-from .config_builder import create_config_from_args
-from .run_handlers import run_test
-from .record_handlers import record_interactions
-from .command_handlers import handle_command_commands
 
 
 def main():
@@ -27,12 +27,17 @@ def main():
         sys.exit(1)
     
     if args.command == 'run':
+        from .config_builder import create_config_from_args
+        from .run_handlers import run_test
+        
         # Create config
         config = create_config_from_args(args)
         
         # Run test
         asyncio.run(run_test(args.yaml_file, config, args))
     elif args.command == 'record':
+        from .record_handlers import record_interactions
+        
         # Record interactions
         asyncio.run(record_interactions(
             output_path=args.output,
@@ -40,15 +45,22 @@ def main():
             headless=args.headless,
             debug=args.debug
         ))
+    elif args.command == 'benchmark':
+        from .benchmark_handlers import run_benchmarks
+        
+        # Exit code 1 when a metric regressed
+        sys.exit(asyncio.run(run_benchmarks(args)))
     # Command commands - send to active recording session
     command_commands = [
         'find', 'click', 'type', 'submit', 'wait', 'info', 'html',
         'save', 'exit', 'pause', 'resume', 'start',
         'caption', 'subtitle', 'audio', 'audio-step', 'screenshot',
         'video-enable', 'video-disable', 'video-quality', 'video-codec',
-        'video-dir', 'video-speed', 'video-subtitles', 'video-audio'
+        'video-dir', 'video-speed', 'video-subtitles', 'video-audio',
+        'batch'
     ]
     if args.command in command_commands:
+        from .command_handlers import handle_command_commands
         handle_command_commands(args)
     else:
         parser.print_help()
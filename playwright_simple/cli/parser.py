@@ -40,6 +40,15 @@ Exemplos:
 
   # Executar com configuração de arquivo
   playwright-simple run test.yaml --config config.yaml
+
+  # Rodar benchmarks offline e comparar com a baseline
+  playwright-simple benchmark browser --baseline benchmarks/baseline.json
+
+  # Medir o pós-processamento de vídeo/áudio com entradas sintéticas
+  playwright-simple benchmark media --duration 30 --resolution 1920x1080
+
+  # Medir o tempo de inicialização da CLI
+  playwright-simple benchmark startup
         """
     )
     
@@ -54,6 +63,9 @@ Exemplos:
     record_parser = subparsers.add_parser('record', help='Gravar interações e gerar YAML')
     record_parser.add_argument('output', type=str, help='Arquivo YAML de saída')
     
+    # Benchmark command
+    _add_benchmark_parser(subparsers)
+    
     # Command commands (for controlling active recording)
     _add_command_parsers(subparsers)
     
@@ -100,6 +112,84 @@ Exemplos:
     return parser
 
 
+def _add_benchmark_parser(subparsers):
+    """Add benchmark subcommand."""
+    benchmark_parser = subparsers.add_parser(
+        'benchmark',
+        help='Executar benchmarks offline (app de fixture local) e comparar com a baseline'
+    )
+    benchmark_parser.add_argument(
+        'suite',
+        nargs='?',
+        choices=['browser', 'media', 'startup'],
+        default='browser',
+        help='Suíte de benchmarks: browser (app de fixture local), media (pós-processamento com ffmpeg) '
+             'ou startup (tempo de inicialização da CLI) (default: browser)'
+    )
+    benchmark_parser.add_argument(
+        '--only',
+        nargs='+',
+        metavar='NOME',
+        help='Rodar apenas estes benchmarks (browser: finder, selectors, stability, event_capture, playback; '
+             'media: concatenate_timed_audio, runner_all_in_one, recorder_processor; '
+             'startup: import_package, click_help, find_help)'
+    )
+    benchmark_parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Amostras por métrica (default: 5)'
+    )
+    benchmark_parser.add_argument(
+        '--baseline',
+        type=str,
+        default='benchmarks/baseline.json',
+        metavar='ARQUIVO',
+        help='Arquivo JSON da baseline (default: benchmarks/baseline.json)'
+    )
+    benchmark_parser.add_argument(
+        '--update-baseline',
+        action='store_true',
+        help='Gravar os resultados como nova baseline em vez de comparar'
+    )
+    benchmark_parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.25,
+        help='Piora relativa tolerada antes de falhar (default: 0.25 = 25%%)'
+    )
+    benchmark_parser.add_argument(
+        '--output',
+        type=str,
+        metavar='ARQUIVO',
+        help='Salvar resultados em JSON'
+    )
+    benchmark_parser.add_argument(
+        '--no-headless',
+        action='store_false',
+        dest='headless',
+        help='Mostrar o browser durante os benchmarks'
+    )
+    benchmark_parser.add_argument(
+        '--duration',
+        type=float,
+        default=10.0,
+        help='media: duração do vídeo sintético em segundos (default: 10)'
+    )
+    benchmark_parser.add_argument(
+        '--resolution',
+        type=str,
+        default='1280x720',
+        help='media: resolução do vídeo sintético WIDTHxHEIGHT (default: 1280x720)'
+    )
+    benchmark_parser.add_argument(
+        '--steps',
+        type=int,
+        default=8,
+        help='media: número de passos narrados na linha do tempo sintética (default: 8)'
+    )
+
+
 def _add_command_parsers(subparsers):
     """Add parsers for command commands (find, click, type, etc.)."""
     command_parser = subparsers.add_parser('find', help='Encontrar elemento em gravação ativa')
@@ -182,6 +272,12 @@ def _add_command_parsers(subparsers):
     
     video_audio_parser = subparsers.add_parser('video-audio', help='Habilitar/desabilitar áudio no YAML')
     video_audio_parser.add_argument('enabled', choices=['true', 'false', 'enable', 'disable'], help='Habilitar ou desabilitar áudio')
+    
+    # Pipelined commands
+    batch_parser = subparsers.add_parser('batch', help='Executar vários comandos em uma única requisição')
+    batch_parser.add_argument('file', type=str, help='Arquivo com um comando por linha (ou lista JSON); "-" para stdin')
+    batch_parser.add_argument('--continue-on-error', action='store_true', help='Continuar executando após um comando falhar')
+    batch_parser.add_argument('--timeout', type=int, default=60, help='Timeout total em segundos')
 
 
 def _add_logging_options(parser):
@@ -249,6 +345,29 @@ def _add_browser_options(run_parser):
         choices=['slow', 'normal', 'fast', 'ultra_fast'],
         help='Nível de velocidade: slow (1.0x), normal (1.0x), fast (0.1x), ultra_fast (0.05x)'
     )
+    browser_group.add_argument(
+        '--typing-mode',
+        choices=['auto', 'instant', 'chunked', 'realistic'],
+        help='Modo de digitação: auto (caractere a caractere só com vídeo), instant (fill + eventos), chunked (blocos), realistic (caractere a caractere)'
+    )
+    browser_group.add_argument(
+        '--profile',
+        choices=['default', 'headless'],
+        dest='execution_profile',
+        help='Perfil de execução: headless desativa cursor, efeitos, animações e persistência de posição (CI sem vídeo)'
+    )
+    browser_group.add_argument(
+        '--trace',
+        type=str,
+        metavar='ARQUIVO',
+        help='Salvar spans de execução (suite/teste/passo/fase) em JSON Chrome trace (abrir em chrome://tracing ou ui.perfetto.dev)'
+    )
+    browser_group.add_argument(
+        '--step-report',
+        type=str,
+        metavar='ARQUIVO',
+        help='Salvar tempo por passo e por fase (espera de DOM, localização, cursor, ação, estabilidade, áudio, log) em JSON e mostrar os passos mais lentos'
+    )
 
 
 def _add_video_options(run_parser):
@@ -14,6 +14,7 @@ import argparse
 from playwright_simple.core.recorder.recorder import Recorder
 from playwright_simple.core.recorder.config import RecorderConfig, SpeedLevel
 from playwright_simple.core.logger import get_logger
+from playwright_simple.core.performance import get_profiler, get_suite_timing_report
 
 
 async def run_test(yaml_file: str, config, args: argparse.Namespace) -> None:
@@ -39,9 +40,12 @@ async def run_test(yaml_file: str, config, args: argparse.Namespace) -> None:
             fast_mode = True
             speed_level = SpeedLevel.FAST
     
+    typing_mode = getattr(getattr(config, 'step', None), 'typing_mode', 'auto') or 'auto'
+    execution_profile = getattr(getattr(config, 'step', None), 'execution_profile', 'default') or 'default'
+    
     # Use Recorder in read mode (SAME class as recording, just different mode)
-    # Use RecorderConfig if speed_level is available, otherwise use legacy parameters
-    if speed_level:
+    # Use RecorderConfig if speed_level, typing_mode or profile is set, otherwise use legacy parameters
+    if speed_level or typing_mode != 'auto' or execution_profile != 'default':
         recorder_config = RecorderConfig.from_kwargs(
             output_path=yaml_path,
             initial_url=None,  # Will be read from YAML
@@ -49,7 +53,9 @@ async def run_test(yaml_file: str, config, args: argparse.Namespace) -> None:
             debug=args.debug if hasattr(args, 'debug') else False,
             fast_mode=fast_mode,
             speed_level=speed_level,
-            mode='read'
+            mode='read',
+            typing_mode=typing_mode,
+            execution_profile=execution_profile
         )
         recorder = Recorder(config=recorder_config)
     else:
@@ -62,12 +68,29 @@ async def run_test(yaml_file: str, config, args: argparse.Namespace) -> None:
             mode='read'  # Read mode: import YAML instead of export
         )
     
+    # Record suite/test/step/phase spans if a trace file was requested
+    trace_path = getattr(args, 'trace', None)
+    profiler = get_profiler()
+    if trace_path:
+        profiler.trace = True
+    
     # Start recorder (SAME method as recording, but executes YAML steps)
     try:
-        await recorder.start()
+        with profiler.span('suite', category='suite', file=str(yaml_path)):
+            await recorder.start()
         print("✅ Teste passou!")
     except Exception as e:
         logger.error(f"Erro ao executar teste: {e}", exc_info=True)
         print(f"❌ Erro ao executar teste: {e}")
         sys.exit(1)
+    finally:
+        if trace_path:
+            profiler.export_chrome_trace(Path(trace_path))
+            print(f"📊 Trace salvo em: {trace_path}")
+        step_report_path = getattr(args, 'step_report', None)
+        if step_report_path:
+            timing_report = get_suite_timing_report()
+            print(timing_report.format_table())
+            timing_report.save_json(Path(step_report_path))
+            print(f"⏱️  Relatório de tempo por passo salvo em: {step_report_path}")
 
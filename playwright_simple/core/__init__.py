@@ -6,57 +6,70 @@ Core modules for playwright-simple.
 This package contains the core functionality of playwright-simple.
 """
 
-from .config import TestConfig
-# Lazy imports to avoid circular dependencies
-try:
-    from .base import SimpleTestBase
-except (ImportError, SyntaxError) as e:
-    SimpleTestBase = None  # type: ignore
-try:
-    from .runner import TestRunner
-except (ImportError, SyntaxError) as e:
-    TestRunner = None  # type: ignore
-from .logging_config import FrameworkLogger, log_action, log_mouse_action, log_keyboard_action, log_cursor_action, log_element_action, log_error
-from .cursor import CursorManager
-from .screenshot import ScreenshotManager
-from .selectors import SelectorManager
+import importlib
+from importlib.util import find_spec
+
+# Public names are resolved on first access (PEP 562): importing one core
+# module (e.g. recorder.command_server from the CLI) does not load the
+# runner, Playwright and every helper with it.
+_LAZY = {
+    "TestConfig": ".config",
+    "SimpleTestBase": ".base",
+    "TestRunner": ".runner",
+    "FrameworkLogger": ".logging_config",
+    "log_action": ".logging_config",
+    "log_mouse_action": ".logging_config",
+    "log_keyboard_action": ".logging_config",
+    "log_cursor_action": ".logging_config",
+    "log_element_action": ".logging_config",
+    "log_error": ".logging_config",
+    "CursorManager": ".cursor",
+    "ScreenshotManager": ".screenshot",
+    "SelectorManager": ".selectors",
+    # Optional HTMX helper (for apps using HTMX)
+    "HTMXHelper": ".htmx",
+    "PlaywrightSimpleError": ".exceptions",
+    "ElementNotFoundError": ".exceptions",
+    "NavigationError": ".exceptions",
+    "ConfigurationError": ".exceptions",
+}
+# Resolve to None instead of raising if they cannot be imported (circular imports)
+_OPTIONAL = {"SimpleTestBase", "TestRunner"}
 # YAMLParser removed - use Recorder for playback or parse_yaml_file from yaml_resolver for parsing
 # VideoManager and TTSManager moved to extensions
-from .exceptions import (
-    PlaywrightSimpleError,
-    ElementNotFoundError,
-    NavigationError,
-    ConfigurationError,
-)
 # VideoProcessingError and TTSGenerationError moved to extensions
 
-# Optional HTMX helper (for apps using HTMX)
-try:
-    from .htmx import HTMXHelper
-    __all__ = [
-        "TestConfig",
-        "SimpleTestBase",
-        "TestRunner",
-        "CursorManager",
-        "ScreenshotManager",
-        "SelectorManager",
-        "HTMXHelper",
-        "PlaywrightSimpleError",
-        "ElementNotFoundError",
-        "NavigationError",
-        "ConfigurationError",
-    ]
-except ImportError:
-    __all__ = [
-        "TestConfig",
-        "SimpleTestBase",
-        "TestRunner",
-        "CursorManager",
-        "ScreenshotManager",
-        "SelectorManager",
-        "PlaywrightSimpleError",
-        "ElementNotFoundError",
-        "NavigationError",
-        "ConfigurationError",
-    ]
+__all__ = [
+    "TestConfig",
+    "SimpleTestBase",
+    "TestRunner",
+    "CursorManager",
+    "ScreenshotManager",
+    "SelectorManager",
+    "HTMXHelper",
+    "PlaywrightSimpleError",
+    "ElementNotFoundError",
+    "NavigationError",
+    "ConfigurationError",
+]
+
+
+def __getattr__(name):
+    """Import public names and submodules on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        if name.startswith('_') or find_spec(f"{__name__}.{name}") is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        return importlib.import_module(f"{__name__}.{name}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except (ImportError, SyntaxError):
+        if name not in _OPTIONAL:
+            raise
+        value = None
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
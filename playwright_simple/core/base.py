@@ -16,6 +16,7 @@ from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeou
 from .config import TestConfig
 from .screenshot import ScreenshotManager
 from .selectors import SelectorManager
+from .selector_memo import get_selector_memo
 from .session import SessionManager
 from .helpers import TestBaseHelpers
 from ..extensions import ExtensionRegistry, Extension
@@ -45,6 +46,7 @@ def _get_cursor_controller_class():
             CursorController = None
             CURSOR_CONTROLLER_AVAILABLE = False
     return CursorController
+from .execution_profile import get_round_trip_savings, visual_enabled
 from .exceptions import (
     ElementNotFoundError,
     NavigationError,
@@ -132,7 +134,12 @@ class SimpleTestBase(
         # Initialize managers with Dependency Injection
         # CursorController is the single source of truth for cursor visualization
         self.screenshot_manager = screenshot_manager or ScreenshotManager(page, self.config.screenshots, test_name)
-        self.selector_manager = selector_manager or SelectorManager(page, self.config.browser.timeout)
+        self.selector_manager = selector_manager or SelectorManager(
+            page,
+            self.config.browser.timeout,
+            memo=get_selector_memo(self.config.step.selector_memo_file) if self.config.step.selector_memo else None,
+            test_name=self.test_name
+        )
         self.session_manager = session_manager or SessionManager()
         
         # Initialize CursorController for action execution (lazy initialization)
@@ -183,7 +190,10 @@ class SimpleTestBase(
             return None
         
         if self._cursor_controller is None:
-            self._cursor_controller = CursorControllerClass(self.page)
+            self._cursor_controller = CursorControllerClass(
+                self.page,
+                visual=visual_enabled(self.config)
+            )
             # Start cursor controller (but don't show cursor by default in tests)
             # The cursor will be shown when actions are executed
             # IMPORTANT: CursorController will remove any existing cursor (from CursorManager)
@@ -270,7 +280,12 @@ class SimpleTestBase(
         # Hover effect is disabled - skip it completely
         # Show click effect(s) only
         if show_click_effect:
+            savings = get_round_trip_savings(self.page)
             for _ in range(click_count):
+                if savings is not None:
+                    # Headless profile: no click effect to wait for
+                    savings.skip('effects', round_trips=0, sleep=CURSOR_CLICK_EFFECT_DELAY)
+                    continue
                 # CursorController will handle click effects when actions are executed
                 # No need to use CursorManager
                 await asyncio.sleep(CURSOR_CLICK_EFFECT_DELAY)
@@ -307,6 +322,7 @@ class SimpleTestBase(
         """
         self.test_name = test_name
         self.screenshot_manager.set_test_name(test_name)
+        self.selector_manager.set_test_name(test_name)
     
     # ==================== Session Methods ====================
     
@@ -106,6 +106,8 @@ class BrowserConfig:
     viewport: Dict[str, int] = field(default_factory=lambda: {"width": 1920, "height": 1080})
     wait_for_load: str = "load"  # load, domcontentloaded, networkidle - how to wait after each action
     wait_timeout: int = 10000  # Timeout for wait_for_load_state in milliseconds
+    memory_profile: bool = False  # tracemalloc snapshot after each test, with the top growing allocation sites
+    memory_budget_mb: Optional[float] = None  # Soft browser RSS budget: relaunch the browser between tests when exceeded
 
 
 @dataclass
@@ -113,6 +115,10 @@ class StepConfig:
     """Configuration for step execution."""
     static_min_duration: float = 3.0  # Minimum duration in seconds for static steps
     fast_mode: bool = False  # If True, ignores delays in static steps (for fast debugging)
+    selector_memo: bool = False  # Remember which selector strategy resolved each target across runs (opt-in)
+    selector_memo_file: str = ".selector_memo.json"  # Memo file (relative to the current directory)
+    typing_mode: str = "auto"  # auto (char by char only when recording video), instant, chunked, realistic
+    execution_profile: str = "default"  # default, or headless (no cursor, effects, animations or position persistence)
     
 @dataclass
 class TestConfig:
@@ -203,10 +209,12 @@ class TestConfig:
         cursor_data = data.get('cursor', {})
         screenshots_data = data.get('screenshots', {})
         browser_data = data.get('browser', {})
+        step_data = data.get('step', {})
         
         # Create sub-configs
         cursor = CursorConfig(**cursor_data)
         screenshots = ScreenshotConfig(**screenshots_data)
+        step = StepConfig(**step_data)
         
         # Ensure viewport is in browser_data
         if 'viewport' not in browser_data:
@@ -234,6 +242,7 @@ class TestConfig:
             video.narration_lang = video_data.get('narration_lang', 'pt-BR')
             video.narration_engine = video_data.get('narration_engine', 'gtts')
             video.narration_slow = video_data.get('narration_slow', False)
+            video.cursor_overlay = video_data.get('cursor_overlay', False)
             video.audio_file = video_data.get('audio_file')
             video.audio_lang = video_data.get('audio_lang', 'pt-BR')
             video.audio_engine = video_data.get('audio_engine', 'gtts')
@@ -257,6 +266,7 @@ class TestConfig:
             video.narration_lang = video_data.get('narration_lang', 'pt-BR')
             video.narration_engine = video_data.get('narration_engine', 'gtts')
             video.narration_slow = video_data.get('narration_slow', False)
+            video.cursor_overlay = video_data.get('cursor_overlay', False)
         
         return cls(
             base_url=base_url,
@@ -264,6 +274,7 @@ class TestConfig:
             video=video,
             screenshots=screenshots,
             browser=browser,
+            step=step,
         )
     
     @classmethod
@@ -279,6 +290,8 @@ class TestConfig:
             PLAYWRIGHT_SIMPLE_VIDEO_QUALITY
             PLAYWRIGHT_SIMPLE_SCREENSHOTS_AUTO
             PLAYWRIGHT_SIMPLE_HEADLESS
+            PLAYWRIGHT_SIMPLE_MEMORY_PROFILE
+            PLAYWRIGHT_SIMPLE_MEMORY_BUDGET_MB
             etc.
         
         Returns:
@@ -321,6 +334,10 @@ class TestConfig:
             browser_dict['headless'] = headless.lower() in ('true', '1', 'yes')
         if timeout := os.getenv('PLAYWRIGHT_SIMPLE_TIMEOUT'):
             browser_dict['timeout'] = int(timeout)
+        if memory_profile := os.getenv('PLAYWRIGHT_SIMPLE_MEMORY_PROFILE'):
+            browser_dict['memory_profile'] = memory_profile.lower() in ('true', '1', 'yes')
+        if memory_budget := os.getenv('PLAYWRIGHT_SIMPLE_MEMORY_BUDGET_MB'):
+            browser_dict['memory_budget_mb'] = float(memory_budget)
         
         if browser_dict:
             config_dict['browser'] = browser_dict
@@ -448,6 +465,9 @@ class TestConfig:
         
         if 'width' not in self.browser.viewport or 'height' not in self.browser.viewport:
             raise ValueError("browser.viewport must have 'width' and 'height'")
+        
+        if self.browser.memory_budget_mb is not None and self.browser.memory_budget_mb <= 0:
+            raise ValueError("browser.memory_budget_mb must be > 0")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
@@ -30,6 +30,9 @@ HOVER_EFFECT_Z_INDEX = 2147483645
 DEFAULT_VIEWPORT_WIDTH = 1920
 DEFAULT_VIEWPORT_HEIGHT = 1080
 
+# Console messages kept per test (oldest dropped first)
+CONSOLE_MESSAGES_LIMIT = 500
+
 # Video processing
 FFMPEG_TIMEOUT = 300  # seconds
 FFMPEG_VERSION_CHECK_TIMEOUT = 5  # seconds
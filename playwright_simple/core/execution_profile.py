@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Execution profiles for playwright-simple.
+
+The ``default`` profile drives the visual layer (cursor overlay, hover/click
+effects, movement animations, cursor position persisted in sessionStorage)
+so recordings look natural. The ``headless`` profile turns that layer off end
+to end for CI runs without video; RoundTripSavings tallies, per step, the
+page round trips and sleeps that were skipped.
+"""
+
+import logging
+import weakref
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionProfile(str, Enum):
+    """Execution profile (visual layer on or off)."""
+    DEFAULT = "default"    # cursor, effects and animations (for video)
+    HEADLESS = "headless"  # no visual layer at all
+
+    @classmethod
+    def parse(cls, value: Union[str, 'ExecutionProfile', None]) -> 'ExecutionProfile':
+        """
+        Get ExecutionProfile from a string (case-insensitive) or None (DEFAULT).
+
+        Raises:
+            ValueError: If value is not a known profile
+        """
+        if value is None or value == '':
+            return cls.DEFAULT
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(str(value).lower())
+        except ValueError:
+            valid = ', '.join(profile.value for profile in cls)
+            raise ValueError(f"Invalid execution profile: {value!r} (valid: {valid})")
+
+    @property
+    def visual(self) -> bool:
+        """Whether the visual layer (cursor, effects, animations) is enabled."""
+        return self != ExecutionProfile.HEADLESS
+
+
+def visual_enabled(config: Any) -> bool:
+    """
+    Check whether a TestConfig runs with the visual layer.
+
+    Args:
+        config: TestConfig (reads ``step.execution_profile``)
+
+    Returns:
+        False for the headless profile, True otherwise
+    """
+    profile = getattr(getattr(config, 'step', None), 'execution_profile', None)
+    return ExecutionProfile.parse(profile).visual
+
+
+# Savings tracker per page (shared by the cursor controller and the step executor)
+_savings: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def get_round_trip_savings(page) -> Optional['RoundTripSavings']:
+    """
+    Get the savings tracker attached to a page.
+
+    Args:
+        page: Playwright page object
+
+    Returns:
+        RoundTripSavings or None if the page runs with the visual layer
+    """
+    try:
+        return _savings.get(page)
+    except TypeError:
+        return None
+
+
+class RoundTripSavings:
+    """
+    Per-step tally of what the headless profile skipped.
+
+    Each skip is recorded under the current step with a kind (``cursor_init``,
+    ``position``, ``animation``, ``effects``), the number of page round trips
+    avoided and the seconds of sleep avoided.
+
+    Attributes:
+        steps: One entry per step: {'step', 'round_trips', 'sleep', 'by_kind'}
+    """
+
+    SETUP_STEP = "setup"
+
+    def __init__(self, page=None) -> None:
+        """
+        Initialize savings tracker.
+
+        Args:
+            page: Optional page to attach to (see get_round_trip_savings)
+        """
+        self.steps: List[Dict[str, Any]] = []
+        self._current: Optional[Dict[str, Any]] = None
+        if page is not None:
+            try:
+                _savings[page] = self
+            except TypeError:
+                logger.debug("Page does not support weak references; savings not shared")
+
+    def start_step(self, name: str) -> None:
+        """Start accounting for a new step."""
+        self._current = {'step': name, 'round_trips': 0, 'sleep': 0.0, 'by_kind': {}}
+        self.steps.append(self._current)
+
+    def skip(self, kind: str, round_trips: int = 1, sleep: float = 0.0) -> None:
+        """
+        Record work skipped because the visual layer is off.
+
+        Args:
+            kind: What was skipped (cursor_init, position, animation, effects)
+            round_trips: Page round trips avoided
+            sleep: Seconds of sleep avoided
+        """
+        if self._current is None:
+            self.start_step(self.SETUP_STEP)
+        current = self._current
+        current['round_trips'] += round_trips
+        current['sleep'] += sleep
+        by_kind = current['by_kind'].setdefault(kind, {'round_trips': 0, 'sleep': 0.0})
+        by_kind['round_trips'] += round_trips
+        by_kind['sleep'] += sleep
+
+    @property
+    def total_round_trips(self) -> int:
+        """Round trips avoided over all steps."""
+        return sum(step['round_trips'] for step in self.steps)
+
+    @property
+    def total_sleep(self) -> float:
+        """Seconds of sleep avoided over all steps."""
+        return sum(step['sleep'] for step in self.steps)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Get savings report.
+
+        Returns:
+            Dictionary with 'steps', 'total_round_trips' and 'total_sleep'
+        """
+        return {
+            'steps': [
+                {
+                    'step': step['step'],
+                    'round_trips': step['round_trips'],
+                    'sleep': round(step['sleep'], 3),
+                    'by_kind': {
+                        kind: {'round_trips': counts['round_trips'], 'sleep': round(counts['sleep'], 3)}
+                        for kind, counts in step['by_kind'].items()
+                    },
+                }
+                for step in self.steps
+            ],
+            'total_round_trips': self.total_round_trips,
+            'total_sleep': round(self.total_sleep, 3),
+        }
+
+    def format_report(self) -> str:
+        """Format savings as a text table (one line per step plus total)."""
+        width = max([len(step['step']) for step in self.steps] + [len('TOTAL'), len('Step')])
+        lines = [f"{'Step':<{width}}  {'Round trips':>11}  {'Sleep (s)':>9}"]
+        for step in self.steps:
+            lines.append(f"{step['step']:<{width}}  {step['round_trips']:>11}  {step['sleep']:>9.2f}")
+        lines.append(f"{'TOTAL':<{width}}  {self.total_round_trips:>11}  {self.total_sleep:>9.2f}")
+        return "\n".join(lines)
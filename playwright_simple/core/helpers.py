@@ -13,6 +13,8 @@ from playwright.async_api import Page, Locator
 
 # CursorManager removed - using CursorController instead
 from .config import TestConfig
+from .execution_profile import get_round_trip_savings
+from .state import capture_page_snapshot
 from .constants import (
     CURSOR_HOVER_DELAY,
     CURSOR_CLICK_EFFECT_DELAY,
@@ -144,8 +146,8 @@ class TestBaseHelpers:
         """
         Detect changes in page state after an action.
         
-        Captures current page state (URL, title) and compares with previous state
-        to detect if page changed after an action.
+        Captures current page state (URL, title, DOM hash) in one round trip
+        and compares with previous state to detect if page changed after an action.
         
         Args:
             state_before: Optional previous state to compare against
@@ -154,18 +156,27 @@ class TestBaseHelpers:
             Dictionary with current state and change detection:
             - url: Current page URL
             - title: Current page title
+            - html_hash: Structural hash of the DOM
             - url_changed: Whether URL changed (if state_before provided)
+            - html_changed: Whether the DOM changed (if state_before provided)
             - state_changed: Whether any state changed (if state_before provided)
         """
         state = {}
         try:
             state['url'] = self.page.url
-            state['title'] = await self.page.title()
+            snapshot = await capture_page_snapshot(self.page, count_visible=False)
+            state['title'] = snapshot['title']
+            state['html_hash'] = snapshot['dom_hash']
             
             if state_before:
                 state['url_changed'] = state_before.get('url') != state['url']
+                state['html_changed'] = (
+                    state_before.get('html_hash') is not None and
+                    state_before['html_hash'] != state['html_hash']
+                )
                 state['state_changed'] = (
                     state['url_changed'] or
+                    state['html_changed'] or
                     state_before.get('title') != state['title']
                 )
         except Exception as e:
@@ -205,7 +216,12 @@ class TestBaseHelpers:
         # Hover effect is disabled - skip it completely
         # Show click effect(s) only
         if show_click_effect:
+            savings = get_round_trip_savings(self.page)
             for _ in range(click_count):
+                if savings is not None:
+                    # Headless profile: no click effect to wait for
+                    savings.skip('effects', round_trips=0, sleep=CURSOR_CLICK_EFFECT_DELAY)
+                    continue
                 # CursorController will handle click effects when actions are executed
                 # No need to use CursorManager
                 await asyncio.sleep(CURSOR_CLICK_EFFECT_DELAY)
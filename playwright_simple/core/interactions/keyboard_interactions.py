@@ -17,6 +17,7 @@ from ..constants import (
     TYPE_CHAR_DELAY,
 )
 from ..logger import get_logger
+from ..typing_modes import TypingMode, resolve_typing_mode, type_fast
 
 logger = logging.getLogger(__name__)
 structured_logger = get_logger()
@@ -25,7 +26,21 @@ structured_logger = get_logger()
 class KeyboardInteractionMixin(BaseInteractionMixin):
     """Mixin providing keyboard-related interaction methods."""
     
-    async def type(self, text: str, selector: Optional[str] = None, description: str = "") -> 'KeyboardInteractionMixin':
+    def _typing_mode(self, mode: Optional[str] = None) -> TypingMode:
+        """Get effective typing mode (explicit, then config.step.typing_mode; auto depends on video)."""
+        config = getattr(self, 'config', None)
+        if mode is None:
+            mode = getattr(getattr(config, 'step', None), 'typing_mode', TypingMode.AUTO)
+        recording_video = bool(getattr(getattr(config, 'video', None), 'enabled', False))
+        return resolve_typing_mode(mode, recording_video)
+    
+    async def type(
+        self,
+        text: str,
+        selector: Optional[str] = None,
+        description: str = "",
+        mode: Optional[str] = None
+    ) -> 'KeyboardInteractionMixin':
         """
         Type text into an element using CursorController.
         
@@ -35,7 +50,10 @@ class KeyboardInteractionMixin(BaseInteractionMixin):
             text: Text to type
             selector: Optional selector for the element (if None, uses focused field)
             description: Optional description for logging
+            mode: Typing mode (auto, instant, chunked, realistic; None = config.step.typing_mode)
         """
+        typing_mode = self._typing_mode(mode)
+        
         # Get CursorController from test base
         cursor_controller = None
         if hasattr(self, '_get_cursor_controller'):
@@ -72,8 +90,17 @@ class KeyboardInteractionMixin(BaseInteractionMixin):
                     action="type", selector=selector, description=description
                 )
                 
-                await element.fill('')  # Clear first
-                await element.type(text, delay=TYPE_CHAR_DELAY)
+                if typing_mode == TypingMode.INSTANT:
+                    # fill() fires input; change is what onchange handlers listen to
+                    await element.fill(text)
+                    await element.dispatch_event('change')
+                elif typing_mode == TypingMode.CHUNKED:
+                    await element.fill('')  # Clear first
+                    await element.focus()
+                    await type_fast(self.page, text, typing_mode)
+                else:
+                    await element.fill('')  # Clear first
+                    await element.type(text, delay=TYPE_CHAR_DELAY)
                 await asyncio.sleep(TYPE_DELAY)
                 
                 structured_logger.action(
@@ -102,7 +129,7 @@ class KeyboardInteractionMixin(BaseInteractionMixin):
             action="type", selector=selector, description=description
         )
         
-        success = await cursor_controller.type_text(text, field_selector)
+        success = await cursor_controller.type_text(text, field_selector, mode=typing_mode)
         
         if not success:
             field = selector or description or 'field'
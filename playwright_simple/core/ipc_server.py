@@ -5,19 +5,42 @@ IPC Server - Comunicação eficiente entre processos usando Unix Domain Sockets.
 
 Usa Unix Domain Sockets para comunicação bidirecional eficiente.
 Alternativa melhor que arquivos JSON para comunicação em tempo real.
+
+Protocolo: cada mensagem é um frame (4 bytes big-endian com o tamanho + JSON).
+Mensagens carregam um campo ``id``; a resposta devolve o mesmo ``id``, o que
+permite vários comandos em andamento na mesma conexão (keep-alive).
 """
 
 import asyncio
 import json
 import logging
 import socket
+import uuid
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable
-from datetime import datetime
+from typing import Optional, Dict, Any, Callable, Set
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_frame(message: Dict[str, Any]) -> bytes:
+    """Serializa mensagem no formato tamanho + JSON."""
+    payload = json.dumps(message).encode('utf-8')
+    return len(payload).to_bytes(4, 'big') + payload
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Lê exatamente ``size`` bytes de um socket bloqueante."""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = sock.recv(remaining)
+        if not chunk:
+            raise ConnectionError("IPC connection closed by server")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
 class IPCServer:
     """Servidor IPC usando Unix Domain Sockets."""
     
@@ -33,13 +56,29 @@ class IPCServer:
         self.message_handler = message_handler
         self.server: Optional[asyncio.Server] = None
         self.running = False
+        # Conexões keep-alive abertas (fechadas em stop())
+        self._client_writers: Set[asyncio.StreamWriter] = set()
+        self._client_tasks: Set[asyncio.Task] = set()
         
         # Limpar socket antigo se existir
         if self.socket_path.exists():
             self.socket_path.unlink()
     
     async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        """Processa mensagens de clientes."""
+        """
+        Processa mensagens de clientes.
+        
+        A conexão é mantida aberta (keep-alive) e cada mensagem é processada
+        em sua própria task, então vários comandos podem estar em andamento ao
+        mesmo tempo. As respostas são escritas na ordem em que terminam e
+        identificadas pelo ``id`` da mensagem original.
+        """
+        write_lock = asyncio.Lock()
+        tasks: Set[asyncio.Task] = set()
+        client_task = asyncio.current_task()
+        self._client_writers.add(writer)
+        self._client_tasks.add(client_task)
+        cancelled = False
         try:
             while True:
                 # Ler mensagem (formato: tamanho + JSON)
@@ -51,27 +90,55 @@ class IPCServer:
                 
                 logger.debug(f"Received message: {message}")
                 
-                # Processar mensagem
-                if self.message_handler:
-                    response = await self.message_handler(message)
-                else:
-                    response = {"status": "ok", "message": "received"}
-                
-                # Enviar resposta
-                response_json = json.dumps(response)
-                response_bytes = response_json.encode('utf-8')
-                writer.write(len(response_bytes).to_bytes(4, 'big'))
-                writer.write(response_bytes)
-                await writer.drain()
+                task = asyncio.create_task(self._dispatch(message, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
                 
         except asyncio.IncompleteReadError:
             # Cliente desconectou
             pass
+        except asyncio.CancelledError:
+            # Servidor parando (stop): descartar comandos em andamento
+            cancelled = True
         except Exception as e:
             logger.error(f"Error handling client: {e}")
         finally:
+            self._client_writers.discard(writer)
+            self._client_tasks.discard(client_task)
+            if cancelled:
+                for task in tasks:
+                    task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
             writer.close()
-            await writer.wait_closed()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+    
+    async def _dispatch(self, message: Dict[str, Any], writer: asyncio.StreamWriter,
+                        write_lock: asyncio.Lock) -> None:
+        """Processa uma mensagem e envia a resposta com o mesmo id."""
+        message_id = message.get('id') if isinstance(message, dict) else None
+        try:
+            if self.message_handler:
+                response = await self.message_handler(message)
+            else:
+                response = {"status": "ok", "message": "received"}
+        except Exception as e:
+            logger.error(f"Error processing IPC message: {e}", exc_info=True)
+            response = {"success": False, "error": str(e)}
+        
+        if isinstance(response, dict) and message_id is not None:
+            response.setdefault('id', message_id)
+        
+        try:
+            # Enviar resposta
+            async with write_lock:
+                writer.write(_encode_frame(response))
+                await writer.drain()
+        except (ConnectionError, RuntimeError) as e:
+            logger.debug(f"Client gone before response {message_id}: {e}")
     
     async def start(self):
         """Inicia servidor."""
@@ -83,10 +150,18 @@ class IPCServer:
         logger.info(f"IPC Server started on {self.socket_path}")
     
     async def stop(self):
-        """Para servidor."""
+        """Para servidor, fechando também as conexões keep-alive abertas."""
         self.running = False
         if self.server:
             self.server.close()
+            # wait_closed() só retorna depois que todos os clientes desconectam
+            for writer in list(self._client_writers):
+                writer.close()
+            client_tasks = list(self._client_tasks)
+            for task in client_tasks:
+                task.cancel()
+            if client_tasks:
+                await asyncio.gather(*client_tasks, return_exceptions=True)
             await self.server.wait_closed()
         if self.socket_path.exists():
             self.socket_path.unlink()
@@ -94,7 +169,13 @@ class IPCServer:
 
 
 class IPCClient:
-    """Cliente IPC para comunicação com servidor."""
+    """
+    Cliente IPC para comunicação com servidor.
+    
+    Mantém uma conexão persistente com o servidor. A API assíncrona suporta
+    várias requisições simultâneas (respostas associadas pelo ``id``); a API
+    síncrona usa um socket bloqueante reaproveitado entre chamadas.
+    """
     
     def __init__(self, socket_path: Path):
         """
@@ -104,11 +185,76 @@ class IPCClient:
             socket_path: Caminho do socket Unix
         """
         self.socket_path = Path(socket_path)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._read_task: Optional[asyncio.Task] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._sync_sock: Optional[socket.socket] = None
+    
+    @property
+    def is_connected(self) -> bool:
+        """Indica se há conexão assíncrona aberta."""
+        return self._writer is not None and not self._writer.is_closing()
+    
+    async def connect(self, timeout: float = 5.0) -> None:
+        """Abre a conexão persistente (se ainda não estiver aberta)."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self.is_connected:
+                return
+            if not self.socket_path.exists():
+                raise ConnectionError(f"Socket not found: {self.socket_path}")
+            try:
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_unix_connection(str(self.socket_path)),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"IPC connection timeout after {timeout}s")
+            except OSError as e:
+                raise ConnectionError(f"IPC communication error: {e}")
+            self._read_task = asyncio.create_task(self._read_responses())
+    
+    async def _read_responses(self) -> None:
+        """Lê respostas e resolve as requisições pendentes pelo id."""
+        error: Exception = ConnectionError("IPC connection closed by server")
+        try:
+            while True:
+                size_bytes = await self._reader.readexactly(4)
+                size = int.from_bytes(size_bytes, 'big')
+                response_bytes = await self._reader.readexactly(size)
+                response = json.loads(response_bytes.decode('utf-8'))
+                
+                future = self._pending.pop(response.get('id'), None)
+                if future and not future.done():
+                    future.set_result(response)
+                else:
+                    logger.debug(f"Discarding IPC response without pending request: {response.get('id')}")
+        except asyncio.IncompleteReadError:
+            pass
+        except asyncio.CancelledError:
+            error = ConnectionError("IPC connection closed")
+        except Exception as e:
+            error = ConnectionError(f"IPC communication error: {e}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+            if self._writer:
+                self._writer.close()
+            self._reader = None
+            self._writer = None
     
     async def send_message(self, message: Dict[str, Any], timeout: float = 5.0) -> Dict[str, Any]:
         """
         Envia mensagem e aguarda resposta.
         
+        Pode ser chamado concorrentemente; cada chamada aguarda apenas a
+        resposta com o seu próprio id.
+        
         Args:
             message: Mensagem a enviar
             timeout: Timeout em segundos
@@ -116,40 +262,102 @@ class IPCClient:
         Returns:
             Resposta do servidor
         """
-        if not self.socket_path.exists():
-            raise ConnectionError(f"Socket not found: {self.socket_path}")
+        await self.connect(timeout=timeout)
+        
+        message = dict(message)
+        message_id = message.setdefault('id', str(uuid.uuid4()))
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
         
         try:
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_unix_connection(str(self.socket_path)),
-                timeout=timeout
-            )
-            
-            try:
-                # Enviar mensagem
-                message_json = json.dumps(message)
-                message_bytes = message_json.encode('utf-8')
-                writer.write(len(message_bytes).to_bytes(4, 'big'))
-                writer.write(message_bytes)
-                await writer.drain()
-                
-                # Ler resposta
-                size_bytes = await asyncio.wait_for(reader.readexactly(4), timeout=timeout)
-                size = int.from_bytes(size_bytes, 'big')
-                
-                response_bytes = await asyncio.wait_for(reader.readexactly(size), timeout=timeout)
-                response = json.loads(response_bytes.decode('utf-8'))
-                
-                return response
-            finally:
-                writer.close()
-                await writer.wait_closed()
+            self._writer.write(_encode_frame(message))
+            await self._writer.drain()
+            return await asyncio.wait_for(future, timeout=timeout)
         except asyncio.TimeoutError:
             raise TimeoutError(f"IPC communication timeout after {timeout}s")
+        except (ConnectionError, TimeoutError):
+            raise
         except Exception as e:
             raise ConnectionError(f"IPC communication error: {e}")
+        finally:
+            self._pending.pop(message_id, None)
+    
+    async def close(self) -> None:
+        """Fecha a conexão assíncrona."""
+        if self._read_task:
+            self._read_task.cancel()
+            try:
+                await self._read_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._read_task = None
+        self.close_sync()
     
     def send_message_sync(self, message: Dict[str, Any], timeout: float = 5.0) -> Dict[str, Any]:
-        """Versão síncrona de send_message."""
-        return asyncio.run(self.send_message(message, timeout))
-
+        """
+        Versão síncrona de send_message.
+        
+        Reaproveita o mesmo socket entre chamadas. Reenvia uma vez apenas
+        quando o servidor não pode ter executado o comando: o envio falhou,
+        ou a conexão ociosa reaproveitada já estava fechada (EOF antes de
+        qualquer resposta). Falhas depois do envio não são repetidas, para
+        não executar um clique ou digitação duas vezes.
+        """
+        message = dict(message)
+        message_id = message.setdefault('id', str(uuid.uuid4()))
+        frame = _encode_frame(message)
+        
+        for attempt in range(2):
+            reused = self._sync_sock is not None
+            sock = self._get_sync_socket(timeout)
+            sent = replied = stale = False
+            try:
+                sock.settimeout(timeout)
+                sock.sendall(frame)
+                sent = True
+                while True:
+                    header = sock.recv(4)
+                    if not header:
+                        # EOF antes de qualquer resposta numa conexão ociosa: o
+                        # servidor fechou-a antes de ler o comando
+                        stale = reused and not replied
+                        raise ConnectionError("IPC connection closed by server")
+                    replied = True
+                    header += _recv_exactly(sock, 4 - len(header))
+                    size = int.from_bytes(header, 'big')
+                    response = json.loads(_recv_exactly(sock, size).decode('utf-8'))
+                    if response.get('id') == message_id:
+                        return response
+            except socket.timeout:
+                # Descartar conexão: a resposta atrasada ficaria no buffer
+                self.close_sync()
+                raise TimeoutError(f"IPC communication timeout after {timeout}s")
+            except (ConnectionError, BrokenPipeError, OSError) as e:
+                self.close_sync()
+                if attempt == 1 or (sent and not stale):
+                    raise ConnectionError(f"IPC communication error: {e}")
+        raise ConnectionError("IPC communication error")
+    
+    def _get_sync_socket(self, timeout: float) -> socket.socket:
+        """Retorna o socket síncrono persistente, conectando se necessário."""
+        if self._sync_sock is None:
+            if not self.socket_path.exists():
+                raise ConnectionError(f"Socket not found: {self.socket_path}")
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError as e:
+                sock.close()
+                raise ConnectionError(f"IPC communication error: {e}")
+            self._sync_sock = sock
+        return self._sync_sock
+    
+    def close_sync(self) -> None:
+        """Fecha o socket síncrono persistente."""
+        if self._sync_sock is not None:
+            try:
+                self._sync_sock.close()
+            except OSError:
+                pass
+            self._sync_sock = None
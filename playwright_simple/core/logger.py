@@ -4,18 +4,88 @@
 Advanced logging system for playwright-simple.
 
 Provides structured logging with context, levels, and detailed debugging information.
+
+Levels are checked before any payload is built, messages are rendered lazily
+(only by a handler that writes them) and file sinks are written by a
+background thread (QueueHandler/QueueListener), so disabled or file-only
+logging costs almost nothing on the event loop.
 """
 
+import atexit
+import copy
 import logging
+import logging.handlers
 import json
+import queue
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 
+class LazyMessage:
+    """
+    Log message rendered on first use.
+
+    Handlers call ``str()`` on the message only when they write the record,
+    so JSON encoding and console formatting are skipped for records that are
+    filtered out, and done by the writer thread for queued sinks.
+    """
+    
+    __slots__ = ('_render', '_args', '_kwargs', '_text')
+    
+    def __init__(self, render: Callable[..., str], *args, **kwargs):
+        self._render = render
+        self._args = args
+        self._kwargs = kwargs
+        self._text: Optional[str] = None
+    
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._render(*self._args, **self._kwargs)
+        return self._text
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves message rendering to the listener thread.
+    
+    The stock QueueHandler formats the record in the calling thread; this one
+    only resolves the traceback (which must not outlive the caller's frames).
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copy the record for the queue without formatting its message."""
+        record = copy.copy(record)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def start_background_handler(target: logging.Logger, handler: logging.Handler) -> logging.handlers.QueueListener:
+    """
+    Attach a handler to a logger through a queue and a writer thread.
+    
+    Args:
+        target: Logger that receives records
+        handler: Sink to run in the background (file, JSON)
+        
+    Returns:
+        Started QueueListener (stopped, and flushed, at interpreter exit)
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(records)
+    queue_handler.setLevel(handler.level)
+    listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    target.addHandler(queue_handler)
+    return listener
+
+
 class LogLevel(Enum):
     """Log levels for structured logging."""
     DEBUG = "DEBUG"
@@ -83,7 +153,8 @@ class StructuredLogger:
         level: str = "INFO",
         log_file: Optional[Path] = None,
         json_log: bool = False,
-        console_output: bool = True
+        console_output: bool = True,
+        background_sinks: bool = True
     ):
         """
         Initialize structured logger.
@@ -94,11 +165,13 @@ class StructuredLogger:
             log_file: Optional file path for logging
             json_log: Whether to output JSON format
             console_output: Whether to output to console
+            background_sinks: Write the log file from a background thread
         """
         self.name = name
         self.log_file = log_file
         self.json_log = json_log
         self.console_output = console_output
+        self._listener: Optional[logging.handlers.QueueListener] = None
         
         # Create logger
         self.logger = logging.getLogger(name)
@@ -123,7 +196,10 @@ class StructuredLogger:
                     file_handler.setFormatter(JSONFormatter())
                 else:
                     file_handler.setFormatter(StructuredFormatter())
-                self.logger.addHandler(file_handler)
+                if background_sinks:
+                    self._listener = start_background_handler(self.logger, file_handler)
+                else:
+                    self.logger.addHandler(file_handler)
         
         # Context stack for nested operations
         self._context_stack: List[LogContext] = []
@@ -147,6 +223,47 @@ class StructuredLogger:
         """Get current context."""
         return self._current_context
     
+    # Map custom levels to standard logging levels
+    _STD_LEVELS = {
+        LogLevel.DEBUG: logging.DEBUG,
+        LogLevel.INFO: logging.INFO,
+        LogLevel.WARNING: logging.WARNING,
+        LogLevel.ERROR: logging.ERROR,
+        LogLevel.CRITICAL: logging.CRITICAL,
+        LogLevel.ACTION: logging.INFO,
+        LogLevel.STATE: logging.INFO,
+        LogLevel.ELEMENT: logging.INFO,
+    }
+    
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a message at this level would be written (cheap)."""
+        return self.logger.isEnabledFor(self._STD_LEVELS.get(level, logging.INFO))
+    
+    def close(self) -> None:
+        """Flush and stop the background file writer, if any."""
+        if self._listener is not None:
+            atexit.unregister(self._listener.stop)
+            self._listener.stop()
+            self._listener = None
+    
+    def _render(
+        self,
+        level: LogLevel,
+        message: str,
+        log_context: Optional[LogContext],
+        **kwargs
+    ) -> str:
+        """Render a log entry in the configured format."""
+        if self.json_log:
+            log_data = {
+                'level': level.value,
+                'message': message,
+                'context': log_context.to_dict() if log_context else {},
+                **kwargs
+            }
+            return json.dumps(log_data, default=str)
+        return self._format_message(level, message, log_context, **kwargs)
+    
     def _log(
         self,
         level: LogLevel,
@@ -155,33 +272,15 @@ class StructuredLogger:
         **kwargs
     ) -> None:
         """Internal logging method."""
+        std_level = self._STD_LEVELS.get(level, logging.INFO)
+        if not self.logger.isEnabledFor(std_level):
+            return
+        
         # Use provided context or current context
         log_context = context or self._current_context
         
-        # Prepare log data
-        log_data = {
-            'level': level.value,
-            'message': message,
-            'context': log_context.to_dict() if log_context else {},
-            **kwargs
-        }
-        
-        # Log based on format
-        if self.json_log:
-            log_message = json.dumps(log_data, default=str)
-        else:
-            log_message = self._format_message(level, message, log_context, **kwargs)
-        
-        # Log using appropriate level
-        # Map custom levels to standard logging levels
-        level_map = {
-            LogLevel.ACTION: "info",
-            LogLevel.STATE: "info",
-            LogLevel.ELEMENT: "info",
-        }
-        log_level = level_map.get(level, level.value.lower())
-        log_method = getattr(self.logger, log_level)
-        log_method(log_message)
+        # Rendered only by the handlers that write it
+        self.logger.log(std_level, LazyMessage(self._render, level, message, log_context, **kwargs))
     
     def _format_message(
         self,
@@ -317,7 +416,7 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.fromtimestamp(record.created).isoformat(),  # event time, not write time
             'level': record.levelname,
             'message': record.getMessage(),
             'module': record.module,
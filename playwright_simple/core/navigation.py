@@ -16,6 +16,7 @@ from .screenshot import ScreenshotManager
 from .selectors import SelectorManager
 from .config import TestConfig
 from .exceptions import NavigationError, ElementNotFoundError
+from .execution_profile import get_round_trip_savings
 from .constants import (
     CURSOR_HOVER_DELAY,
     CURSOR_CLICK_EFFECT_DELAY,
@@ -157,16 +158,21 @@ class NavigationMixin:
                                 # CursorController will handle cursor movement when actions are executed
                                 # No need to use CursorManager
                                 
-                                # Show hover effect
-                                if self.config.cursor.hover_effect:
-                                    # CursorController will handle hover effects when actions are executed
+                                savings = get_round_trip_savings(self.page)
+                                if savings is not None:
+                                    # Headless profile: no hover/click effects to wait for
+                                    savings.skip('effects', round_trips=0, sleep=CURSOR_CLICK_EFFECT_DELAY)
+                                else:
+                                    # Show hover effect
+                                    if self.config.cursor.hover_effect:
+                                        # CursorController will handle hover effects when actions are executed
+                                        # No need to use CursorManager
+                                        await asyncio.sleep(CURSOR_HOVER_DELAY)
+                                    
+                                    # Click with visual animation
+                                    # CursorController will handle click effects when actions are executed
                                     # No need to use CursorManager
-                                    await asyncio.sleep(CURSOR_HOVER_DELAY)
-                                
-                                # Click with visual animation
-                                # CursorController will handle click effects when actions are executed
-                                # No need to use CursorManager
-                                await asyncio.sleep(CURSOR_CLICK_EFFECT_DELAY)
+                                    await asyncio.sleep(CURSOR_CLICK_EFFECT_DELAY)
                                 
                                 # Now click the link
                                 await link_element.click()
@@ -6,7 +6,15 @@ Performance optimization module.
 Provides profiling and optimization utilities.
 """
 
-from .profiler import PerformanceProfiler, get_profiler, set_profiler
+from .profiler import PerformanceProfiler, Span, get_profiler, set_profiler
+from .step_report import PHASES, StepTimingReport, SuiteTimingReport, get_suite_timing_report
+from .round_trips import RoundTripCounter, get_round_trip_counter, instrument_page
+from .memory import MemoryMonitor, MemorySample, browser_rss
 
-__all__ = ['PerformanceProfiler', 'get_profiler', 'set_profiler']
+__all__ = [
+    'PerformanceProfiler', 'Span', 'get_profiler', 'set_profiler',
+    'PHASES', 'StepTimingReport', 'SuiteTimingReport', 'get_suite_timing_report',
+    'RoundTripCounter', 'get_round_trip_counter', 'instrument_page',
+    'MemoryMonitor', 'MemorySample', 'browser_rss',
+]
 
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline benchmarks.
+
+Synthetic fixture pages served locally, benchmark suites and JSON baselines
+used to catch performance regressions.
+"""
+
+from .baseline import (
+    BenchmarkResult,
+    Regression,
+    compare_to_baseline,
+    format_results,
+    load_baseline,
+    save_baseline,
+)
+from .fixture_app import FixtureServer
+
+__all__ = [
+    'BenchmarkResult',
+    'Regression',
+    'compare_to_baseline',
+    'format_results',
+    'load_baseline',
+    'save_baseline',
+    'FixtureServer',
+]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark results and baselines.
+
+Each benchmark produces samples for one or more metrics; the median is
+compared with a stored JSON baseline and a metric regresses when it is
+both relatively (threshold) and absolutely (min_delta) worse.
+"""
+
+import json
+import platform
+import statistics
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+DEFAULT_THRESHOLD = 0.25  # 25% slower than the baseline
+DEFAULT_MIN_DELTA = 0.005  # ignore differences below 5 ms (timer noise)
+
+
+@dataclass
+class BenchmarkResult:
+    """Samples of one metric (lower is better)."""
+    name: str
+    samples: List[float] = field(default_factory=list)
+    unit: str = "s"
+
+    @property
+    def median(self) -> float:
+        """Median of the samples (0 without samples)."""
+        return statistics.median(self.samples) if self.samples else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get result as a dictionary."""
+        return {
+            'median': round(self.median, 6),
+            'min': round(min(self.samples), 6) if self.samples else 0.0,
+            'max': round(max(self.samples), 6) if self.samples else 0.0,
+            'samples': len(self.samples),
+            'unit': self.unit,
+        }
+
+
+@dataclass
+class Regression:
+    """Metric that got worse than its baseline."""
+    name: str
+    baseline: float
+    current: float
+    unit: str = "s"
+
+    @property
+    def ratio(self) -> float:
+        """Current value relative to the baseline."""
+        return self.current / self.baseline if self.baseline else float('inf')
+
+    def __str__(self) -> str:
+        return (f"{self.name}: {self.current:.4f}{self.unit} vs baseline {self.baseline:.4f}{self.unit} "
+                f"(+{(self.ratio - 1) * 100:.0f}%)")
+
+
+def environment() -> Dict[str, str]:
+    """Describe the machine the results come from."""
+    return {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+
+
+def save_baseline(results: List[BenchmarkResult], path: Union[str, Path]) -> Path:
+    """
+    Save results as a baseline JSON file.
+
+    Metrics already in the file but not in results are kept, so suites can
+    update their part of a shared baseline.
+
+    Args:
+        results: Benchmark results
+        path: Baseline file
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    metrics = load_baseline(path)
+    metrics.update({result.name: result.to_dict() for result in results})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'metrics': dict(sorted(metrics.items())),
+    }
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+    return path
+
+
+def load_baseline(path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the metrics of a baseline file.
+
+    Args:
+        path: Baseline file
+
+    Returns:
+        Dictionary metric name -> stored result (empty if the file does not exist)
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8')).get('metrics', {})
+
+
+def compare_to_baseline(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta: float = DEFAULT_MIN_DELTA
+) -> List[Regression]:
+    """
+    Find metrics that regressed.
+
+    Args:
+        results: Current results
+        baseline: Stored metrics (from load_baseline)
+        threshold: Allowed relative slowdown (0.25 = 25%)
+        min_delta: Allowed absolute slowdown regardless of threshold
+
+    Returns:
+        Regressions (metrics missing from the baseline are skipped)
+    """
+    regressions = []
+    for result in results:
+        stored: Optional[Dict[str, Any]] = baseline.get(result.name)
+        if not stored or not result.samples:
+            continue
+        reference = stored.get('median', 0.0)
+        current = result.median
+        if current > reference * (1 + threshold) and current - reference > min_delta:
+            regressions.append(Regression(result.name, reference, current, result.unit))
+    return regressions
+
+
+def format_results(results: List[BenchmarkResult], baseline: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    """Format results as a text table (with the baseline median when known)."""
+    baseline = baseline or {}
+    width = max([len(result.name) for result in results] + [len('Metric')])
+    lines = [f"{'Metric':<{width}}  {'Median':>10}  {'Min':>10}  {'Baseline':>10}  {'Delta':>7}  Unit"]
+    for result in results:
+        values = result.to_dict()
+        reference = baseline.get(result.name, {}).get('median')
+        delta = f"{(result.median / reference - 1) * 100:+.0f}%" if reference else "-"
+        lines.append(
+            f"{result.name:<{width}}  {values['median']:>10.4f}  {values['min']:>10.4f}  "
+            f"{reference if reference is not None else '-':>10}  {delta:>7}  {result.unit}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Browser benchmarks against the local fixture app.
+
+Times element discovery, selector fallback, page stability detection,
+event capture latency and a full YAML playback in headless Chromium.
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+import yaml
+from playwright.async_api import async_playwright
+
+from ...playwright_commands.element_interactions.element_finder import ElementFinder
+from ...recorder.config import RecorderConfig, SpeedLevel
+from ...recorder.event_capture import EventCapture
+from ...recorder.page_stability import wait_for_page_stable
+from ...selectors import SelectorManager
+from .baseline import BenchmarkResult
+from .fixture_app import DEFAULT_DOM_NODES, DEFAULT_FORM_FIELDS, FixtureServer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEAT = 5
+
+
+async def measure(
+    name: str,
+    repeat: int,
+    run: Callable[[], Awaitable[None]],
+    setup: Optional[Callable[[], Awaitable[None]]] = None
+) -> BenchmarkResult:
+    """
+    Time `run` `repeat` times (setup runs before each sample, untimed).
+
+    Args:
+        name: Metric name
+        repeat: Number of samples
+        run: Coroutine function to time
+        setup: Optional coroutine function run before each sample
+
+    Returns:
+        Result with one sample per run
+    """
+    result = BenchmarkResult(name)
+    for _ in range(repeat):
+        if setup is not None:
+            await setup()
+        started = time.perf_counter()
+        await run()
+        result.samples.append(time.perf_counter() - started)
+    return result
+
+
+async def bench_finder(page, server: FixtureServer, repeat: int) -> List[BenchmarkResult]:
+    """ElementFinder.find_by_text on a large DOM (fresh page per sample, so the index is cold)."""
+    url = server.url('/dom', nodes=DEFAULT_DOM_NODES)
+    finder = ElementFinder(page)
+    target = f"Target {DEFAULT_DOM_NODES - 1}"
+
+    async def run():
+        if not await finder.find_by_text(target):
+            raise RuntimeError(f"'{target}' not found on fixture page")
+
+    return [await measure('finder.find_by_text', repeat, run, setup=lambda: page.goto(url))]
+
+
+async def bench_selectors(page, server: FixtureServer, repeat: int) -> List[BenchmarkResult]:
+    """SelectorManager.find_element by CSS selector and by label text on a large form."""
+    await page.goto(server.url('/form', fields=DEFAULT_FORM_FIELDS))
+    manager = SelectorManager(page, timeout=5000, retry_count=1)
+    results = []
+    for name, target in (('css', f"#field-{DEFAULT_FORM_FIELDS - 1}"), ('text', f"Campo {DEFAULT_FORM_FIELDS - 1}")):
+        async def run(target=target):
+            if await manager.find_element(target) is None:
+                raise RuntimeError(f"'{target}' not found on fixture page")
+        results.append(await measure(f'selectors.find_element.{name}', repeat, run))
+    return results
+
+
+async def bench_stability(page, server: FixtureServer, repeat: int) -> List[BenchmarkResult]:
+    """wait_for_page_stable after navigating to pages with fragment swaps and slow XHRs."""
+    results = []
+    for name, url in (
+        ('htmx_swaps', server.url('/htmx', swaps=5, interval=100)),
+        ('slow_xhr', server.url('/slow', requests=3, delay=300)),
+    ):
+        async def run(url=url):
+            await page.goto(url, wait_until='commit')
+            await wait_for_page_stable(page, timeout=10.0, speed_level=SpeedLevel.FAST)
+        results.append(await measure(f'stability.{name}', repeat, run))
+    return results
+
+
+async def bench_event_capture(page, server: FixtureServer, repeat: int) -> List[BenchmarkResult]:
+    """Time from a click in the page to EventCapture emitting it."""
+    await page.goto(server.url('/events'))
+    capture = EventCapture(page, speed_level=SpeedLevel.FAST)
+    received = asyncio.Event()
+    capture.on_event('click', lambda data: received.set())
+    await capture.start()
+    try:
+        async def run():
+            received.clear()
+            await page.click('#primary')
+            await asyncio.wait_for(received.wait(), timeout=10.0)
+        return [await measure('event_capture.click_latency', repeat, run)]
+    finally:
+        await capture.stop()
+
+
+# Benchmarks sharing one page, by name prefix
+BROWSER_BENCHMARKS: Dict[str, Callable] = {
+    'finder': bench_finder,
+    'selectors': bench_selectors,
+    'stability': bench_stability,
+    'event_capture': bench_event_capture,
+}
+
+
+async def bench_playback(server: FixtureServer, repeat: int, headless: bool = True) -> List[BenchmarkResult]:
+    """Full YAML playback through Recorder in read mode (browser launch included)."""
+    from ...recorder.recorder import Recorder
+
+    steps = {
+        'name': 'benchmark',
+        'steps': [
+            {'action': 'go_to', 'url': server.url('/form', fields=DEFAULT_FORM_FIELDS)},
+            {'action': 'type', 'text': 'valor', 'field_text': f"Campo {DEFAULT_FORM_FIELDS - 1}"},
+            {'action': 'click', 'text': 'Salvar'},
+        ],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        yaml_path = Path(tmp) / 'benchmark.yaml'
+        yaml_path.write_text(yaml.safe_dump(steps, allow_unicode=True), encoding='utf-8')
+
+        async def run():
+            config = RecorderConfig.from_kwargs(
+                output_path=yaml_path,
+                headless=headless,
+                speed_level=SpeedLevel.ULTRA_FAST,
+                mode='read',
+                execution_profile='headless'
+            )
+            submitted = len(server.submissions)
+            recorder = Recorder(config=config)
+            await recorder.start()
+            # Step errors are logged, not raised (a missed click is not even a
+            # failed step): a broken playback must not be timed
+            executed = getattr(recorder, 'steps', None) or []
+            completed = [step for step in executed if step.current_state == step.completed]
+            if len(completed) != len(steps['steps']):
+                raise RuntimeError(
+                    f"Playback completed {len(completed)}/{len(steps['steps'])} steps on fixture page"
+                )
+            field = f"field_{DEFAULT_FORM_FIELDS - 1}"
+            if not any(entry.get(field) == 'valor' for entry in server.submissions[submitted:]):
+                raise RuntimeError("Playback did not submit the fixture form with the typed value")
+
+        return [await measure('playback.yaml', repeat, run)]
+
+
+async def run_browser_benchmarks(
+    repeat: int = DEFAULT_REPEAT,
+    headless: bool = True,
+    only: Optional[Iterable[str]] = None
+) -> List[BenchmarkResult]:
+    """
+    Run the browser benchmarks against a local fixture server.
+
+    Args:
+        repeat: Samples per metric
+        headless: Run Chromium headless
+        only: Optional benchmark names to run (finder, selectors, stability, event_capture, playback)
+
+    Returns:
+        Results of all metrics
+    """
+    selected = set(only) if only else None
+    results: List[BenchmarkResult] = []
+    with FixtureServer() as server:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=headless)
+            try:
+                page = await (await browser.new_context()).new_page()
+                for name, bench in BROWSER_BENCHMARKS.items():
+                    if selected is None or name in selected:
+                        logger.info(f"Running benchmark: {name}")
+                        results.extend(await bench(page, server, repeat))
+            finally:
+                await browser.close()
+        if selected is None or 'playback' in selected:
+            logger.info("Running benchmark: playback")
+            results.extend(await bench_playback(server, repeat, headless=headless))
+    return results
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic fixture web app for offline benchmarks.
+
+Serves generated pages from a local ``http.server`` so benchmarks need no
+network and produce comparable numbers run after run:
+
+- ``/dom?nodes=N``: large DOM (N text nodes in nested sections)
+- ``/form?fields=N``: large form with a label per field and a submit button
+- ``/htmx?swaps=N&interval=MS``: HTMX-style fragment swaps fetched from ``/fragment``
+- ``/slow?requests=N&delay=MS``: page firing N XHRs to ``/api/slow``
+- ``/events``: buttons and input for event capture latency
+- ``/api/slow?delay=MS``: JSON endpoint answering after MS milliseconds
+- ``/api/submit?...``: receives the form's fields on submit (see ``FixtureServer.submissions``)
+"""
+
+import html
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOM_NODES = 10000
+DEFAULT_FORM_FIELDS = 200
+
+
+def _page(title: str, body: str, script: str = "") -> str:
+    """Wrap a body in a minimal HTML document."""
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<title>{html.escape(title)}</title></head><body>{body}"
+        f"{f'<script>{script}</script>' if script else ''}</body></html>"
+    )
+
+
+def dom_page(nodes: int = DEFAULT_DOM_NODES) -> str:
+    """Page with `nodes` text elements in sections of 100, the last one a button."""
+    items = [f"<li class='item' data-index='{i}'><span>Item {i}</span></li>" for i in range(nodes - 1)]
+    sections = [
+        f"<section id='section-{start // 100}'><ul>{''.join(items[start:start + 100])}</ul></section>"
+        for start in range(0, len(items), 100)
+    ]
+    sections.append(f"<button id='target' type='button'>Target {nodes - 1}</button>")
+    return _page("DOM", "".join(sections))
+
+
+def form_page(fields: int = DEFAULT_FORM_FIELDS) -> str:
+    """Form with `fields` labelled inputs and a submit button."""
+    rows = "".join(
+        f"<div class='row'><label for='field-{i}'>Campo {i}</label>"
+        f"<input id='field-{i}' name='field_{i}' placeholder='Valor {i}'></div>"
+        for i in range(fields)
+    )
+    body = (
+        f"<form id='big-form' onsubmit=\"event.preventDefault();"
+        f"document.getElementById('result').textContent='Enviado';"
+        f"fetch('/api/submit?' + new URLSearchParams(new FormData(this)))\">{rows}"
+        "<button type='submit'>Salvar</button></form><div id='result'></div>"
+    )
+    return _page("Form", body)
+
+
+def htmx_page(swaps: int = 5, interval: int = 100) -> str:
+    """Page that swaps a fragment `swaps` times, `interval` ms apart, then goes quiet."""
+    script = f"""
+        let swaps = 0;
+        async function swap() {{
+            const response = await fetch('/fragment?n=' + swaps);
+            document.getElementById('target').innerHTML = await response.text();
+            if (++swaps < {swaps}) setTimeout(swap, {interval});
+        }}
+        setTimeout(swap, {interval});
+    """
+    return _page("HTMX", "<div id='target' hx-get='/fragment'>Carregando...</div>", script)
+
+
+def slow_page(requests: int = 3, delay: int = 300) -> str:
+    """Page that fires `requests` XHRs to the slow endpoint on load."""
+    script = f"""
+        for (let i = 0; i < {requests}; i++) {{
+            const xhr = new XMLHttpRequest();
+            xhr.open('GET', '/api/slow?delay={delay}&i=' + i);
+            xhr.onload = () => {{
+                const li = document.createElement('li');
+                li.textContent = xhr.responseText;
+                document.getElementById('results').appendChild(li);
+            }};
+            xhr.send();
+        }}
+    """
+    return _page("Slow", "<ul id='results'></ul>", script)
+
+
+def events_page() -> str:
+    """Page with a few controls for event capture."""
+    body = (
+        "<button id='primary' type='button'>Confirmar</button>"
+        "<a id='link' href='#section'>Detalhes</a>"
+        "<label for='name'>Nome</label><input id='name' name='name'>"
+    )
+    return _page("Events", body)
+
+
+def _int(query: Dict[str, list], key: str, default: int) -> int:
+    """Read an integer query parameter."""
+    try:
+        return int(query.get(key, [default])[0])
+    except (TypeError, ValueError):
+        return default
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    """Routes requests to the page generators."""
+
+    routes: Dict[str, Callable[[Dict[str, list]], Tuple[str, str]]] = {
+        '/dom': lambda q: ('text/html', dom_page(_int(q, 'nodes', DEFAULT_DOM_NODES))),
+        '/form': lambda q: ('text/html', form_page(_int(q, 'fields', DEFAULT_FORM_FIELDS))),
+        '/htmx': lambda q: ('text/html', htmx_page(_int(q, 'swaps', 5), _int(q, 'interval', 100))),
+        '/slow': lambda q: ('text/html', slow_page(_int(q, 'requests', 3), _int(q, 'delay', 300))),
+        '/events': lambda q: ('text/html', events_page()),
+        '/fragment': lambda q: ('text/html', f"<p class='fragment'>Fragmento {_int(q, 'n', 0)}</p>"),
+    }
+
+    def do_GET(self):
+        """Serve a generated page."""
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == '/api/slow':
+            time.sleep(_int(query, 'delay', 300) / 1000)
+            content_type, content = 'application/json', json.dumps({'ok': True, 'i': _int(query, 'i', 0)})
+        elif url.path == '/api/submit':
+            self.server.submissions.append({key: values[-1] for key, values in query.items()})
+            content_type, content = 'application/json', json.dumps({'ok': True})
+        elif url.path in self.routes:
+            content_type, content = self.routes[url.path](query)
+        else:
+            self.send_error(404)
+            return
+        payload = content.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        """Route access logs to debug logging."""
+        logger.debug("fixture: " + format, *args)
+
+
+class FixtureServer:
+    """
+    Local HTTP server for the fixture app, running in a background thread.
+
+    Example:
+        ```python
+        with FixtureServer() as server:
+            await page.goto(server.url('/dom', nodes=10000))
+        ```
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0) -> None:
+        """
+        Initialize server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.host = host
+        self.port = port
+        # Fields of each form submission received by /api/submit
+        self.submissions: List[Dict[str, str]] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'FixtureServer':
+        """Start serving in a daemon thread."""
+        if self._server is None:
+            self._server = ThreadingHTTPServer((self.host, self.port), _FixtureHandler)
+            self._server.daemon_threads = True
+            self._server.submissions = self.submissions
+            self.port = self._server.server_address[1]
+            self._thread = threading.Thread(target=self._server.serve_forever, name='fixture-server', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def url(self, path: str = '/', **params) -> str:
+        """
+        Get URL of a fixture page.
+
+        Args:
+            path: Page path (e.g. '/dom')
+            **params: Query parameters
+
+        Returns:
+            Absolute URL
+        """
+        query = '&'.join(f"{key}={value}" for key, value in params.items())
+        return f"http://{self.host}:{self.port}{path}{'?' + query if query else ''}"
+
+    def __enter__(self) -> 'FixtureServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Media pipeline benchmarks on synthetic inputs.
+
+Inputs are generated deterministically with ffmpeg lavfi sources: a
+test-pattern webm (with a silent Opus track, which the narration mixing
+expects), sine-tone clips standing in for narration, and a synthetic step
+timeline with cursor moves and clicks. Each post-processing path is run
+on a fresh copy of the inputs and measured for wall time, CPU time (this
+process plus its ffmpeg children), peak RSS of the ffmpeg children and
+output size.
+"""
+
+import logging
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .baseline import BenchmarkResult
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEAT = 3
+DEFAULT_DURATION = 10.0
+DEFAULT_RESOLUTION = "1280x720"
+DEFAULT_STEPS = 8
+RSS_SAMPLE_INTERVAL = 0.02
+
+MEDIA_BENCHMARKS = ('concatenate_timed_audio', 'runner_all_in_one', 'recorder_processor')
+
+
+def _ffmpeg(*args: str) -> None:
+    """Run ffmpeg quietly, raising on failure."""
+    subprocess.run(
+        ['ffmpeg', '-hide_banner', '-loglevel', 'error', '-y', *args],
+        check=True, capture_output=True, timeout=600
+    )
+
+
+def generate_video(path: Path, duration: float = DEFAULT_DURATION, resolution: str = DEFAULT_RESOLUTION,
+                   rate: int = 25) -> Path:
+    """Generate a test-pattern webm with a silent audio track."""
+    _ffmpeg(
+        '-f', 'lavfi', '-i', f'testsrc2=size={resolution}:rate={rate}:duration={duration}',
+        '-f', 'lavfi', '-i', 'anullsrc=channel_layout=stereo:sample_rate=48000',
+        '-shortest', '-threads', '1', '-flags', '+bitexact',
+        '-c:v', 'libvpx', '-deadline', 'realtime', '-cpu-used', '8', '-b:v', '1M',
+        '-c:a', 'libopus', str(path)
+    )
+    return path
+
+
+def generate_tone(path: Path, duration: float, frequency: int = 440) -> Path:
+    """Generate a sine-tone clip (stand-in for a narration clip)."""
+    _ffmpeg(
+        '-f', 'lavfi', '-i', f'sine=frequency={frequency}:sample_rate=24000:duration={duration:.3f}',
+        '-flags', '+bitexact', '-c:a', 'libmp3lame', '-b:a', '64k', str(path)
+    )
+    return path
+
+
+def synthetic_timeline(duration: float = DEFAULT_DURATION, steps: int = DEFAULT_STEPS) -> List[Dict[str, Any]]:
+    """
+    Build evenly spaced steps covering the video.
+
+    Every step has a subtitle; narration is as long as half or 90% of the
+    step, and every third clip runs past its step so the audio sync has to
+    push the next clip.
+
+    Returns:
+        Step dictionaries with start_time, end_time, duration, subtitle and audio_duration
+    """
+    step_duration = duration / steps
+    timeline = []
+    for i in range(steps):
+        start = i * step_duration
+        ratio = 1.2 if i % 3 == 2 else (0.5 if i % 2 == 0 else 0.9)
+        timeline.append({
+            'step_number': i + 1,
+            'action': 'click',
+            'start_time': round(start, 3),
+            'end_time': round(start + step_duration, 3),
+            'duration': round(step_duration, 3),
+            'subtitle': f'Passo {i + 1}: clicar em "Botão {i + 1}"',
+            'audio_duration': round(step_duration * ratio, 3),
+        })
+    return timeline
+
+
+def synthetic_cursor_track(timeline: List[Dict[str, Any]], resolution: str = DEFAULT_RESOLUTION):
+    """Cursor track gliding to a point and clicking in every step."""
+    from ...recorder.video.cursor_overlay import CursorTrack
+
+    width, height = (int(value) for value in resolution.split('x'))
+    events = [{'t': 0.0, 'x': width // 2, 'y': height // 2, 'kind': 'move'}]
+    for i, step in enumerate(timeline):
+        x = int(width * (0.2 + 0.6 * ((i * 37) % 10) / 10))
+        y = int(height * (0.2 + 0.6 * ((i * 53) % 10) / 10))
+        click_time = step['start_time'] + step['duration'] / 2
+        events.append({'t': click_time, 'x': x, 'y': y, 'kind': 'move', 'duration': 0.3})
+        events.append({'t': click_time, 'x': x, 'y': y, 'kind': 'click'})
+    return CursorTrack.from_dict({'start_time': 0.0, 'events': events})
+
+
+class MediaInputs:
+    """Synthetic inputs shared by all media benchmarks."""
+
+    def __init__(self, directory: Path, duration: float = DEFAULT_DURATION,
+                 resolution: str = DEFAULT_RESOLUTION, steps: int = DEFAULT_STEPS) -> None:
+        """
+        Generate inputs in a directory.
+
+        Args:
+            directory: Where to write the inputs
+            duration: Video length in seconds
+            resolution: Video size (WIDTHxHEIGHT)
+            steps: Number of steps in the timeline
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.resolution = resolution
+        self.video = generate_video(directory / 'input.webm', duration, resolution)
+        self.timeline = synthetic_timeline(duration, steps)
+        self.clips: List[Tuple[Path, float, float, float, bool]] = [
+            (
+                generate_tone(directory / f"clip_{step['step_number']:02d}.mp3", step['audio_duration'],
+                              frequency=220 + 40 * step['step_number']),
+                step['start_time'], step['audio_duration'], step['duration'], True
+            )
+            for step in self.timeline
+        ]
+        # Concatenated narration (prepared once for the paths that mix it in)
+        self.narration: Optional[Path] = None
+
+    def fresh_video(self, directory: Path) -> Path:
+        """Copy of the input video (processing paths replace their input)."""
+        directory.mkdir(parents=True, exist_ok=True)
+        return Path(shutil.copy2(self.video, directory / 'video.webm'))
+
+
+def _children_rss() -> int:
+    """Resident memory of all child processes in bytes."""
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return total
+
+
+def _cpu_seconds() -> float:
+    """User+system CPU time of this process and its waited-for children."""
+    if resource is None:
+        return time.process_time()
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+@contextmanager
+def probe() -> Iterator[Dict[str, float]]:
+    """
+    Measure wall time, CPU time and peak child RSS of the enclosed block.
+
+    Peak RSS is sampled with psutil; without it, the largest resident size
+    of any child so far (getrusage) is reported, which is an upper bound.
+
+    Yields:
+        Dictionary filled with 'wall', 'cpu' and 'peak_rss' (MB) on exit
+    """
+    stats: Dict[str, float] = {}
+    peak = [0]
+    stop = threading.Event()
+
+    def sample():
+        while not stop.is_set():
+            peak[0] = max(peak[0], _children_rss())
+            stop.wait(RSS_SAMPLE_INTERVAL)
+
+    sampler = threading.Thread(target=sample, name='rss-sampler', daemon=True) if PSUTIL_AVAILABLE else None
+    if sampler is not None:
+        sampler.start()
+    cpu_start = _cpu_seconds()
+    wall_start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats['wall'] = time.perf_counter() - wall_start
+        stats['cpu'] = _cpu_seconds() - cpu_start
+        if sampler is not None:
+            stop.set()
+            sampler.join()
+            stats['peak_rss'] = peak[0] / (1024 * 1024)
+        elif resource is not None:
+            # ru_maxrss is in KB on Linux
+            stats['peak_rss'] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+        else:
+            stats['peak_rss'] = 0.0
+
+
+async def _run_concatenate(inputs: MediaInputs, work: Path) -> Optional[Path]:
+    from ...tts.audio_processing import concatenate_timed_audio
+
+    output = work / 'narration.mp3'
+    await concatenate_timed_audio(inputs.clips, output, work)
+    return output
+
+
+async def _run_runner_all_in_one(inputs: MediaInputs, work: Path) -> Optional[Path]:
+    from ...config import TestConfig
+    from ...runner import TestRunner
+
+    config = TestConfig()
+    config.video.codec = 'mp4'
+    config.video.subtitles = True
+    runner = TestRunner(config=config)
+    return await runner._process_video_all_in_one(
+        inputs.fresh_video(work), inputs.timeline, datetime.now(), narration_audio=inputs.narration
+    )
+
+
+async def _run_recorder_processor(inputs: MediaInputs, work: Path) -> Optional[Path]:
+    from ....extensions.video.config import VideoConfig
+    from ...recorder.video.processor import VideoProcessor
+
+    video_config = VideoConfig(codec='mp4', subtitles=True, hard_subtitles=True, cursor_overlay=True)
+    processor = VideoProcessor(inputs.timeline, video_config,
+                               cursor_track=synthetic_cursor_track(inputs.timeline, inputs.resolution))
+    return await processor.process_video(inputs.fresh_video(work), 'benchmark')
+
+
+_RUNNERS = {
+    'concatenate_timed_audio': _run_concatenate,
+    'runner_all_in_one': _run_runner_all_in_one,
+    'recorder_processor': _run_recorder_processor,
+}
+
+
+async def run_media_benchmarks(
+    repeat: int = DEFAULT_REPEAT,
+    duration: float = DEFAULT_DURATION,
+    resolution: str = DEFAULT_RESOLUTION,
+    steps: int = DEFAULT_STEPS,
+    only: Optional[Iterable[str]] = None,
+    work_dir: Optional[Path] = None
+) -> List[BenchmarkResult]:
+    """
+    Run the media post-processing benchmarks.
+
+    The recorder VideoProcessor is run with cursor overlay and burned-in
+    subtitles; its narration step needs online TTS and is left out (the
+    narration paths are covered by concatenate_timed_audio and the runner).
+
+    Args:
+        repeat: Samples per metric
+        duration: Length of the synthetic video in seconds
+        resolution: Size of the synthetic video (WIDTHxHEIGHT)
+        steps: Number of steps in the synthetic timeline
+        only: Optional benchmark names to run (see MEDIA_BENCHMARKS)
+        work_dir: Directory for inputs and outputs (temporary by default)
+
+    Returns:
+        Results: wall and cpu (s), peak_rss and output_size (MB) per benchmark
+
+    Raises:
+        RuntimeError: If ffmpeg is not available
+    """
+    if shutil.which('ffmpeg') is None:
+        raise RuntimeError("ffmpeg is required for the media benchmarks but was not found")
+
+    selected = [name for name in MEDIA_BENCHMARKS if not only or name in set(only)]
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        root = Path(tmp)
+        inputs = MediaInputs(root / 'inputs', duration, resolution, steps)
+        if 'runner_all_in_one' in selected:
+            prepared = root / 'narration'
+            prepared.mkdir()
+            inputs.narration = await _run_concatenate(inputs, prepared)
+        for name in selected:
+            logger.info(f"Running media benchmark: {name}")
+            metrics = {
+                key: BenchmarkResult(f"media.{name}.{key}", unit=unit)
+                for key, unit in (('wall', 's'), ('cpu', 's'), ('peak_rss', 'MB'), ('output_size', 'MB'))
+            }
+            for sample in range(repeat):
+                work = root / name / str(sample)
+                work.mkdir(parents=True)
+                with probe() as stats:
+                    output = await _RUNNERS[name](inputs, work)
+                if output is None or not Path(output).exists():
+                    raise RuntimeError(f"Media benchmark '{name}' produced no output")
+                stats['output_size'] = Path(output).stat().st_size / (1024 * 1024)
+                for key, result in metrics.items():
+                    result.samples.append(stats[key])
+            results.extend(metrics.values())
+    return results
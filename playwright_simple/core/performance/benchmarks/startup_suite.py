@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CLI startup benchmarks.
+
+Every sample runs a fresh interpreter, so modules already imported by this
+process do not hide import cost. Times are reported net of a bare
+interpreter start, which only measures what playwright-simple adds.
+"""
+
+import json
+import subprocess
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .baseline import BenchmarkResult
+
+DEFAULT_REPEAT = 5
+
+# Seconds `playwright-simple click --help` may add to a bare interpreter start
+CLICK_HELP_TARGET = 0.3
+
+# Modules session commands (find, click, ...) must not import
+HEAVY_MODULES = (
+    'playwright',
+    'playwright_simple.core.runner',
+    'playwright_simple.core.recorder.recorder',
+    'playwright_simple.extensions.video',
+)
+
+_CLI = "from playwright_simple.cli import main; main()"
+
+STARTUP_BENCHMARKS: Dict[str, Sequence[str]] = {
+    'import_package': ('-c', 'import playwright_simple'),
+    'click_help': ('-c', _CLI, 'click', '--help'),
+    'find_help': ('-c', _CLI, 'find', '--help'),
+}
+
+
+def _time_interpreter(args: Sequence[str]) -> float:
+    """Wall time of one interpreter run."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, *args], check=True, capture_output=True, timeout=60)
+    return time.perf_counter() - started
+
+
+def interpreter_overhead(args: Sequence[str], repeat: int = DEFAULT_REPEAT) -> List[float]:
+    """
+    Time an interpreter run net of a bare interpreter start.
+
+    Args:
+        args: Interpreter arguments (e.g. ('-c', 'import playwright_simple'))
+        repeat: Number of samples
+
+    Returns:
+        One sample per run, in seconds (never negative)
+    """
+    _time_interpreter(args)  # warm bytecode and file system caches
+    samples = []
+    for _ in range(repeat):
+        bare = _time_interpreter(('-c', 'pass'))
+        samples.append(max(0.0, _time_interpreter(args) - bare))
+    return samples
+
+
+def imported_heavy_modules(cli_args: Sequence[str]) -> List[str]:
+    """
+    Run the CLI in a fresh interpreter and list the heavy modules it imported.
+
+    Args:
+        cli_args: CLI arguments (e.g. ['click', '--help'])
+
+    Returns:
+        Names from HEAVY_MODULES found in sys.modules at exit
+    """
+    script = (
+        "import atexit, json, sys\n"
+        f"atexit.register(lambda: print(json.dumps([m for m in {list(HEAVY_MODULES)!r} if m in sys.modules])))\n"
+        f"{_CLI}\n"
+    )
+    completed = subprocess.run([sys.executable, '-c', script, *cli_args], capture_output=True, text=True, timeout=60)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_startup_benchmarks(repeat: int = DEFAULT_REPEAT, only: Optional[Iterable[str]] = None) -> List[BenchmarkResult]:
+    """
+    Run the startup benchmarks.
+
+    Args:
+        repeat: Samples per metric
+        only: Optional benchmark names to run (see STARTUP_BENCHMARKS)
+
+    Returns:
+        Results named startup.<name>
+    """
+    selected = set(only) if only else None
+    return [
+        BenchmarkResult(f"startup.{name}", interpreter_overhead(args, repeat))
+        for name, args in STARTUP_BENCHMARKS.items()
+        if selected is None or name in selected
+    ]
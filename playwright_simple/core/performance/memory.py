@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Memory tracking across long test sessions.
+
+Opt-in per-test sampling: a tracemalloc snapshot of this process, diffed
+against the previous test to list the allocation sites that kept growing,
+and the resident memory of the browser processes (psutil). A soft budget
+on the browser RSS tells the runner to relaunch the browser between tests.
+"""
+
+import gc
+import logging
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+DEFAULT_TOP = 10
+
+# Allocations made by the snapshotting itself or the import machinery
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def browser_rss() -> Optional[float]:
+    """
+    Resident memory of the browser processes in MB.
+
+    Playwright runs the browser under its driver, itself a child of this
+    process, so all descendant processes are summed (driver included).
+
+    Returns:
+        RSS in MB, or None without psutil
+    """
+    if not PSUTIL_AVAILABLE:
+        return None
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return total / MB
+
+
+@dataclass
+class Allocation:
+    """Growth of one allocation site between two tests."""
+    location: str  # file:line
+    size_diff: int  # bytes
+    size: int  # bytes still allocated
+    count_diff: int
+
+
+@dataclass
+class MemorySample:
+    """Memory after one test."""
+    test_name: str
+    python_mb: Optional[float] = None  # traced by tracemalloc
+    python_peak_mb: Optional[float] = None  # peak during the test
+    browser_rss_mb: Optional[float] = None
+    top_allocations: List[Allocation] = field(default_factory=list)
+    recycled: bool = False  # browser relaunched after this test
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get sample as a dictionary."""
+        return asdict(self)
+
+
+class MemoryMonitor:
+    """
+    Samples memory between tests and compares each test with the previous one.
+
+    Only the latest tracemalloc snapshot is kept, so the monitor itself
+    does not grow with the suite beyond one small sample per test.
+
+    Example:
+        ```python
+        monitor = MemoryMonitor(budget_mb=1500)
+        monitor.start()
+        for name, test in tests:
+            await run(test)
+            if monitor.over_budget(monitor.sample(name)):
+                await relaunch_browser()
+        print(monitor.format_report())
+        monitor.stop()
+        ```
+    """
+
+    def __init__(self, trace: bool = True, budget_mb: Optional[float] = None, top: int = DEFAULT_TOP,
+                 frames: int = 1):
+        """
+        Initialize monitor.
+
+        Args:
+            trace: Take tracemalloc snapshots (otherwise only browser RSS is sampled)
+            budget_mb: Soft browser RSS budget in MB (None = no budget)
+            top: Allocation sites listed per test
+            frames: Stack frames stored per allocation (more is slower)
+        """
+        self.trace = trace
+        self.budget_mb = budget_mb
+        self.top = top
+        self.frames = frames
+        self.samples: List[MemorySample] = []
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start tracing (if enabled) and take the reference snapshot."""
+        if not self.trace:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._previous = self._snapshot()
+
+    def stop(self) -> None:
+        """Stop tracing if this monitor started it."""
+        self._previous = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        # Unreachable cycles would show up as growth until the next collection
+        gc.collect()
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+    def sample(self, test_name: str) -> MemorySample:
+        """
+        Sample memory after a test.
+
+        Args:
+            test_name: Name of the test that just finished
+
+        Returns:
+            Sample with the top allocation sites that grew since the previous one
+        """
+        sample = MemorySample(test_name, browser_rss_mb=browser_rss())
+        if self.trace and tracemalloc.is_tracing():
+            snapshot = self._snapshot()
+            if self._previous is not None:
+                grown = [stat for stat in snapshot.compare_to(self._previous, 'lineno') if stat.size_diff > 0]
+                sample.top_allocations = [
+                    Allocation(str(stat.traceback[0]), stat.size_diff, stat.size, stat.count_diff)
+                    for stat in grown[:self.top]
+                ]
+            self._previous = snapshot
+            current, peak = tracemalloc.get_traced_memory()
+            sample.python_mb = current / MB
+            sample.python_peak_mb = peak / MB
+            if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+                tracemalloc.reset_peak()
+        self.samples.append(sample)
+        return sample
+
+    def over_budget(self, sample: MemorySample) -> bool:
+        """Whether the browser RSS of a sample exceeds the soft budget."""
+        return (self.budget_mb is not None and sample.browser_rss_mb is not None
+                and sample.browser_rss_mb > self.budget_mb)
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Get all samples as dictionaries."""
+        return [sample.to_dict() for sample in self.samples]
+
+    def format_report(self) -> str:
+        """Format samples as text, with the growing allocation sites of each test."""
+        def mb(value: Optional[float]) -> str:
+            return f"{value:.1f}" if value is not None else "-"
+
+        lines = [f"{'Teste':<30}  {'Python MB':>10}  {'Pico MB':>8}  {'Browser MB':>10}"]
+        for sample in self.samples:
+            recycled = "  (browser reiniciado)" if sample.recycled else ""
+            lines.append(
+                f"{sample.test_name[:30]:<30}  {mb(sample.python_mb):>10}  {mb(sample.python_peak_mb):>8}  "
+                f"{mb(sample.browser_rss_mb):>10}{recycled}"
+            )
+            for allocation in sample.top_allocations:
+                lines.append(f"    +{allocation.size_diff / 1024:.1f} KB ({allocation.count_diff:+d} blocos) "
+                             f"{allocation.location}")
+        return "\n".join(lines)
@@ -4,12 +4,23 @@
 Performance profiler for playwright-simple.
 
 Provides profiling capabilities to identify performance bottlenecks.
+
+Besides flat timers (``measure``) and cProfile, the profiler records nested
+spans (suite → test → step → phase) with attributes, exportable as Chrome
+trace-event JSON (chrome://tracing, https://ui.perfetto.dev).
 """
 
+import asyncio
+import contextvars
+import itertools
+import json
+import os
+import threading
 import time
 import cProfile
 import pstats
 import io
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from contextlib import contextmanager
@@ -18,20 +29,87 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Span currently open in this task/thread (parent of the next span)
+_current_span: 'contextvars.ContextVar' = contextvars.ContextVar(
+    'playwright_simple_current_span', default=None
+)
+# Per-phase self time being collected in this task (see collect_phases)
+_phase_totals: 'contextvars.ContextVar' = contextvars.ContextVar(
+    'playwright_simple_phase_totals', default=None
+)
+
+
+@dataclass
+class Span:
+    """A timed, named section of execution with attributes."""
+    name: str
+    category: str = "phase"  # suite, test, step, phase
+    start: float = 0.0  # perf_counter seconds
+    end: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    span_id: int = 0
+    parent_id: Optional[int] = None
+    track: str = "main"  # task or thread the span ran in
+    child_time: float = 0.0  # time spent in child spans
+    
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (0 while open)."""
+        return (self.end - self.start) if self.end is not None else 0.0
+    
+    @property
+    def self_time(self) -> float:
+        """Duration minus time spent in child spans."""
+        return max(0.0, self.duration - self.child_time)
+    
+    def set(self, **attributes) -> None:
+        """Add attributes (e.g. selector, URL) while the span is open."""
+        self.attributes.update(attributes)
+
+
+class _NoopSpan:
+    """Span returned when tracing is off (attributes are dropped)."""
+    
+    def set(self, **attributes) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _track_name() -> str:
+    """Name of the asyncio task (or thread) a span runs in."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return task.get_name()
+    return threading.current_thread().name
+
 
 class PerformanceProfiler:
     """Performance profiler for measuring execution time and identifying bottlenecks."""
     
-    def __init__(self, enabled: bool = True):
+    def __init__(self, enabled: bool = True, trace: bool = False, max_samples: int = 10000):
         """
         Initialize profiler.
         
         Args:
             enabled: Whether profiling is enabled
+            trace: Whether to record spans (see span / export_chrome_trace)
+            max_samples: Samples kept per operation before they are folded into totals
         """
         self.enabled = enabled
+        self.trace = trace
+        self.max_samples = max_samples
         self.metrics: Dict[str, List[float]] = {}
+        # Folded samples per operation: [count, total, min, max]
+        self._folded: Dict[str, List[float]] = {}
         self.profiler: Optional[cProfile.Profile] = None
+        self.spans: List[Span] = []
+        self._span_ids = itertools.count(1)
+        self._origin = time.perf_counter()
     
     @contextmanager
     def measure(self, operation_name: str):
@@ -57,11 +135,160 @@ class PerformanceProfiler:
             yield
         finally:
             elapsed = time.perf_counter() - start_time
-            if operation_name not in self.metrics:
-                self.metrics[operation_name] = []
-            self.metrics[operation_name].append(elapsed)
+            self.record(operation_name, elapsed)
             logger.debug(f"⏱️  {operation_name}: {elapsed*1000:.2f}ms")
     
+    @contextmanager
+    def span(self, name: str, /, category: str = "phase", **attributes):
+        """
+        Context manager recording a nested span.
+        
+        The span's parent is the span open in the current task when it starts
+        (context variables follow asyncio tasks). Durations also feed the flat
+        metrics, so get_summary covers spans. Inside collect_phases, phase
+        spans are timed even when tracing is off.
+        
+        Args:
+            name: Span name (e.g. "click", "stability_wait")
+            category: suite, test, step or phase
+            **attributes: Attributes such as step number, selector or URL
+            
+        Example:
+            ```python
+            with profiler.span("step", category="step", step=3, action="click") as span:
+                span.set(selector="#save")
+                await do_click()
+            ```
+        """
+        tracing = self.enabled and self.trace
+        phases = _phase_totals.get()
+        if not tracing and phases is None:
+            yield _NOOP_SPAN
+            return
+        
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            category=category,
+            start=time.perf_counter(),
+            attributes=attributes,
+            span_id=next(self._span_ids),
+            parent_id=parent.span_id if parent else None,
+            track=_track_name(),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end = time.perf_counter()
+            _current_span.reset(token)
+            if parent is not None:
+                parent.child_time += span.duration
+            if phases is not None and category == "phase":
+                phases[name] = phases.get(name, 0.0) + span.self_time
+            if tracing:
+                self.spans.append(span)
+                self.record(f"{category}:{name}", span.duration)
+    
+    def record(self, operation_name: str, elapsed: float) -> None:
+        """
+        Add a sample to an operation's metrics.
+        
+        Once an operation has max_samples samples they are folded into its
+        running totals, so long sessions keep constant memory per operation
+        while get_summary still covers every sample.
+        
+        Args:
+            operation_name: Name of the operation
+            elapsed: Duration in seconds
+        """
+        times = self.metrics.setdefault(operation_name, [])
+        times.append(elapsed)
+        if len(times) >= self.max_samples:
+            folded = self._folded.get(operation_name)
+            if folded is None:
+                self._folded[operation_name] = [len(times), sum(times), min(times), max(times)]
+            else:
+                folded[0] += len(times)
+                folded[1] += sum(times)
+                folded[2] = min(folded[2], min(times))
+                folded[3] = max(folded[3], max(times))
+            times.clear()
+    
+    @contextmanager
+    def collect_phases(self):
+        """
+        Collect the self time of phase spans opened in this task.
+        
+        Works without tracing, so per-step breakdowns are always available.
+        
+        Yields:
+            Dictionary phase name -> seconds (filled as spans close)
+        """
+        phases: Dict[str, float] = {}
+        token = _phase_totals.set(phases)
+        try:
+            yield phases
+        finally:
+            _phase_totals.reset(token)
+    
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Convert recorded spans to Chrome trace-event format.
+        
+        Each span becomes a complete ("X") event; each task/thread gets its
+        own track so concurrent spans do not overlap.
+        
+        Returns:
+            Dictionary with 'traceEvents' (load in chrome://tracing or Perfetto)
+        """
+        pid = os.getpid()
+        tids: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+        for span in sorted(self.spans, key=lambda s: s.start):
+            if span.track not in tids:
+                tids[span.track] = len(tids) + 1
+                events.append({
+                    'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tids[span.track],
+                    'args': {'name': span.track},
+                })
+            args = {key: value if isinstance(value, (int, float, bool)) or value is None else str(value)
+                    for key, value in span.attributes.items()}
+            args['span_id'] = span.span_id
+            if span.parent_id is not None:
+                args['parent_id'] = span.parent_id
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((span.start - self._origin) * 1e6, 1),
+                'dur': round(span.duration * 1e6, 1),
+                'pid': pid,
+                'tid': tids[span.track],
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    
+    def export_chrome_trace(self, output_path: Path) -> Path:
+        """
+        Write recorded spans as Chrome trace-event JSON.
+        
+        Args:
+            output_path: Destination file (e.g. trace.json)
+            
+        Returns:
+            Path to the written file
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+        logger.info(f"📊 Trace saved to {output_path} ({len(self.spans)} spans)")
+        return output_path
+    
     def start_profiling(self):
         """Start CPU profiling."""
         if not self.enabled:
@@ -113,15 +340,21 @@ class PerformanceProfiler:
         summary = {}
         
         for operation_name, times in self.metrics.items():
-            if not times:
+            count, total, minimum, maximum = self._folded.get(operation_name, (0, 0.0, float('inf'), 0.0))
+            if times:
+                count += len(times)
+                total += sum(times)
+                minimum = min(minimum, min(times))
+                maximum = max(maximum, max(times))
+            if not count:
                 continue
             
             summary[operation_name] = {
-                'count': len(times),
-                'total': sum(times),
-                'min': min(times),
-                'max': max(times),
-                'avg': sum(times) / len(times),
+                'count': count,
+                'total': total,
+                'min': minimum,
+                'max': maximum,
+                'avg': total / count,
             }
         
         return summary
@@ -151,7 +384,9 @@ class PerformanceProfiler:
     def reset(self):
         """Reset all metrics."""
         self.metrics.clear()
+        self._folded.clear()
         self.profiler = None
+        self.spans.clear()
 
 
 # Global profiler instance
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Protocol round-trip accounting.
+
+Every awaited Page, Mouse, Keyboard or Locator method is one protocol round
+trip to the browser, and those dominate step latency. instrument_page wraps
+these methods on the page instance itself (the page keeps its identity, so
+isinstance checks and registries keyed by page still work), counting and
+timing each call per step and per call site.
+
+Read-only calls (title, content, get_attribute...) repeated with the same
+arguments inside one step, with no page-changing call in between, are
+flagged as redundant.
+"""
+
+import functools
+import inspect
+import logging
+import os
+import sys
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+from .profiler import get_profiler
+
+logger = logging.getLogger(__name__)
+
+# Calls whose result only changes when something else touches the page
+_READ_ONLY = frozenset({
+    'title', 'content', 'inner_text', 'inner_html', 'text_content', 'get_attribute',
+    'input_value', 'is_visible', 'is_hidden', 'is_enabled', 'is_disabled', 'is_checked',
+    'is_editable', 'count', 'bounding_box', 'all_inner_texts', 'all_text_contents',
+})
+# Calls that neither read nor change the page (do not reset redundancy tracking)
+_PASSIVE = frozenset({'screenshot', 'wait_for_timeout'})
+# Synchronous methods returning a Locator whose calls are also round trips
+_LOCATOR_FACTORIES = frozenset({
+    'locator', 'get_by_role', 'get_by_text', 'get_by_label', 'get_by_placeholder',
+    'get_by_alt_text', 'get_by_title', 'get_by_test_id', 'nth', 'filter', 'and_', 'or_',
+})
+# Page attributes holding objects with their own protocol calls
+_SUB_OBJECTS = ('mouse', 'keyboard')
+
+_THIS_FILE = os.path.normcase(os.path.abspath(__file__))
+
+# Page -> counter (weak keys: entries go away with the page)
+_counters: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _call_site() -> str:
+    """Get 'file.py:line function' of the code that made the call."""
+    frame = sys._getframe(1)
+    while frame is not None and os.path.normcase(os.path.abspath(frame.f_code.co_filename)) == _THIS_FILE:
+        frame = frame.f_back
+    if frame is None:
+        return "unknown"
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+def _call_key(target: Any, args: tuple, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Hashable form of the call target and arguments (None if they cannot be represented)."""
+    try:
+        # Locators are recreated for every call; their repr carries the selector
+        return repr((target, args, sorted(kwargs.items())))
+    except Exception:
+        return None
+
+
+class RoundTripCounter:
+    """
+    Per-step count and time of browser protocol calls.
+
+    Calls before the first step are recorded under 'setup'.
+
+    Attributes:
+        steps: One entry per step: {'step', 'calls', 'time', 'by_method', 'by_site', 'redundant'}
+    """
+
+    SETUP_STEP = "setup"
+
+    def __init__(self, page=None, clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Initialize counter.
+
+        Args:
+            page: Optional page to attach to (see get_round_trip_counter)
+            clock: Time source (seconds)
+        """
+        self.clock = clock
+        self.steps: List[Dict[str, Any]] = []
+        self._current: Optional[Dict[str, Any]] = None
+        self._reads: set = set()
+        if page is not None:
+            try:
+                _counters[page] = self
+            except TypeError:
+                logger.debug("Page does not support weak references; round-trip counter not shared")
+
+    @property
+    def current(self) -> Optional[Dict[str, Any]]:
+        """Entry of the step being recorded."""
+        return self._current
+
+    def start_step(self, name: str) -> None:
+        """Start accounting for a new step."""
+        self._current = {'step': name, 'calls': 0, 'time': 0.0, 'by_method': {}, 'by_site': {}, 'redundant': []}
+        self.steps.append(self._current)
+        self._reads = set()
+
+    def record(self, method: str, site: str, seconds: float, call_key: Optional[str] = None) -> None:
+        """
+        Record one protocol call.
+
+        Args:
+            method: Method name (e.g. 'page.title')
+            site: Call site ('file.py:line function')
+            seconds: Time the call took
+            call_key: Target and arguments of read-only calls (for redundancy detection)
+        """
+        if self._current is None:
+            self.start_step(self.SETUP_STEP)
+        current = self._current
+        current['calls'] += 1
+        current['time'] += seconds
+        for table, key in ((current['by_method'], method), (current['by_site'], site)):
+            entry = table.setdefault(key, {'calls': 0, 'time': 0.0})
+            entry['calls'] += 1
+            entry['time'] += seconds
+
+        name = method.rsplit('.', 1)[-1]
+        if name in _READ_ONLY and call_key is not None:
+            key = (method, call_key)
+            if key in self._reads:
+                current['redundant'].append({'method': method, 'site': site})
+            self._reads.add(key)
+        elif name not in _PASSIVE:
+            self._reads.clear()
+
+        profiler = get_profiler()
+        if profiler.enabled:
+            profiler.record(f"round_trip:{method}", seconds)
+
+    @property
+    def total_calls(self) -> int:
+        """Protocol calls over all steps."""
+        return sum(step['calls'] for step in self.steps)
+
+    @property
+    def total_time(self) -> float:
+        """Seconds spent in protocol calls over all steps."""
+        return sum(step['time'] for step in self.steps)
+
+    @property
+    def total_redundant(self) -> int:
+        """Redundant calls over all steps."""
+        return sum(len(step['redundant']) for step in self.steps)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Get round-trip report.
+
+        Returns:
+            Dictionary with 'steps', 'total_calls', 'total_time' and 'total_redundant'
+        """
+        return {
+            'steps': [step_summary(step) for step in self.steps],
+            'total_calls': self.total_calls,
+            'total_time': round(self.total_time, 3),
+            'total_redundant': self.total_redundant,
+        }
+
+    def format_report(self) -> str:
+        """Format round trips as a text table (one line per step plus total)."""
+        width = max([len(step['step']) for step in self.steps] + [len('TOTAL'), len('Step')])
+        lines = [f"{'Step':<{width}}  {'Calls':>5}  {'Time (s)':>8}  {'Redundant':>9}  Top call site"]
+        for step in self.steps:
+            top = max(step['by_site'].items(), key=lambda item: item[1]['time'], default=(None, None))[0]
+            lines.append(f"{step['step']:<{width}}  {step['calls']:>5}  {step['time']:>8.3f}  "
+                         f"{len(step['redundant']):>9}  {top or '-'}")
+        lines.append(f"{'TOTAL':<{width}}  {self.total_calls:>5}  {self.total_time:>8.3f}  "
+                     f"{self.total_redundant:>9}")
+        return "\n".join(lines)
+
+
+def step_summary(step: Dict[str, Any]) -> Dict[str, Any]:
+    """Rounded, JSON-ready form of one step entry of RoundTripCounter."""
+    def rounded(table):
+        return {key: {'calls': entry['calls'], 'time': round(entry['time'], 3)}
+                for key, entry in sorted(table.items(), key=lambda item: item[1]['time'], reverse=True)}
+    return {
+        'step': step['step'],
+        'calls': step['calls'],
+        'time': round(step['time'], 3),
+        'by_method': rounded(step['by_method']),
+        'by_site': rounded(step['by_site']),
+        'redundant': list(step['redundant']),
+    }
+
+
+def _timed(counter: RoundTripCounter, label: str, target: Any, method: Callable) -> Callable:
+    """Wrap a coroutine method so each call is recorded on the counter."""
+    read_only = label.rsplit('.', 1)[-1] in _READ_ONLY
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        site = _call_site()
+        started = counter.clock()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            call_key = _call_key(target, args, kwargs) if read_only else None
+            counter.record(label, site, counter.clock() - started, call_key)
+    return wrapper
+
+
+def _instrument(obj: Any, prefix: str, counter: RoundTripCounter) -> Any:
+    """Wrap the coroutine methods and locator factories of obj in place."""
+    if obj is None or getattr(obj, '__round_trips__', None) is counter:
+        return obj
+    for name, attr in inspect.getmembers(type(obj)):
+        if name.startswith('_'):
+            continue
+        if inspect.iscoroutinefunction(attr):
+            setattr(obj, name, _timed(counter, f"{prefix}.{name}", obj, getattr(obj, name)))
+        elif name in _LOCATOR_FACTORIES and callable(attr):
+            setattr(obj, name, _locator_factory(counter, getattr(obj, name)))
+    try:
+        obj.__round_trips__ = counter
+    except AttributeError:
+        pass
+    return obj
+
+
+def _locator_factory(counter: RoundTripCounter, factory: Callable) -> Callable:
+    """Wrap a Locator-returning method so the returned locator is instrumented too."""
+    @functools.wraps(factory)
+    def wrapper(*args, **kwargs):
+        return _instrument(factory(*args, **kwargs), 'locator', counter)
+    return wrapper
+
+
+def instrument_page(page, counter: Optional[RoundTripCounter] = None) -> RoundTripCounter:
+    """
+    Count and time protocol calls made through a page.
+
+    Page methods, page.mouse, page.keyboard and locators created from the
+    page are covered. Locators obtained via the ``first``/``last``
+    properties are new objects and are not counted.
+
+    Args:
+        page: Playwright page (instrumented in place; calling again is a no-op)
+        counter: Counter to record into (a new one by default)
+
+    Returns:
+        Counter attached to the page
+    """
+    existing = get_round_trip_counter(page)
+    if existing is not None:
+        return existing
+    counter = counter or RoundTripCounter()
+    try:
+        _counters[page] = counter
+    except TypeError:
+        logger.debug("Page does not support weak references; round-trip counter not shared")
+    _instrument(page, 'page', counter)
+    for name in _SUB_OBJECTS:
+        try:
+            _instrument(getattr(page, name), name, counter)
+        except Exception as e:
+            logger.debug(f"Could not instrument page.{name}: {e}")
+    return counter
+
+
+def get_round_trip_counter(page) -> Optional[RoundTripCounter]:
+    """
+    Get the round-trip counter attached to a page.
+
+    Args:
+        page: Playwright page
+
+    Returns:
+        Counter or None if the page is not instrumented
+    """
+    try:
+        return _counters.get(page)
+    except TypeError:
+        return None
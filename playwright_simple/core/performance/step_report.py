@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-step timing breakdown.
+
+Collects where each YAML step spent its time (DOM-ready wait, element
+discovery, cursor animation, action, stability wait, audio sync, logging)
+and ranks the slowest steps and phases per test and per suite, together with
+the browser round trips each step made (see round_trips).
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# Phases reported for every step, in display order. Time not covered by any
+# phase span goes to 'other'.
+PHASES = (
+    'dom_ready_wait',
+    'locate',
+    'cursor_move',
+    'action',
+    'stability_wait',
+    'audio_wait',
+    'logging',
+    'other',
+)
+
+
+class StepTimingReport:
+    """
+    Timing breakdown of the steps of one test.
+
+    Attributes:
+        test_name: Name of the test
+        steps: One entry per step: {'step', 'action', 'duration', 'phases', 'round_trips'}
+    """
+
+    def __init__(self, test_name: str = "test") -> None:
+        """
+        Initialize report.
+
+        Args:
+            test_name: Name of the test
+        """
+        self.test_name = test_name
+        self.steps: List[Dict[str, Any]] = []
+
+    def add_step(self, number: int, action: str, duration: float, phases: Dict[str, float],
+                 round_trips: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record one step.
+
+        Args:
+            number: Step number (1-based)
+            action: Action name
+            duration: Wall time of the step in seconds
+            phases: Seconds per phase (from PerformanceProfiler.collect_phases)
+            round_trips: Protocol calls of the step (from round_trips.step_summary)
+        """
+        breakdown = {phase: phases.get(phase, 0.0) for phase in PHASES if phase != 'other'}
+        # Unknown phase names are kept so new spans show up without code changes
+        breakdown.update({phase: seconds for phase, seconds in phases.items() if phase not in breakdown})
+        breakdown['other'] = max(0.0, duration - sum(breakdown.values()))
+        self.steps.append({'step': number, 'action': action, 'duration': duration, 'phases': breakdown,
+                           'round_trips': round_trips})
+
+    @property
+    def total(self) -> float:
+        """Wall time over all steps."""
+        return sum(step['duration'] for step in self.steps)
+
+    def phase_totals(self) -> Dict[str, float]:
+        """Seconds per phase over all steps, slowest first."""
+        totals: Dict[str, float] = {}
+        for step in self.steps:
+            for phase, seconds in step['phases'].items():
+                totals[phase] = totals.get(phase, 0.0) + seconds
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    @property
+    def round_trips(self) -> int:
+        """Protocol calls over all steps."""
+        return sum(step['round_trips']['calls'] for step in self.steps if step['round_trips'])
+
+    @property
+    def redundant_round_trips(self) -> int:
+        """Redundant protocol calls over all steps."""
+        return sum(len(step['round_trips']['redundant']) for step in self.steps if step['round_trips'])
+
+    def slowest_steps(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Slowest steps first."""
+        return sorted(self.steps, key=lambda step: step['duration'], reverse=True)[:limit]
+
+    def to_dict(self, limit: int = 5) -> Dict[str, Any]:
+        """
+        Get report as a dictionary.
+
+        Args:
+            limit: Number of slowest steps to rank
+
+        Returns:
+            Dictionary with 'test', 'total', 'round_trips', 'redundant_round_trips',
+            'phases', 'slowest' and 'steps'
+        """
+        return {
+            'test': self.test_name,
+            'total': round(self.total, 3),
+            'round_trips': self.round_trips,
+            'redundant_round_trips': self.redundant_round_trips,
+            'phases': _rounded(self.phase_totals()),
+            'slowest': [f"{step['step']}. {step['action']}" for step in self.slowest_steps(limit)],
+            'steps': [
+                {
+                    'step': step['step'],
+                    'action': step['action'],
+                    'duration': round(step['duration'], 3),
+                    'phases': _rounded(step['phases']),
+                    'round_trips': step['round_trips'],
+                }
+                for step in self.steps
+            ],
+        }
+
+    def format_table(self, limit: int = 5) -> str:
+        """Format the slowest steps as a text table (one column per phase)."""
+        rows = [(f"{step['step']}. {step['action']}", step) for step in self.slowest_steps(limit)]
+        width = max([len(label) for label, _ in rows] + [len('TOTAL'), len('Step')])
+        lines = [f"⏱️  {self.test_name}: {len(self.steps)} passo(s), {self.total:.2f}s, "
+                 f"{self.round_trips} round-trip(s) ({self.redundant_round_trips} redundante(s))",
+                 f"{'Step':<{width}}  {'Total':>7}  {'RTs':>5}  " + "  ".join(f"{_short(p):>7}" for p in PHASES)]
+        for label, step in rows:
+            calls = step['round_trips']['calls'] if step['round_trips'] else 0
+            lines.append(f"{label:<{width}}  {step['duration']:>7.2f}  {calls:>5}  "
+                         + "  ".join(f"{step['phases'].get(p, 0.0):>7.2f}" for p in PHASES))
+        totals = self.phase_totals()
+        lines.append(f"{'TOTAL':<{width}}  {self.total:>7.2f}  {self.round_trips:>5}  "
+                     + "  ".join(f"{totals.get(p, 0.0):>7.2f}" for p in PHASES))
+        return "\n".join(lines)
+
+
+class SuiteTimingReport:
+    """
+    Timing breakdown of all tests in a run.
+
+    Attributes:
+        tests: Reports of the tests run so far
+    """
+
+    def __init__(self) -> None:
+        """Initialize suite report."""
+        self.tests: List[StepTimingReport] = []
+
+    def add(self, report: StepTimingReport) -> None:
+        """Add the report of a finished test."""
+        self.tests.append(report)
+
+    def phase_totals(self) -> Dict[str, float]:
+        """Seconds per phase over all tests, slowest first."""
+        totals: Dict[str, float] = {}
+        for report in self.tests:
+            for phase, seconds in report.phase_totals().items():
+                totals[phase] = totals.get(phase, 0.0) + seconds
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def slowest_steps(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Slowest steps over all tests, each tagged with its test."""
+        steps = [dict(step, test=report.test_name) for report in self.tests for step in report.steps]
+        return sorted(steps, key=lambda step: step['duration'], reverse=True)[:limit]
+
+    def to_dict(self, limit: int = 10) -> Dict[str, Any]:
+        """Get suite report as a dictionary."""
+        return {
+            'total': round(sum(report.total for report in self.tests), 3),
+            'round_trips': sum(report.round_trips for report in self.tests),
+            'redundant_round_trips': sum(report.redundant_round_trips for report in self.tests),
+            'phases': _rounded(self.phase_totals()),
+            'slowest': [
+                {'test': step['test'], 'step': step['step'], 'action': step['action'],
+                 'duration': round(step['duration'], 3)}
+                for step in self.slowest_steps(limit)
+            ],
+            'tests': [report.to_dict() for report in self.tests],
+        }
+
+    def format_table(self, limit: int = 10) -> str:
+        """Format phase totals and the slowest steps of the suite."""
+        lines = ["⏱️  Tempo por fase:"]
+        for phase, seconds in self.phase_totals().items():
+            lines.append(f"   {phase:<15} {seconds:>8.2f}s")
+        lines.append(f"🔁 Round-trips: {sum(report.round_trips for report in self.tests)} "
+                     f"({sum(report.redundant_round_trips for report in self.tests)} redundante(s))")
+        lines.append("⏱️  Passos mais lentos:")
+        for step in self.slowest_steps(limit):
+            lines.append(f"   {step['duration']:>7.2f}s  {step['test']} #{step['step']} {step['action']}")
+        return "\n".join(lines)
+
+    def save_json(self, path: Union[str, Path]) -> Path:
+        """
+        Save suite report as JSON.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False), encoding='utf-8')
+        return path
+
+    def reset(self) -> None:
+        """Drop all test reports."""
+        self.tests.clear()
+
+
+def _rounded(values: Dict[str, float]) -> Dict[str, float]:
+    """Round seconds to milliseconds for output."""
+    return {key: round(value, 3) for key, value in values.items()}
+
+
+def _short(phase: str) -> str:
+    """Column header for a phase."""
+    return phase.split('_')[0][:7]
+
+
+# Global suite report
+_global_suite_report: Optional[SuiteTimingReport] = None
+
+
+def get_suite_timing_report() -> SuiteTimingReport:
+    """Get global suite timing report."""
+    global _global_suite_report
+    if _global_suite_report is None:
+        _global_suite_report = SuiteTimingReport()
+    return _global_suite_report
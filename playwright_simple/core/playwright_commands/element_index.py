@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Element Index Module.
+
+In-page index of interactive elements shared by all finders.
+
+The index lives in ``window.__playwrightSimpleElementIndex``. It is built
+lazily by the first lookup on a document, kept up to date from
+MutationObserver records (applied on the next lookup) and discarded
+automatically on navigation, since it belongs to the page's window.
+
+Each indexed element stores normalized values (lower case, collapsed
+whitespace) for these fields:
+
+- ``text``: direct text, falling back to textContent (value for buttons)
+- ``content``: full textContent, when it differs from ``text``
+- ``placeholder``, ``aria`` (aria-label), ``role``, ``name``, ``id``, ``type``
+
+Substring lookups use a trigram index, so a lookup costs roughly the number
+of candidate elements instead of a walk over the whole DOM.
+"""
+
+import logging
+from typing import Dict, Any
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+ELEMENT_INDEX_GLOBAL = '__playwrightSimpleElementIndex'
+
+# Installs the index on the window if not present yet (idempotent statement)
+ELEMENT_INDEX_SCRIPT = r"""
+if (!window.__playwrightSimpleElementIndex) {
+    window.__playwrightSimpleElementIndex = (() => {
+        const INTERACTIVE = 'a, button, input, textarea, select, label, summary, [role], [onclick], ' +
+            '[contenteditable], [tabindex], [aria-label], [placeholder], [style*="pointer"]';
+        const FIELDS = ['text', 'content', 'placeholder', 'aria', 'role', 'name', 'id', 'type'];
+        const OBSERVED_ATTRIBUTES = [
+            'for', 'placeholder', 'aria-label', 'role', 'name', 'id', 'type', 'value',
+            'onclick', 'contenteditable', 'tabindex', 'style'
+        ];
+        const VALUE_TYPES = new Set(['submit', 'button', 'reset']);
+        const MAX_GRAM_LENGTH = 256;
+        const EMPTY = new Set();
+
+        const normalize = (value) => (value || '').toString().replace(/\s+/g, ' ').trim().toLowerCase();
+
+        const values = {};  // field -> Map(element -> normalized value)
+        const grams = {};   // field -> Map(trigram -> Set(element))
+        const longValues = {};  // field -> Set(element) (values too long for trigrams)
+        FIELDS.forEach(field => {
+            values[field] = new Map();
+            grams[field] = new Map();
+            longValues[field] = new Set();
+        });
+        const indexed = new Set();
+        const inputs = new Set();
+        const labels = new Set();
+        const sortedCache = {};
+
+        const pendingAdded = new Set();
+        const pendingRemoved = new Set();
+        const pendingText = new Set();
+        const pendingAttributes = new Set();
+
+        const stats = {builds: 0, flushes: 0, queries: 0, indexed: 0};
+        let built = false;
+        let observer = null;
+
+        const trigrams = (value) => {
+            const result = new Set();
+            for (let i = 0; i + 3 <= value.length; i++) {
+                result.add(value.substr(i, 3));
+            }
+            return result;
+        };
+
+        const sortDocumentOrder = (elements) => elements.sort((a, b) =>
+            a === b ? 0 : (a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1)
+        );
+
+        const directText = (el) => Array.from(el.childNodes)
+            .filter(node => node.nodeType === Node.TEXT_NODE)
+            .map(node => node.textContent.trim())
+            .join(' ')
+            .trim();
+
+        const computeValues = (el) => {
+            const tag = el.tagName;
+            const result = {};
+            if (tag === 'LABEL') {
+                result.text = el.textContent;
+            } else {
+                const direct = directText(el);
+                const content = (el.textContent || '').trim();
+                let text = direct || content;
+                if (!text && (tag === 'BUTTON' ||
+                        (tag === 'INPUT' && VALUE_TYPES.has((el.type || '').toLowerCase())))) {
+                    text = el.value;
+                }
+                result.text = text;
+                if (direct && content !== direct) {
+                    result.content = content;
+                }
+            }
+            result.placeholder = el.getAttribute('placeholder');
+            result.aria = el.getAttribute('aria-label');
+            result.role = el.getAttribute('role');
+            result.name = el.getAttribute('name');
+            result.id = el.id;
+            result.type = (tag === 'INPUT' || tag === 'BUTTON') ? el.type : null;
+            return result;
+        };
+
+        const unindexElement = (el) => {
+            if (!indexed.has(el)) {
+                return;
+            }
+            for (const field of FIELDS) {
+                const value = values[field].get(el);
+                if (value === undefined) {
+                    continue;
+                }
+                values[field].delete(el);
+                longValues[field].delete(el);
+                for (const gram of trigrams(value)) {
+                    const set = grams[field].get(gram);
+                    if (set) {
+                        set.delete(el);
+                        if (!set.size) {
+                            grams[field].delete(gram);
+                        }
+                    }
+                }
+            }
+            indexed.delete(el);
+            if (inputs.delete(el)) {
+                delete sortedCache.inputs;
+            }
+            if (labels.delete(el)) {
+                delete sortedCache.labels;
+            }
+        };
+
+        const indexElement = (el) => {
+            unindexElement(el);
+            if (!el.isConnected || !el.matches(INTERACTIVE)) {
+                return;
+            }
+            const computed = computeValues(el);
+            for (const field of FIELDS) {
+                const value = normalize(computed[field]);
+                if (!value) {
+                    continue;
+                }
+                values[field].set(el, value);
+                if (value.length > MAX_GRAM_LENGTH) {
+                    longValues[field].add(el);
+                    continue;
+                }
+                for (const gram of trigrams(value)) {
+                    let set = grams[field].get(gram);
+                    if (!set) {
+                        set = new Set();
+                        grams[field].set(gram, set);
+                    }
+                    set.add(el);
+                }
+            }
+            indexed.add(el);
+            if (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA') {
+                inputs.add(el);
+                delete sortedCache.inputs;
+            } else if (el.tagName === 'LABEL') {
+                labels.add(el);
+                delete sortedCache.labels;
+            }
+        };
+
+        const indexSubtree = (root) => {
+            if (root.matches && root.matches(INTERACTIVE)) {
+                indexElement(root);
+            }
+            if (root.querySelectorAll) {
+                root.querySelectorAll(INTERACTIVE).forEach(indexElement);
+            }
+        };
+
+        const unindexSubtree = (root) => {
+            unindexElement(root);
+            if (root.querySelectorAll) {
+                root.querySelectorAll(INTERACTIVE).forEach(unindexElement);
+            }
+        };
+
+        const onMutations = (records) => {
+            for (const record of records) {
+                if (record.type === 'childList') {
+                    record.addedNodes.forEach(node => {
+                        if (node.nodeType === Node.ELEMENT_NODE) {
+                            pendingAdded.add(node);
+                        }
+                    });
+                    record.removedNodes.forEach(node => {
+                        if (node.nodeType === Node.ELEMENT_NODE) {
+                            pendingRemoved.add(node);
+                        }
+                    });
+                    pendingText.add(record.target);
+                } else if (record.type === 'characterData') {
+                    if (record.target.parentElement) {
+                        pendingText.add(record.target.parentElement);
+                    }
+                } else if (record.type === 'attributes') {
+                    pendingAttributes.add(record.target);
+                }
+            }
+        };
+
+        const build = () => {
+            indexSubtree(document.documentElement);
+            observer = new MutationObserver(onMutations);
+            observer.observe(document, {
+                childList: true,
+                subtree: true,
+                characterData: true,
+                attributes: true,
+                attributeFilter: OBSERVED_ATTRIBUTES
+            });
+            built = true;
+            stats.builds++;
+        };
+
+        const flush = () => {
+            if (!built) {
+                build();
+                return;
+            }
+            if (observer) {
+                onMutations(observer.takeRecords());
+            }
+            if (!pendingAdded.size && !pendingRemoved.size && !pendingText.size && !pendingAttributes.size) {
+                return;
+            }
+            stats.flushes++;
+            pendingRemoved.forEach(node => {
+                if (!node.isConnected) {
+                    unindexSubtree(node);
+                }
+            });
+            pendingAdded.forEach(node => {
+                if (node.isConnected) {
+                    indexSubtree(node);
+                }
+            });
+            pendingAttributes.forEach(indexElement);
+            // Text changes affect every indexed ancestor (textContent-based fields)
+            const textTargets = new Set();
+            pendingText.forEach(start => {
+                for (let node = start; node; node = node.parentElement) {
+                    if (indexed.has(node)) {
+                        textTargets.add(node);
+                    }
+                }
+            });
+            textTargets.forEach(indexElement);
+            pendingAdded.clear();
+            pendingRemoved.clear();
+            pendingText.clear();
+            pendingAttributes.clear();
+        };
+
+        const sortedSet = (name, set) => {
+            if (!sortedCache[name]) {
+                sortedCache[name] = sortDocumentOrder(Array.from(set).filter(el => el.isConnected));
+            }
+            return sortedCache[name];
+        };
+
+        const matchField = (field, query) => {
+            const fieldValues = values[field];
+            let candidates;
+            if (query.length < 3) {
+                candidates = fieldValues.keys();
+            } else {
+                let smallest = null;
+                for (let i = 0; i + 3 <= query.length; i++) {
+                    const set = grams[field].get(query.substr(i, 3)) || EMPTY;
+                    if (!smallest || set.size < smallest.size) {
+                        smallest = set;
+                    }
+                    if (!smallest.size) {
+                        break;
+                    }
+                }
+                candidates = [...smallest, ...longValues[field]];
+            }
+            const result = [];
+            for (const el of candidates) {
+                const value = fieldValues.get(el);
+                if (value !== undefined && value.includes(query)) {
+                    result.push(el);
+                }
+            }
+            return result;
+        };
+
+        return {
+            normalize,
+
+            // Elements whose normalized field value contains the query, in document order
+            match(fields, query) {
+                flush();
+                stats.queries++;
+                const normalized = normalize(query);
+                if (!normalized) {
+                    return [];
+                }
+                const fieldList = Array.isArray(fields) ? fields : [fields];
+                const found = new Set();
+                for (const field of fieldList) {
+                    matchField(field, normalized).forEach(el => found.add(el));
+                }
+                return sortDocumentOrder(Array.from(found));
+            },
+
+            // Normalized value of a field for an indexed element
+            value(el, field) {
+                return values[field].get(el) || '';
+            },
+
+            // All indexed input/textarea elements, in document order
+            inputs() {
+                flush();
+                return sortedSet('inputs', inputs);
+            },
+
+            // All indexed label elements, in document order
+            labels() {
+                flush();
+                return sortedSet('labels', labels);
+            },
+
+            isHidden(el) {
+                return el.offsetParent === null || el.style.display === 'none';
+            },
+
+            // Input/textarea for a label text: label, placeholder, name/id/aria-label, type.
+            // 'extended' also matches common login/password name/id patterns.
+            findInputByLabel(labelTextLower, options) {
+                const extended = options && options.extended;
+                const isField = (el) => el && (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA');
+
+                // Strategy 1: Find by label text
+                for (const label of this.match('text', labelTextLower)) {
+                    if (label.tagName !== 'LABEL') {
+                        continue;
+                    }
+                    const inputId = label.getAttribute('for');
+                    const input = (inputId && document.getElementById(inputId)) ||
+                        (label.parentElement && label.parentElement.querySelector('input, textarea'));
+                    if (input) {
+                        return input;
+                    }
+                }
+
+                // Strategy 2: Find by placeholder
+                const byPlaceholder = this.match('placeholder', labelTextLower).find(isField);
+                if (byPlaceholder) {
+                    return byPlaceholder;
+                }
+
+                // Strategy 3: Find by name/id/aria-label
+                const byAttribute = this.match(['name', 'id', 'aria'], labelTextLower).find(isField);
+                if (byAttribute) {
+                    return byAttribute;
+                }
+
+                // Strategy 4: Find by type for common field types
+                const typeMap = {
+                    'email': ['email', 'e-mail', 'correio', 'mail'],
+                    'password': ['password', 'senha', 'pass', 'pwd'],
+                    'login': ['login', 'username', 'user', 'usuário']
+                };
+                const fields = this.inputs();
+                for (const input of fields) {
+                    const inputType = input.type || '';
+                    for (const [type, keywords] of Object.entries(typeMap)) {
+                        if (inputType === type && keywords.some(k => labelTextLower.includes(k) || k.includes(labelTextLower))) {
+                            return input;
+                        }
+                    }
+                }
+
+                // Strategy 5: First text input is usually email/login
+                const looksLikeLogin = labelTextLower.includes('email') || labelTextLower.includes('login') ||
+                    labelTextLower.includes('mail');
+                if (looksLikeLogin) {
+                    const firstTextInput = fields.find(inp => inp.type === 'text' || inp.type === 'email');
+                    if (firstTextInput) {
+                        return firstTextInput;
+                    }
+                }
+
+                // Strategy 6: Common name/id patterns
+                if (extended) {
+                    const looksLikePassword = labelTextLower.includes('password') || labelTextLower.includes('senha') ||
+                        labelTextLower.includes('pass');
+                    const loginNames = ['login', 'email', 'username', 'user'];
+                    const passwordNames = ['password', 'pass', 'pwd'];
+                    for (const input of fields) {
+                        const name = (input.name || '').toLowerCase();
+                        const id = (input.id || '').toLowerCase();
+                        if (looksLikeLogin && (loginNames.includes(name) || loginNames.includes(id))) {
+                            return input;
+                        }
+                        if (looksLikePassword && (passwordNames.includes(name) || passwordNames.includes(id))) {
+                            return input;
+                        }
+                    }
+                }
+
+                return null;
+            },
+
+            stats() {
+                flush();
+                return Object.assign({}, stats, {indexed: indexed.size});
+            }
+        };
+    })();
+}
+"""
+
+
+def with_element_index(page_function: str) -> str:
+    """
+    Wrap a page function so it receives the shared element index.
+
+    Args:
+        page_function: JavaScript function ``(args, elementIndex) => {...}``
+
+    Returns:
+        JavaScript function ``(args) => ...`` for ``page.evaluate``
+    """
+    return (
+        "(args) => {\n"
+        f"{ELEMENT_INDEX_SCRIPT}\n"
+        f"return ({page_function})(args, window.{ELEMENT_INDEX_GLOBAL});\n"
+        "}"
+    )
+
+
+async def get_element_index_stats(page: Page) -> Dict[str, Any]:
+    """
+    Get statistics of the page's element index (builds it if needed).
+
+    Args:
+        page: Playwright Page instance
+
+    Returns:
+        Dictionary with 'builds', 'flushes', 'queries' and 'indexed'
+    """
+    return await page.evaluate(with_element_index("(args, elementIndex) => elementIndex.stats()"))
@@ -275,7 +275,8 @@ class ClickHandler:
                     'y': int(box['y'] + box['height'] / 2)
                 }
                 # CRITICAL: Save cursor position BEFORE clicking link (for navigation persistence)
-                if is_link:
+                # (no cursor to persist in the headless profile)
+                if is_link and getattr(cursor_controller, 'visual', True):
                     await self.page.evaluate(f"""
                         () => {{
                             const position = {{
@@ -10,6 +10,8 @@ import logging
 from typing import Optional, Dict, Any
 from playwright.async_api import Page, ElementHandle
 
+from ..element_index import with_element_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,93 +42,69 @@ class ElementFinder:
         Returns:
             Dictionary with 'found', 'x', 'y', 'element', 'isSubmit' or None
         """
-        result = await self.page.evaluate("""
-            ({text, index}) => {
-                const textLower = text.toLowerCase();
+        result = await self.page.evaluate(with_element_index("""
+            ({text, index}, elementIndex) => {
+                const textLower = elementIndex.normalize(text);
                 const matches = [];
+                const isHidden = (el) => elementIndex.isHidden(el);
+                const center = (el) => {
+                    const rect = el.getBoundingClientRect();
+                    return {
+                        x: Math.floor(rect.left + rect.width / 2),
+                        y: Math.floor(rect.top + rect.height / 2)
+                    };
+                };
+                
+                // Candidates come from the shared index (text contains search text, document order)
+                const candidates = elementIndex.match('text', textLower);
                 
                 // Strategy 1: Prioritize SUBMIT buttons first (most important for forms)
                 const submitSelectors = ['input[type="submit"]', 'button[type="submit"]', 'button:not([type])'];
                 for (const selector of submitSelectors) {
-                    const elements = Array.from(document.querySelectorAll(selector));
-                    for (const el of elements) {
-                        if (el.offsetParent === null || el.style.display === 'none') {
+                    for (const el of candidates) {
+                        if (!el.matches(selector) || isHidden(el)) {
                             continue;
                         }
                         
-                        // Check if it's inside a form
+                        // Higher priority for submit buttons in forms
                         const isInForm = el.closest('form') !== null;
-                        
-                        // Check direct text content
-                        const directText = Array.from(el.childNodes)
-                            .filter(node => node.nodeType === Node.TEXT_NODE)
-                            .map(node => node.textContent.trim())
-                            .join(' ')
-                            .trim();
-                        const elText = (directText || el.textContent || el.innerText || el.value || '').trim();
-                        
-                        if (elText.toLowerCase() === textLower || elText.toLowerCase().includes(textLower)) {
-                            const rect = el.getBoundingClientRect();
-                            // Higher priority for submit buttons in forms
-                            matches.push({
-                                element: el,
-                                x: Math.floor(rect.left + rect.width / 2),
-                                y: Math.floor(rect.top + rect.height / 2),
-                                priority: isInForm ? 10 : 5,  // Higher priority if in form
-                                isSubmit: true
-                            });
-                        }
+                        matches.push(Object.assign({
+                            element: el,
+                            priority: isInForm ? 10 : 5,  // Higher priority if in form
+                            isSubmit: true
+                        }, center(el)));
                     }
                 }
                 
                 // Strategy 2: Other clickable elements (links, buttons) - but lower priority
                 const clickableSelectors = ['button', 'a', 'input[type="button"]', '[role="button"]', '[role="link"]'];
                 for (const selector of clickableSelectors) {
-                    const elements = Array.from(document.querySelectorAll(selector));
-                    for (const el of elements) {
+                    for (const el of candidates) {
                         // Skip if already in matches
-                        if (matches.some(m => m.element === el)) {
-                            continue;
-                        }
-                        
-                        if (el.offsetParent === null || el.style.display === 'none') {
+                        if (!el.matches(selector) || matches.some(m => m.element === el) || isHidden(el)) {
                             continue;
                         }
                         
-                        // Check direct text content
-                        const directText = Array.from(el.childNodes)
-                            .filter(node => node.nodeType === Node.TEXT_NODE)
-                            .map(node => node.textContent.trim())
-                            .join(' ')
-                            .trim();
-                        const elText = (directText || el.textContent || el.innerText || '').trim();
-                        
-                        if (elText.toLowerCase() === textLower || elText.toLowerCase().includes(textLower)) {
-                            const rect = el.getBoundingClientRect();
-                            const tag = el.tagName.toLowerCase();
-                            const isInForm = el.closest('form') !== null;
-                            // Lower priority for links, especially if not in form
-                            matches.push({
-                                element: el,
-                                x: Math.floor(rect.left + rect.width / 2),
-                                y: Math.floor(rect.top + rect.height / 2),
-                                priority: (tag === 'a' && !isInForm) ? 1 : 3,  // Links outside forms have lowest priority
-                                isSubmit: false
-                            });
-                        }
+                        const tag = el.tagName.toLowerCase();
+                        const isInForm = el.closest('form') !== null;
+                        // Lower priority for links, especially if not in form
+                        matches.push(Object.assign({
+                            element: el,
+                            priority: (tag === 'a' && !isInForm) ? 1 : 3,  // Links outside forms have lowest priority
+                            isSubmit: false
+                        }, center(el)));
                     }
                 }
                 
                 // Strategy 3: Labels that can be clicked to focus their associated input
-                const labels = Array.from(document.querySelectorAll('label'));
-                for (const label of labels) {
-                    if (label.offsetParent === null || label.style.display === 'none') {
+                for (const label of elementIndex.labels()) {
+                    if (isHidden(label)) {
                         continue;
                     }
                     
-                    const labelText = (label.textContent || label.innerText || '').trim().toLowerCase();
+                    const labelText = elementIndex.value(label, 'text');
                     // More flexible matching: check if label text contains the search text or vice versa
-                    if (labelText.includes(textLower) || textLower.includes(labelText) || labelText === textLower) {
+                    if (labelText && (labelText.includes(textLower) || textLower.includes(labelText))) {
                         // Find associated input
                         let input = null;
                         const forAttr = label.getAttribute('for');
@@ -137,52 +115,39 @@ class ElementFinder:
                             input = label.querySelector('input, textarea, select');
                         }
                         if (input && input.offsetParent !== null) {
-                            const rect = input.getBoundingClientRect();
-                            matches.push({
+                            matches.push(Object.assign({
                                 element: input,
-                                x: Math.floor(rect.left + rect.width / 2),
-                                y: Math.floor(rect.top + rect.height / 2),
                                 priority: 4,  // Higher than generic clickable, lower than buttons
                                 isSubmit: false
-                            });
+                            }, center(input)));
                         } else {
                             // If no input found, click the label itself (some labels are clickable)
-                            const rect = label.getBoundingClientRect();
-                            matches.push({
+                            matches.push(Object.assign({
                                 element: label,
-                                x: Math.floor(rect.left + rect.width / 2),
-                                y: Math.floor(rect.top + rect.height / 2),
                                 priority: 3,
                                 isSubmit: false
-                            });
+                            }, center(label)));
                         }
                     }
                 }
                 
                 // Strategy 4: Any clickable element with text (lowest priority)
                 if (matches.length <= index) {
-                    const allElements = Array.from(document.querySelectorAll('*'));
-                    for (const el of allElements) {
-                        if (el.offsetParent === null || el.style.display === 'none') {
+                    for (const el of elementIndex.match(['text', 'content'], textLower)) {
+                        if (isHidden(el) || matches.some(m => m.element === el)) {
                             continue;
                         }
                         
-                        const elText = (el.textContent || el.innerText || '').trim();
-                        if (elText.toLowerCase().includes(textLower)) {
-                            const tag = el.tagName.toLowerCase();
-                            if (tag === 'button' || tag === 'a' || 
-                                el.getAttribute('role') === 'button' ||
-                                el.getAttribute('onclick') ||
-                                el.style.cursor === 'pointer') {
-                                const rect = el.getBoundingClientRect();
-                                matches.push({
-                                    element: el,
-                                    x: Math.floor(rect.left + rect.width / 2),
-                                    y: Math.floor(rect.top + rect.height / 2),
-                                    priority: 2,
-                                    isSubmit: false
-                                });
-                            }
+                        const tag = el.tagName.toLowerCase();
+                        if (tag === 'button' || tag === 'a' || 
+                            el.getAttribute('role') === 'button' ||
+                            el.getAttribute('onclick') ||
+                            el.style.cursor === 'pointer') {
+                            matches.push(Object.assign({
+                                element: el,
+                                priority: 2,
+                                isSubmit: false
+                            }, center(el)));
                         }
                     }
                 }
@@ -201,7 +166,7 @@ class ElementFinder:
                 }
                 return {found: false};
             }
-        """, {'text': text, 'index': index})
+        """), {'text': text, 'index': index})
         
         return result if result.get('found') else None
     
@@ -219,107 +184,21 @@ class ElementFinder:
             Dictionary with 'found', 'x', 'y' or None
         """
         labelTextLower = label_text.lower()
-        result = await self.page.evaluate("""
-            (args) => {
-                const labelText = args.labelText;
+        result = await self.page.evaluate(with_element_index("""
+            (args, elementIndex) => {
                 const labelTextLower = args.labelTextLower;
-                
-                // Strategy 1: Find by label text
-                const labels = Array.from(document.querySelectorAll('label'));
-                for (const label of labels) {
-                    const labelTextContent = (label.textContent || '').toLowerCase();
-                    if (labelTextContent.includes(labelTextLower)) {
-                        const inputId = label.getAttribute('for');
-                        let input = null;
-                        if (inputId) {
-                            input = document.getElementById(inputId);
-                        }
-                        if (!input) {
-                            input = label.parentElement?.querySelector('input, textarea');
-                        }
-                        if (input) {
-                            const rect = input.getBoundingClientRect();
-                            return {
-                                found: true,
-                                x: Math.floor(rect.left + rect.width / 2),
-                                y: Math.floor(rect.top + rect.height / 2)
-                            };
-                        }
-                    }
-                }
-                
-                // Strategy 2: Find by placeholder
-                const inputs = Array.from(document.querySelectorAll('input, textarea'));
-                for (const input of inputs) {
-                    const placeholder = (input.placeholder || '').toLowerCase();
-                    if (placeholder.includes(labelTextLower)) {
-                        const rect = input.getBoundingClientRect();
-                        return {
-                            found: true,
-                            x: Math.floor(rect.left + rect.width / 2),
-                            y: Math.floor(rect.top + rect.height / 2)
-                        };
-                    }
-                }
-                
-                // Strategy 3: Find by name/id/aria-label (for common field names)
-                for (const input of inputs) {
-                    const name = (input.name || '').toLowerCase();
-                    const id = (input.id || '').toLowerCase();
-                    const ariaLabel = (input.getAttribute('aria-label') || '').toLowerCase();
-                    
-                    if (name.includes(labelTextLower) || 
-                        id.includes(labelTextLower) || 
-                        ariaLabel.includes(labelTextLower)) {
-                        const rect = input.getBoundingClientRect();
-                        return {
-                            found: true,
-                            x: Math.floor(rect.left + rect.width / 2),
-                            y: Math.floor(rect.top + rect.height / 2)
-                        };
-                    }
-                }
-                
-                // Strategy 4: Find by type for common field types
-                const typeMap = {
-                    'email': ['email', 'e-mail', 'e-mail', 'correio', 'mail'],
-                    'password': ['password', 'senha', 'pass', 'pwd'],
-                    'login': ['login', 'username', 'user', 'usuário']
-                };
-                
-                for (const input of inputs) {
-                    const inputType = input.type || '';
-                    for (const [type, keywords] of Object.entries(typeMap)) {
-                        // Check if input type matches AND label text contains any keyword
-                        if (inputType === type && keywords.some(k => labelTextLower.includes(k) || k.includes(labelTextLower))) {
-                            const rect = input.getBoundingClientRect();
-                            return {
-                                found: true,
-                                x: Math.floor(rect.left + rect.width / 2),
-                                y: Math.floor(rect.top + rect.height / 2)
-                            };
-                        }
-                    }
-                }
-                
-                // Strategy 5: Find by input order (first text input is usually email/login)
-                // Only if searching for email/login and no other strategy worked
-                if (labelTextLower.includes('email') || labelTextLower.includes('login') || labelTextLower.includes('mail')) {
-                    const textInputs = inputs.filter(inp => inp.type === 'text' || inp.type === 'email');
-                    if (textInputs.length > 0) {
-                        const firstTextInput = textInputs[0];
-                        const rect = firstTextInput.getBoundingClientRect();
-                        return {
-                            found: true,
-                            x: Math.floor(rect.left + rect.width / 2),
-                            y: Math.floor(rect.top + rect.height / 2)
-                        };
-                    }
+                const input = elementIndex.findInputByLabel(labelTextLower, {extended: false});
+                if (input) {
+                    const rect = input.getBoundingClientRect();
+                    return {
+                        found: true,
+                        x: Math.floor(rect.left + rect.width / 2),
+                        y: Math.floor(rect.top + rect.height / 2)
+                    };
                 }
-                
                 return {found: false};
             }
-        """, {'labelText': label_text, 'labelTextLower': labelTextLower})
+        """), {'labelText': label_text, 'labelTextLower': labelTextLower})
         
         return result if result.get('found') else None
     
@@ -337,98 +216,9 @@ class ElementFinder:
             ElementHandle or None
         """
         labelTextLower = label_text.lower()
-        element = await self.page.evaluate_handle("""
-            (args) => {
-                const labelText = args.labelText;
-                const labelTextLower = args.labelTextLower;
-                
-                // Strategy 1: Find by label
-                const labels = Array.from(document.querySelectorAll('label'));
-                for (const label of labels) {
-                    const labelTextContent = (label.textContent || '').toLowerCase();
-                    if (labelTextContent.includes(labelTextLower)) {
-                        const inputId = label.getAttribute('for');
-                        if (inputId) {
-                            const input = document.getElementById(inputId);
-                            if (input) return input;
-                        }
-                        const input = label.parentElement?.querySelector('input, textarea');
-                        if (input) return input;
-                    }
-                }
-                
-                // Strategy 2: Find by placeholder
-                const inputs = Array.from(document.querySelectorAll('input, textarea'));
-                for (const input of inputs) {
-                    const placeholder = (input.placeholder || '').toLowerCase();
-                    if (placeholder.includes(labelTextLower)) {
-                        return input;
-                    }
-                }
-                
-                // Strategy 3: Find by name/id/aria-label
-                for (const input of inputs) {
-                    const name = (input.name || '').toLowerCase();
-                    const id = (input.id || '').toLowerCase();
-                    const ariaLabel = (input.getAttribute('aria-label') || '').toLowerCase();
-                    
-                    if (name.includes(labelTextLower) || 
-                        id.includes(labelTextLower) || 
-                        ariaLabel.includes(labelTextLower)) {
-                        return input;
-                    }
-                }
-                
-                // Strategy 4: Find by type
-                const typeMap = {
-                    'email': ['email', 'e-mail', 'e-mail', 'correio', 'mail'],
-                    'password': ['password', 'senha', 'pass', 'pwd'],
-                    'login': ['login', 'username', 'user', 'usuário']
-                };
-                
-                for (const input of inputs) {
-                    const inputType = input.type || '';
-                    for (const [type, keywords] of Object.entries(typeMap)) {
-                        // Check if input type matches AND label text contains any keyword
-                        if (inputType === type && keywords.some(k => labelTextLower.includes(k) || k.includes(labelTextLower))) {
-                            return input;
-                        }
-                    }
-                }
-                
-                // Strategy 5: Find by input order (first text input is usually email/login)
-                // Only if searching for email/login and no other strategy worked
-                if (labelTextLower.includes('email') || labelTextLower.includes('login') || labelTextLower.includes('mail')) {
-                    const textInputs = inputs.filter(inp => inp.type === 'text' || inp.type === 'email');
-                    if (textInputs.length > 0) {
-                        return textInputs[0];
-                    }
-                }
-                
-                // Strategy 6: Find by name/id if it matches common patterns
-                for (const input of inputs) {
-                    const name = (input.name || '').toLowerCase();
-                    const id = (input.id || '').toLowerCase();
-                    
-                    // Common patterns: login, email, username, user
-                    if (labelTextLower.includes('email') || labelTextLower.includes('login') || labelTextLower.includes('mail')) {
-                        if (name === 'login' || name === 'email' || name === 'username' || name === 'user' ||
-                            id === 'login' || id === 'email' || id === 'username' || id === 'user') {
-                            return input;
-                        }
-                    }
-                    // Common patterns: password, pass, pwd
-                    if (labelTextLower.includes('password') || labelTextLower.includes('senha') || labelTextLower.includes('pass')) {
-                        if (name === 'password' || name === 'pass' || name === 'pwd' ||
-                            id === 'password' || id === 'pass' || id === 'pwd') {
-                            return input;
-                        }
-                    }
-                }
-                
-                return null;
-            }
-        """, {'labelText': label_text, 'labelTextLower': labelTextLower})
+        element = await self.page.evaluate_handle(with_element_index("""
+            (args, elementIndex) => elementIndex.findInputByLabel(args.labelTextLower, {extended: true})
+        """), {'labelText': label_text, 'labelTextLower': labelTextLower})
         
         if element:
             # evaluate_handle already returns an ElementHandle, not a JSHandle
@@ -63,7 +63,8 @@ class ElementInteractions:
         selector: Optional[str] = None,
         clear: bool = True,
         cursor_controller = None,
-        visual_feedback = None
+        visual_feedback = None,
+        mode: Optional[str] = None
     ) -> bool:
         """
         Type text into an input field.
@@ -76,7 +77,8 @@ class ElementInteractions:
             selector=selector,
             clear=clear,
             cursor_controller=cursor_controller,
-            visual_feedback=visual_feedback
+            visual_feedback=visual_feedback,
+            mode=mode
         )
     
     async def submit_form(
@@ -11,6 +11,13 @@ import logging
 from typing import Optional
 from playwright.async_api import Page, ElementHandle
 
+from ...typing_modes import (
+    CHUNK_DELAY,
+    CHUNK_SIZE,
+    FILL_ELEMENT_SCRIPT,
+    TypingMode,
+    resolve_typing_mode,
+)
 from .element_finder import ElementFinder
 from .focus_helper import FocusHelper
 
@@ -43,7 +50,8 @@ class TypeHandler:
         selector: Optional[str] = None,
         clear: bool = True,
         cursor_controller = None,
-        visual_feedback = None
+        visual_feedback = None,
+        mode: Optional[str] = None
     ) -> bool:
         """
         Type text into an input field.
@@ -55,6 +63,7 @@ class TypeHandler:
             clear: Clear field before typing
             cursor_controller: Optional CursorController instance for visual feedback
             visual_feedback: Optional VisualFeedback instance
+            mode: Typing mode (None = controller's mode, or fast_mode)
         
         Returns:
             True if typed successfully, False otherwise
@@ -97,8 +106,11 @@ class TypeHandler:
             await self._click_before_typing(element, element_coords, cursor_controller, visual_feedback)
             
             # Type the text
-            if self.fast_mode:
+            typing_mode = self._resolve_mode(mode, cursor_controller)
+            if typing_mode == TypingMode.INSTANT:
                 await self._type_fast_mode(element, text)
+            elif typing_mode == TypingMode.CHUNKED:
+                await self._type_chunked(element, text, clear)
             else:
                 await self._type_normal_mode(element, text, clear, element_coords, cursor_controller, visual_feedback)
             
@@ -108,6 +120,14 @@ class TypeHandler:
             logger.error(f"Error typing text: {e}")
             return False
     
+    def _resolve_mode(self, mode: Optional[str], cursor_controller) -> TypingMode:
+        """Get effective typing mode (explicit mode, controller's mode, then fast_mode)."""
+        if mode is None:
+            if cursor_controller is None or self.fast_mode:
+                return TypingMode.INSTANT if self.fast_mode else TypingMode.REALISTIC
+            mode = getattr(cursor_controller, 'typing_mode', TypingMode.AUTO)
+        return resolve_typing_mode(mode, getattr(cursor_controller, 'recording_video', False))
+    
     async def _click_before_typing(
         self,
         element: ElementHandle,
@@ -203,15 +223,7 @@ class TypeHandler:
         """Type text in fast mode (instant value setting)."""
         text_str = str(text)
         logger.debug(f"[TYPE] Fast mode: Setting value '{text_str[:50]}...' (length={len(text_str)}) and dispatching input event")
-        await element.evaluate("""
-            (el, value) => {
-                el.value = value;
-                const inputEvent = new Event('input', { bubbles: true, cancelable: true });
-                el.dispatchEvent(inputEvent);
-                const changeEvent = new Event('change', { bubbles: true, cancelable: true });
-                el.dispatchEvent(changeEvent);
-            }
-        """, text_str)
+        await element.evaluate(FILL_ELEMENT_SCRIPT, text_str)
         logger.debug(f"[TYPE] Fast mode: Input event dispatched, value='{text_str[:50]}...'")
         await asyncio.sleep(0.15)
         logger.debug(f"[TYPE] Fast mode: Triggering blur to finalize input")
@@ -224,6 +236,18 @@ class TypeHandler:
         await asyncio.sleep(0.2)
         logger.debug(f"[TYPE] Fast mode: Typing completed, value='{text_str[:50]}...'")
     
+    async def _type_chunked(self, element: ElementHandle, text: str, clear: bool) -> None:
+        """Type text in chunks with insert_text (medium realism, few round trips)."""
+        text_str = str(text)
+        logger.debug(f"[TYPE] Chunked mode: Inserting '{text_str[:50]}...' in chunks of {CHUNK_SIZE}")
+        if clear:
+            await element.fill('')
+        for start in range(0, len(text_str), CHUNK_SIZE):
+            await self.page.keyboard.insert_text(text_str[start:start + CHUNK_SIZE])
+            await asyncio.sleep(CHUNK_DELAY)
+        await element.evaluate('el => el.blur()')
+        await asyncio.sleep(0.1)
+    
     async def _type_normal_mode(
         self,
         element: ElementHandle,
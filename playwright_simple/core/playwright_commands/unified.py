@@ -232,7 +232,8 @@ async def unified_type(
     cursor_controller = None,
     fast_mode: bool = False,
     cache_key: Optional[Any] = None,
-    cache: Optional[Dict[Any, PlaywrightCommands]] = None
+    cache: Optional[Dict[Any, PlaywrightCommands]] = None,
+    mode: Optional[str] = None
 ) -> bool:
     """
     Unified type function used by ALL type operations.
@@ -250,6 +251,7 @@ async def unified_type(
         fast_mode: Enable fast mode
         cache_key: Optional key for caching PlaywrightCommands
         cache: Optional cache dictionary
+        mode: Typing mode (auto, instant, chunked, realistic; None = controller's mode)
     
     Returns:
         True if typed successfully, False otherwise
@@ -276,7 +278,8 @@ async def unified_type(
             into=into,
             selector=selector,
             clear=clear,
-            cursor_controller=cursor_controller
+            cursor_controller=cursor_controller,
+            mode=mode
         )
         logger.debug(f"unified_type result: {result} (text={text}, into={into}, selector={selector})")
         return result
@@ -6,12 +6,18 @@ Recorder module for interactive test recording.
 Provides functionality to record user interactions and convert them to YAML.
 """
 
-from .element_identifier import ElementIdentifier
-from .recorder import Recorder
-from .event_capture import EventCapture
-from .action_converter import ActionConverter
-from .yaml_writer import YAMLWriter
-from .console_interface import ConsoleInterface
+import importlib
+
+# Resolved on first access (PEP 562): the CLI imports command_server from
+# this package without loading the Recorder and Playwright.
+_LAZY = {
+    'ElementIdentifier': '.element_identifier',
+    'Recorder': '.recorder',
+    'EventCapture': '.event_capture',
+    'ActionConverter': '.action_converter',
+    'YAMLWriter': '.yaml_writer',
+    'ConsoleInterface': '.console_interface',
+}
 
 __all__ = [
     'ElementIdentifier',
@@ -22,3 +28,15 @@ __all__ = [
     'ConsoleInterface'
 ]
 
+
+def __getattr__(name):
+    """Import public names on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -6,11 +6,12 @@ Action State Capture module.
 Captures and compares page state before/after actions to validate if actions worked.
 """
 
-import hashlib
 import logging
 from typing import Dict, Any, Optional, List
 from playwright.async_api import Page
 
+from ..state import capture_page_snapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,66 +30,20 @@ class ActionStateCapture:
             Dictionary with state information:
             - url: Current page URL
             - title: Page title
-            - html_hash: Hash of page HTML (for quick comparison)
+            - html_hash: Structural hash of the DOM (for quick comparison)
             - visible_elements: List of visible interactive elements
             - load_state: Current load state
         """
         state = {}
         try:
             state['url'] = page.url
-            state['title'] = await page.title()
-            
-            # Get HTML hash for quick comparison
-            try:
-                html_content = await page.content()
-                state['html_hash'] = hashlib.md5(html_content.encode()).hexdigest()[:16]
-            except:
-                state['html_hash'] = None
-            
-            # Get visible interactive elements (buttons, links, inputs)
-            try:
-                visible_elements = await page.evaluate("""
-                    () => {
-                        const elements = [];
-                        const selectors = [
-                            'button:visible',
-                            'a:visible',
-                            'input:visible',
-                            '[role="button"]:visible',
-                            '[onclick]:visible'
-                        ];
-                        
-                        selectors.forEach(selector => {
-                            document.querySelectorAll(selector).forEach(el => {
-                                const text = (el.textContent || el.innerText || el.value || '').trim();
-                                if (text) {
-                                    elements.push({
-                                        tag: el.tagName.toLowerCase(),
-                                        text: text.substring(0, 50),
-                                        id: el.id || '',
-                                        className: el.className || ''
-                                    });
-                                }
-                            });
-                        });
-                        
-                        return elements;
-                    }
-                """)
-                state['visible_elements'] = visible_elements
-                state['element_count'] = len(visible_elements)
-            except Exception as e:
-                logger.debug(f"Error capturing visible elements: {e}")
-                state['visible_elements'] = []
-                state['element_count'] = 0
-            
-            # Get load state
-            try:
-                load_state = await page.evaluate("document.readyState")
-                state['load_state'] = load_state
-            except:
-                state['load_state'] = 'unknown'
-                
+            # URL, title, DOM hash, visible elements and readiness in one round trip
+            snapshot = await capture_page_snapshot(page, include_elements=True)
+            state['title'] = snapshot['title']
+            state['html_hash'] = snapshot['dom_hash']
+            state['visible_elements'] = snapshot['elements']
+            state['element_count'] = len(snapshot['elements'])
+            state['load_state'] = snapshot['ready_state']
         except Exception as e:
             logger.error(f"Error capturing state: {e}")
             state['error'] = str(e)
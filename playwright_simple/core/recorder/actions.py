@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Typed step actions.
+
+One dataclass per action (click, type, submit, go_to, wait) plus a dispatch
+table keyed by the YAML action name. Step executors and the command server
+pass these objects straight to the interaction handlers; string parsing is
+only done at the CLI boundary (``from_args``).
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Dict, Optional, Type, Union
+
+from ..playwright_commands.unified import parse_click_args, parse_type_args
+
+
+class _Action(ABC):
+    """Shared construction helpers for actions."""
+
+    name: ClassVar[str] = ''
+
+    @classmethod
+    def from_step(cls, step: Dict[str, Any]) -> '_Action':
+        """Build action from a YAML step dictionary."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in step.items() if key in known})
+
+    @classmethod
+    @abstractmethod
+    def from_args(cls, args: str) -> '_Action':
+        """Build action from CLI command arguments."""
+
+    @classmethod
+    def coerce(cls, value: Union['_Action', Dict[str, Any], str, None]) -> '_Action':
+        """
+        Get an action from an action object, a step/args dict or a CLI string.
+
+        Args:
+            value: Action instance, dictionary or command arguments string
+
+        Returns:
+            Action instance
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls.from_step(value)
+        return cls.from_args(value or '')
+
+
+@dataclass(frozen=True)
+class ClickAction(_Action):
+    """Click an element by text, CSS selector or ARIA role."""
+
+    name: ClassVar[str] = 'click'
+
+    text: Optional[str] = None
+    selector: Optional[str] = None
+    role: Optional[str] = None
+    index: int = 0
+
+    @classmethod
+    def from_args(cls, args: str) -> 'ClickAction':
+        """Build click from CLI arguments ("text", selector "#id", role button [0])."""
+        return cls(**parse_click_args(args))
+
+    def describe(self) -> str:
+        """Short description of the target (for logs and action ids)."""
+        if self.text:
+            return self.text
+        if self.selector:
+            return f"selector {self.selector}"
+        if self.role:
+            return f"role {self.role}[{self.index}]"
+        return ''
+
+
+@dataclass(frozen=True)
+class TypeAction(_Action):
+    """
+    Type text, optionally into a field found by label/placeholder or selector.
+
+    ``mode`` selects the typing strategy for this step (auto, instant,
+    chunked, realistic); None uses the run's default.
+    """
+
+    name: ClassVar[str] = 'type'
+
+    text: str = ''
+    into: Optional[str] = None
+    selector: Optional[str] = None
+    mode: Optional[str] = None
+
+    @classmethod
+    def from_step(cls, step: Dict[str, Any]) -> 'TypeAction':
+        """Build type action from a YAML step (field is ``field_text``, mode is ``typing_mode``)."""
+        return cls(
+            text=step.get('text') or '',
+            into=step.get('into') or step.get('field_text'),
+            selector=step.get('selector'),
+            mode=step.get('typing_mode')
+        )
+
+    @classmethod
+    def from_args(cls, args: str) -> 'TypeAction':
+        """Build type action from CLI arguments ("text" into "field")."""
+        parsed = parse_type_args(args)
+        return cls(text=parsed['text'] or '', into=parsed['into'], selector=parsed['selector'])
+
+    @property
+    def field(self) -> Optional[str]:
+        """Field identifier used to locate the input (selector or label text)."""
+        return self.selector or self.into
+
+    def describe(self) -> str:
+        """Short description of the action (for logs and action ids)."""
+        return f"{self.text} into {self.field}" if self.field else self.text
+
+
+@dataclass(frozen=True)
+class SubmitAction(_Action):
+    """Submit the current form, optionally through a button with given text."""
+
+    name: ClassVar[str] = 'submit'
+
+    button_text: Optional[str] = None
+
+    @classmethod
+    def from_step(cls, step: Dict[str, Any]) -> 'SubmitAction':
+        """Build submit from a YAML step (``button_text`` or ``text``)."""
+        return cls(button_text=step.get('button_text') or step.get('text'))
+
+    @classmethod
+    def from_args(cls, args: str) -> 'SubmitAction':
+        """Build submit from CLI arguments (optional "button text")."""
+        button_text = args.strip().strip('"\'') if args and args.strip() else None
+        return cls(button_text=button_text)
+
+    def describe(self) -> str:
+        """Short description of the action (for logs and action ids)."""
+        return self.button_text or ''
+
+
+@dataclass(frozen=True)
+class GoToAction(_Action):
+    """Navigate to a URL."""
+
+    name: ClassVar[str] = 'go_to'
+
+    url: Optional[str] = None
+
+    @classmethod
+    def from_args(cls, args: str) -> 'GoToAction':
+        """Build navigation from CLI arguments (URL)."""
+        url = args.strip().strip('"\'') if args else ''
+        return cls(url=url or None)
+
+
+@dataclass(frozen=True)
+class WaitAction(_Action):
+    """Sleep for a number of seconds."""
+
+    name: ClassVar[str] = 'wait'
+
+    seconds: float = 1.0
+
+    @classmethod
+    def from_args(cls, args: str) -> 'WaitAction':
+        """Build wait from CLI arguments (seconds)."""
+        args = (args or '').strip()
+        return cls(seconds=float(args)) if args else cls()
+
+
+Action = Union[ClickAction, TypeAction, SubmitAction, GoToAction, WaitAction]
+
+# Dispatch table: YAML action name -> action class
+ACTION_TYPES: Dict[str, Type[_Action]] = {
+    action_type.name: action_type
+    for action_type in (ClickAction, TypeAction, SubmitAction, GoToAction, WaitAction)
+}
+
+
+def action_from_step(step: Dict[str, Any]) -> Optional[Action]:
+    """
+    Build the typed action for a YAML step.
+
+    Args:
+        step: Step dictionary with an 'action' key
+
+    Returns:
+        Action instance, or None for unknown actions
+    """
+    action_type = ACTION_TYPES.get(step.get('action'))
+    if action_type is None:
+        return None
+    return action_type.from_step(step)
@@ -5,10 +5,10 @@ Click handler for Playwright commands.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
 from .base_handler import BaseHandler
-from ...playwright_commands.unified import parse_click_args
+from ..actions import ClickAction
 from ..action_state_capture import ActionStateCapture
 
 logger = logging.getLogger(__name__)
@@ -17,8 +17,13 @@ logger = logging.getLogger(__name__)
 class ClickHandler(BaseHandler):
     """Handles click commands."""
     
-    async def handle_click(self, args: str) -> Dict[str, Any]:
-        """Handle click command."""
+    async def handle_click(self, args: Union[ClickAction, Dict[str, Any], str]) -> Dict[str, Any]:
+        """
+        Handle click command.
+        
+        Args:
+            args: ClickAction (or step dict), or CLI arguments string
+        """
         result = {
             'success': False,
             'element_found': False,
@@ -41,11 +46,12 @@ class ClickHandler(BaseHandler):
                 )
             return result
         
-        if not args:
+        action = ClickAction.coerce(args)
+        if not (action.text or action.selector or action.role):
             result['error'] = "No arguments provided"
             return result
         
-        action_id = f"click_{args}"
+        action_id = f"click_{action.describe()}"
         if self.recorder_logger:
             self.recorder_logger.start_action_timer(action_id)
         
@@ -70,15 +76,13 @@ class ClickHandler(BaseHandler):
         if not cursor_controller.is_active:
             await cursor_controller.start()
         
-        parsed = parse_click_args(args)
-        
         element_found = False
-        if parsed['text']:
-            element_found = await cursor_controller.click_by_text(parsed['text'])
-        elif parsed['selector']:
-            element_found = await cursor_controller.click_by_selector(parsed['selector'])
-        elif parsed['role']:
-            element_found = await cursor_controller.click_by_role(parsed['role'], parsed['index'])
+        if action.text:
+            element_found = await cursor_controller.click_by_text(action.text)
+        elif action.selector:
+            element_found = await cursor_controller.click_by_selector(action.selector)
+        elif action.role:
+            element_found = await cursor_controller.click_by_role(action.role, action.index)
         else:
             result['error'] = "Invalid arguments"
             return result
@@ -91,8 +95,8 @@ class ClickHandler(BaseHandler):
                 duration_ms = self.recorder_logger.end_action_timer(action_id)
                 self.recorder_logger.log_critical_failure(
                     action='pw-click',
-                    error=f"Element not found: {args}",
-                    element_info={'text': parsed.get('text'), 'selector': parsed.get('selector'), 'role': parsed.get('role')},
+                    error=f"Element not found: {action.describe()}",
+                    element_info={'text': action.text, 'selector': action.selector, 'role': action.role},
                     page_state=state_before
                 )
             return result
@@ -112,9 +116,9 @@ class ClickHandler(BaseHandler):
         duration_ms = self.recorder_logger.end_action_timer(action_id) if self.recorder_logger else None
         
         element_info = {
-            'text': parsed.get('text'),
-            'selector': parsed.get('selector'),
-            'role': parsed.get('role')
+            'text': action.text,
+            'selector': action.selector,
+            'role': action.role
         }
         
         if self.recorder_logger:
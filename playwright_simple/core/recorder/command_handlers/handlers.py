@@ -6,8 +6,9 @@ Main CommandHandlers class.
 Coordinates all handler modules.
 """
 
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, Any, Union
 
+from ..actions import ClickAction, TypeAction, SubmitAction
 from .recording_handlers import RecordingHandlers
 from .metadata_handlers import MetadataHandlers
 from .cursor_handlers import CursorHandlers
@@ -155,16 +156,16 @@ class CommandHandlers:
         """Handle find-all command."""
         await self._playwright.handle_find_all(args)
     
-    async def handle_pw_click(self, args: str):
-        """Handle pw-click command."""
+    async def handle_pw_click(self, args: Union[ClickAction, Dict[str, Any], str]):
+        """Handle pw-click command (ClickAction, step dict or CLI arguments string)."""
         return await self._playwright.handle_pw_click(args)
     
-    async def handle_pw_type(self, args: str):
-        """Handle pw-type command."""
+    async def handle_pw_type(self, args: Union[TypeAction, Dict[str, Any], str]):
+        """Handle pw-type command (TypeAction, step dict or CLI arguments string)."""
         return await self._playwright.handle_pw_type(args)
     
-    async def handle_pw_submit(self, args: str):
-        """Handle pw-submit command."""
+    async def handle_pw_submit(self, args: Union[SubmitAction, Dict[str, Any], str]):
+        """Handle pw-submit command (SubmitAction, step dict or CLI arguments string)."""
         return await self._playwright.handle_pw_submit(args)
     
     async def handle_pw_wait(self, args: str) -> None:
@@ -8,7 +8,9 @@ Handles Playwright direct commands (find, click, type, submit, wait, info, html)
 
 import logging
 import asyncio
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Union
+
+from ..actions import ClickAction, TypeAction, SubmitAction
 
 logger = logging.getLogger(__name__)
 
@@ -181,8 +183,8 @@ class PlaywrightHandlers:
         else:
             print(f"❌ No elements found")
     
-    async def handle_pw_click(self, args: str) -> Dict[str, Any]:
-        """Handle pw-click command."""
+    async def handle_pw_click(self, args: Union[ClickAction, Dict[str, Any], str]) -> Dict[str, Any]:
+        """Handle pw-click command (ClickAction, step dict or CLI arguments string)."""
         from .click_handler import ClickHandler
         
         handler = ClickHandler(
@@ -194,8 +196,8 @@ class PlaywrightHandlers:
         )
         return await handler.handle_click(args)
     
-    async def handle_pw_type(self, args: str) -> Dict[str, Any]:
-        """Handle pw-type command."""
+    async def handle_pw_type(self, args: Union[TypeAction, Dict[str, Any], str]) -> Dict[str, Any]:
+        """Handle pw-type command (TypeAction, step dict or CLI arguments string)."""
         from .type_handler import TypeHandler
         
         handler = TypeHandler(
@@ -207,8 +209,8 @@ class PlaywrightHandlers:
         )
         return await handler.handle_type(args)
     
-    async def handle_pw_submit(self, args: str) -> Dict[str, Any]:
-        """Handle pw-submit command."""
+    async def handle_pw_submit(self, args: Union[SubmitAction, Dict[str, Any], str]) -> Dict[str, Any]:
+        """Handle pw-submit command (SubmitAction, step dict or CLI arguments string)."""
         from .submit_handler import SubmitHandler
         
         handler = SubmitHandler(
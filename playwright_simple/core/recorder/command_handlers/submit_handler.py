@@ -5,9 +5,10 @@ Submit handler for Playwright commands.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
 from .base_handler import BaseHandler
+from ..actions import SubmitAction
 from ..action_converter import ActionConverter
 from ..action_state_capture import ActionStateCapture
 
@@ -17,8 +18,13 @@ logger = logging.getLogger(__name__)
 class SubmitHandler(BaseHandler):
     """Handles submit commands."""
     
-    async def handle_submit(self, args: str) -> Dict[str, Any]:
-        """Handle submit command."""
+    async def handle_submit(self, args: Union[SubmitAction, Dict[str, Any], str]) -> Dict[str, Any]:
+        """
+        Handle submit command.
+        
+        Args:
+            args: SubmitAction (or step dict), or CLI arguments string (optional button text)
+        """
         result = {
             'success': False,
             'element_found': False,
@@ -35,7 +41,8 @@ class SubmitHandler(BaseHandler):
             result['error'] = "Page not available"
             return result
         
-        action_id = f"submit_{args}"
+        action = SubmitAction.coerce(args)
+        action_id = f"submit_{action.describe()}"
         if self.recorder_logger:
             self.recorder_logger.start_action_timer(action_id)
         
@@ -60,7 +67,7 @@ class SubmitHandler(BaseHandler):
         if not cursor_controller.is_active:
             await cursor_controller.start()
         
-        button_text = args.strip().strip('"\'') if args.strip() else None
+        button_text = action.button_text
         
         # Get submit element info
         submit_element_info = None
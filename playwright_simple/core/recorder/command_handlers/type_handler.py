@@ -6,10 +6,10 @@ Type handler for Playwright commands.
 
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
 from .base_handler import BaseHandler
-from ...playwright_commands.unified import parse_type_args
+from ..actions import TypeAction
 from ..action_state_capture import ActionStateCapture
 
 logger = logging.getLogger(__name__)
@@ -18,8 +18,13 @@ logger = logging.getLogger(__name__)
 class TypeHandler(BaseHandler):
     """Handles type commands."""
     
-    async def handle_type(self, args: str) -> Dict[str, Any]:
-        """Handle type command."""
+    async def handle_type(self, args: Union[TypeAction, Dict[str, Any], str]) -> Dict[str, Any]:
+        """
+        Handle type command.
+        
+        Args:
+            args: TypeAction (or step dict), or CLI arguments string
+        """
         result = {
             'success': False,
             'element_found': False,
@@ -38,11 +43,12 @@ class TypeHandler(BaseHandler):
             result['error'] = "Page not available"
             return result
         
-        if not args:
+        action = TypeAction.coerce(args)
+        if not (action.text or action.field):
             result['error'] = "No arguments provided"
             return result
         
-        action_id = f"type_{args}"
+        action_id = f"type_{action.describe()}"
         if self.recorder_logger:
             self.recorder_logger.start_action_timer(action_id)
         
@@ -67,9 +73,7 @@ class TypeHandler(BaseHandler):
         if not cursor_controller.is_active:
             await cursor_controller.start()
         
-        parsed = parse_type_args(args)
-        
-        if not parsed['text']:
+        if not action.text:
             result['error'] = "No text specified"
             return result
         
@@ -78,7 +82,7 @@ class TypeHandler(BaseHandler):
         field_selector_for_value = None
         
         try:
-            if parsed['selector']:
+            if action.selector:
                 field_element_info = await page.evaluate("""
                     (selector) => {
                         const el = document.querySelector(selector);
@@ -97,9 +101,9 @@ class TypeHandler(BaseHandler):
                                 : ''
                         };
                     }
-                """, parsed['selector'])
-                field_selector_for_value = parsed['selector']
-            elif parsed['into']:
+                """, action.selector)
+                field_selector_for_value = action.selector
+            elif action.into:
                 field_element_info = await page.evaluate("""
                     (fieldText) => {
                         const textLower = fieldText.toLowerCase();
@@ -135,7 +139,7 @@ class TypeHandler(BaseHandler):
                         }
                         return null;
                     }
-                """, parsed['into'])
+                """, action.into)
                 if field_element_info and field_element_info.get('id'):
                     field_selector_for_value = f"#{field_element_info['id']}"
         except Exception as e:
@@ -181,10 +185,10 @@ class TypeHandler(BaseHandler):
                 pass
         
         if not field_already_focused and field_element_info:
-            if parsed['selector']:
-                field_clicked = await cursor_controller.click_by_selector(parsed['selector'])
-            elif parsed['into']:
-                field_clicked = await cursor_controller.click_by_text(parsed['into'])
+            if action.selector:
+                field_clicked = await cursor_controller.click_by_selector(action.selector)
+            elif action.into:
+                field_clicked = await cursor_controller.click_by_text(action.into)
         
         result['element_found'] = field_clicked or field_element_info is not None
         
@@ -193,8 +197,8 @@ class TypeHandler(BaseHandler):
             return result
         
         # Type text
-        field_selector = parsed['selector'] or parsed['into'] or None
-        type_success = await cursor_controller.type_text(parsed['text'], field_selector)
+        field_selector = action.field
+        type_success = await cursor_controller.type_text(action.text, field_selector, mode=action.mode)
         
         if not type_success:
             result['error'] = "Failed to type text"
@@ -219,7 +223,7 @@ class TypeHandler(BaseHandler):
         
         value_before = result.get('field_value_before', '')
         value_after = result.get('field_value_after', '')
-        expected_text = parsed['text']
+        expected_text = action.text
         
         result['action_worked'] = (
             value_after != value_before and
@@ -236,10 +240,10 @@ class TypeHandler(BaseHandler):
         
         duration_ms = self.recorder_logger.end_action_timer(action_id) if self.recorder_logger else None
         
-        field = parsed.get('into') or parsed.get('selector') or 'field'
+        field = action.into or action.selector or 'field'
         element_info = {
             'field': field,
-            'text': parsed['text'],
+            'text': action.text,
             'value_before': value_before,
             'value_after': value_after
         }
@@ -4,7 +4,9 @@
 Command Server for Recorder.
 
 Allows external commands (from CLI) to control an active recording session.
-Uses file-based IPC for communication.
+Uses a Unix domain socket (see core/ipc_server.py) as the primary transport,
+with the original file-based protocol kept as a fallback for platforms
+without Unix sockets.
 """
 
 import asyncio
@@ -13,7 +15,7 @@ import logging
 import os
 import tempfile
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Union
 from datetime import datetime, timedelta
 
 # Try to import psutil for process checking
@@ -24,11 +26,16 @@ except ImportError:
     psutil = None
     PSUTIL_AVAILABLE = False
 
+from ..ipc_server import IPCServer, IPCClient
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive IPC clients, one per socket path (reused across send_command calls)
+_ipc_clients: Dict[str, IPCClient] = {}
+
 
 class CommandServer:
-    """File-based command server for recorder."""
+    """Command server for recorder (Unix socket with file-based fallback)."""
     
     def __init__(self, recorder_instance, session_id: Optional[str] = None):
         """
@@ -48,7 +55,9 @@ class CommandServer:
         self.command_file = self.temp_dir / f"{self.session_id}.commands"
         self.response_file = self.temp_dir / f"{self.session_id}.response"
         self.lock_file = self.temp_dir / f"{self.session_id}.lock"
+        self.socket_file = self.temp_dir / f"{self.session_id}.sock"
         
+        self.ipc_server: Optional[IPCServer] = None
         self.is_running = False
         self.command_handlers: Dict[str, Callable] = {}
         
@@ -88,6 +97,9 @@ class CommandServer:
         self.register_handler('video-quality', self._handle_video_quality)
         self.register_handler('video-codec', self._handle_video_codec)
         self.register_handler('video-dir', self._handle_video_dir)
+        
+        # Pipelined commands
+        self.register_handler('batch', self._handle_batch)
     
     def register_handler(self, command: str, handler: Callable):
         """Register a command handler."""
@@ -97,21 +109,40 @@ class CommandServer:
         """Start command server."""
         self.is_running = True
         
+        # Primary transport: Unix socket (concurrent, keep-alive)
+        socket_path = None
+        if hasattr(asyncio, 'start_unix_server'):
+            try:
+                self.ipc_server = IPCServer(self.socket_file, self._process_command)
+                await self.ipc_server.start()
+                socket_path = str(self.socket_file)
+            except Exception as e:
+                logger.warning(f"Unix socket unavailable, using file-based commands only: {e}")
+                self.ipc_server = None
+        
         # Create lock file to indicate server is running
         self.lock_file.write_text(json.dumps({
             'session_id': self.session_id,
             'pid': os.getpid(),
-            'started_at': datetime.now().isoformat()
+            'started_at': datetime.now().isoformat(),
+            'socket': socket_path
         }))
         
-        # Start polling loop
+        # Fallback transport: file polling
         asyncio.create_task(self._poll_commands())
-        logger.info(f"Command server started (session: {self.session_id})")
+        logger.info(f"Command server started (session: {self.session_id}, socket: {socket_path})")
     
     async def stop(self):
         """Stop command server."""
         self.is_running = False
         
+        if self.ipc_server:
+            try:
+                await self.ipc_server.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping IPC server: {e}")
+            self.ipc_server = None
+        
         # Clean up files
         try:
             if self.lock_file.exists():
@@ -184,6 +215,58 @@ class CommandServer:
                 'error': str(e)
             }
     
+    async def _handle_batch(self, args: Union[str, list, dict]) -> Dict[str, Any]:
+        """
+        Handle batch command - run several commands in order, server-side.
+        
+        Args may be a list of commands or a dict ``{'commands': [...],
+        'stop_on_error': bool}`` (also accepted as a JSON string). Each command
+        is either ``{'command': 'click', 'args': '"Entrar"'}`` or a string
+        such as ``'click "Entrar"'``. Execution stops at the first failure
+        unless ``stop_on_error`` is False.
+        """
+        if isinstance(args, str):
+            try:
+                args = json.loads(args) if args.strip() else []
+            except json.JSONDecodeError as e:
+                return {'success': False, 'error': f'Invalid batch payload: {e}'}
+        
+        stop_on_error = True
+        if isinstance(args, dict):
+            stop_on_error = args.get('stop_on_error', True)
+            args = args.get('commands', [])
+        if not isinstance(args, list):
+            return {'success': False, 'error': 'Batch payload must be a list of commands'}
+        
+        results = []
+        failed_at = None
+        for index, item in enumerate(args):
+            command_data = _normalize_batch_item(item)
+            if command_data is None:
+                response = {'success': False, 'error': f'Invalid batch item: {item!r}'}
+            elif command_data['command'] == 'batch':
+                response = {'success': False, 'error': 'Nested batch commands are not allowed'}
+            else:
+                command_data['id'] = index
+                response = await self._process_command(command_data)
+            
+            response['command'] = command_data['command'] if command_data else None
+            results.append(response)
+            
+            if not _is_successful_response(response):
+                if failed_at is None:
+                    failed_at = index
+                if stop_on_error:
+                    break
+        
+        return {
+            'success': failed_at is None,
+            'total': len(args),
+            'completed': len(results),
+            'failed_at': failed_at,
+            'results': results
+        }
+    
     async def _handle_find(self, args: str) -> Dict[str, Any]:
         """Handle find command."""
         page = self._get_page()
@@ -230,13 +313,12 @@ class CommandServer:
         
         return {'elements': elements}
     
-    async def _handle_click(self, args: str) -> Dict[str, Any]:
+    async def _handle_click(self, args: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Handle click command using CursorController directly."""
         page = self._get_page()
         if not page:
             return {'error': 'Page not available'}
         
-        from ..playwright_commands.unified import parse_click_args
         
         # Get cursor controller
         cursor_controller = None
@@ -250,27 +332,27 @@ class CommandServer:
         if not cursor_controller.is_active:
             await cursor_controller.start()
         
-        # Parse arguments using unified parser
-        parsed = parse_click_args(args)
+        # CLI strings are parsed once here; structured (dict) args are used as-is
+        from .actions import ClickAction
+        action = ClickAction.coerce(args)
         
         # Execute click using CursorController
         success = False
-        if parsed['text']:
-            success = await cursor_controller.click_by_text(parsed['text'])
-        elif parsed['selector']:
-            success = await cursor_controller.click_by_selector(parsed['selector'])
-        elif parsed['role']:
-            success = await cursor_controller.click_by_role(parsed['role'], parsed['index'])
+        if action.text:
+            success = await cursor_controller.click_by_text(action.text)
+        elif action.selector:
+            success = await cursor_controller.click_by_selector(action.selector)
+        elif action.role:
+            success = await cursor_controller.click_by_role(action.role, action.index)
         
         return {'success': success}
     
-    async def _handle_type(self, args: str) -> Dict[str, Any]:
+    async def _handle_type(self, args: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Handle type command using CursorController directly."""
         page = self._get_page()
         if not page:
             return {'error': 'Page not available'}
         
-        from ..playwright_commands.unified import parse_type_args
         
         # Get cursor controller
         cursor_controller = None
@@ -284,23 +366,26 @@ class CommandServer:
         if not cursor_controller.is_active:
             await cursor_controller.start()
         
-        # Parse arguments using unified parser
-        parsed = parse_type_args(args)
+        # CLI strings are parsed once here; structured (dict) args are used as-is
+        from .actions import TypeAction
+        action = TypeAction.coerce(args)
         
-        if not parsed['text']:
+        if not action.text:
             return {'error': 'Usage: type "text" into "field"'}
         
         # Execute type using CursorController
-        field_selector = parsed['selector'] or parsed['into'] or None
-        success = await cursor_controller.type_text(parsed['text'], field_selector)
+        success = await cursor_controller.type_text(action.text, action.field, mode=action.mode)
         
         return {'success': success}
     
-    async def _handle_submit(self, args: str) -> Dict[str, Any]:
+    async def _handle_submit(self, args: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Handle submit command using PlaywrightHandlers to ensure step is added to YAML."""
+        from .actions import SubmitAction
+        action = SubmitAction.coerce(args)
+        
         # Use PlaywrightHandlers to handle submit, which will add step to YAML
         if hasattr(self.recorder, 'command_handlers') and self.recorder.command_handlers:
-            result = await self.recorder.command_handlers.handle_pw_submit(args)
+            result = await self.recorder.command_handlers.handle_pw_submit(action)
             return {'success': result.get('success', False), 'error': result.get('error')}
         
         # Fallback: use CursorController directly (legacy)
@@ -320,11 +405,8 @@ class CommandServer:
         if not cursor_controller.is_active:
             await cursor_controller.start()
         
-        # Parse button text (optional)
-        button_text = args.strip().strip('"\'') if args.strip() else None
-        
         # Execute submit using CursorController
-        success = await cursor_controller.submit_form(button_text)
+        success = await cursor_controller.submit_form(action.button_text)
         
         return {'success': success}
     
@@ -436,16 +518,17 @@ class CommandServer:
         
         return None
     
-    async def _handle_navigate(self, args: str) -> Dict[str, Any]:
+    async def _handle_navigate(self, args: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Handle navigate command."""
         page = self._get_page()
         if not page:
             return {'error': 'Page not available'}
         
         from ..playwright_commands import PlaywrightCommands
+        from .actions import GoToAction
         commands = PlaywrightCommands(page)
         
-        url = args.strip().strip('"\'')
+        url = GoToAction.coerce(args).url or ''
         success = await commands.navigate(url)
         return {'success': success}
     
@@ -600,6 +683,29 @@ class CommandServer:
         return {'success': True, 'message': f'Video directory set to: {video_dir}'}
 
 
+def _normalize_batch_item(item: Any) -> Optional[Dict[str, Any]]:
+    """Convert a batch entry (dict or 'command args' string) into command data."""
+    if isinstance(item, dict) and item.get('command'):
+        return {'command': str(item['command']).lower(), 'args': item.get('args', '')}
+    if isinstance(item, str) and item.strip():
+        parts = item.strip().split(None, 1)
+        return {'command': parts[0].lower(), 'args': parts[1] if len(parts) > 1 else ''}
+    return None
+
+
+def _is_successful_response(response: Dict[str, Any]) -> bool:
+    """Check both transport-level and handler-level success of a response."""
+    if not response.get('success'):
+        return False
+    result = response.get('result')
+    if isinstance(result, dict):
+        if result.get('error'):
+            return False
+        if result.get('success') is False:
+            return False
+    return True
+
+
 def find_active_sessions() -> list:
     """Find all active recording sessions."""
     temp_dir = Path(tempfile.gettempdir()) / "playwright-simple"
@@ -618,7 +724,8 @@ def find_active_sessions() -> list:
                         sessions.append({
                             'session_id': data['session_id'],
                             'pid': data['pid'],
-                            'started_at': data.get('started_at')
+                            'started_at': data.get('started_at'),
+                            'socket': data.get('socket')
                         })
                     else:
                         # Process died, clean up
@@ -632,7 +739,8 @@ def find_active_sessions() -> list:
                 sessions.append({
                     'session_id': data['session_id'],
                     'pid': data['pid'],
-                    'started_at': data.get('started_at')
+                    'started_at': data.get('started_at'),
+                    'socket': data.get('socket')
                 })
         except Exception as e:
             logger.debug(f"Error reading lock file {lock_file}: {e}")
@@ -892,6 +1000,13 @@ def cleanup_old_sessions(force: bool = False, timeout: float = 5.0) -> int:
                 resp_file.unlink()
             except:
                 pass
+        for sock_file in temp_dir.glob("*.sock"):
+            if time.time() - start_time > timeout:
+                break
+            try:
+                sock_file.unlink()
+            except:
+                pass
     
     if cleaned > 0:
         logger.info(f"Cleaned up {cleaned} old session(s)")
@@ -904,10 +1019,13 @@ def cleanup_old_sessions(force: bool = False, timeout: float = 5.0) -> int:
     return cleaned
 
 
-def send_command(command: str, args: str = "", session_id: Optional[str] = None, timeout: float = 5.0) -> Dict[str, Any]:
+def send_command(command: str, args: Union[str, list, dict] = "", session_id: Optional[str] = None, timeout: float = 5.0) -> Dict[str, Any]:
     """
     Send command to active recording session.
     
+    Uses the session's Unix socket when available (keeping the connection
+    open for subsequent calls) and falls back to the file-based protocol.
+    
     Args:
         command: Command name
         args: Command arguments
@@ -917,7 +1035,6 @@ def send_command(command: str, args: str = "", session_id: Optional[str] = None,
     Returns:
         Response dictionary
     """
-    import time
     import uuid
     
     temp_dir = Path(tempfile.gettempdir()) / "playwright-simple"
@@ -930,22 +1047,62 @@ def send_command(command: str, args: str = "", session_id: Optional[str] = None,
             return {'success': False, 'error': 'No active recording session found'}
         session_id = sessions[0]['session_id']
     
-    command_file = temp_dir / f"{session_id}.commands"
-    response_file = temp_dir / f"{session_id}.response"
-    
     # Check if session exists
     lock_file = temp_dir / f"{session_id}.lock"
     if not lock_file.exists():
         return {'success': False, 'error': f'Session {session_id} not found'}
     
-    # Send command
-    command_id = str(uuid.uuid4())
     command_data = {
-        'id': command_id,
+        'id': str(uuid.uuid4()),
         'command': command,
         'args': args
     }
     
+    socket_path = _get_session_socket(lock_file)
+    if socket_path:
+        try:
+            return _send_via_socket(socket_path, command_data, timeout)
+        except TimeoutError:
+            # The command reached the server; re-sending it via file could run it twice
+            return {'success': False, 'error': 'Timeout waiting for response'}
+        except ConnectionError as e:
+            logger.debug(f"Socket transport unavailable ({e}), falling back to file")
+    
+    return _send_via_file(temp_dir, session_id, command_data, timeout)
+
+
+def _get_session_socket(lock_file: Path) -> Optional[str]:
+    """Read the socket path advertised in a session lock file."""
+    try:
+        socket_path = json.loads(lock_file.read_text()).get('socket')
+    except (OSError, ValueError):
+        return None
+    if socket_path and Path(socket_path).exists():
+        return socket_path
+    return None
+
+
+def _send_via_socket(socket_path: str, command_data: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    """Send command over the session's Unix socket using a keep-alive client."""
+    client = _ipc_clients.get(socket_path)
+    if client is None:
+        client = IPCClient(Path(socket_path))
+        _ipc_clients[socket_path] = client
+    try:
+        return client.send_message_sync(command_data, timeout=timeout)
+    except ConnectionError:
+        _ipc_clients.pop(socket_path, None)
+        raise
+
+
+def _send_via_file(temp_dir: Path, session_id: str, command_data: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    """Send command using the file-based protocol (fallback transport)."""
+    import time
+    
+    command_file = temp_dir / f"{session_id}.commands"
+    response_file = temp_dir / f"{session_id}.response"
+    command_id = command_data['id']
+    
     command_file.write_text(json.dumps(command_data))
     
     # Wait for response
@@ -965,3 +1122,25 @@ def send_command(command: str, args: str = "", session_id: Optional[str] = None,
     
     return {'success': False, 'error': 'Timeout waiting for response'}
 
+
+def send_batch(commands: List[Union[str, Dict[str, Any]]], session_id: Optional[str] = None,
+               timeout: float = 60.0, stop_on_error: bool = True) -> Dict[str, Any]:
+    """
+    Send several commands to the active recording session in one round-trip.
+    
+    Args:
+        commands: Commands to run in order, as ``{'command', 'args'}`` dicts
+            or ``'command args'`` strings
+        session_id: Optional session ID (uses first available if not specified)
+        timeout: Timeout in seconds for the whole batch
+        stop_on_error: Stop at the first failing command
+    
+    Returns:
+        Response dictionary; ``result`` holds per-command results
+    """
+    return send_command(
+        'batch',
+        {'commands': list(commands), 'stop_on_error': stop_on_error},
+        session_id=session_id,
+        timeout=timeout
+    )
@@ -11,6 +11,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, Literal
 
+from ..execution_profile import ExecutionProfile
+from ..typing_modes import TypingMode
 from .exceptions import RecorderConfigurationError
 
 
@@ -95,6 +97,8 @@ class RecorderConfig:
     mode: Literal['write', 'read'] = 'write'
     log_level: Optional[str] = None
     log_file: Optional[Path] = None
+    typing_mode: str = 'auto'  # auto, instant, chunked, realistic (see TypingMode)
+    execution_profile: str = 'default'  # default, headless (no cursor/effects/animations)
     
     def __post_init__(self):
         """Validate configuration values."""
@@ -126,6 +130,30 @@ class RecorderConfig:
                 details={'mode': self.mode, 'valid_modes': ['write', 'read']}
             )
         
+        # Validate typing_mode
+        try:
+            self.typing_mode = TypingMode.parse(self.typing_mode).value
+        except ValueError:
+            raise RecorderConfigurationError(
+                f"Invalid typing_mode: {self.typing_mode}",
+                details={
+                    'typing_mode': self.typing_mode,
+                    'valid_modes': [mode.value for mode in TypingMode]
+                }
+            )
+        
+        # Validate execution_profile
+        try:
+            self.execution_profile = ExecutionProfile.parse(self.execution_profile).value
+        except ValueError:
+            raise RecorderConfigurationError(
+                f"Invalid execution_profile: {self.execution_profile}",
+                details={
+                    'execution_profile': self.execution_profile,
+                    'valid_profiles': [profile.value for profile in ExecutionProfile]
+                }
+            )
+        
         # Validate log_level if provided
         if self.log_level is not None:
             valid_levels = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
@@ -152,7 +180,9 @@ class RecorderConfig:
         speed_level: Optional[SpeedLevel] = None,
         mode: str = 'write',
         log_level: Optional[str] = None,
-        log_file: Optional[Path] = None
+        log_file: Optional[Path] = None,
+        typing_mode: str = 'auto',
+        execution_profile: str = 'default'
     ) -> 'RecorderConfig':
         """
         Create RecorderConfig from keyword arguments.
@@ -171,6 +201,8 @@ class RecorderConfig:
             mode: 'write' for recording (export), 'read' for playback (import)
             log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             log_file: Optional log file path
+            typing_mode: Typing mode (auto, instant, chunked, realistic)
+            execution_profile: Execution profile (default, headless)
             
         Returns:
             RecorderConfig instance
@@ -191,6 +223,8 @@ class RecorderConfig:
             speed_level=speed_level,
             mode=mode,
             log_level=log_level,
-            log_file=log_file
+            log_file=log_file,
+            typing_mode=typing_mode,
+            execution_profile=execution_profile
         )
 
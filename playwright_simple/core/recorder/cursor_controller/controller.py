@@ -6,11 +6,14 @@ Main CursorController class.
 Coordinates all cursor modules.
 """
 
-from typing import Optional
+from typing import Optional, Union
 from playwright.async_api import Page
 import logging
 import asyncio
 
+from ...execution_profile import RoundTripSavings, get_round_trip_savings
+from ...typing_modes import TypingMode
+
 from .visual import CursorVisual
 from .movement import CursorMovement
 from .interaction import CursorInteraction
@@ -28,7 +31,17 @@ except ImportError:
 class CursorController:
     """Controls a visual cursor overlay in the browser."""
     
-    def __init__(self, page: Page, fast_mode: bool = False, speed_level=None, recorder_logger=None):
+    def __init__(
+        self,
+        page: Page,
+        fast_mode: bool = False,
+        speed_level=None,
+        recorder_logger=None,
+        typing_mode: Union[str, TypingMode] = TypingMode.AUTO,
+        recording_video: bool = False,
+        visual: bool = True,
+        cursor_track=None
+    ):
         """Initialize cursor controller.
         
         Args:
@@ -36,6 +49,12 @@ class CursorController:
             fast_mode: If True, reduce delays for faster execution (deprecated, use speed_level)
             speed_level: SpeedLevel enum (preferred over fast_mode)
             recorder_logger: Optional RecorderLogger instance for logging
+            typing_mode: Default typing mode (auto = char by char only when recording video)
+            recording_video: Whether the run is being recorded to video
+            visual: If False (headless profile), no overlay, effects, animations
+                or position persistence; skipped work is tallied in ``savings``
+            cursor_track: Optional CursorTrack; with visual=False, moves and clicks
+                are logged there so the cursor can be drawn onto the video afterwards
         """
         self.page = page
         self.is_active = False
@@ -54,6 +73,11 @@ class CursorController:
         else:
             self.speed_level = speed_level
         self.recorder_logger = recorder_logger
+        self.typing_mode = TypingMode.parse(typing_mode)
+        self.recording_video = recording_video
+        self.visual = visual
+        self.savings = None if visual else (get_round_trip_savings(page) or RoundTripSavings(page))
+        self.cursor_track = cursor_track
         
         # Initialize modules
         self._visual = CursorVisual(page)
@@ -69,6 +93,22 @@ class CursorController:
             initial_x: Initial X position (None = center or last position)
             initial_y: Initial Y position (None = center or last position)
         """
+        if not self.visual:
+            # Headless profile: nothing to inject or restore
+            self.is_active = True
+            if initial_x is None or initial_y is None:
+                viewport = self.page.viewport_size if self.cursor_track is not None else None
+                if isinstance(viewport, dict):
+                    # Overlay cursor starts at the center, like the injected one
+                    initial_x = viewport.get('width', 0) // 2
+                    initial_y = viewport.get('height', 0) // 2
+            if initial_x is not None and initial_y is not None:
+                self.current_x = self._movement.current_x = initial_x
+                self.current_y = self._movement.current_y = initial_y
+            if self.cursor_track is not None:
+                self.cursor_track.move(self.current_x, self.current_y)
+            self.savings.skip('cursor_init', round_trips=6)
+            return
         await self._visual.start(force, initial_x, initial_y)
         self.is_active = self._visual.is_active
         
@@ -103,10 +143,16 @@ class CursorController:
     
     async def show(self):
         """Show cursor overlay."""
+        if not self.visual:
+            self.savings.skip('effects')
+            return
         await self._visual.show()
     
     async def hide(self):
         """Hide cursor overlay."""
+        if not self.visual:
+            self.savings.skip('effects')
+            return
         await self._visual.hide()
     
     async def move(self, x: int, y: int, smooth: bool = True):
@@ -211,7 +257,11 @@ class CursorController:
         the cursor position after page navigations. Used by both recording and playback.
         
         The logic is identical to what the recorder uses, encapsulated here for reuse.
+        Not registered in the headless profile (there is no cursor to restore).
         """
+        if not self.visual:
+            return
+        
         async def on_navigation(frame):
             """Restore cursor position after navigation."""
             try:
@@ -299,9 +349,14 @@ class CursorController:
         # Register navigation listener
         self.page.on('framenavigated', on_navigation)
     
-    async def type_text(self, text: str, field_selector: Optional[str] = None) -> bool:
-        """Type text into a field."""
-        return await self._interaction.type_text(text, field_selector)
+    async def type_text(
+        self,
+        text: str,
+        field_selector: Optional[str] = None,
+        mode: Union[str, TypingMode, None] = None
+    ) -> bool:
+        """Type text into a field (mode overrides the controller's typing mode)."""
+        return await self._interaction.type_text(text, field_selector, mode=mode)
     
     async def submit_form(self, button_text: Optional[str] = None) -> bool:
         """Submit a form by clicking the submit button."""
@@ -317,6 +372,7 @@ class CursorController:
     
     async def stop(self):
         """Stop cursor controller."""
-        await self._visual.stop()
+        if self.visual:
+            await self._visual.stop()
         self.is_active = False
 
@@ -8,9 +8,14 @@ Handles cursor interactions (click, type, press key, get element).
 
 import asyncio
 import logging
-from typing import Optional
+from typing import Optional, Union
 from playwright.async_api import Page
 
+from ...playwright_commands.element_index import with_element_index
+from ...performance import get_profiler
+from ...typing_modes import TypingMode, resolve_typing_mode, type_fast
+from .target_finders import TEXT_TARGET_SCRIPT, FIELD_TARGET_SCRIPT
+
 logger = logging.getLogger(__name__)
 
 # Import SpeedLevel for type hints
@@ -69,6 +74,22 @@ def _get_delay(controller, normal_delay: float, min_delay: float = None) -> floa
     return max(calculated_delay, min_delay_for_level)
 
 
+# Shows the click indicator at a position for 300ms
+CLICK_EFFECT_SCRIPT = """
+({x, y}) => {
+    const clickIndicator = document.getElementById('__playwright_cursor_click');
+    if (clickIndicator) {
+        clickIndicator.style.left = `${x}px`;
+        clickIndicator.style.top = `${y}px`;
+        clickIndicator.style.display = 'block';
+        setTimeout(() => {
+            clickIndicator.style.display = 'none';
+        }, 300);
+    }
+}
+"""
+
+
 class CursorInteraction:
     """Handles cursor interactions."""
     
@@ -77,6 +98,26 @@ class CursorInteraction:
         self.page = page
         self.controller = controller
     
+    async def _show_click_effect(self, x: int, y: int) -> None:
+        """Flash the click indicator at a position (skipped in the headless profile)."""
+        if not getattr(self.controller, 'visual', True):
+            self.controller.savings.skip('effects')
+            track = getattr(self.controller, 'cursor_track', None)
+            if track is not None:
+                # Cursor overlay: the ripple is drawn onto the video afterwards
+                track.click(x, y)
+            return
+        await self.page.evaluate(CLICK_EFFECT_SCRIPT, {'x': x, 'y': y})
+    
+    async def _pause_for_cursor(self, normal_delay: float, min_delay: float = None) -> None:
+        """Pause so the cursor is seen at its destination (skipped in the headless profile)."""
+        delay = _get_delay(self.controller, normal_delay, min_delay)
+        if not getattr(self.controller, 'visual', True):
+            self.controller.savings.skip('animation', round_trips=0, sleep=delay)
+            return
+        with get_profiler().span('cursor_move', pause=True):
+            await asyncio.sleep(delay)
+    
     async def click(self, x: Optional[int] = None, y: Optional[int] = None):
         """Click at cursor position or specified coordinates."""
         try:
@@ -95,24 +136,12 @@ class CursorInteraction:
                 speed_level = getattr(self.controller, 'speed_level', None)
                 if speed_level and SpeedLevel and speed_level == SpeedLevel.ULTRA_FAST:
                     # Ultra fast: minimal delay but still visible
-                    await asyncio.sleep(0.05)  # 50ms minimum for visibility
+                    await self._pause_for_cursor(0.05, min_delay=0.05)  # 50ms minimum for visibility
                 else:
-                    await asyncio.sleep(_get_delay(self.controller, 0.15, min_delay=0.05))
+                    await self._pause_for_cursor(0.15, min_delay=0.05)
             
             # Show click animation
-            await self.page.evaluate(f"""
-                () => {{
-                    const clickIndicator = document.getElementById('__playwright_cursor_click');
-                    if (clickIndicator) {{
-                        clickIndicator.style.left = '{click_x}px';
-                        clickIndicator.style.top = '{click_y}px';
-                        clickIndicator.style.display = 'block';
-                        setTimeout(() => {{
-                            clickIndicator.style.display = 'none';
-                        }}, 300);
-                    }}
-                }}
-            """)
+            await self._show_click_effect(click_x, click_y)
             
             # Perform actual click
             await self.page.mouse.click(click_x, click_y)
@@ -146,12 +175,13 @@ class CursorInteraction:
             logger.info(f"Attempting to click by text: '{text}'")
             
             # Wait for page to be ready (especially after navigation)
-            try:
-                await self.page.wait_for_load_state('domcontentloaded', timeout=5000)
-                # Wait a bit more for dynamic content
-                await asyncio.sleep(_get_delay(self.controller, 0.5))
-            except:
-                pass  # Continue even if timeout
+            with get_profiler().span('dom_ready_wait'):
+                try:
+                    await self.page.wait_for_load_state('domcontentloaded', timeout=5000)
+                    # Wait a bit more for dynamic content
+                    await asyncio.sleep(_get_delay(self.controller, 0.5))
+                except:
+                    pass  # Continue even if timeout
             
             # Check for special prefixes
             text_lower = text.lower().strip()
@@ -170,164 +200,15 @@ class CursorInteraction:
                 return await self._click_by_submit(search_text)
             
             # Regular text search (buttons, links, etc.)
-            # Escape text for JavaScript
-            escaped_text = text.replace("'", "\\'").replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
-            
-            # Find element by text
-            element_info = await self.page.evaluate(f"""
-                () => {{
-                    // Try multiple strategies with priority
-                    const text = '{escaped_text}';
-                    const lowerText = text.toLowerCase();
-                    const candidates = [];
-                    
-                    // FIRST: Check if this looks like a form field name (senha, email, usuário, etc.)
-                    // If so, prioritize inputs over links
-                    const fieldKeywords = ['senha', 'password', 'email', 'e-mail', 'usuário', 'user', 'username', 'nome', 'name', 'telefone', 'phone', 'cpf', 'cnpj', 'endereço', 'address'];
-                    const isFieldName = fieldKeywords.some(keyword => lowerText === keyword || lowerText.includes(keyword) || lowerText.includes('email') || lowerText.includes('e-mail'));
-                    
-                    // If it looks like a field name, search inputs first
-                    if (isFieldName) {{
-                        const inputs = Array.from(document.querySelectorAll('input, textarea'));
-                        for (const input of inputs) {{
-                            if (input.offsetParent === null || input.style.display === 'none' || input.style.visibility === 'hidden') {{
-                                continue;
-                            }}
-                            
-                            // Check label
-                            let labelText = '';
-                            const labels = input.labels || [];
-                            for (const label of labels) {{
-                                labelText = (label.textContent || '').trim().toLowerCase();
-                                if (labelText === lowerText || labelText.includes(lowerText)) {{
-                                    const rect = input.getBoundingClientRect();
-                                    candidates.push({{
-                                        element: input,
-                                        priority: 15, // Very high priority for input fields
-                                        text: labelText,
-                                        tagName: input.tagName,
-                                        type: 'input-label'
-                                    }});
-                                    break;
-                                }}
-                            }}
-                            
-                            // Check placeholder
-                            const placeholder = (input.placeholder || '').toLowerCase();
-                            if (placeholder === lowerText || placeholder.includes(lowerText)) {{
-                                const rect = input.getBoundingClientRect();
-                                candidates.push({{
-                                    element: input,
-                                    priority: 14, // High priority for placeholder match
-                                    text: placeholder,
-                                    tagName: input.tagName,
-                                    type: 'input-placeholder'
-                                }});
-                            }}
-                            
-                            // Check name/id
-                            const name = (input.name || '').toLowerCase();
-                            const id = (input.id || '').toLowerCase();
-                            if (name === lowerText || id === lowerText || name.includes(lowerText) || id.includes(lowerText)) {{
-                                const rect = input.getBoundingClientRect();
-                                candidates.push({{
-                                    element: input,
-                                    priority: 13, // High priority for name/id match
-                                    text: name || id,
-                                    tagName: input.tagName,
-                                    type: 'input-name-id'
-                                }});
-                            }}
-                        }}
-                    }}
-                    
-                    // Collect all potential matches with priority scores
-                    const allClickable = Array.from(document.querySelectorAll('button, a, input[type="button"], input[type="submit"], [role="button"], [onclick]'));
-                    
-                    for (const el of allClickable) {{
-                        // Skip hidden elements
-                        if (el.offsetParent === null || el.style.display === 'none' || el.style.visibility === 'hidden') {{
-                            continue;
-                        }}
-                        
-                        const elText = (el.textContent || el.value || el.getAttribute('aria-label') || '').trim();
-                        const elTextLower = elText.toLowerCase();
-                        
-                        // Calculate priority score
-                        let priority = 0;
-                        let matches = false;
-                        
-                        // Priority 10: Exact match
-                        if (elTextLower === lowerText) {{
-                            priority = 10;
-                            matches = true;
-                        }}
-                        // Priority 8: Starts with text (for buttons like "Login" vs "Login here")
-                        else if (elTextLower.startsWith(lowerText + ' ') || elTextLower.startsWith(lowerText + '\\n') || elTextLower.startsWith(lowerText + '\\t')) {{
-                            priority = 8;
-                            matches = true;
-                        }}
-                        // Priority 6: Ends with text
-                        else if (elTextLower.endsWith(' ' + lowerText) || elTextLower.endsWith('\\n' + lowerText)) {{
-                            priority = 6;
-                            matches = true;
-                        }}
-                        // Priority 4: Contains as whole word (not part of another word)
-                        // Use regex to match word boundaries
-                        else {{
-                            const wordBoundaryRegex = new RegExp('\\\\b' + lowerText.replace(/[.*+?^${{}}()|[\\\\]\\\\]/g, '\\\\$&') + '\\\\b', 'i');
-                            if (wordBoundaryRegex.test(elText)) {{
-                                priority = 4;
-                                matches = true;
-                            }}
-                            // Priority 2: Contains text (partial match - lowest priority, only if no word boundary match)
-                            else if (elTextLower.includes(lowerText)) {{
-                                priority = 2;
-                                matches = true;
-                            }}
-                        }}
-                        
-                        if (matches) {{
-                            // Bonus for buttons over links
-                            if (el.tagName === 'BUTTON' || el.type === 'button' || el.type === 'submit') {{
-                                priority += 1;
-                            }}
-                            // Penalty for links when we're looking for field names
-                            else if (isFieldName && el.tagName === 'A') {{
-                                priority -= 2; // Reduce priority for links when searching for field names
-                            }}
-                            
-                            candidates.push({{
-                                element: el,
-                                priority: priority,
-                                text: elText,
-                                tagName: el.tagName
-                            }});
-                        }}
-                    }}
-                    
-                    // Sort by priority (highest first)
-                    candidates.sort((a, b) => b.priority - a.priority);
-                    
-                    // Return the highest priority match
-                    if (candidates.length > 0) {{
-                        const best = candidates[0].element;
-                        const rect = best.getBoundingClientRect();
-                        return {{
-                            found: true,
-                            x: Math.floor(rect.left + rect.width / 2),
-                            y: Math.floor(rect.top + rect.height / 2),
-                            tagName: best.tagName,
-                            text: (best.textContent || best.value || '').trim(),
-                            id: best.id || '',
-                            name: best.name || '',
-                            priority: candidates[0].priority
-                        }};
-                    }}
-                    
-                    return {{ found: false }};
-                }}
-            """)
+            # Reuse the target resolved by the step executor's lookahead prefetch, if still valid
+            with get_profiler().span('locate', text=text) as span:
+                from ..locator_prefetch import get_locator_prefetcher  # locator_prefetch imports this package
+                prefetcher = get_locator_prefetcher(self.page)
+                element_info = await prefetcher.resolve('text', text) if prefetcher else None
+                span.set(prefetched=bool(element_info))
+                if not element_info:
+                    # Find element by text
+                    element_info = await self.page.evaluate(TEXT_TARGET_SCRIPT, text)
             
             if not element_info or not element_info.get('found'):
                 logger.warning(f"Element with text '{text}' not found")
@@ -364,22 +245,10 @@ class CursorInteraction:
             
             # Small additional delay so user can see cursor at destination before clicking
             # Use minimum 50ms even in fast_mode to ensure cursor is visible at destination
-            await asyncio.sleep(_get_delay(self.controller, 0.15, min_delay=0.05))
+            await self._pause_for_cursor(0.15, min_delay=0.05)
             
             # Show click animation
-            await self.page.evaluate(f"""
-                () => {{
-                    const clickIndicator = document.getElementById('__playwright_cursor_click');
-                    if (clickIndicator) {{
-                        clickIndicator.style.left = '{click_x}px';
-                        clickIndicator.style.top = '{click_y}px';
-                        clickIndicator.style.display = 'block';
-                        setTimeout(() => {{
-                            clickIndicator.style.display = 'none';
-                        }}, 300);
-                    }}
-                }}
-            """)
+            await self._show_click_effect(click_x, click_y)
             
             # Perform actual click
             await self.page.mouse.click(click_x, click_y)
@@ -428,21 +297,9 @@ class CursorInteraction:
             click_y = element_info['y']
             
             await self.controller.move(click_x, click_y)
-            await asyncio.sleep(_get_delay(self.controller, 0.2))
+            await self._pause_for_cursor(0.2)
             
-            await self.page.evaluate(f"""
-                () => {{
-                    const clickIndicator = document.getElementById('__playwright_cursor_click');
-                    if (clickIndicator) {{
-                        clickIndicator.style.left = '{click_x}px';
-                        clickIndicator.style.top = '{click_y}px';
-                        clickIndicator.style.display = 'block';
-                        setTimeout(() => {{
-                            clickIndicator.style.display = 'none';
-                        }}, 300);
-                    }}
-                }}
-            """)
+            await self._show_click_effect(click_x, click_y)
             
             await self.page.mouse.click(click_x, click_y)
             logger.info(f"Clicked on input with placeholder '{placeholder_text}' at ({click_x}, {click_y})")
@@ -454,67 +311,50 @@ class CursorInteraction:
     async def _click_by_input(self, search_text: str) -> bool:
         """Click on input by label, name, placeholder, or type."""
         try:
-            escaped_text = search_text.replace("'", "\\'").replace('"', '\\"')
-            
-            element_info = await self.page.evaluate(f"""
-                () => {{
-                    const searchText = '{escaped_text}'.toLowerCase();
+            element_info = await self.page.evaluate(with_element_index("""
+                (args, elementIndex) => {
+                    const searchText = args.searchText.toLowerCase();
+                    const isField = (el) => el.tagName === 'INPUT' || el.tagName === 'TEXTAREA';
                     
                     // Strategy 1: Find by label text
                     let field = null;
-                    const labels = Array.from(document.querySelectorAll('label'));
-                    const label = labels.find(l => {{
-                        const labelText = (l.textContent || '').trim().toLowerCase();
-                        return labelText.includes(searchText);
-                    }});
+                    const label = elementIndex.match('text', searchText).find(el => el.tagName === 'LABEL');
                     
-                    if (label) {{
-                        if (label.htmlFor) {{
+                    if (label) {
+                        if (label.htmlFor) {
                             field = document.getElementById(label.htmlFor);
-                        }} else {{
+                        } else {
                             // Find input near label
                             const labelParent = label.parentElement;
-                            if (labelParent) {{
+                            if (labelParent) {
                                 field = labelParent.querySelector('input, textarea');
-                            }}
-                        }}
-                    }}
+                            }
+                        }
+                    }
                     
                     // Strategy 2: Find by placeholder
-                    if (!field) {{
-                        field = Array.from(document.querySelectorAll('input, textarea')).find(el => {{
-                            const placeholder = (el.placeholder || '').toLowerCase();
-                            return placeholder.includes(searchText);
-                        }});
-                    }}
+                    if (!field) {
+                        field = elementIndex.match('placeholder', searchText).find(isField);
+                    }
                     
                     // Strategy 3: Find by name
-                    if (!field) {{
-                        field = Array.from(document.querySelectorAll('input, textarea')).find(el => {{
-                            const name = (el.name || '').toLowerCase();
-                            return name.includes(searchText);
-                        }});
-                    }}
+                    if (!field) {
+                        field = elementIndex.match('name', searchText).find(isField);
+                    }
                     
                     // Strategy 4: Find by id
-                    if (!field) {{
-                        field = Array.from(document.querySelectorAll('input, textarea')).find(el => {{
-                            const id = (el.id || '').toLowerCase();
-                            return id.includes(searchText);
-                        }});
-                    }}
+                    if (!field) {
+                        field = elementIndex.match('id', searchText).find(isField);
+                    }
                     
                     // Strategy 5: Find by type (email, password, etc.)
-                    if (!field) {{
-                        field = Array.from(document.querySelectorAll('input, textarea')).find(el => {{
-                            const type = (el.type || '').toLowerCase();
-                            return type === searchText;
-                        }});
-                    }}
+                    if (!field) {
+                        field = elementIndex.inputs().find(el => (el.type || '').toLowerCase() === searchText);
+                    }
                     
-                    if (field && (field.tagName === 'INPUT' || field.tagName === 'TEXTAREA')) {{
+                    if (field && (field.tagName === 'INPUT' || field.tagName === 'TEXTAREA')) {
                         const rect = field.getBoundingClientRect();
-                        return {{
+                        return {
                             found: true,
                             x: Math.floor(rect.left + rect.width / 2),
                             y: Math.floor(rect.top + rect.height / 2),
@@ -523,12 +363,12 @@ class CursorInteraction:
                             name: field.name || '',
                             id: field.id || '',
                             type: field.type || ''
-                        }};
-                    }}
+                        };
+                    }
                     
-                    return {{ found: false }};
-                }}
-            """)
+                    return { found: false };
+                }
+            """), {'searchText': search_text})
             
             if not element_info or not element_info.get('found'):
                 return False
@@ -537,21 +377,9 @@ class CursorInteraction:
             click_y = element_info['y']
             
             await self.controller.move(click_x, click_y)
-            await asyncio.sleep(_get_delay(self.controller, 0.2))
+            await self._pause_for_cursor(0.2)
             
-            await self.page.evaluate(f"""
-                () => {{
-                    const clickIndicator = document.getElementById('__playwright_cursor_click');
-                    if (clickIndicator) {{
-                        clickIndicator.style.left = '{click_x}px';
-                        clickIndicator.style.top = '{click_y}px';
-                        clickIndicator.style.display = 'block';
-                        setTimeout(() => {{
-                            clickIndicator.style.display = 'none';
-                        }}, 300);
-                    }}
-                }}
-            """)
+            await self._show_click_effect(click_x, click_y)
             
             await self.page.mouse.click(click_x, click_y)
             logger.info(f"Clicked on input '{search_text}' at ({click_x}, {click_y})")
@@ -634,21 +462,9 @@ class CursorInteraction:
             click_y = element_info['y']
             
             await self.controller.move(click_x, click_y)
-            await asyncio.sleep(_get_delay(self.controller, 0.2))
+            await self._pause_for_cursor(0.2)
             
-            await self.page.evaluate(f"""
-                () => {{
-                    const clickIndicator = document.getElementById('__playwright_cursor_click');
-                    if (clickIndicator) {{
-                        clickIndicator.style.left = '{click_x}px';
-                        clickIndicator.style.top = '{click_y}px';
-                        clickIndicator.style.display = 'block';
-                        setTimeout(() => {{
-                            clickIndicator.style.display = 'none';
-                        }}, 300);
-                    }}
-                }}
-            """)
+            await self._show_click_effect(click_x, click_y)
             
             await self.page.mouse.click(click_x, click_y)
             logger.info(f"Clicked on submit button '{element_info.get('text', '')}' at ({click_x}, {click_y})")
@@ -673,43 +489,38 @@ class CursorInteraction:
                 await self.controller.start()
             await self.controller.show()
             
-            # Find element by selector
-            element = await self.page.query_selector(selector)
-            if not element:
-                logger.warning(f"Element with selector '{selector}' not found")
-                return False
-            
-            # Get element coordinates
-            box = await element.bounding_box()
-            if not box:
-                # If no bounding box, try to click directly
-                await element.click()
-                logger.info(f"Clicked on element with selector '{selector}' (no bounding box)")
-                return True
-            
-            click_x = int(box['x'] + box['width'] / 2)
-            click_y = int(box['y'] + box['height'] / 2)
+            from ..locator_prefetch import get_locator_prefetcher  # locator_prefetch imports this package
+            prefetcher = get_locator_prefetcher(self.page)
+            cached = await prefetcher.resolve('selector', selector) if prefetcher else None
+            if cached:
+                click_x = cached['x']
+                click_y = cached['y']
+            else:
+                # Find element by selector
+                element = await self.page.query_selector(selector)
+                if not element:
+                    logger.warning(f"Element with selector '{selector}' not found")
+                    return False
+                
+                # Get element coordinates
+                box = await element.bounding_box()
+                if not box:
+                    # If no bounding box, try to click directly
+                    await element.click()
+                    logger.info(f"Clicked on element with selector '{selector}' (no bounding box)")
+                    return True
+                
+                click_x = int(box['x'] + box['width'] / 2)
+                click_y = int(box['y'] + box['height'] / 2)
             
             logger.info(f"Found element with selector '{selector}' at ({click_x}, {click_y})")
             
             # Move cursor to element position
             await self.controller.move(click_x, click_y)
-            await asyncio.sleep(_get_delay(self.controller, 0.2))
+            await self._pause_for_cursor(0.2)
             
             # Show click animation
-            await self.page.evaluate(f"""
-                () => {{
-                    const clickIndicator = document.getElementById('__playwright_cursor_click');
-                    if (clickIndicator) {{
-                        clickIndicator.style.left = '{click_x}px';
-                        clickIndicator.style.top = '{click_y}px';
-                        clickIndicator.style.display = 'block';
-                        setTimeout(() => {{
-                            clickIndicator.style.display = 'none';
-                        }}, 300);
-                    }}
-                }}
-            """)
+            await self._show_click_effect(click_x, click_y)
             
             # Perform actual click using mouse (consistent with other methods)
             await self.page.mouse.click(click_x, click_y)
@@ -759,22 +570,10 @@ class CursorInteraction:
             
             # Move cursor to element position
             await self.controller.move(click_x, click_y)
-            await asyncio.sleep(_get_delay(self.controller, 0.2))
+            await self._pause_for_cursor(0.2)
             
             # Show click animation
-            await self.page.evaluate(f"""
-                () => {{
-                    const clickIndicator = document.getElementById('__playwright_cursor_click');
-                    if (clickIndicator) {{
-                        clickIndicator.style.left = '{click_x}px';
-                        clickIndicator.style.top = '{click_y}px';
-                        clickIndicator.style.display = 'block';
-                        setTimeout(() => {{
-                            clickIndicator.style.display = 'none';
-                        }}, 300);
-                    }}
-                }}
-            """)
+            await self._show_click_effect(click_x, click_y)
             
             # Perform actual click using mouse (consistent with other methods)
             await self.page.mouse.click(click_x, click_y)
@@ -825,13 +624,53 @@ class CursorInteraction:
             logger.error(f"Error getting element at position: {e}")
             return None
     
-    async def type_text(self, text: str, field_selector: Optional[str] = None) -> bool:
+    async def _enter_text(self, text: str, mode: Union[str, TypingMode, None] = None) -> None:
+        """
+        Enter text into the focused field using the effective typing mode.
+        
+        Args:
+            text: Text to enter
+            mode: Typing mode for this call (None = controller's mode)
+        """
+        if mode is None:
+            mode = getattr(self.controller, 'typing_mode', TypingMode.AUTO)
+        effective = resolve_typing_mode(mode, getattr(self.controller, 'recording_video', False))
+        if await type_fast(self.page, text, effective):
+            return
+        
+        # Realistic: type character by character for visual effect
+        # Use speed_level to determine typing delay
+        speed_level = getattr(self.controller, 'speed_level', None)
+        if speed_level is None:
+            # Fallback to fast_mode for backward compatibility
+            fast_mode = getattr(self.controller, 'fast_mode', False)
+            speed_level = SpeedLevel.FAST if (SpeedLevel and fast_mode) else SpeedLevel.NORMAL if SpeedLevel else None
+        
+        if speed_level == SpeedLevel.ULTRA_FAST if (SpeedLevel and speed_level) else False:
+            # Ultra fast: instant typing (delay=0)
+            await self.page.keyboard.type(text, delay=0)
+        elif speed_level == SpeedLevel.FAST if (SpeedLevel and speed_level) else False:
+            # Fast: type quickly with minimal delay (delay=5)
+            await self.page.keyboard.type(text, delay=5)
+        else:
+            # Normal/Slow mode: type character by character for visual effect
+            for char in text:
+                await self.page.keyboard.type(char, delay=50)  # Small delay between chars
+                await asyncio.sleep(_get_delay(self.controller, 0.03))  # Small delay for visual effect
+    
+    async def type_text(
+        self,
+        text: str,
+        field_selector: Optional[str] = None,
+        mode: Union[str, TypingMode, None] = None
+    ) -> bool:
         """
         Type text into a field.
         
         Args:
             text: Text to type
             field_selector: Optional selector for the field (label text, placeholder, name, id)
+            mode: Typing mode for this call (None = controller's mode; see TypingMode)
             
         Returns:
             True if field was found and text was typed, False otherwise
@@ -841,66 +680,18 @@ class CursorInteraction:
             escaped_text = text.replace("'", "\\'").replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
             
             if field_selector:
-                # Find field by selector (label, placeholder, name, id)
-                escaped_selector = field_selector.replace("'", "\\'").replace('"', '\\"')
-                
-                # Find field by selector
-                field_info = await self.page.evaluate(f"""
-                    () => {{
-                        const selector = '{escaped_selector}';
-                        let field = null;
-                        
-                        // Try by label text
-                        const labels = Array.from(document.querySelectorAll('label'));
-                        const label = labels.find(l => l.textContent.trim().toLowerCase().includes(selector.toLowerCase()));
-                        if (label && label.htmlFor) {{
-                            field = document.getElementById(label.htmlFor);
-                        }}
-                        
-                        // Try by placeholder
-                        if (!field) {{
-                            field = Array.from(document.querySelectorAll('input, textarea')).find(el => {{
-                                return (el.placeholder || '').toLowerCase().includes(selector.toLowerCase());
-                            }});
-                        }}
-                        
-                        // Try by name
-                        if (!field) {{
-                            field = document.querySelector(`input[name*="${{selector}}"], textarea[name*="${{selector}}"]`);
-                        }}
-                        
-                        // Try by id
-                        if (!field) {{
-                            field = document.getElementById(selector);
-                        }}
-                        
-                        // Try by label text content (find input near label)
-                        if (!field && label) {{
-                            const labelParent = label.parentElement;
-                            if (labelParent) {{
-                                field = labelParent.querySelector('input, textarea');
-                            }}
-                        }}
-                        
-                        if (field && (field.tagName === 'INPUT' || field.tagName === 'TEXTAREA')) {{
-                            const rect = field.getBoundingClientRect();
-                            return {{
-                                success: true,
-                                x: Math.floor(rect.left + rect.width / 2),
-                                y: Math.floor(rect.top + rect.height / 2),
-                                name: field.name || '',
-                                id: field.id || ''
-                            }};
-                        }}
-                        
-                        return {{ success: false }};
-                    }}
-                """)
+                # Find field by selector (label, placeholder, name, id),
+                # reusing the lookahead prefetch result if still valid
+                from ..locator_prefetch import get_locator_prefetcher  # locator_prefetch imports this package
+                prefetcher = get_locator_prefetcher(self.page)
+                field_info = await prefetcher.resolve('field', field_selector) if prefetcher else None
+                if not field_info:
+                    field_info = await self.page.evaluate(FIELD_TARGET_SCRIPT, field_selector)
                 
                 if field_info and field_info.get('success'):
                     # Move cursor to field
                     await self.controller.move(field_info['x'], field_info['y'])
-                    await asyncio.sleep(_get_delay(self.controller, 0.2))
+                    await self._pause_for_cursor(0.2)
                     
                     # Click to focus
                     await self.page.mouse.click(field_info['x'], field_info['y'])
@@ -910,25 +701,7 @@ class CursorInteraction:
                     await self.page.keyboard.press('Control+A')
                     await asyncio.sleep(_get_delay(self.controller, 0.1))
                     
-                    # Type character by character for visual effect
-                    # Use speed_level to determine typing delay
-                    speed_level = getattr(self.controller, 'speed_level', None)
-                    if speed_level is None:
-                        # Fallback to fast_mode for backward compatibility
-                        fast_mode = getattr(self.controller, 'fast_mode', False)
-                        speed_level = SpeedLevel.FAST if (SpeedLevel and fast_mode) else SpeedLevel.NORMAL if SpeedLevel else None
-                    
-                    if speed_level == SpeedLevel.ULTRA_FAST if (SpeedLevel and speed_level) else False:
-                        # Ultra fast: instant typing (delay=0)
-                        await self.page.keyboard.type(text, delay=0)
-                    elif speed_level == SpeedLevel.FAST if (SpeedLevel and speed_level) else False:
-                        # Fast: type quickly with minimal delay (delay=5)
-                        await self.page.keyboard.type(text, delay=5)
-                    else:
-                        # Normal/Slow mode: type character by character for visual effect
-                        for char in text:
-                            await self.page.keyboard.type(char, delay=50)  # Small delay between chars
-                            await asyncio.sleep(_get_delay(self.controller, 0.03))  # Small delay for visual effect
+                    await self._enter_text(text, mode)
                     
                     logger.info(f"Typed '{text}' into field '{field_selector}'")
                     return True
@@ -961,7 +734,7 @@ class CursorInteraction:
                 
                 if field_pos:
                     await self.controller.move(field_pos['x'], field_pos['y'])
-                    await asyncio.sleep(_get_delay(self.controller, 0.2))
+                    await self._pause_for_cursor(0.2)
                     
                     # Check if field is already focused before clicking
                     is_focused = await self.page.evaluate("""
@@ -994,25 +767,7 @@ class CursorInteraction:
                     await self.page.keyboard.press('Control+A')
                     await asyncio.sleep(_get_delay(self.controller, 0.1))
                 
-                # Type character by character for visual effect
-                # Use speed_level to determine typing delay
-                speed_level = getattr(self.controller, 'speed_level', None)
-                if speed_level is None:
-                    # Fallback to fast_mode for backward compatibility
-                    fast_mode = getattr(self.controller, 'fast_mode', False)
-                    speed_level = SpeedLevel.FAST if (SpeedLevel and fast_mode) else SpeedLevel.NORMAL if SpeedLevel else None
-                
-                if speed_level == SpeedLevel.ULTRA_FAST if (SpeedLevel and speed_level) else False:
-                    # Ultra fast: instant typing (delay=0)
-                    await self.page.keyboard.type(text, delay=0)
-                elif speed_level == SpeedLevel.FAST if (SpeedLevel and speed_level) else False:
-                    # Fast: type quickly with minimal delay (delay=5)
-                    await self.page.keyboard.type(text, delay=5)
-                else:
-                    # Normal/Slow mode: type character by character for visual effect
-                    for char in text:
-                        await self.page.keyboard.type(char, delay=50)  # Small delay between chars
-                        await asyncio.sleep(_get_delay(self.controller, 0.03))  # Small delay for visual effect
+                await self._enter_text(text, mode)
                 
                 logger.info(f"Typed '{text}' into focused field")
                 return True
@@ -10,6 +10,8 @@ import logging
 import asyncio
 from playwright.async_api import Page
 
+from ...performance import get_profiler
+
 logger = logging.getLogger(__name__)
 
 # Import SpeedLevel for type hints
@@ -29,12 +31,56 @@ class CursorMovement:
         self.current_x = 0
         self.current_y = 0
     
+    def _animation_timing(self):
+        """Get (animation duration in seconds, timeout in ms) for the controller's speed level."""
+        # Get speed_level from controller
+        speed_level = getattr(self.controller, 'speed_level', None)
+        
+        # Fallback to fast_mode for backward compatibility
+        if speed_level is None:
+            fast_mode = getattr(self.controller, 'fast_mode', False)
+            if fast_mode:
+                speed_level = SpeedLevel.FAST if SpeedLevel else None
+            else:
+                speed_level = SpeedLevel.NORMAL if SpeedLevel else None
+        
+        # Determine animation duration based on speed level
+        if speed_level == SpeedLevel.ULTRA_FAST if (SpeedLevel and speed_level) else False:
+            # Ultra fast: minimal animation (50ms) to keep cursor visible
+            return 0.05, 100  # 50ms - minimal but visible, 100ms timeout
+        elif speed_level == SpeedLevel.FAST if (SpeedLevel and speed_level) else False:
+            # Fast: shorter animation (50ms)
+            return 0.05, 100
+        elif speed_level == SpeedLevel.SLOW if (SpeedLevel and speed_level) else False:
+            # Slow: normal animation (for demonstration videos)
+            return 0.3, 350
+        # Normal mode: standard animation
+        return 0.3, 350
+    
     async def move(self, x: int, y: int, smooth: bool = True):
         """Move cursor to position."""
+        with get_profiler().span('cursor_move', x=x, y=y, smooth=smooth):
+            await self._move(x, y, smooth)
+    
+    async def _move(self, x: int, y: int, smooth: bool):
+        """Move cursor to position (untraced)."""
         try:
             self.current_x = x
             self.current_y = y
             
+            if not getattr(self.controller, 'visual', True):
+                # Headless profile: only track the position (no storage write, show or animation)
+                duration = self._animation_timing()[0] if smooth else 0.0
+                savings = self.controller.savings
+                savings.skip('position')
+                savings.skip('effects')
+                savings.skip('animation', sleep=duration)
+                track = getattr(self.controller, 'cursor_track', None)
+                if track is not None:
+                    # Cursor overlay: the glide is drawn onto the video afterwards
+                    track.move(x, y, duration)
+                return
+            
             # Store position for persistence across navigations
             # Use both window property and sessionStorage for reliability
             await self.page.evaluate(f"""
@@ -59,34 +105,7 @@ class CursorMovement:
             await self.controller.show()
             
             if smooth:
-                # Get speed_level from controller
-                speed_level = getattr(self.controller, 'speed_level', None)
-                
-                # Fallback to fast_mode for backward compatibility
-                if speed_level is None:
-                    fast_mode = getattr(self.controller, 'fast_mode', False)
-                    if fast_mode:
-                        speed_level = SpeedLevel.FAST if SpeedLevel else None
-                    else:
-                        speed_level = SpeedLevel.NORMAL if SpeedLevel else None
-                
-                # Determine animation duration based on speed level
-                if speed_level == SpeedLevel.ULTRA_FAST if (SpeedLevel and speed_level) else False:
-                    # Ultra fast: minimal animation (50ms) to keep cursor visible
-                    animation_duration = 0.05  # 50ms - minimal but visible
-                    timeout = 100  # 100ms timeout
-                elif speed_level == SpeedLevel.FAST if (SpeedLevel and speed_level) else False:
-                    # Fast: shorter animation (50ms)
-                    animation_duration = 0.05  # 50ms
-                    timeout = 100  # 100ms timeout
-                elif speed_level == SpeedLevel.SLOW if (SpeedLevel and speed_level) else False:
-                    # Slow: normal animation (for demonstration videos)
-                    animation_duration = 0.3  # 300ms
-                    timeout = 350  # 350ms timeout
-                else:
-                    # Normal mode: standard animation
-                    animation_duration = 0.3  # 300ms
-                    timeout = 350  # 350ms timeout
+                animation_duration, timeout = self._animation_timing()
                 
                 # Smooth animation to position
                 # Use Promise to wait for animation to complete
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Target finder scripts shared by cursor interactions.
+
+JavaScript functions that locate the element a click/type step targets.
+They are used both by CursorInteraction (one target at a time) and by the
+step executor's locator prefetch (many targets in one call), so both pick
+exactly the same element.
+"""
+
+# (text) => {element, priority, text, tagName} | null
+# Best clickable element (or form field, for field-like names) matching text.
+TEXT_TARGET_FINDER = """
+(text) => {
+    const lowerText = text.toLowerCase();
+    const candidates = [];
+
+    // FIRST: Check if this looks like a form field name (senha, email, usuário, etc.)
+    // If so, prioritize inputs over links
+    const fieldKeywords = ['senha', 'password', 'email', 'e-mail', 'usuário', 'user', 'username', 'nome', 'name', 'telefone', 'phone', 'cpf', 'cnpj', 'endereço', 'address'];
+    const isFieldName = fieldKeywords.some(keyword => lowerText === keyword || lowerText.includes(keyword) || lowerText.includes('email') || lowerText.includes('e-mail'));
+
+    // If it looks like a field name, search inputs first
+    if (isFieldName) {
+        const inputs = Array.from(document.querySelectorAll('input, textarea'));
+        for (const input of inputs) {
+            if (input.offsetParent === null || input.style.display === 'none' || input.style.visibility === 'hidden') {
+                continue;
+            }
+
+            // Check label
+            let labelText = '';
+            const labels = input.labels || [];
+            for (const label of labels) {
+                labelText = (label.textContent || '').trim().toLowerCase();
+                if (labelText === lowerText || labelText.includes(lowerText)) {
+                    const rect = input.getBoundingClientRect();
+                    candidates.push({
+                        element: input,
+                        priority: 15, // Very high priority for input fields
+                        text: labelText,
+                        tagName: input.tagName,
+                        type: 'input-label'
+                    });
+                    break;
+                }
+            }
+
+            // Check placeholder
+            const placeholder = (input.placeholder || '').toLowerCase();
+            if (placeholder === lowerText || placeholder.includes(lowerText)) {
+                const rect = input.getBoundingClientRect();
+                candidates.push({
+                    element: input,
+                    priority: 14, // High priority for placeholder match
+                    text: placeholder,
+                    tagName: input.tagName,
+                    type: 'input-placeholder'
+                });
+            }
+
+            // Check name/id
+            const name = (input.name || '').toLowerCase();
+            const id = (input.id || '').toLowerCase();
+            if (name === lowerText || id === lowerText || name.includes(lowerText) || id.includes(lowerText)) {
+                const rect = input.getBoundingClientRect();
+                candidates.push({
+                    element: input,
+                    priority: 13, // High priority for name/id match
+                    text: name || id,
+                    tagName: input.tagName,
+                    type: 'input-name-id'
+                });
+            }
+        }
+    }
+
+    // Collect all potential matches with priority scores
+    const allClickable = Array.from(document.querySelectorAll('button, a, input[type="button"], input[type="submit"], [role="button"], [onclick]'));
+
+    for (const el of allClickable) {
+        // Skip hidden elements
+        if (el.offsetParent === null || el.style.display === 'none' || el.style.visibility === 'hidden') {
+            continue;
+        }
+
+        const elText = (el.textContent || el.value || el.getAttribute('aria-label') || '').trim();
+        const elTextLower = elText.toLowerCase();
+
+        // Calculate priority score
+        let priority = 0;
+        let matches = false;
+
+        // Priority 10: Exact match
+        if (elTextLower === lowerText) {
+            priority = 10;
+            matches = true;
+        }
+        // Priority 8: Starts with text (for buttons like "Login" vs "Login here")
+        else if (elTextLower.startsWith(lowerText + ' ') || elTextLower.startsWith(lowerText + '\\n') || elTextLower.startsWith(lowerText + '\\t')) {
+            priority = 8;
+            matches = true;
+        }
+        // Priority 6: Ends with text
+        else if (elTextLower.endsWith(' ' + lowerText) || elTextLower.endsWith('\\n' + lowerText)) {
+            priority = 6;
+            matches = true;
+        }
+        // Priority 4: Contains as whole word (not part of another word)
+        // Use regex to match word boundaries
+        else {
+            const wordBoundaryRegex = new RegExp('\\\\b' + lowerText.replace(/[.*+?^${}()|[\\\\]\\\\]/g, '\\\\$&') + '\\\\b', 'i');
+            if (wordBoundaryRegex.test(elText)) {
+                priority = 4;
+                matches = true;
+            }
+            // Priority 2: Contains text (partial match - lowest priority, only if no word boundary match)
+            else if (elTextLower.includes(lowerText)) {
+                priority = 2;
+                matches = true;
+            }
+        }
+
+        if (matches) {
+            // Bonus for buttons over links
+            if (el.tagName === 'BUTTON' || el.type === 'button' || el.type === 'submit') {
+                priority += 1;
+            }
+            // Penalty for links when we're looking for field names
+            else if (isFieldName && el.tagName === 'A') {
+                priority -= 2; // Reduce priority for links when searching for field names
+            }
+
+            candidates.push({
+                element: el,
+                priority: priority,
+                text: elText,
+                tagName: el.tagName
+            });
+        }
+    }
+
+    // Sort by priority (highest first)
+    candidates.sort((a, b) => b.priority - a.priority);
+    return candidates.length > 0 ? candidates[0] : null;
+}
+"""
+
+# (selector) => HTMLInputElement | HTMLTextAreaElement | null
+# Field matched by label text, placeholder, name or id.
+FIELD_TARGET_FINDER = """
+(selector) => {
+    let field = null;
+
+    // Try by label text
+    const labels = Array.from(document.querySelectorAll('label'));
+    const label = labels.find(l => l.textContent.trim().toLowerCase().includes(selector.toLowerCase()));
+    if (label && label.htmlFor) {
+        field = document.getElementById(label.htmlFor);
+    }
+
+    // Try by placeholder
+    if (!field) {
+        field = Array.from(document.querySelectorAll('input, textarea')).find(el => {
+            return (el.placeholder || '').toLowerCase().includes(selector.toLowerCase());
+        });
+    }
+
+    // Try by name
+    if (!field) {
+        field = document.querySelector(`input[name*="${selector}"], textarea[name*="${selector}"]`);
+    }
+
+    // Try by id
+    if (!field) {
+        field = document.getElementById(selector);
+    }
+
+    // Try by label text content (find input near label)
+    if (!field && label) {
+        const labelParent = label.parentElement;
+        if (labelParent) {
+            field = labelParent.querySelector('input, textarea');
+        }
+    }
+
+    if (field && (field.tagName === 'INPUT' || field.tagName === 'TEXTAREA')) {
+        return field;
+    }
+    return null;
+}
+"""
+
+# (match) => {found, tagName, text, id, name, priority}
+# Details of a TEXT_TARGET_FINDER match (without coordinates).
+TEXT_TARGET_INFO = """
+(match) => ({
+    found: true,
+    tagName: match.element.tagName,
+    text: (match.element.textContent || match.element.value || '').trim(),
+    id: match.element.id || '',
+    name: match.element.name || '',
+    priority: match.priority
+})
+"""
+
+# (field) => {success, name, id}
+# Details of a FIELD_TARGET_FINDER match (without coordinates).
+FIELD_TARGET_INFO = """
+(field) => ({
+    success: true,
+    name: field.name || '',
+    id: field.id || ''
+})
+"""
+
+# (text) => {found, x, y, tagName, text, id, name, priority} | {found: false}
+TEXT_TARGET_SCRIPT = """
+(text) => {
+    const match = (""" + TEXT_TARGET_FINDER + """)(text);
+    if (!match) {
+        return { found: false };
+    }
+    const rect = match.element.getBoundingClientRect();
+    return Object.assign((""" + TEXT_TARGET_INFO + """)(match), {
+        x: Math.floor(rect.left + rect.width / 2),
+        y: Math.floor(rect.top + rect.height / 2)
+    });
+}
+"""
+
+# (selector) => {success, x, y, name, id} | {success: false}
+FIELD_TARGET_SCRIPT = """
+(selector) => {
+    const field = (""" + FIELD_TARGET_FINDER + """)(selector);
+    if (!field) {
+        return { success: false };
+    }
+    const rect = field.getBoundingClientRect();
+    return Object.assign((""" + FIELD_TARGET_INFO + """)(field), {
+        x: Math.floor(rect.left + rect.width / 2),
+        y: Math.floor(rect.top + rect.height / 2)
+    });
+}
+"""
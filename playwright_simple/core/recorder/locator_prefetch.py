@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lookahead locator prefetch for YAML step execution.
+
+Once the page settles, resolves the targets of the next steps expected on
+the same page in a single in-page call. Matched elements are kept in a
+page-side registry (watched by a MutationObserver on their subtree) and
+their bounding boxes are cached here, so consecutive clicks and types on one
+form skip repeated discovery. Entries are invalidated on navigation or when
+the matched subtree mutates; a hit is also rejected when something else
+(e.g. a modal backdrop) is on top of the element's center.
+"""
+
+import logging
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
+
+from .cursor_controller.target_finders import (
+    TEXT_TARGET_FINDER,
+    TEXT_TARGET_INFO,
+    FIELD_TARGET_FINDER,
+    FIELD_TARGET_INFO,
+)
+
+logger = logging.getLogger(__name__)
+
+# Page-side registry of prefetched elements (Map: key -> {element, dirty, observer})
+PREFETCH_REGISTRY_GLOBAL = '__playwrightSimplePrefetch'
+
+# Default number of upcoming steps to resolve in one batch
+DEFAULT_LOOKAHEAD = 5
+
+# Click text prefixes handled by dedicated (non-prefetched) strategies
+_SPECIAL_CLICK_PREFIXES = ('placeholder ', 'input ', 'submit ')
+
+_PREFETCH_SCRIPT = """
+(targets) => {
+    const registry = window.""" + PREFETCH_REGISTRY_GLOBAL + """ ||
+        (window.""" + PREFETCH_REGISTRY_GLOBAL + """ = new Map());
+    const findText = """ + TEXT_TARGET_FINDER + """;
+    const textInfo = """ + TEXT_TARGET_INFO + """;
+    const findField = """ + FIELD_TARGET_FINDER + """;
+    const fieldInfo = """ + FIELD_TARGET_INFO + """;
+
+    return targets.map(({key, kind, query}) => {
+        let element = null;
+        let info = {};
+        try {
+            if (kind === 'text') {
+                const match = findText(query);
+                if (match) {
+                    element = match.element;
+                    info = textInfo(match);
+                }
+            } else if (kind === 'field') {
+                element = findField(query);
+                if (element) {
+                    info = fieldInfo(element);
+                }
+            } else if (kind === 'selector') {
+                element = document.querySelector(query);
+            }
+        } catch (e) {
+            element = null;
+        }
+        if (!element) {
+            return null;
+        }
+
+        const previous = registry.get(key);
+        if (previous) {
+            previous.observer.disconnect();
+        }
+        const entry = {element: element, dirty: false, observer: null};
+        entry.observer = new MutationObserver(() => {
+            entry.dirty = true;
+            entry.observer.disconnect();
+        });
+        entry.observer.observe(element, {subtree: true, childList: true, attributes: true, characterData: true});
+        registry.set(key, entry);
+
+        const rect = element.getBoundingClientRect();
+        return {info: info, box: {x: rect.left, y: rect.top, width: rect.width, height: rect.height}};
+    });
+}
+"""
+
+_VALIDATE_SCRIPT = """
+(key) => {
+    const registry = window.""" + PREFETCH_REGISTRY_GLOBAL + """;
+    const entry = registry && registry.get(key);
+    if (!entry) {
+        return null;
+    }
+    const element = entry.element;
+    const rect = element.isConnected ? element.getBoundingClientRect() : null;
+    if (entry.dirty || !rect || (rect.width === 0 && rect.height === 0)) {
+        entry.observer.disconnect();
+        registry.delete(key);
+        return null;
+    }
+    const x = Math.floor(rect.left + rect.width / 2);
+    const y = Math.floor(rect.top + rect.height / 2);
+    // A modal or overlay opened elsewhere leaves the element in place but
+    // covered: the click must land on the element itself (or a descendant)
+    const hit = document.elementFromPoint(x, y);
+    if (!hit || !element.contains(hit)) {
+        return null;
+    }
+    return {x: x, y: y, box: {x: rect.left, y: rect.top, width: rect.width, height: rect.height}};
+}
+"""
+
+_CLEAR_SCRIPT = """
+() => {
+    const registry = window.""" + PREFETCH_REGISTRY_GLOBAL + """;
+    if (registry) {
+        registry.forEach(entry => entry.observer.disconnect());
+        registry.clear();
+    }
+}
+"""
+
+# Prefetcher attached to each page (looked up by cursor interactions)
+_prefetchers: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def get_locator_prefetcher(page) -> Optional['LocatorPrefetcher']:
+    """
+    Get the prefetcher attached to a page.
+
+    Args:
+        page: Playwright page object
+
+    Returns:
+        LocatorPrefetcher or None if the page has none
+    """
+    try:
+        return _prefetchers.get(page)
+    except TypeError:
+        return None
+
+
+def step_targets(step: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Get the (kind, query) targets a step will look up.
+
+    Mirrors how ActionExecutors drives the cursor: click text -> text lookup,
+    click selector -> selector lookup, type into field -> text lookup (to
+    focus) plus field lookup (to type).
+
+    Args:
+        step: Step dictionary from YAML
+
+    Returns:
+        List of (kind, query) tuples (empty if nothing can be prefetched)
+    """
+    action = step.get('action')
+    targets = []
+    if action == 'click':
+        text = step.get('text')
+        selector = step.get('selector')
+        if text:
+            if _is_plain_click_text(text):
+                targets.append(('text', text))
+        elif selector:
+            targets.append(('selector', selector))
+    elif action == 'type':
+        field_text = step.get('field_text')
+        if field_text and not step.get('selector'):
+            if _is_plain_click_text(field_text):
+                targets.append(('text', field_text))
+            targets.append(('field', field_text))
+    return targets
+
+
+def _is_plain_click_text(text: str) -> bool:
+    """Check if click text uses the regular text strategy (no special prefix)."""
+    text_lower = text.lower().strip()
+    return text_lower != 'submit' and not text_lower.startswith(_SPECIAL_CLICK_PREFIXES)
+
+
+class LocatorPrefetcher:
+    """
+    Resolves and caches step targets ahead of execution.
+
+    Attributes:
+        page: Playwright page object
+        stats: Counters ('prefetch_calls', 'prefetched', 'hits', 'misses', 'invalidations')
+    """
+
+    def __init__(self, page):
+        """
+        Initialize locator prefetcher and attach it to the page.
+
+        Args:
+            page: Playwright page object
+        """
+        self.page = page
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._url: Optional[str] = None
+        self.stats = {'prefetch_calls': 0, 'prefetched': 0, 'hits': 0, 'misses': 0, 'invalidations': 0}
+
+        try:
+            _prefetchers[page] = self
+        except TypeError:
+            logger.debug("Page does not support weak references; prefetch cache not shared")
+
+        if hasattr(page, 'on'):
+            try:
+                page.on('framenavigated', self._on_frame_navigated)
+            except Exception as e:
+                logger.debug(f"Could not watch navigations for prefetch cache: {e}")
+
+    @staticmethod
+    def make_key(kind: str, query: str) -> str:
+        """Build the cache key for a target."""
+        return f"{kind}:{query}"
+
+    def _on_frame_navigated(self, frame) -> None:
+        """Drop cached targets when the main frame navigates."""
+        main_frame = getattr(self.page, 'main_frame', None)
+        if main_frame is None or frame is main_frame:
+            self.invalidate()
+
+    def _current_url(self) -> Optional[str]:
+        """Get page URL (None if unavailable)."""
+        url = getattr(self.page, 'url', None)
+        return url if isinstance(url, str) else None
+
+    def invalidate(self) -> None:
+        """Drop all cached targets (page-side entries die with the document)."""
+        if self._entries:
+            self.stats['invalidations'] += 1
+        self._entries.clear()
+        self._url = None
+
+    async def prefetch_ahead(self, steps: List[Dict[str, Any]], start: int, lookahead: int = DEFAULT_LOOKAHEAD) -> int:
+        """
+        Prefetch targets for the steps starting at index start.
+
+        Only runs when the current step has a target that is not cached yet;
+        the window stops at the first go_to (new page) and after the first
+        submit (likely navigation).
+
+        Args:
+            steps: All YAML steps
+            start: Index (0-based) of the step about to execute
+            lookahead: Maximum number of steps to resolve
+
+        Returns:
+            Number of targets resolved
+        """
+        if lookahead <= 0 or start >= len(steps):
+            return 0
+
+        if self._url is not None and self._current_url() != self._url:
+            self.invalidate()
+
+        current_keys = [self.make_key(kind, query) for kind, query in step_targets(steps[start])]
+        if not current_keys or all(key in self._entries for key in current_keys):
+            return 0
+
+        targets = []
+        seen = set(self._entries)
+        for step in steps[start:start + lookahead]:
+            if step.get('action') == 'go_to':
+                break
+            for kind, query in step_targets(step):
+                key = self.make_key(kind, query)
+                if key not in seen:
+                    seen.add(key)
+                    targets.append({'key': key, 'kind': kind, 'query': query})
+            if step.get('action') == 'submit':
+                break
+
+        if not targets:
+            return 0
+
+        try:
+            results = await self.page.evaluate(_PREFETCH_SCRIPT, targets)
+        except Exception as e:
+            logger.debug(f"Locator prefetch failed: {e}")
+            return 0
+
+        self.stats['prefetch_calls'] += 1
+        self._url = self._current_url()
+        resolved = 0
+        for target, result in zip(targets, results or []):
+            if result:
+                self._entries[target['key']] = result
+                resolved += 1
+        self.stats['prefetched'] += resolved
+        logger.debug(f"Prefetched {resolved}/{len(targets)} step targets")
+        return resolved
+
+    async def resolve(self, kind: str, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a prefetched target if it is still valid.
+
+        Validation is a single lightweight in-page call (no DOM search); it
+        also refreshes the bounding box, so scrolling does not break hits,
+        and misses when the element's center is covered (e.g. by an overlay).
+
+        Args:
+            kind: 'text', 'field' or 'selector'
+            query: Text, field label or CSS selector
+
+        Returns:
+            Target info with 'x' and 'y' (center), or None on a miss
+        """
+        key = self.make_key(kind, query)
+        entry = self._entries.get(key)
+        if entry is not None and self._url is not None and self._current_url() != self._url:
+            self.invalidate()
+            entry = None
+
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+
+        try:
+            position = await self.page.evaluate(_VALIDATE_SCRIPT, key)
+        except Exception as e:
+            logger.debug(f"Prefetched target validation failed for {key}: {e}")
+            position = None
+
+        if not position:
+            self._entries.pop(key, None)
+            self.stats['misses'] += 1
+            return None
+
+        entry['box'] = position['box']
+        self.stats['hits'] += 1
+        return {**entry.get('info', {}), 'x': position['x'], 'y': position['y']}
+
+    async def close(self) -> None:
+        """Detach from the page and release page-side entries."""
+        self._entries.clear()
+        try:
+            if _prefetchers.get(self.page) is self:
+                del _prefetchers[self.page]
+        except TypeError:
+            pass
+        if hasattr(self.page, 'remove_listener'):
+            try:
+                self.page.remove_listener('framenavigated', self._on_frame_navigated)
+            except Exception:
+                pass
+        try:
+            await self.page.evaluate(_CLEAR_SCRIPT)
+        except Exception:
+            pass
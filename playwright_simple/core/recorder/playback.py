@@ -9,40 +9,36 @@ Provides functionality for executing YAML steps in read mode.
 import asyncio
 import logging
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from .step_executor import StepExecutor
 from .page_stability import wait_for_page_stable
 from ..tts import TTSManager
+from ..tts.duration_model import DurationModel, get_duration_predictor, heuristic_duration
+from ..tts.pre_generation import PreGeneration
 
 logger = logging.getLogger(__name__)
 
 
-def estimate_audio_duration(text: str) -> float:
+def estimate_audio_duration(text: str, duration_model: Optional[DurationModel] = None) -> float:
     """
-    Estimate audio duration based on text length.
+    Estimate audio duration of a narration before it is synthesized.
     
-    Uses average speaking rate for Portuguese: ~150 words/min = 2.5 words/sec
-    For Portuguese, average word length is ~5 characters, so ~12.5 chars/sec
-    We use a conservative estimate of ~10 chars/sec to account for pauses.
+    Uses the duration model of the TTS voice once it is calibrated on past
+    clips, else ~10 chars/sec plus 0.5s of pauses (minimum 0.5s).
     
     Args:
         text: Text to estimate duration for
+        duration_model: Optional model of the voice (TTSManager.duration_model)
         
     Returns:
         Estimated duration in seconds
     """
-    if not text or not text.strip():
-        return 0.0
-    
-    # Average speaking rate: ~10 characters per second for Portuguese
-    # Add 0.5s buffer for natural pauses
-    char_count = len(text.strip())
-    estimated_seconds = (char_count / 10.0) + 0.5
-    
-    # Minimum duration: 0.5s
-    return max(0.5, estimated_seconds)
+    if duration_model is not None and duration_model.calibrated:
+        return duration_model.predict(text)
+    return heuristic_duration(text)
 
 
 async def play_audio_for_step(tts_manager: Optional[TTSManager], text: str, cache_dir: Optional[Path] = None, estimate_audio_duration_func=None) -> float:
@@ -60,7 +56,9 @@ async def play_audio_for_step(tts_manager: Optional[TTSManager], text: str, cach
     if not text or not text.strip():
         return 0.0
     
-    estimate_func = estimate_audio_duration_func or estimate_audio_duration
+    estimate_func = estimate_audio_duration_func or partial(
+        estimate_audio_duration, duration_model=getattr(tts_manager, 'duration_model', None)
+    )
     
     if not tts_manager:
         # Fallback to estimated duration
@@ -133,6 +131,41 @@ def get_tts_manager(video_config, video_dir: Optional[Path] = None):
         return None, None
 
 
+def start_audio_pregeneration(
+    yaml_steps: List[Dict[str, Any]],
+    video_config,
+    video_dir: Optional[Path] = None,
+    test_name: str = 'test'
+) -> Optional[PreGeneration]:
+    """
+    Start synthesizing the narration of YAML steps in the background.
+    
+    Call it as soon as the YAML is parsed, before launching the browser,
+    so synthesis overlaps with the launch and the first steps.
+    
+    Args:
+        yaml_steps: List of step dictionaries from YAML
+        video_config: VideoConfig object with audio settings
+        video_dir: Optional video directory for the generated clips
+        test_name: Test name (for the clips directory)
+        
+    Returns:
+        PreGeneration handle, or None if audio is disabled or TTS is unavailable
+    """
+    if not yaml_steps:
+        return None
+    tts_manager, _ = get_tts_manager(video_config, video_dir)
+    if tts_manager is None:
+        return None
+    try:
+        logger.info("🎵 Starting audio pre-generation in the background...")
+        return tts_manager.start_pre_generation(yaml_steps, Path(video_dir or 'videos'), test_name)
+    except Exception as e:
+        logger.warning(f"Failed to pre-generate audios: {e}. Will proceed without audio sync.")
+        logger.debug(f"Pre-generation error details: {e}", exc_info=True)
+        return None
+
+
 async def execute_yaml_steps(
     yaml_steps: List[Dict[str, Any]],
     page,
@@ -141,7 +174,9 @@ async def execute_yaml_steps(
     speed_level,
     video_start_time: datetime,
     video_config = None,
-    video_dir: Optional[Path] = None
+    video_dir: Optional[Path] = None,
+    test_name: str = 'test',
+    pending_audio: Optional[PreGeneration] = None
 ) -> List[Any]:
     """
     Execute YAML steps using StepExecutor.
@@ -155,6 +190,9 @@ async def execute_yaml_steps(
         video_start_time: Video recording start time
         video_config: Optional VideoConfig for audio
         video_dir: Optional video directory for audio cache
+        test_name: Test name for the per-step timing report
+        pending_audio: Narration already being generated (see start_audio_pregeneration);
+            started here when None and audio is enabled
         
     Returns:
         List of TestStep objects with all timing and content data
@@ -175,67 +213,17 @@ async def execute_yaml_steps(
                 details={}
             )
         logger.error(error_msg)
+        if pending_audio is not None:
+            pending_audio.cancel()
         raise RuntimeError("Page not available")
     
     # Get video start time
     if not video_start_time:
         video_start_time = datetime.now()
     
-    # PRE-GENERATE ALL AUDIOS BEFORE EXECUTING STEPS
-    # This allows StepExecutor to wait for previous audio to finish
-    pre_generated_audio_info = None
-    if video_config and (video_config.audio or video_config.narration):
-        try:
-            # Determine which config to use
-            use_audio_config = video_config.audio if hasattr(video_config, 'audio') else False
-            if use_audio_config:
-                lang = video_config.audio_lang
-                engine = video_config.audio_engine
-                voice = getattr(video_config, 'audio_voice', None)
-                rate = getattr(video_config, 'audio_rate', None)
-                pitch = getattr(video_config, 'audio_pitch', None)
-                volume = getattr(video_config, 'audio_volume', None)
-            else:
-                lang = video_config.narration_lang
-                engine = video_config.narration_engine
-                voice = getattr(video_config, 'narration_voice', None)
-                rate = None
-                pitch = None
-                volume = None
-            
-            if not engine or engine == 'gtts':
-                engine = 'edge-tts'
-            
-            # Create TTSManager for pre-generation
-            tts_manager = TTSManager(
-                lang=lang,
-                engine=engine,
-                slow=False,
-                voice=voice,
-                rate=rate,
-                pitch=pitch,
-                volume=volume
-            )
-            
-            # Pre-generate all audios in parallel
-            logger.info("🎵 Pre-generating all audios before step execution...")
-            # Extract test name from YAML or use default
-            test_name = 'test'  # Will be passed from caller
-            if not video_dir:
-                video_dir = Path('videos')
-            
-            pre_generated_audio_info = await tts_manager.pre_generate_audios(
-                yaml_steps,
-                video_dir,
-                test_name
-            )
-            
-            logger.info(f"🎵 Pre-generated {len(pre_generated_audio_info.get('audio_data', {}))} audio files")
-            
-        except Exception as e:
-            logger.warning(f"Failed to pre-generate audios: {e}. Will proceed without audio sync.")
-            logger.debug(f"Pre-generation error details: {e}", exc_info=True)
-            pre_generated_audio_info = None
+    # Narration is synthesized in the background: each step waits only for its own clip
+    if pending_audio is None:
+        pending_audio = start_audio_pregeneration(yaml_steps, video_config, video_dir, test_name)
     
     # Get TTS manager for real-time playback (if needed)
     tts_manager, audio_cache_dir = get_tts_manager(video_config, video_dir) if video_config else (None, None)
@@ -264,19 +252,29 @@ async def execute_yaml_steps(
         wait_for_page_stable=wait_for_page_stable_func,
         play_audio_for_step=play_audio_for_step_func,
         estimate_audio_duration=estimate_audio_duration,
-        pre_generated_audio_info=pre_generated_audio_info
+        pending_audio=pending_audio,
+        test_name=test_name
     )
     
     # Execute steps - now returns list of TestStep objects
-    steps = await executor.execute_steps(yaml_steps)
+    try:
+        steps = await executor.execute_steps(yaml_steps)
+    finally:
+        if pending_audio is not None:
+            pending_audio.cancel()  # clips of steps that never ran
+            predictor = get_duration_predictor()
+            predictor.save()  # probed durations calibrate the next runs
+            accuracy = predictor.format_accuracy()
+            if accuracy:
+                logger.info(accuracy)
     
     # Debug: show what's in steps (only in debug mode)
     if recorder_logger and recorder_logger.is_debug and steps:
         from ...step import TestStep
         steps_with_subtitle = sum(1 for s in steps if isinstance(s, TestStep) and s.subtitle)
         steps_with_audio = sum(1 for s in steps if isinstance(s, TestStep) and s.audio)
-        logger.info(f"🎬 DEBUG: Steps with subtitle: {steps_with_subtitle}/{len(steps)}")
-        logger.info(f"🎬 DEBUG: Steps with audio: {steps_with_audio}/{len(steps)}")
+        logger.debug(f"🎬 DEBUG: Steps with subtitle: {steps_with_subtitle}/{len(steps)}")
+        logger.debug(f"🎬 DEBUG: Steps with audio: {steps_with_audio}/{len(steps)}")
     
     logger.info("✅ All YAML steps executed successfully")
     
@@ -22,6 +22,8 @@ from .command_handlers import CommandHandlers
 from .command_server import CommandServer
 from .recorder_logger import RecorderLogger
 from .config import RecorderConfig
+from ..execution_profile import ExecutionProfile
+from ..performance import get_profiler
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +126,8 @@ class Recorder:
         self.browser_manager = BrowserManager(headless=self.config.headless, slow_mo=slow_mo_value)
         self.event_capture: Optional[EventCapture] = None
         self.cursor_controller: Optional[CursorController] = None
+        self.cursor_track = None  # Cursor positions/clicks for the post-production overlay
+        self._pending_audio = None  # Narration synthesized in the background (read mode)
         self.action_converter = ActionConverter(recorder_logger=self.recorder_logger)
         
         # In write mode: YAMLWriter, in read mode: load YAML steps
@@ -145,9 +149,9 @@ class Recorder:
                 yaml_data = yaml.safe_load(f)
             self.yaml_data = yaml_data
             self.yaml_steps = yaml_data.get('steps', []) if yaml_data else []
-            logger.info(f"🎬 DEBUG: Loaded YAML - steps count: {len(self.yaml_steps)}, steps type: {type(self.yaml_steps)}")
+            logger.debug(f"🎬 DEBUG: Loaded YAML - steps count: {len(self.yaml_steps)}, steps type: {type(self.yaml_steps)}")
             if self.yaml_steps:
-                logger.info(f"🎬 DEBUG: First step: {self.yaml_steps[0]}")
+                logger.debug(f"🎬 DEBUG: First step: {self.yaml_steps[0]}")
             # Get initial_url from YAML if not provided
             if not self.config.initial_url or self.config.initial_url == 'about:blank':
                 first_step = self.yaml_steps[0] if self.yaml_steps else {}
@@ -160,19 +164,19 @@ class Recorder:
             self.video_config = None
             self.video_manager = None
             self.video_start_time = None
-            logger.info(f"🎬 VIDEO DEBUG: Checking video config - VIDEO_AVAILABLE={VIDEO_AVAILABLE}, mode={self.config.mode}")
+            logger.debug(f"🎬 VIDEO DEBUG: Checking video config - VIDEO_AVAILABLE={VIDEO_AVAILABLE}, mode={self.config.mode}")
             if yaml_data:
-                logger.info(f"🎬 VIDEO DEBUG: yaml_data exists, has 'config': {'config' in yaml_data}")
+                logger.debug(f"🎬 VIDEO DEBUG: yaml_data exists, has 'config': {'config' in yaml_data}")
                 if 'config' in yaml_data:
-                    logger.info(f"🎬 VIDEO DEBUG: config keys: {list(yaml_data['config'].keys())}")
-                    logger.info(f"🎬 VIDEO DEBUG: has 'video': {'video' in yaml_data['config']}")
+                    logger.debug(f"🎬 VIDEO DEBUG: config keys: {list(yaml_data['config'].keys())}")
+                    logger.debug(f"🎬 VIDEO DEBUG: has 'video': {'video' in yaml_data['config']}")
                     if 'video' in yaml_data['config']:
-                        logger.info(f"🎬 VIDEO DEBUG: video config: {yaml_data['config']['video']}")
+                        logger.debug(f"🎬 VIDEO DEBUG: video config: {yaml_data['config']['video']}")
             
             if VIDEO_AVAILABLE and yaml_data and 'config' in yaml_data and 'video' in yaml_data['config']:
                 try:
                     video_data = yaml_data['config']['video']
-                    logger.info(f"🎬 VIDEO DEBUG: Loading video config from YAML: {video_data}")
+                    logger.debug(f"🎬 VIDEO DEBUG: Loading video config from YAML: {video_data}")
                     self.video_config = VideoConfig(
                         enabled=video_data.get('enabled', False),
                         quality=video_data.get('quality', 'high'),
@@ -185,21 +189,22 @@ class Recorder:
                         narration=video_data.get('narration', False),
                         narration_lang=video_data.get('narration_lang', 'pt-BR'),
                         narration_engine=video_data.get('narration_engine', 'gtts'),
-                        narration_slow=video_data.get('narration_slow', False)
+                        narration_slow=video_data.get('narration_slow', False),
+                        cursor_overlay=video_data.get('cursor_overlay', False)
                     )
-                    logger.info(f"🎬 VIDEO DEBUG: VideoConfig created - enabled={self.video_config.enabled}")
+                    logger.debug(f"🎬 VIDEO DEBUG: VideoConfig created - enabled={self.video_config.enabled}")
                     if self.video_config.enabled:
                         self.video_manager = VideoManager(self.video_config)
-                        logger.info(f"🎬 VIDEO DEBUG: VideoManager created successfully")
+                        logger.debug(f"🎬 VIDEO DEBUG: VideoManager created successfully")
                         logger.info(f"Video recording enabled: {self.video_config.dir}, quality={self.video_config.quality}, codec={self.video_config.codec}")
                     else:
-                        logger.info(f"🎬 VIDEO DEBUG: VideoConfig.enabled is False, not creating VideoManager")
+                        logger.debug(f"🎬 VIDEO DEBUG: VideoConfig.enabled is False, not creating VideoManager")
                 except Exception as e:
                     logger.warning(f"Error loading video config from YAML: {e}", exc_info=True)
                     self.video_config = None
                     self.video_manager = None
             else:
-                logger.info(f"🎬 VIDEO DEBUG: Video config not loaded - VIDEO_AVAILABLE={VIDEO_AVAILABLE}, has_yaml_data={bool(yaml_data)}, has_config={'config' in yaml_data if yaml_data else False}, has_video={'video' in yaml_data.get('config', {}) if yaml_data and 'config' in yaml_data else False}")
+                logger.debug(f"🎬 VIDEO DEBUG: Video config not loaded - VIDEO_AVAILABLE={VIDEO_AVAILABLE}, has_yaml_data={bool(yaml_data)}, has_config={'config' in yaml_data if yaml_data else False}, has_video={'video' in yaml_data.get('config', {}) if yaml_data and 'config' in yaml_data else False}")
         
         self.console = ConsoleInterface()
         
@@ -300,12 +305,16 @@ class Recorder:
                         details={'operation': 'cleanup_old_sessions'}
                     )
             
+            # Start synthesizing narration now so it overlaps with the browser launch
+            if self.mode == 'read':
+                self._start_audio_pregeneration()
+            
             # Configure browser manager with video options if needed
             if self.mode == 'read':
                 has_video_manager = hasattr(self, 'video_manager') and self.video_manager is not None
                 has_video_config = hasattr(self, 'video_config') and self.video_config is not None
                 enabled = self.video_config.enabled if has_video_config else False
-                logger.info(f"🎬 VIDEO DEBUG: Checking video setup - mode={self.mode}, has_video_manager={has_video_manager}, has_video_config={has_video_config}, enabled={enabled}")
+                logger.debug(f"🎬 VIDEO DEBUG: Checking video setup - mode={self.mode}, has_video_manager={has_video_manager}, has_video_config={has_video_config}, enabled={enabled}")
             
             if self.mode == 'read' and hasattr(self, 'video_manager') and self.video_manager and hasattr(self, 'video_config') and self.video_config and self.video_config.enabled:
                 # Get test name from YAML
@@ -332,7 +341,7 @@ class Recorder:
                 import time
                 self.video_start_time = datetime.now()
                 video_start_timestamp = time.time()
-                logger.info(f"🎬 VIDEO DEBUG: Video recording STARTED at timestamp {video_start_timestamp:.2f}")
+                logger.debug(f"🎬 VIDEO DEBUG: Video recording STARTED at timestamp {video_start_timestamp:.2f}")
                 
                 # Start browser using browser_manager (will create context with video)
                 page = await self.browser_manager.start()
@@ -340,7 +349,7 @@ class Recorder:
                 
                 browser_started_time = time.time()
                 elapsed_since_start = browser_started_time - video_start_timestamp
-                logger.info(f"🎬 VIDEO DEBUG: Browser started at {elapsed_since_start:.2f}s after video start")
+                logger.debug(f"🎬 VIDEO DEBUG: Browser started at {elapsed_since_start:.2f}s after video start")
                 
                 # Log browser started
                 if self.recorder_logger:
@@ -367,13 +376,13 @@ class Recorder:
                     # Verify video is enabled in context
                     context_options = getattr(self.browser_manager.context, '_options', {})
                     has_video = 'record_video_dir' in context_options or 'recordVideo' in str(context_options)
-                    logger.info(f"🎬 VIDEO DEBUG: Context has video recording: {has_video}")
+                    logger.debug(f"🎬 VIDEO DEBUG: Context has video recording: {has_video}")
                     logger.info(f"Video recording in context: {has_video}, options keys: {list(context_options.keys()) if isinstance(context_options, dict) else 'N/A'}")
                     
                     # Check for any timeout settings that might affect video
                     context_timeout = getattr(self.browser_manager.context, '_timeout_settings', None)
                     if context_timeout:
-                        logger.info(f"🎬 VIDEO DEBUG: Context timeout settings: {context_timeout}")
+                        logger.debug(f"🎬 VIDEO DEBUG: Context timeout settings: {context_timeout}")
                 
                 logger.info(f"Browser started with video recording enabled for test: {test_name}")
             else:
@@ -443,13 +452,9 @@ class Recorder:
                 
                 # Log initial navigation
                 if self.recorder_logger:
-                    try:
-                        page_title = await page.title()
-                    except:
-                        page_title = 'N/A'
                     self.recorder_logger.log_screen_event(
                         event_type='initial_navigation',
-                        page_state={'url': page.url, 'title': page_title},
+                        page_state=await self.recorder_logger.page_state(page),
                         details={'target_url': self.initial_url}
                     )
                 
@@ -483,11 +488,25 @@ class Recorder:
             
             # Initialize cursor controller if available
             if CURSOR_AVAILABLE:
+                recording_video = bool(
+                    self.mode == 'read' and self.video_config and self.video_config.enabled
+                )
+                visual = ExecutionProfile.parse(self.config.execution_profile).visual
+                if recording_video and getattr(self.video_config, 'cursor_overlay', False):
+                    # Cursor is drawn onto the video afterwards: only log positions and clicks
+                    from .video.cursor_overlay import CursorTrack
+                    start_time = self.video_start_time.timestamp() if self.video_start_time else None
+                    self.cursor_track = CursorTrack(start_time=start_time)
+                    visual = False
                 self.cursor_controller = CursorController(
                     page, 
                     fast_mode=self.fast_mode, 
                     speed_level=self.speed_level,
-                    recorder_logger=self.recorder_logger
+                    recorder_logger=self.recorder_logger,
+                    typing_mode=self.config.typing_mode,
+                    recording_video=recording_video,
+                    visual=visual,
+                    cursor_track=self.cursor_track
                 )
                 # Start cursor at center of screen (or last position if available)
                 await self.cursor_controller.start()
@@ -585,7 +604,9 @@ class Recorder:
                 # Log state change: is_recording = True (read mode)
                 self._log_state_change('is_recording', False, True, {'mode': 'read'})
                 
-                await self._execute_yaml_steps()
+                yaml_name = self.yaml_data.get('name', 'test') if self.yaml_data else 'test'
+                with get_profiler().span(yaml_name, category='test', url=self.initial_url):
+                    await self._execute_yaml_steps()
                 logger.info("YAML steps execution completed")
             
         except Exception as e:
@@ -616,6 +637,10 @@ class Recorder:
             print(f"❌ Error: {e}")
             raise
         finally:
+            # Narration started before the browser: drop clips no step will play
+            # (e.g. startup failed before the steps ran)
+            if self._pending_audio is not None:
+                self._pending_audio.cancel()
             logger.info("Finally block: calling stop()...")
             # Stop command server
             if self.command_server:
@@ -806,7 +831,7 @@ class Recorder:
                 import time
                 if hasattr(self, 'video_start_time'):
                     video_duration = (datetime.now() - self.video_start_time).total_seconds()
-                    logger.info(f"🎬 VIDEO DEBUG: Video recording duration so far: {video_duration:.2f}s")
+                    logger.debug(f"🎬 VIDEO DEBUG: Video recording duration so far: {video_duration:.2f}s")
                 
                 # CRITICAL: Verify page and context are still the same before closing
                 if self.browser_manager.context and self.page:
@@ -820,7 +845,7 @@ class Recorder:
                 # Playwright writes video asynchronously, so we need to wait for all frames
                 # Adjust wait time based on speed_level for better performance
                 before_close_wait_time = time.time()
-                logger.info(f"🎬 VIDEO DEBUG: Starting wait before closing context at {before_close_wait_time:.2f}s")
+                logger.debug(f"🎬 VIDEO DEBUG: Starting wait before closing context at {before_close_wait_time:.2f}s")
                 
                 # Calculate wait time based on speed_level
                 from .config import SpeedLevel
@@ -834,7 +859,7 @@ class Recorder:
                 await asyncio.sleep(wait_time)
                 after_close_wait_time = time.time()
                 wait_elapsed = after_close_wait_time - before_close_wait_time
-                logger.info(f"🎬 VIDEO DEBUG: Wait completed, elapsed: {wait_elapsed:.2f}s (speed_level: {self.speed_level})")
+                logger.debug(f"🎬 VIDEO DEBUG: Wait completed, elapsed: {wait_elapsed:.2f}s (speed_level: {self.speed_level})")
                 logger.info("Waiting before closing context to ensure video captures all actions")
                 
                 # IMPORTANT: Playwright finalizes video when context closes
@@ -842,12 +867,12 @@ class Recorder:
                 if self.browser_manager.context:
                     context_id = id(self.browser_manager.context)
                     before_close_time = time.time()
-                    logger.info(f"🎬 VIDEO DEBUG: About to close context {context_id} at {before_close_time:.2f}s")
+                    logger.debug(f"🎬 VIDEO DEBUG: About to close context {context_id} at {before_close_time:.2f}s")
                     logger.info(f"Closing context {context_id} to finalize video...")
                     await self.browser_manager.context.close()
                     after_close_time = time.time()
                     close_elapsed = after_close_time - before_close_time
-                    logger.info(f"🎬 VIDEO DEBUG: Context closed, elapsed: {close_elapsed:.2f}s")
+                    logger.debug(f"🎬 VIDEO DEBUG: Context closed, elapsed: {close_elapsed:.2f}s")
                     logger.info("Context closed, video should be finalized")
                 
                 # Wait for video to be finalized - Playwright saves videos asynchronously
@@ -902,7 +927,8 @@ class Recorder:
                                 '-y',
                                 str(mp4_path)
                             ]
-                            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                            with get_profiler().span('encode', stage='mp4'):
+                                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
                             if result.returncode == 0 and mp4_path.exists():
                                 found_video.unlink()
                                 found_video = mp4_path
@@ -932,7 +958,7 @@ class Recorder:
                             from .video.processor import VideoProcessor
                             test_name = self.yaml_data.get('name', 'test') if hasattr(self, 'yaml_data') and self.yaml_data else 'test'
                             
-                            processor = VideoProcessor(self.steps, self.video_config)
+                            processor = VideoProcessor(self.steps, self.video_config, cursor_track=self.cursor_track)
                             current_video_path = await processor.process_video(expected_path_final, test_name)
                             
                             # Ensure final video has correct name
@@ -1101,6 +1127,26 @@ class Recorder:
         cache_dir = getattr(self, '_audio_cache_dir', None)
         return await play_audio_for_step(tts_manager, text, cache_dir)
     
+    def _get_video_dir(self) -> Optional[Path]:
+        """Get video directory from video config, if any."""
+        if hasattr(self, 'video_config') and self.video_config and hasattr(self.video_config, 'dir'):
+            return Path(self.video_config.dir)
+        return None
+    
+    def _start_audio_pregeneration(self):
+        """Start background narration synthesis for the YAML steps (read mode)."""
+        from .playback import start_audio_pregeneration
+        
+        video_config = getattr(self, 'video_config', None)
+        if not video_config or not getattr(self, 'yaml_steps', None):
+            return
+        self._pending_audio = start_audio_pregeneration(
+            self.yaml_steps,
+            video_config,
+            self._get_video_dir(),
+            self.yaml_data.get('name', 'test') if self.yaml_data else 'test'
+        )
+    
     async def _execute_yaml_steps(self):
         """Execute YAML steps using playback module."""
         from .playback import execute_yaml_steps
@@ -1111,11 +1157,6 @@ class Recorder:
         else:
             video_start_time = datetime.now()
         
-        # Get video directory
-        video_dir = None
-        if hasattr(self, 'video_config') and self.video_config and hasattr(self.video_config, 'dir'):
-            video_dir = Path(self.video_config.dir)
-        
         # Execute steps using playback module
         self.steps = await execute_yaml_steps(
             yaml_steps=self.yaml_steps,
@@ -1125,7 +1166,9 @@ class Recorder:
             speed_level=self.speed_level,
             video_start_time=video_start_time,
             video_config=getattr(self, 'video_config', None),
-            video_dir=video_dir
+            video_dir=self._get_video_dir(),
+            test_name=self.yaml_data.get('name', 'test') if self.yaml_data else 'test',
+            pending_audio=self._pending_audio
         )
     
     async def _handle_keydown(self, event_data: dict):
@@ -14,7 +14,18 @@ from datetime import datetime
 from pathlib import Path
 
 from .logging_config import RecorderLoggingConfig
-from ..logger import StructuredLogger, LogLevel, LogContext
+from ..logger import StructuredLogger, LogLevel, LogContext, LazyMessage
+
+# Map level names to LogLevel enum
+_LEVELS = {
+    'DEBUG': LogLevel.DEBUG,
+    'INFO': LogLevel.INFO,
+    'WARNING': LogLevel.WARNING,
+    'ERROR': LogLevel.ERROR,
+    'CRITICAL': LogLevel.CRITICAL
+}
+# Levels whose entries carry the full page state (title included)
+_DETAILED_LEVELS = ('WARNING', 'ERROR', 'CRITICAL')
 
 
 class RecorderLogger:
@@ -84,6 +95,36 @@ class RecorderLogger:
         """Set current page state."""
         self.current_page_state = page_state
     
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether an entry at this level would be written (cheap, no payload built)."""
+        return self.structured_logger.is_enabled_for(_LEVELS.get(level, LogLevel.INFO))
+    
+    async def page_state(self, page, level: str = 'INFO', **extra) -> Optional[Dict[str, Any]]:
+        """
+        Describe a page for a log entry, paying only for what will be written.
+        
+        The URL is a local property; the title costs a round trip to the
+        browser, so it is only fetched in debug mode or for WARNING and above.
+        
+        Args:
+            page: Playwright page (or None)
+            level: Level of the entry the state is for
+            **extra: Additional page state fields
+            
+        Returns:
+            Page state dict, or None if the entry would not be written
+        """
+        if page is None or not self.is_enabled_for(level):
+            return None
+        state = {'url': getattr(page, 'url', 'N/A')}
+        if self.is_debug or level in _DETAILED_LEVELS:
+            try:
+                state['title'] = await page.title()
+            except Exception:
+                state['title'] = 'N/A'
+        state.update(extra)
+        return state
+    
     def _get_context(self, **kwargs) -> LogContext:
         """Build log context from current state and kwargs."""
         element_info = kwargs.get('element_info')
@@ -195,6 +236,9 @@ class RecorderLogger:
         **kwargs
     ):
         """Internal logging method."""
+        if not self.is_enabled_for(level):
+            return
+        
         log_data = self._build_log_data(
             level=level,
             message=message,
@@ -216,23 +260,20 @@ class RecorderLogger:
             duration_ms=duration_ms
         )
         
-        # Map level to LogLevel enum
-        level_map = {
-            'DEBUG': LogLevel.DEBUG,
-            'INFO': LogLevel.INFO,
-            'WARNING': LogLevel.WARNING,
-            'ERROR': LogLevel.ERROR,
-            'CRITICAL': LogLevel.CRITICAL
+        log_level = _LEVELS.get(level, LogLevel.INFO)
+        
+        # Rendered later (possibly on the writer thread): copy the caller's
+        # dicts and lists so the entry shows their state at this call
+        log_data = {
+            key: value.copy() if isinstance(value, (dict, list)) else value
+            for key, value in log_data.items()
         }
-        log_level = level_map.get(level, LogLevel.INFO)
         
-        # Format message for console
+        # Format message lazily (JSON or human-readable), only if a handler writes it
         if self.json_format:
-            # JSON format
-            log_message = json.dumps(log_data, default=str)
+            log_message = LazyMessage(json.dumps, log_data, default=str)
         else:
-            # Human-readable format
-            log_message = self._format_console_message(log_data)
+            log_message = LazyMessage(self._format_console_message, log_data)
         
         # Log using structured logger
         self.structured_logger._log(log_level, log_message, context=context)
@@ -8,7 +8,10 @@ Provides executors for different step actions (go_to, click, type, submit, wait)
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Union
+
+from ...performance import get_profiler
+from ..actions import Action, ClickAction, TypeAction, SubmitAction, GoToAction, WaitAction
 
 logger = logging.getLogger(__name__)
 
@@ -39,158 +42,137 @@ class ActionExecutors:
         self.recorder_logger = recorder_logger
         self.speed_level = speed_level
         self._wait_for_page_stable = wait_for_page_stable
+        
+        # Dispatch table: action name -> executor
+        self._executors: Dict[str, Callable] = {
+            GoToAction.name: self.execute_go_to,
+            ClickAction.name: self.execute_click,
+            TypeAction.name: self.execute_type,
+            SubmitAction.name: self.execute_submit,
+            WaitAction.name: self.execute_wait,
+        }
     
-    async def execute_go_to(self, step: Dict[str, Any], step_num: int):
+    async def execute(self, action: Action, step_num: int):
+        """
+        Execute a typed action.
+        
+        Args:
+            action: Action instance (see recorder.actions)
+            step_num: Step number (for logging/timers)
+        """
+        executor = self._executors.get(action.name)
+        if executor is None:
+            logger.warning(f"No executor for action '{action.name}'")
+            return
+        with get_profiler().span('action', action=action.name, step=step_num):
+            await executor(action, step_num)
+    
+    async def _wait_stable(self, timeout: float):
+        """Wait for the page to stabilize (if a waiter was given), as a traced phase."""
+        if not self._wait_for_page_stable:
+            return
+        with get_profiler().span('stability_wait', timeout=timeout):
+            await self._wait_for_page_stable(timeout=timeout)
+    
+    async def execute_go_to(self, step: Union[GoToAction, Dict[str, Any]], step_num: int):
         """Execute go_to action."""
-        url = step.get('url')
+        url = GoToAction.coerce(step).url
         if not url:
             return
         
         if self.recorder_logger:
-            self.recorder_logger.log_screen_event(
-                event_type='navigation',
-                page_state={'url': url, 'previous_url': self.page.url if hasattr(self.page, 'url') else ''}
-            )
+            with get_profiler().span('logging'):
+                self.recorder_logger.log_screen_event(
+                    event_type='navigation',
+                    page_state={'url': url, 'previous_url': self.page.url if hasattr(self.page, 'url') else ''}
+                )
         
         await self.page.goto(url, wait_until='domcontentloaded')
         
-        if self._wait_for_page_stable:
-            await self._wait_for_page_stable(timeout=10.0)
+        await self._wait_stable(10.0)
         
         if self.recorder_logger:
-            try:
-                page_title = await self.page.title()
-            except:
-                page_title = 'N/A'
-            self.recorder_logger.log_screen_event(
-                event_type='page_loaded',
-                page_state={'url': self.page.url, 'title': page_title}
+            with get_profiler().span('logging'):
+                self.recorder_logger.log_screen_event(
+                    event_type='page_loaded',
+                    page_state=await self.recorder_logger.page_state(self.page)
+                )
+    
+    async def _log_step_result(
+        self,
+        step_num: int,
+        action: str,
+        result: Optional[Dict[str, Any]],
+        element_info: Optional[Dict[str, Any]]
+    ):
+        """Log a step outcome (the page title is only fetched if the entry needs it)."""
+        with get_profiler().span('logging'):
+            duration_ms = self.recorder_logger.end_action_timer(f"step_{step_num}_{action}")
+            success = result.get('success', False) if result else False
+            error = result.get('error') if result else None
+            page_state = await self.recorder_logger.page_state(self.page, 'ERROR' if error else 'INFO')
+            self.recorder_logger.log_step_execution(
+                step_number=step_num,
+                action=action,
+                success=success,
+                duration_ms=duration_ms,
+                error=error,
+                element_info=element_info,
+                page_state=page_state
             )
     
-    async def execute_click(self, step: Dict[str, Any], step_num: int):
+    async def execute_click(self, step: Union[ClickAction, Dict[str, Any]], step_num: int):
         """Execute click action."""
-        text = step.get('text')
-        selector = step.get('selector')
-        
-        try:
-            await self.page.wait_for_load_state('domcontentloaded', timeout=5000)
-        except:
-            pass
-        
-        if text:
-            result = await self.command_handlers.handle_pw_click(f'"{text}"')
-        elif selector:
-            result = await self.command_handlers.handle_pw_click(f'selector "{selector}"')
+        action = ClickAction.coerce(step)
+        text = action.text
+        selector = action.selector
+        
+        with get_profiler().span('dom_ready_wait'):
+            try:
+                await self.page.wait_for_load_state('domcontentloaded', timeout=5000)
+            except:
+                pass
+        
+        if text or selector or action.role:
+            result = await self.command_handlers.handle_pw_click(action)
         else:
             logger.warning(f"Click step has no text or selector: {step}")
             result = {'success': False, 'error': 'No text or selector'}
         
         if self.recorder_logger:
-            duration_ms = self.recorder_logger.end_action_timer(f"step_{step_num}_click")
-            element_info = {'text': text, 'selector': selector} if text or selector else None
-            try:
-                if hasattr(self.page, 'title'):
-                    page_title = await self.page.title()
-                else:
-                    page_title = 'N/A'
-            except:
-                page_title = 'N/A'
-            page_state = {
-                'url': self.page.url if hasattr(self.page, 'url') else 'N/A',
-                'title': page_title
-            }
-            self.recorder_logger.log_step_execution(
-                step_number=step_num,
-                action='click',
-                success=result.get('success', False) if result else False,
-                duration_ms=duration_ms,
-                error=result.get('error') if result else None,
-                element_info=element_info,
-                page_state=page_state
-            )
+            await self._log_step_result(step_num, 'click', result, {'text': text, 'selector': selector} if text or selector else None)
         
-        if self._wait_for_page_stable:
-            await self._wait_for_page_stable(timeout=10.0)
+        await self._wait_stable(10.0)
     
-    async def execute_type(self, step: Dict[str, Any], step_num: int):
+    async def execute_type(self, step: Union[TypeAction, Dict[str, Any]], step_num: int):
         """Execute type action."""
-        text = step.get('text', '')
-        selector = step.get('selector')
-        field_text = step.get('field_text')
-        
-        if selector:
-            result = await self.command_handlers.handle_pw_type(f'"{text}" selector "{selector}"')
-        elif field_text:
-            result = await self.command_handlers.handle_pw_type(f'"{text}" into "{field_text}"')
-        else:
-            result = await self.command_handlers.handle_pw_type(f'"{text}"')
+        action = TypeAction.coerce(step)
+        text = action.text
+        selector = action.selector
+        field_text = action.into
+        
+        result = await self.command_handlers.handle_pw_type(action)
         
         if self.recorder_logger:
-            duration_ms = self.recorder_logger.end_action_timer(f"step_{step_num}_type")
-            element_info = {'field': field_text or selector, 'text': text}
-            try:
-                if hasattr(self.page, 'title'):
-                    page_title = await self.page.title()
-                else:
-                    page_title = 'N/A'
-            except:
-                page_title = 'N/A'
-            page_state = {
-                'url': self.page.url if hasattr(self.page, 'url') else 'N/A',
-                'title': page_title
-            }
-            self.recorder_logger.log_step_execution(
-                step_number=step_num,
-                action='type',
-                success=result.get('success', False) if result else False,
-                duration_ms=duration_ms,
-                error=result.get('error') if result else None,
-                element_info=element_info,
-                page_state=page_state
-            )
+            await self._log_step_result(step_num, 'type', result, {'field': field_text or selector, 'text': text})
         
-        if self._wait_for_page_stable:
-            await self._wait_for_page_stable(timeout=5.0)
+        await self._wait_stable(5.0)
     
-    async def execute_submit(self, step: Dict[str, Any], step_num: int):
+    async def execute_submit(self, step: Union[SubmitAction, Dict[str, Any]], step_num: int):
         """Execute submit action."""
-        button_text = step.get('button_text') or step.get('text')
+        action = SubmitAction.coerce(step)
+        button_text = action.button_text
         
-        if button_text:
-            result = await self.command_handlers.handle_pw_submit(f'"{button_text}"')
-        else:
-            result = await self.command_handlers.handle_pw_submit('')
+        result = await self.command_handlers.handle_pw_submit(action)
         
         if self.recorder_logger:
-            duration_ms = self.recorder_logger.end_action_timer(f"step_{step_num}_submit")
-            element_info = {'button_text': button_text}
-            try:
-                if hasattr(self.page, 'title'):
-                    page_title = await self.page.title()
-                else:
-                    page_title = 'N/A'
-            except:
-                page_title = 'N/A'
-            page_state = {
-                'url': self.page.url if hasattr(self.page, 'url') else 'N/A',
-                'title': page_title
-            }
-            self.recorder_logger.log_step_execution(
-                step_number=step_num,
-                action='submit',
-                success=result.get('success', False) if result else False,
-                duration_ms=duration_ms,
-                error=result.get('error') if result else None,
-                element_info=element_info,
-                page_state=page_state
-            )
+            await self._log_step_result(step_num, 'submit', result, {'button_text': button_text})
         
-        if self._wait_for_page_stable:
-            await self._wait_for_page_stable(timeout=10.0)
+        await self._wait_stable(10.0)
     
-    async def execute_wait(self, step: Dict[str, Any], step_num: int):
+    async def execute_wait(self, step: Union[WaitAction, Dict[str, Any]], step_num: int):
         """Execute wait action."""
-        seconds = step.get('seconds', 1.0)
+        seconds = WaitAction.coerce(step).seconds
         
         if self.speed_level:
             multiplier = self.speed_level.get_multiplier()
@@ -8,15 +8,30 @@ Handles execution of individual steps with audio synchronization.
 
 import asyncio
 import logging
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from ...execution_profile import get_round_trip_savings
+from ...performance import StepTimingReport, get_profiler, get_round_trip_counter, get_suite_timing_report
+from ...performance.round_trips import step_summary
 from ...step import TestStep
+from ..actions import action_from_step
+from ..locator_prefetch import LocatorPrefetcher, DEFAULT_LOOKAHEAD
 from .action_executors import ActionExecutors
 
 logger = logging.getLogger(__name__)
 
+# Step keys copied onto the step span as attributes
+_TARGET_KEYS = ('text', 'selector', 'url', 'field_text', 'role')
+
+
+def _step_target(step: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the step's target (text, selector, URL...) for span attributes."""
+    return {key: step[key] for key in _TARGET_KEYS if step.get(key) is not None}
+
 
 class StepExecutor:
     """Executes YAML steps with audio synchronization."""
@@ -31,7 +46,10 @@ class StepExecutor:
         wait_for_page_stable=None,
         play_audio_for_step=None,
         estimate_audio_duration=None,
-        pre_generated_audio_info=None
+        pre_generated_audio_info=None,
+        pending_audio=None,
+        prefetch_lookahead: int = DEFAULT_LOOKAHEAD,
+        test_name: str = "test"
     ):
         """
         Initialize step executor.
@@ -46,6 +64,10 @@ class StepExecutor:
             play_audio_for_step: Function to play audio for a step
             estimate_audio_duration: Function to estimate audio duration
             pre_generated_audio_info: Dict with pre-generated audio info from TTSManager.pre_generate_audios()
+            pending_audio: PreGeneration still running (TTSManager.start_pre_generation());
+                each step waits only for its own clip
+            prefetch_lookahead: Number of upcoming steps whose targets are resolved in one batch (0 disables)
+            test_name: Test name used in the per-step timing report
         """
         self.page = page
         self.command_handlers = command_handlers
@@ -56,6 +78,7 @@ class StepExecutor:
         self._play_audio_for_step = play_audio_for_step
         self._estimate_audio_duration = estimate_audio_duration
         self.pre_generated_audio_info = pre_generated_audio_info or {}
+        self.pending_audio = pending_audio
         
         # Initialize action executors
         self.action_executors = ActionExecutors(
@@ -66,9 +89,53 @@ class StepExecutor:
             wait_for_page_stable=wait_for_page_stable
         )
         
+        # Lookahead locator prefetch (cursor interactions reuse its results)
+        self.prefetch_lookahead = prefetch_lookahead
+        self.locator_prefetcher = LocatorPrefetcher(page) if prefetch_lookahead > 0 else None
+        
+        # Where each step spent its time (filled even when tracing is off)
+        self.timing_report = StepTimingReport(test_name)
+        
         self.steps: List[TestStep] = []
         self.last_audio_end_time = 0.0  # Track when last audio ended (relative to video start)
     
+    @contextmanager
+    def _timed_step(self, profiler, round_trips, number: int, action: str, step: Dict[str, Any]):
+        """Span one step and add its phase breakdown to the timing report (failed steps included)."""
+        if round_trips is not None:
+            round_trips.start_step(f"{number}. {action}")
+        started = time.perf_counter()
+        with profiler.collect_phases() as phases:
+            try:
+                with profiler.span(f"{number}. {action}", category='step', step=number, action=action,
+                                   **_step_target(step)):
+                    yield
+            finally:
+                self.timing_report.add_step(
+                    number, action, time.perf_counter() - started, phases,
+                    step_summary(round_trips.current) if round_trips is not None else None
+                )
+    
+    async def _apply_synthesized_durations(self, steps: List[TestStep], upto: Optional[TestStep] = None) -> None:
+        """
+        Replace predicted audio durations with the synthesized ones (dropping failed clips).
+        
+        Steps are resolved in order and removed from the list, up to and
+        including `upto` (all of them by default).
+        """
+        while steps:
+            test_step = steps.pop(0)
+            predicted = test_step.audio_duration_seconds
+            clip = await self.pending_audio.clip(test_step.step_number)
+            if clip is None:
+                test_step.audio_file_path = None
+                test_step.audio_duration_seconds = None
+            else:
+                test_step.audio_file_path, test_step.audio_duration_seconds = clip
+                logger.debug(f"🎤 Step {test_step.step_number}: predicted {predicted:.2f}s, synthesized {clip[1]:.2f}s")
+            if test_step is upto:
+                break
+    
     async def execute_steps(self, yaml_steps: List[Dict[str, Any]]) -> List[TestStep]:
         """
         Execute YAML steps with audio synchronization.
@@ -79,6 +146,15 @@ class StepExecutor:
         Returns:
             List of TestStep objects with all timing and content data
         """
+        try:
+            return await self._execute_steps(yaml_steps)
+        finally:
+            # Detach the prefetcher (navigation listener, page-side entries) even if a step failed
+            if self.locator_prefetcher:
+                await self.locator_prefetcher.close()
+    
+    async def _execute_steps(self, yaml_steps: List[Dict[str, Any]]) -> List[TestStep]:
+        """Execute YAML steps (see execute_steps)."""
         if not yaml_steps:
             logger.warning("No YAML steps to execute")
             return []
@@ -91,227 +167,251 @@ class StepExecutor:
         # Extract pre-generated audio info
         # Only audio_data is needed - timestamps are now calculated from real step execution times
         audio_data = self.pre_generated_audio_info.get('audio_data', {})
+        predicted_steps: List[TestStep] = []  # planned with predicted audio durations
         
         # Log execution start
         if self.recorder_logger:
             total_steps = len(yaml_steps)
-            try:
-                if hasattr(self.page, 'title'):
-                    page_title = await self.page.title()
-                else:
-                    page_title = 'N/A'
-            except:
-                page_title = 'N/A'
-            page_url = self.page.url if hasattr(self.page, 'url') else 'N/A'
             self.recorder_logger.log_screen_event(
                 event_type='yaml_execution_started',
-                page_state={'url': page_url, 'title': page_title},
+                page_state=await self.recorder_logger.page_state(self.page),
                 details={'total_steps': total_steps}
             )
         
+        # Headless profile: tally skipped visual work per step
+        savings = get_round_trip_savings(self.page)
+        # Spans per step and phase (no-op unless tracing is enabled)
+        profiler = get_profiler()
+        # Browser protocol calls per step (when the page is instrumented)
+        round_trips = get_round_trip_counter(self.page)
+        
         for i, step in enumerate(yaml_steps, 1):
             action = step.get('action')
             description = step.get('description', '')
             subtitle = step.get('subtitle')
             audio = step.get('audio')
             
-            step_start_datetime = datetime.now()
-            step_start_elapsed = (step_start_datetime - video_start_datetime).total_seconds()
-            
-            # Set step context
-            if self.recorder_logger:
-                self.recorder_logger.set_step_context(i, action)
-            
-            # Log step execution start
-            if self.recorder_logger:
-                try:
-                    if hasattr(self.page, 'title'):
-                        page_title = await self.page.title()
+            with self._timed_step(profiler, round_trips, i, action, step):
+                if savings is not None:
+                    savings.start_step(f"{i}. {action}")
+                
+                step_start_datetime = datetime.now()
+                step_start_elapsed = (step_start_datetime - video_start_datetime).total_seconds()
+                
+                # Set step context and log step execution start
+                if self.recorder_logger:
+                    with profiler.span('logging'):
+                        self.recorder_logger.set_step_context(i, action)
+                        page_state = await self.recorder_logger.page_state(self.page)
+                        if page_state is not None:
+                            self.recorder_logger.set_page_state(page_state)
+                
+                # Handle subtitle continuity
+                if subtitle is not None:
+                    if subtitle == '':
+                        current_subtitle = None
                     else:
-                        page_title = 'N/A'
-                except:
-                    page_title = 'N/A'
-                page_state = {
-                    'url': self.page.url if hasattr(self.page, 'url') else 'N/A',
-                    'title': page_title
-                }
-                self.recorder_logger.set_page_state(page_state)
-            
-            # Handle subtitle continuity
-            if subtitle is not None:
-                if subtitle == '':
-                    current_subtitle = None
-                else:
-                    current_subtitle = subtitle
-            elif current_subtitle:
-                pass  # Continue previous subtitle
-            
-            # Handle audio continuity
-            if audio is not None:
-                if audio == '':
-                    current_audio = None
-                else:
-                    current_audio = audio
-            elif current_audio:
-                pass  # Continue previous audio
-            
-            # Create TestStep object
-            test_step = TestStep(
-                step_number=i,
-                action=step,
-                subtitle=current_subtitle,
-                description=description,
-                video_start_time=video_start_datetime,
-                audio=current_audio
-            )
-            
-            # AUDIO SYNCHRONIZATION: Wait for previous audio to finish if this step has audio
-            # This ensures video is recorded with correct timestamps from the start
-            # Uses REAL timestamps from previously executed steps, not estimated ones
-            if i in audio_data:
-                # Step has pre-generated audio - get audio data first
-                audio_file, audio_duration = audio_data[i]
-                current_time_elapsed = step_start_elapsed
+                        current_subtitle = subtitle
+                elif current_subtitle:
+                    pass  # Continue previous subtitle
+                
+                # Handle audio continuity
+                if audio is not None:
+                    if audio == '':
+                        current_audio = None
+                    else:
+                        current_audio = audio
+                elif current_audio:
+                    pass  # Continue previous audio
+                
+                # Create TestStep object
+                test_step = TestStep(
+                    step_number=i,
+                    action=step,
+                    subtitle=current_subtitle,
+                    description=description,
+                    video_start_time=video_start_datetime,
+                    audio=current_audio
+                )
                 
-                # Check if previous step has audio that is still playing
-                # Use REAL timestamps from the previous step that was already executed
-                previous_audio_end_time = None
-                if i > 1 and len(self.steps) > 0:
-                    # Get the previous step (already executed and added to self.steps)
-                    previous_step = self.steps[-1]  # Last executed step
+                # AUDIO SYNCHRONIZATION: Wait for previous audio to finish if this step has audio
+                # This ensures video is recorded with correct timestamps from the start
+                # Uses REAL timestamps from previously executed steps, not estimated ones
+                clip = audio_data.get(i)
+                if clip is None and self.pending_audio is not None and self.pending_audio.has_audio(i):
+                    clip = None if self.pending_audio.is_ready(i) else self.pending_audio.prediction(i)
+                    if clip is not None:
+                        # Plan with the predicted duration; the real one is set once synthesized
+                        predicted_steps.append(test_step)
+                    else:
+                        # Clip still being synthesized in the background - wait for this one only
+                        with profiler.span('audio_synthesis', ready=self.pending_audio.is_ready(i)):
+                            clip = await self.pending_audio.clip(i)
+                        step_start_datetime = datetime.now()
+                        step_start_elapsed = (step_start_datetime - video_start_datetime).total_seconds()
+                if clip is not None:
+                    # Step has pre-generated audio - get audio data first
+                    audio_file, audio_duration = clip
+                    current_time_elapsed = step_start_elapsed
                     
-                    # Check if previous step has audio
-                    if (hasattr(previous_step, 'audio_file_path') and 
-                        previous_step.audio_file_path and 
-                        hasattr(previous_step, 'audio_duration_seconds') and 
-                        previous_step.audio_duration_seconds and
-                        hasattr(previous_step, '_start_seconds') and
-                        previous_step._start_seconds is not None):
+                    # Check if previous step has audio that is still playing
+                    # Use REAL timestamps from the previous step that was already executed
+                    previous_audio_end_time = None
+                    if i > 1 and len(self.steps) > 0:
+                        # Get the previous step (already executed and added to self.steps)
+                        previous_step = self.steps[-1]  # Last executed step
+                        
+                        # Previous clip planned with a predicted duration: switch to the real
+                        # one before computing when it ends, so an under-prediction never
+                        # makes this clip overlap it (waits for its synthesis if needed)
+                        if (previous_step.audio_file_path != audio_file and
+                                any(predicted is previous_step for predicted in predicted_steps)):
+                            with profiler.span('audio_synthesis', previous_step=i - 1):
+                                await self._apply_synthesized_durations(predicted_steps, upto=previous_step)
+                            step_start_datetime = datetime.now()
+                            step_start_elapsed = (step_start_datetime - video_start_datetime).total_seconds()
+                            current_time_elapsed = step_start_elapsed
                         
-                        # If previous and current steps share the same audio file (continuity),
-                        # the audio is already playing, so we don't need to wait
-                        if previous_step.audio_file_path != audio_file:
-                            # Different audio files - calculate when previous audio REALLY ended using real timestamps
-                            previous_audio_end_time = previous_step._start_seconds + previous_step.audio_duration_seconds
-                            logger.debug(f"🎤 Step {i}: Previous step {i-1} audio ends at {previous_audio_end_time:.2f}s (start: {previous_step._start_seconds:.2f}s, duration: {previous_step.audio_duration_seconds:.2f}s)")
-                        else:
-                            # Same audio file - audio is continuing, no need to wait
-                            logger.debug(f"🎤 Step {i}: Previous step {i-1} shares same audio file, audio is continuing")
+                        # Check if previous step has audio
+                        if (hasattr(previous_step, 'audio_file_path') and 
+                            previous_step.audio_file_path and 
+                            hasattr(previous_step, 'audio_duration_seconds') and 
+                            previous_step.audio_duration_seconds and
+                            hasattr(previous_step, '_start_seconds') and
+                            previous_step._start_seconds is not None):
+                            
+                            # If previous and current steps share the same audio file (continuity),
+                            # the audio is already playing, so we don't need to wait
+                            if previous_step.audio_file_path != audio_file:
+                                # Different audio files - calculate when previous audio REALLY ended using real timestamps
+                                previous_audio_end_time = previous_step._start_seconds + previous_step.audio_duration_seconds
+                                logger.debug(f"🎤 Step {i}: Previous step {i-1} audio ends at {previous_audio_end_time:.2f}s (start: {previous_step._start_seconds:.2f}s, duration: {previous_step.audio_duration_seconds:.2f}s)")
+                            else:
+                                # Same audio file - audio is continuing, no need to wait
+                                logger.debug(f"🎤 Step {i}: Previous step {i-1} shares same audio file, audio is continuing")
+                    
+                    # Determine when this step should start
+                    # If previous audio is still playing, wait until it finishes
+                    if previous_audio_end_time is not None and previous_audio_end_time > current_time_elapsed:
+                        # Previous audio is still playing - wait until it finishes
+                        wait_time = previous_audio_end_time - current_time_elapsed
+                        logger.debug(f"🎤 Step {i}: Waiting {wait_time:.2f}s for previous audio to finish (previous audio ends at {previous_audio_end_time:.2f}s, current time: {current_time_elapsed:.2f}s)")
+                        with profiler.span('audio_wait', wait_seconds=round(wait_time, 3)):
+                            await asyncio.sleep(wait_time)
+                        # Update step start time after waiting
+                        step_start_datetime = datetime.now()
+                        step_start_elapsed = (step_start_datetime - video_start_datetime).total_seconds()
+                        logger.debug(f"🎤 Step {i}: Waited, new start time: {step_start_elapsed:.2f}s")
+                    
+                    # Store audio data in step
+                    test_step.audio_file_path = audio_file
+                    test_step.audio_duration_seconds = audio_duration
+                    
+                    # Note: last_audio_end_time will be updated after step execution completes
+                    # when we have the real start_time_seconds value
                 
-                # Determine when this step should start
-                # If previous audio is still playing, wait until it finishes
-                if previous_audio_end_time is not None and previous_audio_end_time > current_time_elapsed:
-                    # Previous audio is still playing - wait until it finishes
-                    wait_time = previous_audio_end_time - current_time_elapsed
-                    logger.info(f"🎤 Step {i}: Waiting {wait_time:.2f}s for previous audio to finish (previous audio ends at {previous_audio_end_time:.2f}s, current time: {current_time_elapsed:.2f}s)")
-                    await asyncio.sleep(wait_time)
-                    # Update step start time after waiting
-                    step_start_datetime = datetime.now()
-                    step_start_elapsed = (step_start_datetime - video_start_datetime).total_seconds()
-                    logger.info(f"🎤 Step {i}: Waited, new start time: {step_start_elapsed:.2f}s")
+                # Initialize timing - mark as starting
+                test_step.start()
+                test_step._start_seconds = step_start_elapsed
+                test_step.start_time = step_start_datetime
                 
-                # Store audio data in step
-                test_step.audio_file_path = audio_file
-                test_step.audio_duration_seconds = audio_duration
+                # Start timer
+                step_action_id = f"step_{i}_{action}"
+                if self.recorder_logger:
+                    self.recorder_logger.start_action_timer(step_action_id)
                 
-                # Note: last_audio_end_time will be updated after step execution completes
-                # when we have the real start_time_seconds value
-            
-            # Initialize timing - mark as starting
-            test_step.start()
-            test_step._start_seconds = step_start_elapsed
-            test_step.start_time = step_start_datetime
-            
-            # Start timer
-            step_action_id = f"step_{i}_{action}"
-            if self.recorder_logger:
-                self.recorder_logger.start_action_timer(step_action_id)
-            
-            try:
-                # Mark as executing
-                test_step.execute()
-                test_step.execute_time = datetime.now()
+                # Page has settled after the previous step: resolve targets of the next steps in one call
+                if self.locator_prefetcher:
+                    with profiler.span('locate', prefetch=True):
+                        await self.locator_prefetcher.prefetch_ahead(yaml_steps, i - 1, self.prefetch_lookahead)
                 
-                # Execute action using action executors
-                if action == 'go_to':
-                    await self.action_executors.execute_go_to(step, i)
-                elif action == 'click':
-                    await self.action_executors.execute_click(step, i)
-                elif action == 'type':
-                    await self.action_executors.execute_type(step, i)
-                elif action == 'submit':
-                    await self.action_executors.execute_submit(step, i)
-                elif action == 'wait':
-                    await self.action_executors.execute_wait(step, i)
+                try:
+                    # Mark as executing
+                    test_step.execute()
+                    test_step.execute_time = datetime.now()
+                    
+                    # Execute typed action using action executors
+                    typed_action = action_from_step(step)
+                    if typed_action is not None:
+                        await self.action_executors.execute(typed_action, i)
+                    
+                    # Mark as waiting for load
+                    test_step.wait_load()
+                    test_step.wait_load_time = datetime.now()
+                    
+                except Exception as e:
+                    step_error_datetime = datetime.now()
+                    step_error_elapsed = (step_error_datetime - video_start_datetime).total_seconds()
+                    
+                    if self.recorder_logger:
+                        with profiler.span('logging'):
+                            duration_ms = self.recorder_logger.end_action_timer(step_action_id)
+                            page_state = await self.recorder_logger.page_state(self.page, 'CRITICAL')
+                            self.recorder_logger.log_critical_failure(
+                                action=f'step_{i}_{action}',
+                                error=str(e),
+                                page_state=page_state
+                            )
+                            self.recorder_logger.log_step_execution(
+                                step_number=i,
+                                action=action,
+                                success=False,
+                                duration_ms=duration_ms,
+                                error=str(e),
+                                page_state=page_state
+                            )
+                    
+                    # Mark step as failed
+                    test_step.fail_with_error(e)
+                    test_step._end_seconds = step_error_elapsed
+                    test_step._duration = step_error_elapsed - test_step._start_seconds
+                    self.steps.append(test_step)
+                    raise
                 
-                # Mark as waiting for load
-                test_step.wait_load()
-                test_step.wait_load_time = datetime.now()
+                # Calculate step end time (based on actual execution, not audio playback)
+                step_end_datetime = datetime.now()
+                step_end_elapsed = (step_end_datetime - video_start_datetime).total_seconds()
+                step_duration = step_end_elapsed - test_step._start_seconds
                 
-            except Exception as e:
-                step_error_datetime = datetime.now()
-                step_error_elapsed = (step_error_datetime - video_start_datetime).total_seconds()
+                # Mark as completed
+                test_step.complete()
+                test_step._end_seconds = step_end_elapsed
+                test_step._duration = step_duration
                 
-                if self.recorder_logger:
-                    duration_ms = self.recorder_logger.end_action_timer(step_action_id)
-                    page_state = {
-                        'url': self.page.url if hasattr(self.page, 'url') else 'N/A',
-                        'title': await self.page.title() if hasattr(self.page, 'title') else 'N/A'
-                    }
-                    self.recorder_logger.log_critical_failure(
-                        action=f'step_{i}_{action}',
-                        error=str(e),
-                        page_state=page_state
-                    )
-                    self.recorder_logger.log_step_execution(
-                        step_number=i,
-                        action=action,
-                        success=False,
-                        duration_ms=duration_ms,
-                        error=str(e),
-                        page_state=page_state
-                    )
+                # Update last_audio_end_time using REAL timestamps if this step has audio
+                if (hasattr(test_step, 'audio_file_path') and test_step.audio_file_path and
+                    hasattr(test_step, 'audio_duration_seconds') and test_step.audio_duration_seconds and
+                    test_step._start_seconds is not None):
+                    # Calculate when this audio REALLY ends using real timestamps
+                    self.last_audio_end_time = test_step._start_seconds + test_step.audio_duration_seconds
+                    logger.debug(f"🎤 Step {i}: Audio ends at {self.last_audio_end_time:.2f}s (start: {test_step._start_seconds:.2f}s, duration: {test_step.audio_duration_seconds:.2f}s)")
                 
-                # Mark step as failed
-                test_step.fail_with_error(e)
-                test_step._end_seconds = step_error_elapsed
-                test_step._duration = step_error_elapsed - test_step._start_seconds
                 self.steps.append(test_step)
-                raise
-            
-            # Calculate step end time (based on actual execution, not audio playback)
-            step_end_datetime = datetime.now()
-            step_end_elapsed = (step_end_datetime - video_start_datetime).total_seconds()
-            step_duration = step_end_elapsed - test_step._start_seconds
-            
-            # Mark as completed
-            test_step.complete()
-            test_step._end_seconds = step_end_elapsed
-            test_step._duration = step_duration
-            
-            # Update last_audio_end_time using REAL timestamps if this step has audio
-            if (hasattr(test_step, 'audio_file_path') and test_step.audio_file_path and
-                hasattr(test_step, 'audio_duration_seconds') and test_step.audio_duration_seconds and
-                test_step._start_seconds is not None):
-                # Calculate when this audio REALLY ends using real timestamps
-                self.last_audio_end_time = test_step._start_seconds + test_step.audio_duration_seconds
-                logger.debug(f"🎤 Step {i}: Audio ends at {self.last_audio_end_time:.2f}s (start: {test_step._start_seconds:.2f}s, duration: {test_step.audio_duration_seconds:.2f}s)")
-            
-            self.steps.append(test_step)
+        
+        if predicted_steps:
+            await self._apply_synthesized_durations(predicted_steps)
+        
+        if self.locator_prefetcher:
+            stats = self.locator_prefetcher.stats
+            logger.info(
+                f"Locator prefetch: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['prefetched']} targets in {stats['prefetch_calls']} calls"
+            )
+        
+        if savings is not None:
+            logger.info(f"Headless profile savings per step:\n{savings.format_report()}")
+        
+        if round_trips is not None:
+            logger.info(f"Browser round trips per step:\n{round_trips.format_report()}")
+        
+        logger.info(f"Step timing breakdown:\n{self.timing_report.format_table()}")
+        get_suite_timing_report().add(self.timing_report)
         
         # Log execution completed
         if self.recorder_logger:
-            try:
-                page_url = self.page.url if hasattr(self.page, 'url') else 'N/A'
-                if hasattr(self.page, 'title'):
-                    page_title = await self.page.title()
-                else:
-                    page_title = 'N/A'
-            except:
-                page_title = 'N/A'
             self.recorder_logger.log_screen_event(
                 event_type='yaml_execution_completed',
-                page_state={'url': page_url, 'title': page_title},
+                page_state=await self.recorder_logger.page_state(self.page),
                 details={'total_steps': len(yaml_steps)}
             )
         
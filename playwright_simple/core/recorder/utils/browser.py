@@ -9,6 +9,8 @@ Shared browser management code.
 from typing import Optional, Dict, Any
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
+from ...performance import instrument_page
+
 
 class BrowserManager:
     """Manages browser lifecycle."""
@@ -70,6 +72,8 @@ class BrowserManager:
             context_opts = getattr(self.context, '_options', {})
             logger.info(f"BrowserManager: Context created with video: context={id(self.context)}, has record_video_dir={('record_video_dir' in context_opts) or ('recordVideo' in str(context_opts))}")
         self.page = await self.context.new_page()
+        # Count and time protocol calls per step (see step report)
+        instrument_page(self.page)
         return self.page
     
     async def stop(self):
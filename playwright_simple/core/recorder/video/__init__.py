@@ -3,16 +3,19 @@
 """
 Video processing module for recorder.
 
-Provides functionality for processing videos: subtitles, audio embedding, and cleanup.
+Provides functionality for processing videos: cursor overlay, subtitles, audio embedding, and cleanup.
 """
 
 from .processor import VideoProcessor
 from .subtitles import SubtitleGenerator
 from .audio_embedder import AudioEmbedder
+from .cursor_overlay import CursorOverlay, CursorTrack
 
 __all__ = [
     'VideoProcessor',
     'SubtitleGenerator',
-    'AudioEmbedder'
+    'AudioEmbedder',
+    'CursorOverlay',
+    'CursorTrack'
 ]
 
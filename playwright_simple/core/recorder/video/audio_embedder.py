@@ -39,12 +39,12 @@ class AudioEmbedder:
         Returns:
             Path to video with audio, or original path if processing failed
         """
-        logger.info(f"🎤 DEBUG: generate_and_add_audio called")
-        logger.info(f"🎤 DEBUG: hasattr steps: {hasattr(self, 'steps')}")
+        logger.debug(f"🎤 DEBUG: generate_and_add_audio called")
+        logger.debug(f"🎤 DEBUG: hasattr steps: {hasattr(self, 'steps')}")
         if hasattr(self, 'steps'):
-            logger.info(f"🎤 DEBUG: steps is not None: {self.steps is not None}")
+            logger.debug(f"🎤 DEBUG: steps is not None: {self.steps is not None}")
             if self.steps:
-                logger.info(f"🎤 DEBUG: steps length: {len(self.steps)}")
+                logger.debug(f"🎤 DEBUG: steps length: {len(self.steps)}")
             else:
                 logger.warning(f"🎤 DEBUG: steps is EMPTY list!")
         else:
@@ -93,8 +93,8 @@ class AudioEmbedder:
                 import edge_tts
                 # Test if it actually works
                 edge_tts_available = True
-                logger.info(f"🎤 DEBUG: edge_tts importado com sucesso")
-                logger.info(f"🎤 DEBUG: edge_tts module path: {edge_tts.__file__ if hasattr(edge_tts, '__file__') else 'unknown'}")
+                logger.debug(f"🎤 DEBUG: edge_tts importado com sucesso")
+                logger.debug(f"🎤 DEBUG: edge_tts module path: {edge_tts.__file__ if hasattr(edge_tts, '__file__') else 'unknown'}")
             except ImportError as e:
                 edge_tts_available = False
                 logger.warning(f"edge-tts not available, cannot generate audio: {e}")
@@ -110,7 +110,7 @@ class AudioEmbedder:
                 print(f"⚠️  Erro ao importar edge-tts: {e}")
                 return video_path
             
-            logger.info(f"🎤 DEBUG: Criando TTSManager com engine={engine}, lang={lang}, voice={voice}")
+            logger.debug(f"🎤 DEBUG: Criando TTSManager com engine={engine}, lang={lang}, voice={voice}")
             try:
                 tts_manager = TTSManager(
                     lang=lang,
@@ -121,7 +121,7 @@ class AudioEmbedder:
                     pitch=pitch,
                     volume=volume
                 )
-                logger.info(f"🎤 DEBUG: TTSManager criado com sucesso")
+                logger.debug(f"🎤 DEBUG: TTSManager criado com sucesso")
             except ImportError as e:
                 logger.error(f"🎤 DEBUG: ImportError ao criar TTSManager: {e}", exc_info=True)
                 print(f"⚠️  Erro ao criar TTSManager: {e}")
@@ -135,11 +135,11 @@ class AudioEmbedder:
             # TTSManager will generate audio and store it in the steps themselves
             from ...step import TestStep
             
-            logger.info(f"🎤 DEBUG: Processing {len(self.steps)} steps for audio generation")
+            logger.debug(f"🎤 DEBUG: Processing {len(self.steps)} steps for audio generation")
             steps_with_audio = sum(1 for s in self.steps if isinstance(s, TestStep) and s.audio)
             steps_without_audio = len(self.steps) - steps_with_audio
             
-            logger.info(f"🎤 DEBUG: Steps with audio: {steps_with_audio}, without audio: {steps_without_audio}")
+            logger.debug(f"🎤 DEBUG: Steps with audio: {steps_with_audio}, without audio: {steps_without_audio}")
             
             if not self.steps:
                 logger.warning("No steps prepared for audio generation")
@@ -156,7 +156,7 @@ class AudioEmbedder:
             
             # Generate narration - TTSManager will store audio data in steps
             logger.info(f"Generating audio narration for {len(self.steps)} steps...")
-            logger.info(f"🎤 DEBUG: Steps with audio text: {steps_with_audio_text}/{len(self.steps)}")
+            logger.debug(f"🎤 DEBUG: Steps with audio text: {steps_with_audio_text}/{len(self.steps)}")
             print(f"🔊 Gerando narração para {len(self.steps)} steps...")
             print(f"🔊 DEBUG: {steps_with_audio_text} steps têm texto de áudio")
             
@@ -168,11 +168,11 @@ class AudioEmbedder:
                     return_timed_audio=True  # Returns single file with all audio + silence, synchronized with video
                 )
                 
-                logger.info(f"🎤 DEBUG: generate_narration returned: {narration_audio}")
+                logger.debug(f"🎤 DEBUG: generate_narration returned: {narration_audio}")
                 if narration_audio:
-                    logger.info(f"🎤 DEBUG: narration_audio path exists: {narration_audio.exists()}")
+                    logger.debug(f"🎤 DEBUG: narration_audio path exists: {narration_audio.exists()}")
                     if narration_audio.exists():
-                        logger.info(f"🎤 DEBUG: narration_audio size: {narration_audio.stat().st_size} bytes")
+                        logger.debug(f"🎤 DEBUG: narration_audio size: {narration_audio.stat().st_size} bytes")
                 
                 if not narration_audio or not narration_audio.exists():
                     logger.warning("Audio narration generation failed")
@@ -236,8 +236,8 @@ class AudioEmbedder:
                 print(f"❌ Erro: Arquivo de áudio não encontrado: {narration_audio}")
                 return video_path
             
-            logger.info(f"🎤 DEBUG: Video file exists: {video_path.exists()}, size: {video_path.stat().st_size} bytes")
-            logger.info(f"🎤 DEBUG: Audio file exists: {narration_audio.exists()}, size: {narration_audio.stat().st_size} bytes")
+            logger.debug(f"🎤 DEBUG: Video file exists: {video_path.exists()}, size: {video_path.stat().st_size} bytes")
+            logger.debug(f"🎤 DEBUG: Audio file exists: {narration_audio.exists()}, size: {narration_audio.stat().st_size} bytes")
             
             cmd = [
                 'ffmpeg',
@@ -257,11 +257,11 @@ class AudioEmbedder:
             ]
             
             logger.info(f"Running ffmpeg to embed audio: {' '.join(cmd)}")
-            logger.info(f"🎤 DEBUG: Video input (relative): {video_path}")
-            logger.info(f"🎤 DEBUG: Video input (absolute): {video_input_absolute}")
-            logger.info(f"🎤 DEBUG: Audio input (relative): {narration_audio}")
-            logger.info(f"🎤 DEBUG: Audio input (absolute): {audio_input_absolute}")
-            logger.info(f"🎤 DEBUG: Video output (absolute): {output_path}")
+            logger.debug(f"🎤 DEBUG: Video input (relative): {video_path}")
+            logger.debug(f"🎤 DEBUG: Video input (absolute): {video_input_absolute}")
+            logger.debug(f"🎤 DEBUG: Audio input (relative): {narration_audio}")
+            logger.debug(f"🎤 DEBUG: Audio input (absolute): {audio_input_absolute}")
+            logger.debug(f"🎤 DEBUG: Video output (absolute): {output_path}")
             print(f"🔄 Processando vídeo com áudio...")
             print(f"🎤 DEBUG: Embutindo áudio do arquivo: {narration_audio.name}")
             print(f"🎤 DEBUG: Vídeo de entrada: {video_path.name}")
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Post-production cursor overlay.
+
+Instead of injecting a cursor into the page and animating it with repeated
+``page.evaluate`` calls, the run only records where the cursor went and when
+it clicked (CursorTrack). After recording, CursorOverlay composites a cursor
+sprite, click ripples and a hover halo onto the video with ffmpeg's overlay
+filter, so the page never holds a cursor element and nothing flickers on
+navigation.
+"""
+
+import logging
+import struct
+import subprocess
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Same colors as CursorConfig.click_effect_color / hover_effect_color
+CLICK_COLOR = (0x00, 0x7b, 0xff)
+HOVER_COLOR = (0x00, 0x56, 0xb3)
+
+# Ripple shown after a click (same 300ms as the injected click indicator)
+RIPPLE_DURATION = 0.3
+RIPPLE_RADIUS = 20
+RIPPLE_THICKNESS = 4
+# Halo around the cursor shown just before a click
+HOVER_LEAD = 0.15
+HOVER_RADIUS = 16
+
+# Arrow cursor outline; the hotspot is the tip at (0, 0)
+CURSOR_POLYGON = [(0, 0), (0, 21), (5, 16), (9, 25), (12, 24), (8, 15), (15, 15)]
+CURSOR_OUTLINE = 1.5
+
+
+@dataclass
+class CursorEvent:
+    """One cursor event, in seconds since the video started."""
+    t: float
+    x: int
+    y: int
+    kind: str = "move"  # move or click
+    duration: float = 0.0  # move animation length (glide ends at t)
+
+
+class CursorTrack:
+    """
+    Cursor positions and clicks logged during a run, for CursorOverlay.
+
+    Moves are logged when they happen; their glide is rendered ending at the
+    logged time, so a click right after a move finds the cursor in place.
+    """
+
+    def __init__(self, start_time: Optional[float] = None, clock: Callable[[], float] = time.time):
+        """
+        Initialize cursor track.
+
+        Args:
+            start_time: Timestamp (from ``clock``) matching the first video frame
+            clock: Time source (``time.time`` by default)
+        """
+        self._clock = clock
+        self.start_time = clock() if start_time is None else start_time
+        self.events: List[CursorEvent] = []
+
+    def _elapsed(self) -> float:
+        return max(0.0, self._clock() - self.start_time)
+
+    def move(self, x: int, y: int, duration: float = 0.0) -> None:
+        """Log the cursor moving to (x, y)."""
+        self.events.append(CursorEvent(self._elapsed(), int(x), int(y), 'move', duration))
+
+    def click(self, x: int, y: int) -> None:
+        """Log a click at (x, y)."""
+        self.events.append(CursorEvent(self._elapsed(), int(x), int(y), 'click'))
+
+    @property
+    def moves(self) -> List[CursorEvent]:
+        """Move events in time order."""
+        return [event for event in self.events if event.kind == 'move']
+
+    @property
+    def clicks(self) -> List[CursorEvent]:
+        """Click events in time order."""
+        return [event for event in self.events if event.kind == 'click']
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize track (for logs or re-rendering)."""
+        return {'start_time': self.start_time, 'events': [asdict(event) for event in self.events]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CursorTrack':
+        """Rebuild a track serialized with to_dict."""
+        track = cls(start_time=data.get('start_time', 0.0))
+        track.events = [CursorEvent(**event) for event in data.get('events', [])]
+        return track
+
+
+# ---------------------------------------------------------------------------
+# Sprites (plain RGBA PNGs, no imaging dependency)
+# ---------------------------------------------------------------------------
+
+def _png(width: int, height: int, rgba: bytes) -> bytes:
+    """Encode RGBA pixels as a PNG."""
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    stride = width * 4
+    raw = b''.join(b'\x00' + rgba[row * stride:(row + 1) * stride] for row in range(height))
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+        + chunk(b'IDAT', zlib.compress(raw, 9))
+        + chunk(b'IEND', b'')
+    )
+
+
+def _segment_distance(px: float, py: float, a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    ax, ay = a
+    bx, by = b
+    dx, dy = bx - ax, by - ay
+    length = dx * dx + dy * dy
+    u = 0.0 if length == 0 else max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length))
+    return ((px - ax - u * dx) ** 2 + (py - ay - u * dy) ** 2) ** 0.5
+
+
+def _inside(px: float, py: float, polygon: List[Tuple[float, float]]) -> bool:
+    inside = False
+    j = len(polygon) - 1
+    for i, (xi, yi) in enumerate(polygon):
+        xj, yj = polygon[j]
+        if (yi > py) != (yj > py) and px < (xj - xi) * (py - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def cursor_sprite() -> Tuple[bytes, int, int]:
+    """
+    Draw the arrow cursor (white with a dark outline).
+
+    Returns:
+        (PNG bytes, width, height); the hotspot is the top-left pixel
+    """
+    width = max(x for x, _ in CURSOR_POLYGON) + 2
+    height = max(y for _, y in CURSOR_POLYGON) + 2
+    edges = list(zip(CURSOR_POLYGON, CURSOR_POLYGON[1:] + CURSOR_POLYGON[:1]))
+    pixels = bytearray(width * height * 4)
+    for py in range(height):
+        for px in range(width):
+            cx, cy = px + 0.5, py + 0.5
+            distance = min(_segment_distance(cx, cy, a, b) for a, b in edges)
+            if distance <= CURSOR_OUTLINE:
+                color = (0x20, 0x20, 0x20, 255)
+            elif _inside(cx, cy, CURSOR_POLYGON):
+                color = (255, 255, 255, 255)
+            else:
+                continue
+            offset = (py * width + px) * 4
+            pixels[offset:offset + 4] = bytes(color)
+    return _png(width, height, bytes(pixels)), width, height
+
+
+def circle_sprite(radius: int, color: Tuple[int, int, int], alpha: int, thickness: Optional[int] = None) -> bytes:
+    """
+    Draw a disc (thickness=None) or a ring of the given radius.
+
+    Returns:
+        PNG bytes of a (2*radius x 2*radius) image centered on the circle
+    """
+    size = radius * 2
+    pixels = bytearray(size * size * 4)
+    for py in range(size):
+        for px in range(size):
+            distance = ((px + 0.5 - radius) ** 2 + (py + 0.5 - radius) ** 2) ** 0.5
+            if distance > radius or (thickness is not None and distance < radius - thickness):
+                continue
+            offset = (py * size + px) * 4
+            pixels[offset:offset + 4] = bytes((*color, alpha))
+    return _png(size, size, bytes(pixels))
+
+
+# ---------------------------------------------------------------------------
+# ffmpeg expressions
+# ---------------------------------------------------------------------------
+
+def _num(value: float) -> str:
+    """Format a number for an ffmpeg expression."""
+    return f"{value:.3f}".rstrip('0').rstrip('.') or '0'
+
+
+def position_expr(moves: List[CursorEvent], axis: str) -> str:
+    """
+    Build an ffmpeg expression for the cursor coordinate over time.
+
+    The expression is flat (no nesting): the first position plus one eased
+    term per move, so it stays cheap to parse for long recordings.
+
+    Args:
+        moves: Move events in time order
+        axis: 'x' or 'y'
+
+    Returns:
+        Expression of ``t`` (seconds)
+    """
+    if not moves:
+        return '0'
+    terms = [str(getattr(moves[0], axis))]
+    for previous, move in zip(moves, moves[1:]):
+        delta = getattr(move, axis) - getattr(previous, axis)
+        if delta == 0:
+            continue
+        start = max(previous.t, move.t - move.duration)
+        length = move.t - start
+        if length <= 0:
+            terms.append(f"{delta}*gte(t,{_num(move.t)})")
+        else:
+            progress = f"clip((t-{_num(start)})/{_num(length)},0,1)"
+            # ease-out, like the injected cursor's CSS transition
+            terms.append(f"{delta}*(1-pow(1-{progress},2))")
+    return '+'.join(terms)
+
+
+def click_position_expr(clicks: List[CursorEvent], axis: str) -> str:
+    """Build an expression for the coordinate of the latest click at ``t``."""
+    if not clicks:
+        return '0'
+    terms = [str(getattr(clicks[0], axis))]
+    for previous, click in zip(clicks, clicks[1:]):
+        delta = getattr(click, axis) - getattr(previous, axis)
+        if delta:
+            terms.append(f"{delta}*gte(t,{_num(click.t)})")
+    return '+'.join(terms)
+
+
+def windows_expr(windows: List[Tuple[float, float]]) -> str:
+    """Build an ``enable`` expression that is non-zero inside any window."""
+    return '+'.join(f"between(t,{_num(start)},{_num(end)})" for start, end in windows) or '0'
+
+
+class CursorOverlay:
+    """Composites a CursorTrack onto a recorded video with ffmpeg."""
+
+    def __init__(self, track: CursorTrack, video_config: Any = None):
+        """
+        Initialize cursor overlay.
+
+        Args:
+            track: Logged cursor positions and clicks
+            video_config: VideoConfig (codec of the output)
+        """
+        self.track = track
+        self.video_config = video_config
+
+    def build_filter(self) -> str:
+        """
+        Build the filter_complex graph.
+
+        Inputs: 0 = video, 1 = cursor, 2 = ripple, 3 = halo. Output label: ``[v]``.
+        """
+        moves = self.track.moves
+        clicks = self.track.clicks
+        x = position_expr(moves, 'x')
+        y = position_expr(moves, 'y')
+
+        parts = []
+        label = '0:v'
+        if clicks:
+            halo = windows_expr([(max(0.0, c.t - HOVER_LEAD), c.t + RIPPLE_DURATION) for c in clicks])
+            parts.append(
+                f"[{label}][3:v]overlay=x='{x}-{HOVER_RADIUS}':y='{y}-{HOVER_RADIUS}'"
+                f":eval=frame:shortest=1:enable='{halo}'[hover]"
+            )
+            ripple = windows_expr([(c.t, c.t + RIPPLE_DURATION) for c in clicks])
+            cx = click_position_expr(clicks, 'x')
+            cy = click_position_expr(clicks, 'y')
+            parts.append(
+                f"[hover][2:v]overlay=x='{cx}-{RIPPLE_RADIUS}':y='{cy}-{RIPPLE_RADIUS}'"
+                f":eval=frame:shortest=1:enable='{ripple}'[ripple]"
+            )
+            label = 'ripple'
+        parts.append(f"[{label}][1:v]overlay=x='{x}':y='{y}':eval=frame:shortest=1[v]")
+        return ';'.join(parts)
+
+    def write_sprites(self, directory: Path) -> List[Path]:
+        """Write cursor, ripple and halo PNGs; returns their paths in input order."""
+        sprites = [
+            ('cursor.png', cursor_sprite()[0]),
+            ('ripple.png', circle_sprite(RIPPLE_RADIUS, CLICK_COLOR, 220, thickness=RIPPLE_THICKNESS)),
+            ('hover.png', circle_sprite(HOVER_RADIUS, HOVER_COLOR, 80)),
+        ]
+        paths = []
+        for name, data in sprites:
+            path = directory / name
+            path.write_bytes(data)
+            paths.append(path)
+        return paths
+
+    def build_command(self, video_path: Path, output_path: Path, sprites: List[Path]) -> List[str]:
+        """Build the ffmpeg command line."""
+        cmd = ['ffmpeg', '-i', str(video_path)]
+        for sprite in sprites:
+            cmd.extend(['-loop', '1', '-i', str(sprite)])
+        cmd.extend(['-filter_complex', self.build_filter(), '-map', '[v]', '-map', '0:a?'])
+        if output_path.suffix.lower() == '.mp4':
+            cmd.extend(['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '23', '-movflags', '+faststart'])
+        else:
+            cmd.extend(['-c:v', 'libvpx-vp9', '-deadline', 'realtime', '-cpu-used', '8'])
+        cmd.extend(['-c:a', 'copy', '-y', str(output_path)])
+        return cmd
+
+    async def apply(self, video_path: Path) -> Path:
+        """
+        Draw the cursor onto a video (replacing it in place).
+
+        Args:
+            video_path: Recorded video
+
+        Returns:
+            Path to the video with the cursor, or the original path on failure
+        """
+        if not self.track.moves:
+            logger.info("Cursor track is empty, skipping cursor overlay")
+            return video_path
+
+        try:
+            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True, timeout=5)
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            logger.warning("ffmpeg not found, cannot draw cursor overlay")
+            print(f"⚠️  ffmpeg não encontrado. Cursor não será desenhado no vídeo.")
+            return video_path
+
+        output_path = video_path.parent / f"{video_path.stem}_with_cursor{video_path.suffix}"
+        try:
+            with tempfile.TemporaryDirectory(prefix='cursor_overlay_') as temp_dir:
+                sprites = self.write_sprites(Path(temp_dir))
+                cmd = self.build_command(video_path, output_path, sprites)
+                logger.debug(f"Cursor overlay ffmpeg command: {' '.join(cmd)}")
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+
+            if result.returncode == 0 and output_path.exists():
+                video_path.unlink()
+                output_path.rename(video_path)
+                logger.info(
+                    f"Cursor overlay drawn: {len(self.track.moves)} moves, "
+                    f"{len(self.track.clicks)} clicks"
+                )
+                print(f"✅ Cursor desenhado no vídeo: {video_path.name}")
+                return video_path
+
+            error_msg = (result.stderr or result.stdout or '')[-500:]
+            logger.warning(f"ffmpeg failed to draw cursor overlay: {error_msg}")
+            print(f"⚠️  Erro ao desenhar cursor no vídeo")
+        except Exception as e:
+            logger.error(f"Error drawing cursor overlay: {e}", exc_info=True)
+            print(f"⚠️  Erro ao desenhar cursor no vídeo: {e}")
+        if output_path.exists():
+            output_path.unlink()
+        return video_path
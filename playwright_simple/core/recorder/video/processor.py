@@ -3,7 +3,7 @@
 """
 Video processor module.
 
-Coordinates complete video processing: subtitles, audio, and cleanup.
+Coordinates complete video processing: cursor overlay, subtitles, audio, and cleanup.
 """
 
 import logging
@@ -14,29 +14,33 @@ from typing import List, Any, Optional
 
 from .subtitles import SubtitleGenerator
 from .audio_embedder import AudioEmbedder
+from .cursor_overlay import CursorOverlay, CursorTrack
+from ...performance import get_profiler
 
 logger = logging.getLogger(__name__)
 
 
 class VideoProcessor:
-    """Coordinates video processing: subtitles, audio embedding, and cleanup."""
+    """Coordinates video processing: cursor overlay, subtitles, audio embedding, and cleanup."""
     
-    def __init__(self, steps: List[Any], video_config):
+    def __init__(self, steps: List[Any], video_config, cursor_track: Optional[CursorTrack] = None):
         """
         Initialize video processor.
         
         Args:
             steps: List of TestStep objects or dicts with timing information
             video_config: VideoConfig object with video settings
+            cursor_track: Cursor positions/clicks logged during the run (cursor overlay)
         """
         self.steps = steps
         self.video_config = video_config
         self.subtitle_generator = SubtitleGenerator(steps, video_config)
         self.audio_embedder = AudioEmbedder(steps, video_config)
+        self.cursor_overlay = CursorOverlay(cursor_track, video_config) if cursor_track is not None else None
     
     async def process_video(self, video_path: Path, test_name: str) -> Optional[Path]:
         """
-        Process video: add subtitles and audio in sequence.
+        Process video: draw cursor, add subtitles and audio in sequence.
         
         Args:
             video_path: Path to video file
@@ -47,14 +51,21 @@ class VideoProcessor:
         """
         current_video_path = video_path
         
+        # Step 0: Draw the cursor from the logged track (cursor overlay mode)
+        if self.cursor_overlay and getattr(self.video_config, 'cursor_overlay', False):
+            print(f"🖱️  Desenhando cursor no vídeo...")
+            with get_profiler().span('encode', stage='cursor_overlay'):
+                current_video_path = await self.cursor_overlay.apply(current_video_path)
+        
         # Step 1: Generate and add subtitles if enabled
         if self.video_config.subtitles and self.steps:
             logger.info("🎬 Generating subtitles for video...")
-            logger.info(f"🎬 DEBUG: steps count: {len(self.steps)}")
+            logger.debug(f"🎬 DEBUG: steps count: {len(self.steps)}")
             print(f"📝 Gerando legendas para o vídeo...")
             print(f"📝 DEBUG: {len(self.steps)} steps com timestamps")
             try:
-                result_video = await self.subtitle_generator.generate_and_add_subtitles(current_video_path)
+                with get_profiler().span('encode', stage='subtitles'):
+                    result_video = await self.subtitle_generator.generate_and_add_subtitles(current_video_path)
                 if result_video and result_video.exists():
                     current_video_path = result_video
                     logger.info(f"Video with subtitles ready: {current_video_path.name}")
@@ -73,15 +84,16 @@ class VideoProcessor:
         # Use current_video_path (which may already have subtitles embedded)
         if (self.video_config.audio or self.video_config.narration) and self.steps:
             logger.info("🎤 Generating audio narration for video...")
-            logger.info(f"🎤 DEBUG: steps count: {len(self.steps)}")
-            logger.info(f"🎤 DEBUG: video_config.audio={self.video_config.audio}, video_config.narration={self.video_config.narration}")
+            logger.debug(f"🎤 DEBUG: steps count: {len(self.steps)}")
+            logger.debug(f"🎤 DEBUG: video_config.audio={self.video_config.audio}, video_config.narration={self.video_config.narration}")
             print(f"🔊 Gerando narração de áudio para o vídeo...")
             print(f"🔊 DEBUG: {len(self.steps)} steps com timestamps")
             print(f"🔊 DEBUG: audio={self.video_config.audio}, narration={self.video_config.narration}")
             try:
-                logger.info(f"🎤 DEBUG: Using test_name: {test_name}")
+                logger.debug(f"🎤 DEBUG: Using test_name: {test_name}")
                 print(f"🔊 DEBUG: Nome do teste: {test_name}")
-                result_video = await self.audio_embedder.generate_and_add_audio(current_video_path, test_name)
+                with get_profiler().span('encode', stage='audio'):
+                    result_video = await self.audio_embedder.generate_and_add_audio(current_video_path, test_name)
                 if result_video and result_video.exists():
                     current_video_path = result_video
                     logger.info(f"Video with audio ready: {current_video_path.name}")
@@ -154,7 +166,7 @@ class VideoProcessor:
                             logger.warning(f"Could not remove video {video_file.name}: {e}")
                     
                     # Remove files with temporary suffixes
-                    if any(suffix in video_file.stem for suffix in ['_with_subtitles', '_with_audio', '_tts_temp']):
+                    if any(suffix in video_file.stem for suffix in ['_with_subtitles', '_with_audio', '_with_cursor', '_tts_temp']):
                         try:
                             video_file.unlink()
                             cleaned.append(video_file.name)
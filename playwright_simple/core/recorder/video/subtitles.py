@@ -48,12 +48,12 @@ class SubtitleGenerator:
         Returns:
             Path to SRT file, or None if generation failed
         """
-        logger.info(f"🎬 DEBUG: generate_srt_file called")
-        logger.info(f"🎬 DEBUG: hasattr steps: {hasattr(self, 'steps')}")
+        logger.debug(f"🎬 DEBUG: generate_srt_file called")
+        logger.debug(f"🎬 DEBUG: hasattr steps: {hasattr(self, 'steps')}")
         if hasattr(self, 'steps'):
-            logger.info(f"🎬 DEBUG: steps is not None: {self.steps is not None}")
+            logger.debug(f"🎬 DEBUG: steps is not None: {self.steps is not None}")
             if self.steps:
-                logger.info(f"🎬 DEBUG: steps length: {len(self.steps)}")
+                logger.debug(f"🎬 DEBUG: steps length: {len(self.steps)}")
             else:
                 logger.warning(f"🎬 DEBUG: steps is EMPTY list!")
         else:
@@ -79,7 +79,7 @@ class SubtitleGenerator:
                 
                 # Process steps and eliminate overlaps
                 processed_steps = []
-                logger.info(f"🎬 DEBUG: Processing {len(self.steps)} steps for SRT")
+                logger.debug(f"🎬 DEBUG: Processing {len(self.steps)} steps for SRT")
                 steps_with_subtitle = 0
                 steps_without_subtitle = 0
                 
@@ -157,8 +157,8 @@ class SubtitleGenerator:
                             current['duration'] = new_end - current['start']
                             break
                 
-                logger.info(f"🎬 DEBUG: Steps with subtitle: {steps_with_subtitle}, without subtitle: {steps_without_subtitle}")
-                logger.info(f"🎬 DEBUG: Processed {len(processed_steps)} steps for SRT file")
+                logger.debug(f"🎬 DEBUG: Steps with subtitle: {steps_with_subtitle}, without subtitle: {steps_without_subtitle}")
+                logger.debug(f"🎬 DEBUG: Processed {len(processed_steps)} steps for SRT file")
                 
                 # Write SRT entries
                 srt_entries_written = 0
@@ -172,7 +172,7 @@ class SubtitleGenerator:
                         subtitle_index += 1
                         srt_entries_written += 1
                 
-                logger.info(f"🎬 DEBUG: Wrote {srt_entries_written} SRT entries to file")
+                logger.debug(f"🎬 DEBUG: Wrote {srt_entries_written} SRT entries to file")
             
             if srt_path.exists():
                 srt_size = srt_path.stat().st_size
@@ -255,7 +255,7 @@ class SubtitleGenerator:
             try:
                 # Copy SRT to simple filename
                 shutil.copy2(srt_path, simple_srt_path)
-                logger.info(f"🎬 DEBUG: SRT copiado para nome simples: {simple_srt_name}")
+                logger.debug(f"🎬 DEBUG: SRT copiado para nome simples: {simple_srt_name}")
                 
                 # Use simple filename in filter (relative to video directory)
                 # This avoids all path escaping issues
@@ -302,14 +302,14 @@ class SubtitleGenerator:
             ])
             
             logger.info(f"Processing video with subtitles: {srt_path.name}")
-            logger.info(f"🎬 DEBUG: SRT path (absolute): {srt_absolute}")
+            logger.debug(f"🎬 DEBUG: SRT path (absolute): {srt_absolute}")
             if srt_escaped_absolute:
-                logger.info(f"🎬 DEBUG: SRT path (escaped): {srt_escaped_absolute}")
+                logger.debug(f"🎬 DEBUG: SRT path (escaped): {srt_escaped_absolute}")
             else:
-                logger.info(f"🎬 DEBUG: SRT path (using simple filename): {simple_srt_name}")
-            logger.info(f"🎬 DEBUG: Video input (absolute): {video_absolute}")
-            logger.info(f"🎬 DEBUG: Video output: {output_path}")
-            logger.info(f"🎬 DEBUG: FFmpeg command: {' '.join(cmd)}")
+                logger.debug(f"🎬 DEBUG: SRT path (using simple filename): {simple_srt_name}")
+            logger.debug(f"🎬 DEBUG: Video input (absolute): {video_absolute}")
+            logger.debug(f"🎬 DEBUG: Video output: {output_path}")
+            logger.debug(f"🎬 DEBUG: FFmpeg command: {' '.join(cmd)}")
             print(f"🎬 Processando vídeo com legendas (burn)...")
             print(f"🎬 DEBUG: Queimando legendas do arquivo: {srt_path.name}")
             print(f"🎬 DEBUG: Vídeo de entrada: {video_path.name}")
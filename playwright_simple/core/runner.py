@@ -12,6 +12,7 @@ import re
 import subprocess
 import traceback
 import json
+from collections import deque
 from pathlib import Path
 from typing import Callable, List, Tuple, Optional, Dict, Any
 from datetime import datetime
@@ -22,8 +23,13 @@ from .base import SimpleTestBase
 from .video import VideoManager
 from .tts import TTSManager
 from .exceptions import ElementNotFoundError, NavigationError, VideoProcessingError
+from .execution_profile import RoundTripSavings, visual_enabled
+from .session import SessionManager
+from .logger import LazyMessage
+from .performance import MemoryMonitor, get_profiler, instrument_page
 from .constants import (
     CLEANUP_DELAY,
+    CONSOLE_MESSAGES_LIMIT,
     VIDEO_FINALIZATION_DELAY,
     FFMPEG_TIMEOUT,
     FFMPEG_VERSION_CHECK_TIMEOUT,
@@ -49,6 +55,14 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
 def _log_action(action: str, test_name: str, details: Optional[Dict[str, Any]] = None, level: str = "INFO"):
     """
     Log structured action for debugging.
@@ -59,6 +73,10 @@ def _log_action(action: str, test_name: str, details: Optional[Dict[str, Any]] =
         details: Additional details to log
         level: Log level (DEBUG, INFO, WARNING, ERROR)
     """
+    log_level = _LOG_LEVELS.get(level, logging.INFO)
+    if not logger.isEnabledFor(log_level):
+        return
+    
     log_data = {
         "timestamp": datetime.now().isoformat(),
         "test": test_name,
@@ -67,16 +85,8 @@ def _log_action(action: str, test_name: str, details: Optional[Dict[str, Any]] =
     if details:
         log_data.update(details)
     
-    log_message = json.dumps(log_data, ensure_ascii=False)
-    
-    if level == "DEBUG":
-        logger.debug(log_message)
-    elif level == "WARNING":
-        logger.warning(log_message)
-    elif level == "ERROR":
-        logger.error(log_message)
-    else:
-        logger.info(log_message)
+    # Encoded only by the handlers that write it
+    logger.log(log_level, LazyMessage(json.dumps, log_data, ensure_ascii=False))
 
 
 class TestRunner:
@@ -128,11 +138,15 @@ class TestRunner:
         
         self.config = config
         self.video_manager = VideoManager(config.video)
+        self.session_manager = SessionManager()
         
         # Test execution tracking
         self.test_results: List[Dict[str, Any]] = []
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
+        
+        # Per-test memory samples (opt-in, see BrowserConfig.memory_profile)
+        self.memory: Optional[MemoryMonitor] = None
     
     async def run_test(
         self,
@@ -175,6 +189,11 @@ class TestRunner:
         start_time = datetime.now()
         video_start_time = None  # Time when video recording actually starts (context creation)
         create_context = context is None
+        session_name = getattr(test_func, 'load_session', None)
+        session_restored = False
+        test = None
+        savings = None
+        round_trips = None
         
         try:
             # Create context if needed
@@ -194,7 +213,7 @@ class TestRunner:
                 # Capture context creation time - this is when video recording actually begins
                 context_creation_time = datetime.now()
                 
-                context = await browser.new_context(
+                context_options = dict(
                     viewport=self.config.browser.viewport,
                     locale=self.config.browser.locale,
                     device_scale_factor=1,
@@ -202,6 +221,14 @@ class TestRunner:
                     ignore_https_errors=True,
                     **video_options
                 )
+                # Restore a saved session with the context itself (no extra navigation)
+                session = self.session_manager.get_session(session_name) if isinstance(session_name, str) else None
+                if session is not None:
+                    context_options.update(session.context_options())
+                context = await browser.new_context(**context_options)
+                if session is not None:
+                    await session.install(context)
+                    session_restored = True
                 context.set_default_timeout(self.config.browser.timeout)
                 context.set_default_navigation_timeout(self.config.browser.navigation_timeout)
                 
@@ -214,6 +241,7 @@ class TestRunner:
             
             # Create page
             page = await context.new_page()
+            round_trips = instrument_page(page)
             _log_action("page_created", test_name)
             
             # Use context creation time as video start time (when recording actually began)
@@ -232,58 +260,12 @@ class TestRunner:
             # CursorController is the single source of truth for cursor visualization
             # No need to inject CursorManager cursor here
             
-            # Remove hover effect and hide click effect if disabled (they might have been created)
-            from .constants import CLICK_EFFECT_ELEMENT_ID
-            await page.evaluate(f"""
-                (function() {{
-                    const HOVER_EFFECT_ID = '{HOVER_EFFECT_ELEMENT_ID}';
-                    const CLICK_EFFECT_ID = '{CLICK_EFFECT_ELEMENT_ID}';
-                    
-                    // Remove hover effect
-                    const hoverEffect = document.getElementById(HOVER_EFFECT_ID);
-                    if (hoverEffect) {{
-                        hoverEffect.remove();
-                    }}
-                    
-                    // Hide click effect (it should only appear during clicks)
-                    const clickEffect = document.getElementById(CLICK_EFFECT_ID);
-                    if (clickEffect) {{
-                        clickEffect.style.opacity = '0';
-                        clickEffect.style.display = 'none';
-                        clickEffect.style.width = '0px';
-                        clickEffect.style.height = '0px';
-                    }}
-                }})();
-            """)
-            
-            await asyncio.sleep(0.2)  # Reduced delay
-            print(f"  ✅ Cursor injetado")
+            # Headless profile: no cursor, effects or animations (tallied per step)
+            visual = visual_enabled(self.config)
+            savings = None if visual else RoundTripSavings(page)
             
-            # Navigate to base URL first
-            if self.config.base_url:
-                print(f"  🌐 Navegando para: {self.config.base_url}")
-                _log_action("navigation_started", test_name, {"url": self.config.base_url})
-                try:
-                    await page.goto(self.config.base_url, wait_until="load", timeout=self.config.browser.navigation_timeout)
-                    final_url = page.url
-                    page_title = await page.title()
-                    _log_action("navigation_completed", test_name, {
-                        "final_url": final_url,
-                        "title": page_title
-                    })
-                except Exception as nav_error:
-                    _log_action("navigation_failed", test_name, {
-                        "url": self.config.base_url,
-                        "error": str(nav_error)
-                    }, level="ERROR")
-                    raise
-                await asyncio.sleep(0.3)  # Reduced delay
-                # After navigation, just ensure cursor exists (don't force re-inject to avoid duplicates)
-                # The init script should handle cursor creation on page load
-                # CursorController will handle cursor restoration after navigation
-                # No need to use CursorManager
-                
-                # Remove hover effect and hide click effect again after navigation (in case they were recreated)
+            if visual:
+                # Remove hover effect and hide click effect if disabled (they might have been created)
                 from .constants import CLICK_EFFECT_ELEMENT_ID
                 await page.evaluate(f"""
                     (function() {{
@@ -307,10 +289,68 @@ class TestRunner:
                     }})();
                 """)
                 
-                await asyncio.sleep(0.1)
+                await asyncio.sleep(0.2)  # Reduced delay
+                print(f"  ✅ Cursor injetado")
+            else:
+                savings.skip('effects', sleep=0.2)
+            
+            # Navigate to base URL first
+            if self.config.base_url:
+                print(f"  🌐 Navegando para: {self.config.base_url}")
+                _log_action("navigation_started", test_name, {"url": self.config.base_url})
+                try:
+                    await page.goto(self.config.base_url, wait_until="load", timeout=self.config.browser.navigation_timeout)
+                    if logger.isEnabledFor(logging.INFO):
+                        # Title costs a round trip: only fetch it if the entry is written
+                        _log_action("navigation_completed", test_name, {
+                            "final_url": page.url,
+                            "title": await page.title()
+                        })
+                except Exception as nav_error:
+                    _log_action("navigation_failed", test_name, {
+                        "url": self.config.base_url,
+                        "error": str(nav_error)
+                    }, level="ERROR")
+                    raise
+                await asyncio.sleep(0.3)  # Reduced delay
+                # After navigation, just ensure cursor exists (don't force re-inject to avoid duplicates)
+                # The init script should handle cursor creation on page load
+                # CursorController will handle cursor restoration after navigation
+                # No need to use CursorManager
+                
+                if visual:
+                    # Remove hover effect and hide click effect again after navigation (in case they were recreated)
+                    from .constants import CLICK_EFFECT_ELEMENT_ID
+                    await page.evaluate(f"""
+                        (function() {{
+                            const HOVER_EFFECT_ID = '{HOVER_EFFECT_ELEMENT_ID}';
+                            const CLICK_EFFECT_ID = '{CLICK_EFFECT_ELEMENT_ID}';
+                            
+                            // Remove hover effect
+                            const hoverEffect = document.getElementById(HOVER_EFFECT_ID);
+                            if (hoverEffect) {{
+                                hoverEffect.remove();
+                            }}
+                            
+                            // Hide click effect (it should only appear during clicks)
+                            const clickEffect = document.getElementById(CLICK_EFFECT_ID);
+                            if (clickEffect) {{
+                                clickEffect.style.opacity = '0';
+                                clickEffect.style.display = 'none';
+                                clickEffect.style.width = '0px';
+                                clickEffect.style.height = '0px';
+                            }}
+                        }})();
+                    """)
+                    
+                    await asyncio.sleep(0.1)
+                else:
+                    savings.skip('effects', sleep=0.1)
             
             # Load session if test function has load_session attribute
-            if hasattr(test_func, 'load_session') and test_func.load_session:
+            if session_restored:
+                print(f"  ✅ Sessão restaurada com o contexto: {session_name}")
+            elif session_name:
                 print(f"  💾 Carregando sessão: {test_func.load_session}")
                 session_loaded = await test.load_session(test_func.load_session)
                 if session_loaded:
@@ -323,7 +363,7 @@ class TestRunner:
                     print(f"  ⚠️  Sessão não encontrada")
             
             # Set up console message listener to capture JavaScript logs
-            console_messages = []
+            console_messages = deque(maxlen=CONSOLE_MESSAGES_LIMIT)
             def handle_console(msg):
                 console_messages.append(msg.text)
                 if "DEBUG" in msg.text or "cursor" in msg.text.lower() or "error" in msg.text.lower():
@@ -334,6 +374,9 @@ class TestRunner:
             # Run test
             print(f"  ▶️  Executando teste...")
             _log_action("test_execution_started", test_name)
+            if savings is not None:
+                savings.start_step(test_name)
+            round_trips.start_step(test_name)
             
             # Use video_start_time if available, otherwise use start_time
             # video_start_time is when recording actually began (context creation)
@@ -411,7 +454,7 @@ class TestRunner:
             }, level="ERROR")
             
             # Capture screenshot on failure
-            if self.config.screenshots.on_failure and 'test' in locals():
+            if self.config.screenshots.on_failure and test is not None:
                 try:
                     screenshot_path = await test.screenshot_manager.capture_on_failure(e)
                     result["screenshots"].append(str(screenshot_path))
@@ -426,7 +469,8 @@ class TestRunner:
                     screenshots_dir = Path(self.config.screenshots.dir)
                     error_screenshot = screenshots_dir / test_name / "error_page.png"
                     error_screenshot.parent.mkdir(parents=True, exist_ok=True)
-                    await page.screenshot(path=str(error_screenshot), full_page=True)
+                    with get_profiler().span('screenshot', name=error_screenshot.name, error=True):
+                        await page.screenshot(path=str(error_screenshot), full_page=True)
                     print(f"  📸 Screenshot da página de erro salvo: {error_screenshot}")
                 except Exception as e:
                     logger.warning(f"Error capturing page screenshot: {e}")
@@ -445,6 +489,24 @@ class TestRunner:
                     print(f"  ⚠️  Erro ao capturar HTML da página: {e}")
         
         finally:
+            # Selector memo: one write per test instead of one per changed lookup
+            if test is not None:
+                test.selector_manager.save_memo()
+            
+            # Report what the headless profile skipped
+            if savings is not None:
+                result["visual_savings"] = savings.report()
+                print(f"  ⚡ Perfil headless: {savings.total_round_trips} round-trips e "
+                      f"{savings.total_sleep:.2f}s de espera evitados")
+                _log_action("visual_savings", test_name, result["visual_savings"], level="DEBUG")
+            
+            # Report browser protocol calls (setup and test body)
+            if round_trips is not None:
+                result["round_trips"] = round_trips.report()
+                print(f"  🔁 {round_trips.total_calls} round-trips ({round_trips.total_time:.2f}s), "
+                      f"{round_trips.total_redundant} redundante(s)")
+                _log_action("round_trips", test_name, result["round_trips"], level="DEBUG")
+            
             # Cleanup (reduced delays)
             if 'page' in locals():
                 await asyncio.sleep(CLEANUP_DELAY)
@@ -453,6 +515,7 @@ class TestRunner:
             if create_context and context:
                 await asyncio.sleep(CLEANUP_DELAY)
                 await context.close()
+                self.video_manager.unregister_context(test_name)
             
             # Get video path and rename to test name
             # Playwright creates videos with hash in record_video_dir, we rename after
@@ -671,7 +734,7 @@ class TestRunner:
                     })
         
         # Validate screenshots if any were captured
-        if 'test' in locals() and hasattr(test, 'screenshot_manager'):
+        if test is not None and hasattr(test, 'screenshot_manager'):
             screenshot_validation = test.screenshot_manager.validate_screenshots()
             result["screenshot_validation"] = screenshot_validation
             
@@ -738,21 +801,28 @@ class TestRunner:
         self.start_time = datetime.now()
         self.test_results = []
         
+        browser_config = self.config.browser
+        self.memory = None
+        if browser_config.memory_profile or browser_config.memory_budget_mb:
+            self.memory = MemoryMonitor(trace=browser_config.memory_profile, budget_mb=browser_config.memory_budget_mb)
+            self.memory.start()
+        
         async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=self.config.browser.headless,
-                slow_mo=self.config.browser.slow_mo
-            )
+            browser = await self._launch_browser(p)
             
             try:
-                if parallel and workers > 1:
-                    # Run tests in parallel
-                    await self._run_parallel(browser, tests, workers)
-                else:
-                    # Run tests sequentially
-                    for test_name, test_func in tests:
-                        result = await self.run_test(test_name, test_func, browser=browser)
-                        self.test_results.append(result)
+                with get_profiler().span('suite', category='suite', tests=len(tests), workers=workers if parallel else 1):
+                    if parallel and workers > 1:
+                        # Run tests in parallel
+                        await self._run_parallel(browser, tests, workers)
+                    else:
+                        # Run tests sequentially
+                        for test_name, test_func in tests:
+                            with get_profiler().span(test_name, category='test', url=self.config.base_url):
+                                result = await self.run_test(test_name, test_func, browser=browser)
+                            self.test_results.append(result)
+                            if self.memory is not None:
+                                browser = await self._check_memory(p, browser, test_name, result)
                 
                 self.end_time = datetime.now()
                 
@@ -766,9 +836,50 @@ class TestRunner:
             finally:
                 await browser.close()
                 await asyncio.sleep(1)
+                if self.memory is not None:
+                    if parallel and workers > 1:
+                        # Tests overlap: one sample for the whole parallel run
+                        self.memory.sample('parallel')
+                    print("\n🧠 Memória por teste:")
+                    print(self.memory.format_report())
+                    self.memory.stop()
         
         return self.test_results
     
+    async def _launch_browser(self, playwright) -> Browser:
+        """Launch Chromium with the configured options."""
+        return await playwright.chromium.launch(
+            headless=self.config.browser.headless,
+            slow_mo=self.config.browser.slow_mo
+        )
+    
+    async def _check_memory(self, playwright, browser: Browser, test_name: str, result: Dict[str, Any]) -> Browser:
+        """
+        Sample memory after a test and relaunch the browser if it is over budget.
+        
+        Args:
+            playwright: Playwright instance (to relaunch)
+            browser: Current browser
+            test_name: Test that just finished
+            result: Its result (receives the sample under "memory")
+            
+        Returns:
+            Browser to use for the next test
+        """
+        sample = self.memory.sample(test_name)
+        if self.memory.over_budget(sample):
+            print(f"  🧠 Browser usando {sample.browser_rss_mb:.0f} MB "
+                  f"(orçamento {self.memory.budget_mb:.0f} MB): reiniciando")
+            _log_action("browser_recycled", test_name, {
+                "browser_rss_mb": sample.browser_rss_mb,
+                "budget_mb": self.memory.budget_mb
+            }, level="WARNING")
+            await browser.close()
+            browser = await self._launch_browser(playwright)
+            sample.recycled = True
+        result["memory"] = sample.to_dict()
+        return browser
+    
     async def _run_parallel(
         self, 
         browser: Browser, 
@@ -787,7 +898,8 @@ class TestRunner:
         
         async def run_with_semaphore(test_name: str, test_func: Callable):
             async with semaphore:
-                return await self.run_test(test_name, test_func, browser=browser)
+                with get_profiler().span(test_name, category='test', url=self.config.base_url):
+                    return await self.run_test(test_name, test_func, browser=browser)
         
         tasks = [run_with_semaphore(test_name, test_func) for test_name, test_func in tests]
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -14,6 +14,7 @@ from playwright.async_api import Page
 
 from .config import ScreenshotConfig
 from .exceptions import ElementNotFoundError
+from .performance import get_profiler
 
 logger = logging.getLogger(__name__)
 
@@ -97,25 +98,26 @@ class ScreenshotManager:
         }
         
         # Capture screenshot
-        if element:
-            # Screenshot specific element
-            try:
-                element_locator = self.page.locator(element).first
-                await element_locator.wait_for(state="visible", timeout=timeout)
-                await element_locator.screenshot(path=str(screenshot_path))
-            except (ElementNotFoundError, Exception) as e:
-                # Fallback to page screenshot if element not found
-                logger.warning(f"Element screenshot failed, falling back to page screenshot: {e}")
+        with get_profiler().span('screenshot', name=screenshot_name, element=element, full_page=use_full_page):
+            if element:
+                # Screenshot specific element
+                try:
+                    element_locator = self.page.locator(element).first
+                    await element_locator.wait_for(state="visible", timeout=timeout)
+                    await element_locator.screenshot(path=str(screenshot_path))
+                except (ElementNotFoundError, Exception) as e:
+                    # Fallback to page screenshot if element not found
+                    logger.warning(f"Element screenshot failed, falling back to page screenshot: {e}")
+                    await self.page.screenshot(
+                        path=str(screenshot_path),
+                        full_page=use_full_page
+                    )
+            else:
+                # Screenshot page
                 await self.page.screenshot(
                     path=str(screenshot_path),
                     full_page=use_full_page
                 )
-        else:
-            # Screenshot page
-            await self.page.screenshot(
-                path=str(screenshot_path),
-                full_page=use_full_page
-            )
         
         return screenshot_path
     
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Self-healing selector memo for playwright-simple.
+
+Remembers, per (test, step, target), which strategy and concrete selector
+resolved an element in a previous run, so SelectorManager can try it first
+instead of walking the whole fallback cascade again. Also keeps hit rates
+per strategy.
+"""
+
+import atexit
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Default memo file (relative to the current working directory)
+DEFAULT_MEMO_FILE = ".selector_memo.json"
+
+# Shared memo instances, one per file path
+_memos: Dict[str, 'SelectorMemo'] = {}
+
+
+class SelectorMemo:
+    """
+    Persisted memo of selector resolutions.
+
+    Entries are keyed by ``test::step::target`` and store the strategy
+    (``text``, ``primary``, ``alternative``, ``retry``) and the concrete
+    selector that found the element. Strategy statistics count attempts and
+    hits, including the ``memo`` pseudo-strategy itself.
+
+    Attributes:
+        path: JSON file where the memo is persisted
+        entries: Resolutions keyed by ``test::step::target``
+        strategies: Attempt/hit counters per strategy
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, autosave: bool = True) -> None:
+        """
+        Initialize selector memo.
+
+        Args:
+            path: Memo file (defaults to .selector_memo.json in the current directory)
+            autosave: Save pending changes at interpreter exit (default: True)
+        """
+        self.path = Path(path) if path else Path.cwd() / DEFAULT_MEMO_FILE
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.strategies: Dict[str, Dict[str, int]] = {}
+        self._dirty = False
+        self._load()
+        if autosave:
+            atexit.register(self.save)
+
+    @staticmethod
+    def make_key(test: str, step: str, target: str) -> str:
+        """Build the memo key for a (test, step, target) triple."""
+        return f"{test}::{step}::{target}"
+
+    def _load(self) -> None:
+        """Load memo from disk (missing or invalid files start empty)."""
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable selector memo {self.path}: {e}")
+            return
+        if data.get('version') != self.VERSION:
+            logger.debug(f"Ignoring selector memo with version {data.get('version')}")
+            return
+        self.entries = data.get('entries', {})
+        self.strategies = data.get('strategies', {})
+
+    def lookup(self, test: str, step: str, target: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the last successful resolution for a target.
+
+        Args:
+            test: Test name
+            step: Step identifier within the test
+            target: Selector or text requested by the test
+
+        Returns:
+            Entry with 'strategy' and 'selector', or None
+        """
+        return self.entries.get(self.make_key(test, step, target))
+
+    def record_attempt(self, strategy: str, success: bool) -> None:
+        """
+        Count an attempt of a strategy.
+
+        Args:
+            strategy: Strategy name
+            success: Whether the strategy found the element
+        """
+        counters = self.strategies.setdefault(strategy, {'attempts': 0, 'hits': 0})
+        counters['attempts'] += 1
+        if success:
+            counters['hits'] += 1
+        self._dirty = True
+
+    def remember(self, test: str, step: str, target: str, strategy: str, selector: str) -> bool:
+        """
+        Store the resolution that found a target.
+
+        Args:
+            test: Test name
+            step: Step identifier within the test
+            target: Selector or text requested by the test
+            strategy: Strategy that resolved it
+            selector: Concrete selector that matched
+
+        Returns:
+            True if the stored resolution changed
+        """
+        key = self.make_key(test, step, target)
+        entry = self.entries.get(key)
+        changed = not entry or entry.get('strategy') != strategy or entry.get('selector') != selector
+        if changed:
+            entry = {'strategy': strategy, 'selector': selector, 'hits': 0}
+            self.entries[key] = entry
+        entry['hits'] = entry.get('hits', 0) + 1
+        entry['updated_at'] = datetime.now().isoformat()
+        self._dirty = True
+        return changed
+
+    def forget(self, test: str, step: str, target: str) -> None:
+        """Drop a resolution that no longer works."""
+        if self.entries.pop(self.make_key(test, step, target), None) is not None:
+            self._dirty = True
+
+    def hit_rates(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get hit rates per strategy.
+
+        Returns:
+            Dictionary of strategy -> {'attempts', 'hits', 'hit_rate'}
+        """
+        return {
+            strategy: {
+                'attempts': counters['attempts'],
+                'hits': counters['hits'],
+                'hit_rate': counters['hits'] / counters['attempts'] if counters['attempts'] else 0.0,
+            }
+            for strategy, counters in self.strategies.items()
+        }
+
+    def save(self) -> None:
+        """Write pending changes to disk (atomic replace)."""
+        if not self._dirty:
+            return
+        data = {
+            'version': self.VERSION,
+            'entries': self.entries,
+            'strategies': self.strategies,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save selector memo {self.path}: {e}")
+
+
+def get_selector_memo(path: Optional[Union[str, Path]] = None) -> SelectorMemo:
+    """
+    Get the shared SelectorMemo for a file (one instance per path per process).
+
+    Args:
+        path: Memo file (defaults to .selector_memo.json in the current directory)
+
+    Returns:
+        SelectorMemo instance
+    """
+    resolved = str((Path(path) if path else Path.cwd() / DEFAULT_MEMO_FILE).resolve())
+    memo = _memos.get(resolved)
+    if memo is None:
+        memo = SelectorMemo(resolved)
+        _memos[resolved] = memo
+    return memo
@@ -8,9 +8,11 @@ Provides intelligent element location with automatic fallback and retry logic.
 
 import asyncio
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
 
+from .selector_memo import SelectorMemo
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,10 +25,18 @@ class SelectorManager:
     prioritizes reliable selectors (data-testid, aria-label) over less
     reliable ones (CSS, text).
     
+    When a SelectorMemo is given, the strategy and concrete selector that
+    resolved each (test, step, target) are remembered across runs and tried
+    first on the next lookup. The Nth lookup of the same target in a test is
+    treated as step N. Changes are kept in memory until save_memo() (called by
+    the runner at the end of each test).
+    
     Attributes:
         page: Playwright Page instance
         timeout: Default timeout in milliseconds for element finding
         retry_count: Number of retry attempts with exponential backoff
+        memo: Optional SelectorMemo with resolutions from previous runs
+        test_name: Test name used to key memo entries (see set_test_name)
         SELECTOR_PRIORITY: Priority order for selector strategies (class attribute)
     """
     
@@ -40,7 +50,27 @@ class SelectorManager:
         'css',
     ]
     
-    def __init__(self, page: Page, timeout: int = 30000, retry_count: int = 3) -> None:
+    # Maximum wait in milliseconds for fallback strategies (text, alternatives)
+    FALLBACK_TIMEOUT: int = 5000
+    
+    # Maximum wait in milliseconds for a memoized selector before running the cascade
+    MEMO_PROBE_TIMEOUT: int = 1000
+    
+    # Milliseconds the primary and text selectors race alone before broad
+    # fallbacks ('*:has-text', '[role="button"]', ...) join in
+    BROAD_GRACE: int = 1000
+    
+    # Seconds a higher-priority strategy still gets after another one matched
+    RACE_GRACE: float = 0.05
+    
+    def __init__(
+        self,
+        page: Page,
+        timeout: int = 30000,
+        retry_count: int = 3,
+        memo: Optional[SelectorMemo] = None,
+        test_name: str = "default"
+    ) -> None:
         """
         Initialize selector manager.
         
@@ -48,10 +78,32 @@ class SelectorManager:
             page: Playwright page instance
             timeout: Default timeout in milliseconds (default: 30000)
             retry_count: Number of retries with exponential backoff (default: 3)
+            memo: Optional SelectorMemo to reuse resolutions across runs
+            test_name: Test name used to key memo entries (default: "default")
         """
         self.page = page
         self.timeout = timeout
         self.retry_count = retry_count
+        self.memo = memo
+        self.test_name = test_name
+        self._target_occurrences: Dict[str, int] = {}
+    
+    def set_test_name(self, test_name: str) -> None:
+        """
+        Set the test name used to key memo entries.
+        
+        Lookups of the new test are counted from step 1 again.
+        
+        Args:
+            test_name: New test name
+        """
+        self.test_name = test_name
+        self._target_occurrences.clear()
+    
+    def save_memo(self) -> None:
+        """Write the memo changes of this test to disk (no-op without a memo)."""
+        if self.memo:
+            self.memo.save()
     
     async def find_by_text(
         self,
@@ -87,33 +139,45 @@ class SelectorManager:
                 await locator.click()
             ```
         """
+        locator, _ = await self._find_by_text(text, description, timeout, state)
+        return locator
+    
+    async def _find_by_text(
+        self,
+        text: str,
+        description: str = "",
+        timeout: Optional[int] = None,
+        state: str = "visible"
+    ) -> Tuple[Optional[Locator], Optional[str]]:
+        """Find element by visible text, returning the locator and the selector that matched."""
         if not text or not text.strip():
-            return None
+            return None, None
         
         timeout = timeout or self.timeout
-        text_escaped = text.replace('"', '\\"')
         
-        # Try multiple text-based selectors (in order of preference)
-        text_selectors = [
-            f'button:has-text("{text_escaped}")',
-            f'a:has-text("{text_escaped}")',
-            f'[role="button"]:has-text("{text_escaped}")',
-            f'[role="link"]:has-text("{text_escaped}")',
-            f'*:has-text("{text_escaped}")',  # Any element with text (last resort)
-        ]
-        
-        for selector in text_selectors:
+        for selector in self._text_selectors(text):
             try:
                 locator = self.page.locator(selector).first
-                await locator.wait_for(state=state, timeout=min(timeout, 5000))
+                await locator.wait_for(state=state, timeout=min(timeout, self.FALLBACK_TIMEOUT))
                 if await locator.count() > 0 and await locator.is_visible():
                     logger.debug(f"Found element by text '{text}' using selector '{selector}': {description}")
-                    return locator
+                    return locator, selector
             except Exception as e:
                 logger.debug(f"Text selector '{selector}' failed: {e}")
                 continue
         
-        return None
+        return None, None
+    
+    def _text_selectors(self, text: str) -> List[str]:
+        """Get text-based selectors for text, in order of preference."""
+        text_escaped = text.replace('"', '\\"')
+        return [
+            f'button:has-text("{text_escaped}")',
+            f'a:has-text("{text_escaped}")',
+            f'[role="button"]:has-text("{text_escaped}")',
+            f'[role="link"]:has-text("{text_escaped}")',
+            f'*:has-text("{text_escaped}")',  # Any element with text (last resort)
+        ]
     
     async def find_element(
         self,
@@ -153,6 +217,13 @@ class SelectorManager:
             ```
         """
         timeout = timeout or self.timeout
+        step_key = self._next_step_key(selector) if self.memo else None
+        
+        # Try the resolution that worked in a previous run first
+        if self.memo:
+            memo_locator = await self._find_memoized(selector, step_key, description, timeout, state)
+            if memo_locator:
+                return memo_locator
         
         # Detect if selector is text (not CSS)
         # CSS selectors typically start with #, ., [, or contain : (for pseudo-classes)
@@ -162,34 +233,34 @@ class SelectorManager:
             ' ' not in selector.strip() or len(selector.split()) == 1
         )
         
-        # If it looks like text, try finding by text first
+        # Strategies equivalent to the primary selector (the text selectors, if
+        # it looks like text, and the primary selector itself) race from the
+        # start. Broad fallbacks match far more than the target, so they join
+        # after BROAD_GRACE: a primary that renders a little late still wins,
+        # and a primary that never matches costs the grace, not its timeout.
+        fallback_timeout = min(timeout, self.FALLBACK_TIMEOUT)
+        broad_delay = min(timeout, self.BROAD_GRACE)
+        candidates: List[Tuple[str, str, bool, int, int]] = []
+        broad: List[Tuple[str, str, bool, int, int]] = []
         if is_likely_text and not any(char in selector for char in ['#', '.', '[', ':', '(', ')', '>', '+', '~']):
-            text_locator = await self.find_by_text(selector, description, timeout, state)
-            if text_locator:
-                return text_locator
-        
-        # Try primary selector first
-        try:
-            locator = self.page.locator(selector).first
-            await locator.wait_for(state=state, timeout=timeout)
-            if await locator.count() > 0:
-                logger.debug(f"Found element with selector '{selector}': {description}")
-                return locator
-        except Exception as e:
-            logger.debug(f"Primary selector '{selector}' failed: {e}")
+            *text_selectors, any_element = self._text_selectors(selector)
+            candidates.extend(('text', text_selector, True, fallback_timeout, 0) for text_selector in text_selectors)
+            broad.append(('text', any_element, True, fallback_timeout, broad_delay))
+        candidates.append(('primary', selector, False, timeout, 0))
+        broad.extend(
+            ('alternative', alt_selector, False, fallback_timeout, broad_delay)
+            for alt_selector in self._generate_alternatives(selector)
+        )
+        candidates.extend(broad)
         
-        # Try alternative selectors
-        alternatives = self._generate_alternatives(selector)
-        for alt_selector in alternatives:
-            try:
-                locator = self.page.locator(alt_selector).first
-                await locator.wait_for(state=state, timeout=min(timeout, 5000))
-                if await locator.count() > 0:
-                    logger.info(f"Found element with alternative selector '{alt_selector}': {description}")
-                    return locator
-            except Exception as e:
-                logger.debug(f"Alternative selector '{alt_selector}' failed: {e}")
-                continue
+        winner = await self._race_strategies(candidates, state)
+        for strategy in dict.fromkeys(candidate[0] for candidate in candidates):
+            self._record_attempt(strategy, winner is not None and winner[0] == strategy)
+        if winner:
+            strategy, winning_selector, locator = winner
+            logger.debug(f"Found element with {strategy} selector '{winning_selector}': {description}")
+            self._remember(step_key, selector, strategy, winning_selector)
+            return locator
         
         # Retry with exponential backoff
         for attempt in range(self.retry_count):
@@ -201,14 +272,144 @@ class SelectorManager:
                 await locator.wait_for(state=state, timeout=timeout)
                 if await locator.count() > 0:
                     logger.info(f"Found element on retry {attempt + 1}: {description}")
+                    self._record_attempt('retry', True)
+                    self._remember(step_key, selector, 'retry', selector)
                     return locator
             except Exception as e:
                 logger.debug(f"Retry {attempt + 1} with selector '{selector}' failed: {e}")
                 continue
+        if self.retry_count:
+            self._record_attempt('retry', False)
         
         logger.warning(f"Element not found after all attempts: {description or selector}")
         return None
     
+    async def _probe(
+        self,
+        selector: str,
+        timeout: int,
+        state: str,
+        require_visible: bool,
+        delay: int = 0
+    ) -> Optional[Locator]:
+        """Wait for a single selector (after delay milliseconds), returning its locator or None."""
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        try:
+            locator = self.page.locator(selector).first
+            await locator.wait_for(state=state, timeout=timeout)
+            if await locator.count() > 0 and (not require_visible or await locator.is_visible()):
+                return locator
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Selector '{selector}' failed: {e}")
+        return None
+    
+    async def _race_strategies(
+        self,
+        candidates: List[Tuple[str, str, bool, int, int]],
+        state: str
+    ) -> Optional[Tuple[str, str, Locator]]:
+        """
+        Wait for equivalent candidate selectors concurrently.
+        
+        The first candidate to match wins. Higher-priority candidates (earlier
+        in the list) still running at that moment get RACE_GRACE seconds to
+        finish, so elements that are already present resolve deterministically
+        by priority. Losing waits are cancelled.
+        
+        Args:
+            candidates: (strategy, selector, require_visible, timeout_ms, delay_ms) in priority order
+            state: Element state to wait for
+            
+        Returns:
+            (strategy, selector, locator) of the winner, or None
+        """
+        if not candidates:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        tasks = [
+            asyncio.ensure_future(self._probe(candidate_selector, candidate_timeout, state, require_visible, delay))
+            for _, candidate_selector, require_visible, candidate_timeout, delay in candidates
+        ]
+        best: Optional[int] = None
+        deadline: Optional[float] = None
+        try:
+            pending = set(tasks)
+            while pending:
+                wait_timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for index, task in enumerate(tasks):
+                    if task in done and task.result() is not None and (best is None or index < best):
+                        best = index
+                if best is None:
+                    continue
+                if all(task.done() for task in tasks[:best]) or not done:
+                    break
+                if deadline is None:
+                    deadline = loop.time() + self.RACE_GRACE
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if best is None:
+            return None
+        strategy, winning_selector = candidates[best][:2]
+        return strategy, winning_selector, tasks[best].result()
+    
+    def _next_step_key(self, target: str) -> str:
+        """Get the step part of the memo key for a lookup of target."""
+        occurrence = self._target_occurrences.get(target, 0) + 1
+        self._target_occurrences[target] = occurrence
+        return f"#{occurrence}"
+    
+    async def _find_memoized(
+        self,
+        target: str,
+        step_key: str,
+        description: str,
+        timeout: int,
+        state: str
+    ) -> Optional[Locator]:
+        """Try the selector that resolved this (test, step, target) last time."""
+        entry = self.memo.lookup(self.test_name, step_key, target)
+        if not entry:
+            return None
+        
+        memo_selector = entry['selector']
+        try:
+            locator = self.page.locator(memo_selector).first
+            await locator.wait_for(state=state, timeout=min(timeout, self.MEMO_PROBE_TIMEOUT))
+            if await locator.count() > 0:
+                logger.debug(
+                    f"Found element with memoized {entry['strategy']} selector '{memo_selector}': {description}"
+                )
+                self._record_attempt('memo', True)
+                self._remember(step_key, target, entry['strategy'], memo_selector)
+                return locator
+        except Exception as e:
+            logger.debug(f"Memoized selector '{memo_selector}' failed: {e}")
+        
+        self._record_attempt('memo', False)
+        self.memo.forget(self.test_name, step_key, target)
+        return None
+    
+    def _record_attempt(self, strategy: str, success: bool) -> None:
+        """Count a strategy attempt in the memo statistics."""
+        if self.memo:
+            self.memo.record_attempt(strategy, success)
+    
+    def _remember(self, step_key: Optional[str], target: str, strategy: str, selector: str) -> None:
+        """Store the winning resolution (written to disk by save_memo)."""
+        if self.memo and step_key is not None:
+            self.memo.remember(self.test_name, step_key, target, strategy, selector)
+    
     def _generate_alternatives(self, selector: str) -> List[str]:
         """
         Generate alternative selectors based on primary selector.
@@ -5,12 +5,164 @@ Session management for playwright-simple.
 
 Handles saving and loading browser session state (cookies, localStorage, sessionStorage)
 to enable test continuity.
+
+Sessions are stored as Playwright storage state (cookies and localStorage
+per origin, see ``context.storage_state()``) plus sessionStorage per origin,
+which storage state does not cover. Restoring never navigates: a new
+context gets the state through ``new_context(storage_state=...)``, and
+sessionStorage (or everything, for an existing context) is written by an
+init script when the first document of each origin loads.
 """
 
+import asyncio
 import json
+import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from playwright.async_api import BrowserContext, Page
+from typing import Dict, Any, Optional, List, Tuple
+from urllib.parse import urlsplit
+from playwright.async_api import Browser, BrowserContext, Page
+
+# Parsed session files by path, valid while the file's mtime is unchanged
+_SESSION_CACHE: Dict[Path, Tuple[int, 'SavedSession']] = {}
+
+# Writes the saved storage of the document's origin. localStorage is shared by
+# every tab of the context, so it is written once per context (the marker holds
+# a token unique to this init script); sessionStorage is per tab and written once
+# per tab (popups inherit it, marker included).
+_RESTORE_SCRIPT = """
+(() => {
+    const saved = %s;
+    const token = %s;
+    const entry = saved[location.origin];
+    const marker = '__playwright_simple_session_restored__';
+    if (!entry) return;
+    try {
+        if (entry.localStorage && localStorage.getItem(marker) !== token) {
+            for (const [key, value] of Object.entries(entry.localStorage)) localStorage.setItem(key, value);
+            localStorage.setItem(marker, token);
+        }
+        if (entry.sessionStorage && !sessionStorage.getItem(marker)) {
+            for (const [key, value] of Object.entries(entry.sessionStorage)) sessionStorage.setItem(key, value);
+            sessionStorage.setItem(marker, '1');
+        }
+    } catch (e) {
+        // Storage is not available for this document (e.g. about:blank, sandboxed frame)
+    }
+})();
+"""
+
+
+def _restore_script(storage: Dict[str, Dict[str, Dict[str, str]]]) -> str:
+    """Init script writing storage per origin, with a fresh per-context token."""
+    return _RESTORE_SCRIPT % (json.dumps(storage), json.dumps(uuid.uuid4().hex))
+
+
+def _origin(url: str) -> str:
+    """Origin of a URL as location.origin reports it (default ports omitted)."""
+    parts = urlsplit(url)
+    default_port = {'http': 80, 'https': 443}.get(parts.scheme)
+    port = f":{parts.port}" if parts.port and parts.port != default_port else ""
+    return f"{parts.scheme}://{parts.hostname}{port}"
+
+
+_READ_SESSION_STORAGE = """
+() => {
+    const data = {};
+    for (let i = 0; i < sessionStorage.length; i++) {
+        const key = sessionStorage.key(i);
+        data[key] = sessionStorage.getItem(key);
+    }
+    return { origin: location.origin, data };
+}
+"""
+
+
+@dataclass
+class SavedSession:
+    """A saved session: storage state plus sessionStorage per origin."""
+    name: str
+    storage_state: Dict[str, Any] = field(default_factory=lambda: {'cookies': [], 'origins': []})
+    # origin (or '*' for legacy storage: first origin only) -> {'localStorage': {...}, 'sessionStorage': {...}}
+    init_storage: Dict[str, Dict[str, Dict[str, str]]] = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> 'SavedSession':
+        """
+        Create from a session file's content.
+        
+        Files written before storage state support hold cookies and one
+        localStorage/sessionStorage mapping without origin (kept under '*');
+        install() restores it on the origin of the context's first top-level
+        navigation only.
+        """
+        if 'storage_state' in data:
+            init_storage = {
+                origin: {'sessionStorage': values}
+                for origin, values in data.get('sessionStorage', {}).items()
+            }
+            return cls(name, data['storage_state'], init_storage)
+        legacy = {
+            key: data[key] for key in ('localStorage', 'sessionStorage') if data.get(key)
+        }
+        return cls(name, {'cookies': data.get('cookies', []), 'origins': []}, {'*': legacy} if legacy else {})
+    
+    def context_options(self) -> Dict[str, Any]:
+        """Keyword arguments for browser.new_context restoring cookies and localStorage."""
+        return {'storage_state': self.storage_state}
+    
+    def init_script(self, include_local_storage: bool = False) -> Optional[str]:
+        """
+        Init script writing the storage that storage state does not restore.
+        
+        Args:
+            include_local_storage: Also write localStorage from the storage state
+                (needed when the context was not created with it)
+        
+        Returns:
+            Script source, or None if there is nothing to write
+        """
+        storage = {
+            origin: dict(values) for origin, values in self.init_storage.items() if origin != '*'
+        }
+        if include_local_storage:
+            for origin in self.storage_state.get('origins', []):
+                values = {item['name']: item['value'] for item in origin.get('localStorage', [])}
+                if values:
+                    storage.setdefault(origin['origin'], {})['localStorage'] = values
+        if not storage:
+            return None
+        return _restore_script(storage)
+    
+    async def install(self, context: BrowserContext, include_local_storage: bool = False) -> None:
+        """
+        Add the init script (if any) to a context.
+        
+        Legacy storage without origin is bound to the origin of the first
+        top-level navigation: that request is held until a script for its
+        origin is installed, so other origins and iframes never receive it.
+        """
+        script = self.init_script(include_local_storage)
+        if script:
+            await context.add_init_script(script=script)
+        legacy = self.init_storage.get('*')
+        if legacy:
+            await self._install_on_first_origin(context, legacy)
+    
+    @staticmethod
+    async def _install_on_first_origin(context: BrowserContext, storage: Dict[str, Dict[str, str]]) -> None:
+        claimed = False
+        
+        async def claim(route, request) -> None:
+            nonlocal claimed
+            if (not claimed and request.is_navigation_request()
+                    and request.frame.parent_frame is None and request.url.startswith('http')):
+                claimed = True
+                await context.add_init_script(script=_restore_script({_origin(request.url): storage}))
+                await context.unroute('**/*', claim)
+            await route.continue_()
+        
+        await context.route('**/*', claim)
 
 
 class SessionManager:
@@ -47,6 +199,59 @@ class SessionManager:
         safe_name = "".join(c for c in session_name if c.isalnum() or c in ('-', '_'))
         return self.sessions_dir / f"{safe_name}.json"
     
+    def get_session(self, session_name: str) -> Optional[SavedSession]:
+        """
+        Get a saved session, reading its file only when it changed.
+        
+        Args:
+            session_name: Name of the session
+            
+        Returns:
+            SavedSession, or None if not found or unreadable
+        """
+        session_path = self._get_session_path(session_name)
+        try:
+            mtime = session_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            _SESSION_CACHE.pop(session_path, None)
+            return None
+        
+        cached = _SESSION_CACHE.get(session_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        try:
+            with open(session_path, 'r', encoding='utf-8') as f:
+                session = SavedSession.from_dict(session_name, json.load(f))
+        except Exception as e:
+            print(f"  ❌ Error loading session {session_name}: {e}")
+            return None
+        _SESSION_CACHE[session_path] = (mtime, session)
+        return session
+    
+    async def new_context(self, browser: Browser, session_name: str, **options) -> Optional[BrowserContext]:
+        """
+        Create a browser context that starts with a saved session.
+        
+        Cookies and localStorage come with the context; sessionStorage is
+        written when each origin's first document loads. No page is opened.
+        
+        Args:
+            browser: Browser to create the context in
+            session_name: Name of session to restore
+            **options: Other browser.new_context options
+            
+        Returns:
+            The new context, or None if the session was not found
+        """
+        session = self.get_session(session_name)
+        if session is None:
+            print(f"  ⚠️  Session not found: {session_name} ({self._get_session_path(session_name)})")
+            return None
+        context = await browser.new_context(**options, **session.context_options())
+        await session.install(context)
+        return context
+    
     async def save_session(
         self,
         context: BrowserContext,
@@ -64,73 +269,42 @@ class SessionManager:
         Returns:
             Path to saved session file
         """
-        session_data: Dict[str, Any] = {}
-        
-        # Save cookies
-        cookies = await context.cookies()
-        session_data["cookies"] = cookies
+        storage_state = await context.storage_state()
+        session_storage: Dict[str, Dict[str, str]] = {}
         
-        # Save storage if requested
         if include_storage:
-            # Get storage from first page or create a temporary one
-            pages = context.pages
-            if pages:
-                page = pages[0]
-            else:
-                page = await context.new_page()
-                try:
-                    # Navigate to a page to access storage
-                    await page.goto("about:blank")
-                except Exception:
-                    pass
-            
-            try:
-                # Get localStorage
-                localStorage_data = await page.evaluate("""
-                    () => {
-                        const data = {};
-                        for (let i = 0; i < localStorage.length; i++) {
-                            const key = localStorage.key(i);
-                            data[key] = localStorage.getItem(key);
-                        }
-                        return data;
-                    }
-                """)
-                session_data["localStorage"] = localStorage_data
-                
-                # Get sessionStorage
-                session_storage_data = await page.evaluate("""
-                    () => {
-                        const data = {};
-                        for (let i = 0; i < sessionStorage.length; i++) {
-                            const key = sessionStorage.key(i);
-                            data[key] = sessionStorage.getItem(key);
-                        }
-                        return data;
-                    }
-                """)
-                session_data["sessionStorage"] = session_storage_data
-            except Exception as e:
-                # If storage access fails, continue without it
-                print(f"  ⚠️  Warning: Could not save storage: {e}")
-                session_data["localStorage"] = {}
-                session_data["sessionStorage"] = {}
-            
-            # Close temporary page if we created it
-            if not pages:
-                try:
-                    await page.close()
-                except Exception:
-                    pass
+            # sessionStorage lives in the open pages (read concurrently; no page is opened for it)
+            snapshots = await asyncio.gather(
+                *(self._read_session_storage(page) for page in context.pages)
+            )
+            for snapshot in snapshots:
+                if snapshot and snapshot['data'] and snapshot['origin'] != 'null':
+                    session_storage.setdefault(snapshot['origin'], {}).update(snapshot['data'])
+        else:
+            storage_state = {'cookies': storage_state.get('cookies', []), 'origins': []}
+        
+        session_data = {'storage_state': storage_state, 'sessionStorage': session_storage}
         
         # Save to file
         session_path = self._get_session_path(session_name)
         with open(session_path, 'w', encoding='utf-8') as f:
             json.dump(session_data, f, indent=2)
+        _SESSION_CACHE[session_path] = (
+            session_path.stat().st_mtime_ns, SavedSession.from_dict(session_name, session_data)
+        )
         
         print(f"  💾 Session saved: {session_name} -> {session_path}")
         return session_path
     
+    @staticmethod
+    async def _read_session_storage(page: Page) -> Optional[Dict[str, Any]]:
+        """Read a page's origin and sessionStorage (None if not accessible)."""
+        try:
+            return await page.evaluate(_READ_SESSION_STORAGE)
+        except Exception as e:
+            print(f"  ⚠️  Warning: Could not save storage: {e}")
+            return None
+    
     async def load_session(
         self,
         context: BrowserContext,
@@ -138,7 +312,12 @@ class SessionManager:
         apply_storage: bool = True
     ) -> bool:
         """
-        Load browser session state.
+        Load browser session state into an existing context.
+        
+        Cookies apply immediately; localStorage and sessionStorage are
+        written by an init script when the next document of each origin
+        loads (callers navigate after loading a session). Prefer
+        new_context when the context has not been created yet.
         
         Args:
             context: Browser context to load state into
@@ -148,67 +327,17 @@ class SessionManager:
         Returns:
             True if session was loaded, False if not found
         """
-        session_path = self._get_session_path(session_name)
-        
-        if not session_path.exists():
-            print(f"  ⚠️  Session not found: {session_name} ({session_path})")
+        session = self.get_session(session_name)
+        if session is None:
+            print(f"  ⚠️  Session not found: {session_name} ({self._get_session_path(session_name)})")
             return False
         
-        try:
-            with open(session_path, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
-        except Exception as e:
-            print(f"  ❌ Error loading session {session_name}: {e}")
-            return False
-        
-        # Load cookies
-        if "cookies" in session_data:
-            await context.add_cookies(session_data["cookies"])
+        cookies = session.storage_state.get('cookies', [])
+        if cookies:
+            await context.add_cookies(cookies)
         
-        # Load storage if requested
         if apply_storage:
-            # Get or create a page to set storage
-            pages = context.pages
-            if pages:
-                page = pages[0]
-            else:
-                page = await context.new_page()
-                try:
-                    await page.goto("about:blank")
-                except Exception:
-                    pass
-            
-            try:
-                # Set localStorage
-                if "localStorage" in session_data:
-                    localStorage_data = session_data["localStorage"]
-                    await page.evaluate("""
-                        (data) => {
-                            for (const [key, value] of Object.entries(data)) {
-                                localStorage.setItem(key, value);
-                            }
-                        }
-                    """, localStorage_data)
-                
-                # Set sessionStorage
-                if "sessionStorage" in session_data:
-                    session_storage_data = session_data["sessionStorage"]
-                    await page.evaluate("""
-                        (data) => {
-                            for (const [key, value] of Object.entries(data)) {
-                                sessionStorage.setItem(key, value);
-                            }
-                        }
-                    """, session_storage_data)
-            except Exception as e:
-                print(f"  ⚠️  Warning: Could not load storage: {e}")
-            
-            # Close temporary page if we created it
-            if not pages:
-                try:
-                    await page.close()
-                except Exception:
-                    pass
+            await session.install(context, include_local_storage=True)
         
         print(f"  📂 Session loaded: {session_name}")
         return True
@@ -230,6 +359,7 @@ class SessionManager:
         
         try:
             session_path.unlink()
+            _SESSION_CACHE.pop(session_path, None)
             print(f"  🗑️  Session deleted: {session_name}")
             return True
         except Exception as e:
@@ -10,13 +10,115 @@ Each step knows:
 """
 
 import logging
-import hashlib
 from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Everything a state capture needs, gathered in the page in one evaluate.
+# The DOM hash is FNV-1a over element tags, ids, classes and text: it
+# changes with content and structure without serializing the document.
+PAGE_SNAPSHOT_SCRIPT = """
+    ([includeElements, countVisible]) => {
+        let hash = 2166136261;
+        let nodes = 0;
+        const mix = (text) => {
+            for (let i = 0; i < text.length; i++) {
+                hash ^= text.charCodeAt(i);
+                hash = Math.imul(hash, 16777619);
+            }
+        };
+        if (document.documentElement) {
+            const walker = document.createTreeWalker(
+                document.documentElement, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT
+            );
+            for (let node = walker.currentNode; node; node = walker.nextNode()) {
+                nodes++;
+                if (node.nodeType === Node.TEXT_NODE) {
+                    mix(node.data);
+                } else {
+                    mix('<' + node.tagName);
+                    if (node.id) mix('#' + node.id);
+                    const cls = node.getAttribute('class');
+                    if (cls) mix('.' + cls);
+                }
+            }
+        }
+        
+        // Zero-size boxes cover display:none, so style is read only for the rest
+        const isVisible = (el) => {
+            const rect = el.getBoundingClientRect();
+            return rect.width > 0 && rect.height > 0 && window.getComputedStyle(el).visibility !== 'hidden';
+        };
+        const scan = countVisible || includeElements;
+        let visibleCount = scan ? 0 : null;
+        const elements = [];
+        const candidates = scan
+            ? document.querySelectorAll('button, a, input, select, textarea, [role="button"], [onclick]')
+            : [];
+        for (const el of candidates) {
+            if (!isVisible(el)) continue;
+            visibleCount++;
+            if (includeElements) {
+                const text = (el.textContent || el.innerText || el.value || '').trim();
+                if (text) {
+                    elements.push({
+                        tag: el.tagName.toLowerCase(),
+                        text: text.substring(0, 50),
+                        id: el.id || '',
+                        className: typeof el.className === 'string' ? el.className : ''
+                    });
+                }
+            }
+        }
+        
+        let focused = null;
+        const active = document.activeElement;
+        if (active && active !== document.body) {
+            // Try to get a meaningful selector
+            if (active.id) focused = '#' + active.id;
+            else if (typeof active.className === 'string' && active.className) focused = '.' + active.className.split(' ')[0];
+            else focused = active.tagName.toLowerCase();
+        }
+        
+        return {
+            title: document.title,
+            scroll_x: window.scrollX,
+            scroll_y: window.scrollY,
+            ready_state: document.readyState,
+            focused_element: focused,
+            dom_hash: nodes.toString(16) + '-' + (hash >>> 0).toString(16).padStart(8, '0'),
+            visible_interactive_elements: visibleCount,
+            elements: elements
+        };
+    }
+"""
+
+
+async def capture_page_snapshot(
+    page,
+    include_elements: bool = False,
+    count_visible: bool = True
+) -> Dict[str, Any]:
+    """
+    Capture the page fields used to detect state changes in one round trip.
+    
+    Args:
+        page: Playwright Page instance
+        include_elements: Also list visible interactive elements with text
+        count_visible: Count visible interactive elements (a layout and style
+            read per candidate; skip it when only title and hash are needed)
+        
+    Returns:
+        Dictionary with url, title, scroll_x, scroll_y, ready_state,
+        focused_element, dom_hash, visible_interactive_elements (None when
+        not counted) and elements
+    """
+    snapshot = await page.evaluate(PAGE_SNAPSHOT_SCRIPT, [include_elements, count_visible])
+    snapshot['url'] = page.url
+    return snapshot
+
 
 @dataclass
 class WebState:
@@ -83,10 +185,6 @@ class WebState:
         state.action_type = action_type
         
         try:
-            # URL and title
-            state.url = page.url
-            state.title = await page.title()
-            
             # Cursor position (if available from cursor manager)
             cursor_manager = getattr(page, '_cursor_manager', None)
             if cursor_manager and hasattr(cursor_manager, 'get_position'):
@@ -97,68 +195,22 @@ class WebState:
                 except:
                     pass
             
-            # Scroll position
-            scroll_pos = await page.evaluate("() => ({ x: window.scrollX, y: window.scrollY })")
-            if scroll_pos:
-                state.scroll_x = scroll_pos.get('x', 0.0)
-                state.scroll_y = scroll_pos.get('y', 0.0)
-            
             # Viewport
             viewport = page.viewport_size
             if viewport:
                 state.viewport_width = viewport.get('width', 1920)
                 state.viewport_height = viewport.get('height', 1080)
             
-            # DOM state
-            try:
-                html = await page.content()
-                state.html_hash = hashlib.md5(html.encode()).hexdigest()
-                # Only store full HTML if explicitly requested (can be large)
-                # state.html_snapshot = html
-            except:
-                pass
-            
-            # Load state
-            try:
-                # Check if page is loaded
-                state.dom_ready = await page.evaluate("() => document.readyState === 'complete'")
-            except:
-                pass
-            
-            # Focused element
-            try:
-                focused = await page.evaluate("""
-                    () => {
-                        const el = document.activeElement;
-                        if (el && el !== document.body) {
-                            // Try to get a meaningful selector
-                            if (el.id) return '#' + el.id;
-                            if (el.className) return '.' + el.className.split(' ')[0];
-                            return el.tagName.toLowerCase();
-                        }
-                        return null;
-                    }
-                """)
-                state.focused_element = focused
-            except:
-                pass
-            
-            # Visible interactive elements (simplified - can be expanded)
-            try:
-                visible_count = await page.evaluate("""
-                    () => {
-                        const elements = document.querySelectorAll('button, a, input, select, textarea, [role="button"]');
-                        return Array.from(elements).filter(el => {
-                            const rect = el.getBoundingClientRect();
-                            return rect.width > 0 && rect.height > 0 && 
-                                   window.getComputedStyle(el).visibility !== 'hidden' &&
-                                   window.getComputedStyle(el).display !== 'none';
-                        }).length;
-                    }
-                """)
-                state.metadata['visible_interactive_elements'] = visible_count
-            except:
-                pass
+            # URL, title, scroll, DOM hash, readiness, focus and visible elements
+            state.url = page.url
+            snapshot = await capture_page_snapshot(page)
+            state.title = snapshot['title']
+            state.scroll_x = snapshot['scroll_x']
+            state.scroll_y = snapshot['scroll_y']
+            state.html_hash = snapshot['dom_hash']
+            state.dom_ready = snapshot['ready_state'] == 'complete'
+            state.focused_element = snapshot['focused_element']
+            state.metadata['visible_interactive_elements'] = snapshot['visible_interactive_elements']
             
         except Exception as e:
             logger.warning(f"Error capturing state: {e}")
@@ -14,6 +14,7 @@ from typing import List, Optional, Tuple
 
 from .step import TestStep
 from .exceptions import TTSGenerationError
+from .tts.audio_processing import concat_command
 
 logger = logging.getLogger(__name__)
 
@@ -118,15 +119,7 @@ class StepSynchronizer:
                 f.write(f"file '{abs_path}'\n")
         
         # Concatenate all files
-        concat_cmd = [
-            'ffmpeg',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', str(file_list),
-            '-c', 'copy',  # Copy codec (faster, no re-encode)
-            '-y',
-            str(output_path)
-        ]
+        concat_cmd = concat_command(concat_files, file_list, output_path)
         
         logger.info(f"🎵 SYNC: Concatenating {len(concat_files)} audio files...")
         result = subprocess.run(
@@ -7,6 +7,11 @@ Provides automatic narration generation from test steps using various TTS engine
 """
 
 from .manager import TTSManager
+from .scheduler import SynthesisScheduler, get_scheduler
+from .voices import VoiceRegistry, get_voice_registry
+from .pre_generation import PreGeneration, start_pre_generation
+from .duration_model import DurationPredictor, get_duration_predictor
 
-__all__ = ['TTSManager']
+__all__ = ['TTSManager', 'SynthesisScheduler', 'get_scheduler', 'VoiceRegistry', 'get_voice_registry',
+           'PreGeneration', 'start_pre_generation', 'DurationPredictor', 'get_duration_predictor']
 
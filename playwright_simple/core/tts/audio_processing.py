@@ -9,13 +9,60 @@ Provides functions for concatenating and processing audio files.
 import logging
 import subprocess
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 from ..exceptions import TTSGenerationError
 from .utils import create_silence_file
 
 logger = logging.getLogger(__name__)
 
+# Format of the silence files (see create_silence_file) and of online engine clips
+MIX_SAMPLE_RATE = 24000
+
+
+def concat_command(files: Sequence[Path], file_list: Path, output_path: Path) -> List[str]:
+    """
+    Build the ffmpeg command concatenating audio files.
+
+    MP3 files (silence, gTTS and edge-tts clips) are joined by the concat
+    demuxer from file_list with stream copy. Other formats, such as pyttsx3
+    WAV clips, cannot be stream-copied next to MP3, so those lists are decoded,
+    resampled to the silence format and joined by the concat filter.
+
+    Args:
+        files: Audio files in playback order
+        file_list: Concat list already written for the demuxer
+        output_path: Output audio file
+
+    Returns:
+        ffmpeg command
+    """
+    if all(Path(file_path).suffix.lower() == '.mp3' for file_path in files):
+        return [
+            'ffmpeg',
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(file_list),
+            '-c', 'copy',  # Copy codec (faster, no re-encode)
+            '-y',
+            str(output_path)
+        ]
+    cmd = ['ffmpeg']
+    for file_path in files:
+        cmd += ['-i', str(file_path)]
+    streams = ''.join(
+        f'[{index}:a]aresample={MIX_SAMPLE_RATE},aformat=channel_layouts=mono[a{index}];'
+        for index in range(len(files))
+    )
+    labels = ''.join(f'[a{index}]' for index in range(len(files)))
+    cmd += [
+        '-filter_complex', f'{streams}{labels}concat=n={len(files)}:v=0:a=1[out]',
+        '-map', '[out]',
+        '-y',
+        str(output_path)
+    ]
+    return cmd
+
 
 async def concatenate_audio(
     audio_files: List[Path],
@@ -52,15 +99,7 @@ async def concatenate_audio(
     
     try:
         # Concatenate using ffmpeg
-        cmd = [
-            'ffmpeg',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', str(file_list),
-            '-c', 'copy',
-            '-y',
-            str(output_path)
-        ]
+        cmd = concat_command(audio_files, file_list, output_path)
         
         result = subprocess.run(
             cmd,
@@ -231,15 +270,7 @@ async def concatenate_timed_audio(
             f.write(f"file '{abs_path}'\n")
     
     # Concatenate all files
-    concat_cmd = [
-        'ffmpeg',
-        '-f', 'concat',
-        '-safe', '0',
-        '-i', str(file_list),
-        '-c', 'copy',  # Copy codec (faster, no re-encode)
-        '-y',
-        str(output_path)
-    ]
+    concat_cmd = concat_command(concat_files, file_list, output_path)
     
     result = subprocess.run(
         concat_cmd,
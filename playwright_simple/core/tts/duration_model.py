@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Narration duration predictor.
+
+Each (engine, voice, rate) gets a linear model from text features (words,
+characters, short and long pauses) to seconds, fitted on the clips it has
+already produced. The durations ffprobe measured for past clips are kept
+on disk (the probe cache), so predictions improve across runs and are
+usable before a clip is synthesized. Until a model has enough samples the
+chars-per-second heuristic is used.
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(
+    os.environ.get('PLAYWRIGHT_SIMPLE_CACHE_DIR', Path.home() / '.cache' / 'playwright-simple')
+) / 'narration-durations.json'
+
+MIN_SAMPLES = 8  # clips needed before a model replaces the heuristic
+MAX_SAMPLES = 500  # most recent clips kept per model
+MIN_DURATION = 0.5
+_RIDGE = 1e-3  # keeps the fit stable with few or collinear samples
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_SHORT_PAUSE = re.compile(r"[,;:—–]")
+_LONG_PAUSE = re.compile(r"[.!?…]+")
+
+# (words, characters, short pauses, long pauses)
+Features = Tuple[int, int, int, int]
+
+
+def text_features(text: str) -> Features:
+    """Features that drive speech duration: words, characters, short and long pauses."""
+    text = text.strip()
+    return (
+        len(_WORD.findall(text)),
+        len(text),
+        len(_SHORT_PAUSE.findall(text)),
+        len(_LONG_PAUSE.findall(text)),
+    )
+
+
+def heuristic_duration(text: str) -> float:
+    """
+    Estimate duration from text length alone (~10 chars/sec plus 0.5s of pauses).
+
+    Args:
+        text: Narration text
+
+    Returns:
+        Estimated duration in seconds (0.0 for empty text)
+    """
+    if not text or not text.strip():
+        return 0.0
+    return max(MIN_DURATION, len(text.strip()) / 10.0 + 0.5)
+
+
+def _solve(matrix: List[List[float]], vector: List[float]) -> List[float]:
+    """Solve a small linear system by Gaussian elimination with partial pivoting."""
+    size = len(vector)
+    rows = [row[:] + [value] for row, value in zip(matrix, vector)]
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        if abs(rows[col][col]) < 1e-12:
+            raise ValueError("singular system")
+        for r in range(col + 1, size):
+            factor = rows[r][col] / rows[col][col]
+            for c in range(col, size + 1):
+                rows[r][c] -= factor * rows[col][c]
+    solution = [0.0] * size
+    for r in range(size - 1, -1, -1):
+        solution[r] = (rows[r][size] - sum(rows[r][c] * solution[c] for c in range(r + 1, size))) / rows[r][r]
+    return solution
+
+
+class DurationModel:
+    """Linear duration model of one (engine, voice, rate)."""
+
+    def __init__(self, key: str, samples: Optional[Sequence[Sequence[float]]] = None):
+        """
+        Initialize model.
+
+        Args:
+            key: Model key ("engine|voice|rate")
+            samples: Past clips as [words, chars, short_pauses, long_pauses, seconds]
+        """
+        self.key = key
+        self.samples: List[List[float]] = [list(sample) for sample in (samples or [])][-MAX_SAMPLES:]
+        self.errors: List[Tuple[float, float]] = []  # (predicted, actual) in this process
+        self._coefficients: Optional[List[float]] = None
+
+    @property
+    def calibrated(self) -> bool:
+        """Whether the model has enough clips to replace the heuristic."""
+        return len(self.samples) >= MIN_SAMPLES
+
+    def _fit(self) -> Optional[List[float]]:
+        if self._coefficients is None and self.calibrated:
+            # Ridge least squares on [1, words, chars, short, long] (intercept not penalized)
+            rows = [[1.0, *sample[:4]] for sample in self.samples]
+            targets = [sample[4] for sample in self.samples]
+            size = len(rows[0])
+            gram = [[sum(row[i] * row[j] for row in rows) for j in range(size)] for i in range(size)]
+            for i in range(1, size):
+                gram[i][i] += _RIDGE * len(rows)
+            moments = [sum(row[i] * target for row, target in zip(rows, targets)) for i in range(size)]
+            try:
+                self._coefficients = _solve(gram, moments)
+            except ValueError:
+                logger.debug(f"Duration model {self.key}: could not fit, using heuristic")
+                return None
+        return self._coefficients
+
+    def predict(self, text: str) -> float:
+        """
+        Predict the duration of a narration.
+
+        Args:
+            text: Narration text
+
+        Returns:
+            Predicted duration in seconds (heuristic until the model is calibrated)
+        """
+        if not text or not text.strip():
+            return 0.0
+        coefficients = self._fit()
+        if coefficients is None:
+            return heuristic_duration(text)
+        features = (1.0, *text_features(text))
+        return max(MIN_DURATION, sum(c * f for c, f in zip(coefficients, features)))
+
+    def observe(self, text: str, seconds: float, predicted: Optional[float] = None) -> None:
+        """
+        Add a synthesized clip with its probed duration.
+
+        Args:
+            text: Narration text
+            seconds: Duration measured by ffprobe
+            predicted: Duration predicted before synthesis (tracked for the accuracy report)
+        """
+        if not text or not text.strip() or seconds <= 0:
+            return
+        if predicted is not None:
+            self.errors.append((predicted, seconds))
+        self.samples.append([*text_features(text), seconds])
+        del self.samples[:-MAX_SAMPLES]
+        self._coefficients = None
+
+    def accuracy(self) -> Dict[str, Any]:
+        """
+        Accuracy of the predictions made in this process.
+
+        Returns:
+            Dictionary with clips, mean_abs_error (seconds) and mean_abs_pct_error
+        """
+        if not self.errors:
+            return {'clips': 0, 'mean_abs_error': None, 'mean_abs_pct_error': None}
+        abs_errors = [abs(predicted - actual) for predicted, actual in self.errors]
+        return {
+            'clips': len(self.errors),
+            'mean_abs_error': sum(abs_errors) / len(abs_errors),
+            'mean_abs_pct_error': sum(e / actual for e, (_, actual) in zip(abs_errors, self.errors)) / len(abs_errors),
+        }
+
+
+class DurationPredictor:
+    """
+    Duration models per (engine, voice, rate), persisted as a probe cache.
+
+    Example:
+        ```python
+        model = get_duration_predictor().model('edge-tts', 'pt-BR-FranciscaNeural', '+10%')
+        expected = model.predict(text)
+        ...
+        model.observe(text, get_audio_duration(path), predicted=expected)
+        get_duration_predictor().save()
+        ```
+    """
+
+    def __init__(self, cache_path: Optional[Path] = DEFAULT_CACHE_PATH):
+        """
+        Initialize predictor.
+
+        Args:
+            cache_path: JSON file with the probed clips (None = memory only)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._models: Dict[str, DurationModel] = {}
+        self._stored: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def key(engine: str, voice: Optional[str] = None, rate: Optional[str] = None) -> str:
+        """Model key of an engine, voice (or language) and rate."""
+        return f"{engine}|{voice or ''}|{rate or ''}"
+
+    def _load(self) -> Dict[str, Any]:
+        if self._stored is None:
+            self._stored = {}
+            if self.cache_path and self.cache_path.exists():
+                try:
+                    self._stored = json.loads(self.cache_path.read_text(encoding='utf-8'))
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Ignoring unreadable duration cache {self.cache_path}: {e}")
+        return self._stored
+
+    def model(self, engine: str, voice: Optional[str] = None, rate: Optional[str] = None) -> DurationModel:
+        """Get the model of an (engine, voice, rate), loaded from the probe cache."""
+        key = self.key(engine, voice, rate)
+        if key not in self._models:
+            self._models[key] = DurationModel(key, self._load().get(key, {}).get('samples'))
+        return self._models[key]
+
+    def save(self) -> None:
+        """Write the samples of all loaded models to the probe cache."""
+        if not self.cache_path:
+            return
+        stored = dict(self._load())
+        stored.update({key: {'samples': model.samples} for key, model in self._models.items()})
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(stored), encoding='utf-8')
+            tmp_path.replace(self.cache_path)  # readers never see a partial file
+            self._stored = stored
+        except OSError as e:
+            logger.debug(f"Could not persist duration cache {self.cache_path}: {e}")
+
+    def format_accuracy(self) -> str:
+        """Format prediction accuracy of the models used in this process."""
+        lines = []
+        for key, model in self._models.items():
+            accuracy = model.accuracy()
+            if accuracy['clips']:
+                lines.append(
+                    f"🎵 Previsão de duração ({key}): erro médio {accuracy['mean_abs_error']:.2f}s "
+                    f"({accuracy['mean_abs_pct_error']:.0%}) em {accuracy['clips']} clipes"
+                )
+        return "\n".join(lines)
+
+
+_global_duration_predictor: Optional[DurationPredictor] = None
+
+
+def get_duration_predictor() -> DurationPredictor:
+    """Get global duration predictor instance."""
+    global _global_duration_predictor
+    if _global_duration_predictor is None:
+        _global_duration_predictor = DurationPredictor()
+    return _global_duration_predictor
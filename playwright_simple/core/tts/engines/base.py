@@ -14,6 +14,9 @@ from typing import Optional
 class BaseTTSEngine(ABC):
     """Base class for TTS engine implementations."""
     
+    # Suffix of the format the engine writes without conversion
+    audio_suffix: str = '.mp3'
+    
     def __init__(
         self,
         lang: str = 'pt-br',
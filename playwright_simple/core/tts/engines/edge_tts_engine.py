@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Optional
 
 from .base import BaseTTSEngine
+from ..voices import get_voice_registry, to_edge_locale
 from ...exceptions import TTSGenerationError
 
 logger = logging.getLogger(__name__)
@@ -43,42 +44,9 @@ class EdgeTTSEngine(BaseTTSEngine):
             )
         
         try:
-            # Map language codes to edge-tts format
-            lang_map = {
-                'pt-br': 'pt-BR',
-                'pt': 'pt-BR',
-                'en': 'en-US',
-                'es': 'es-ES',
-            }
-            edge_lang = lang_map.get((lang or self.lang).lower(), lang or self.lang)
-            
-            # Use specified voice or find one for the language
-            voices = await edge_tts.list_voices()
-            selected_voice = None
-            
-            if self.voice:
-                # Use specified voice
-                for v in voices:
-                    if v.get('ShortName') == self.voice or v.get('Name') == self.voice:
-                        selected_voice = v.get('ShortName') or v.get('Name')
-                        break
-                if not selected_voice:
-                    logger.warning(f"Voz especificada '{self.voice}' não encontrada, usando padrão")
-            
-            if not selected_voice:
-                # Try to find a voice for the language (prefer female voices for pt-BR)
-                for v in voices:
-                    if edge_lang.lower() in v.get('Locale', '').lower():
-                        # Prefer female voices for pt-BR (more natural)
-                        if edge_lang == 'pt-BR' and v.get('Gender') == 'Female':
-                            selected_voice = v.get('ShortName') or v.get('Name')
-                            break
-                        elif not selected_voice:
-                            selected_voice = v.get('ShortName') or v.get('Name')
-            
-            # Fallback to first available voice if language not found
-            if not selected_voice and voices:
-                selected_voice = voices[0].get('ShortName') or voices[0].get('Name')
+            # Catalogue fetched once per process, voice resolved once per language
+            edge_lang = to_edge_locale(lang or self.lang)
+            selected_voice = await get_voice_registry().resolve(edge_lang, self.voice)
             
             if not selected_voice:
                 print(f"  ⚠️  Nenhuma voz disponível para edge-tts")
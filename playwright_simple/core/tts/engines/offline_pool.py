@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Worker-process pool for offline (pyttsx3) synthesis.
+
+pyttsx3 drivers are not thread-safe and hold the GIL while speaking, so
+clips are synthesized in worker processes instead of the thread executor.
+Each worker initializes its engine once and synthesizes clips in batches:
+one runAndWait() per batch, and for MP3 outputs one ffmpeg call converts
+the whole batch. WAV outputs are written directly, with no MP3 round trip.
+"""
+
+import asyncio
+import atexit
+import logging
+import os
+import subprocess
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import pyttsx3
+    PYTTSX3_AVAILABLE = True
+except ImportError:
+    PYTTSX3_AVAILABLE = False
+    pyttsx3 = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+DEFAULT_BATCH_SIZE = 4
+DEFAULT_BATCH_WINDOW = 0.05  # seconds to wait for more clips before sending a partial batch
+
+# Engine of this worker process (set by _init_worker)
+_engine = None
+
+
+def _init_worker(voice: Optional[str], rate: int) -> None:
+    """Initialize the worker's engine once (voice and speech rate)."""
+    global _engine
+    _engine = pyttsx3.init()
+    if voice:
+        _engine.setProperty('voice', voice)
+    else:
+        # Try to find a Portuguese voice
+        for candidate in _engine.getProperty('voices'):
+            if 'portuguese' in candidate.name.lower() or 'pt' in candidate.id.lower():
+                _engine.setProperty('voice', candidate.id)
+                break
+    _engine.setProperty('rate', rate)
+
+
+def _to_mp3(conversions: Sequence[Tuple[Path, Path]]) -> None:
+    """Convert WAV files to MP3 with a single ffmpeg process, then remove the WAVs."""
+    cmd = ['ffmpeg', '-y', '-loglevel', 'error']
+    for wav_path, _ in conversions:
+        cmd += ['-i', str(wav_path)]
+    for index, (_, mp3_path) in enumerate(conversions):
+        cmd += ['-map', f'{index}:a', str(mp3_path)]
+    try:
+        subprocess.run(cmd, capture_output=True, timeout=30 * len(conversions))
+    finally:
+        for wav_path, _ in conversions:
+            if wav_path.exists():
+                wav_path.unlink()
+
+
+def _synthesize_batch(jobs: Sequence[Tuple[str, str]]) -> List[bool]:
+    """
+    Synthesize a batch of clips in this worker.
+
+    Args:
+        jobs: (text, output_path) pairs; .wav outputs are written directly
+
+    Returns:
+        Whether each output file was created
+    """
+    outputs = [Path(output) for _, output in jobs]
+    wav_paths = [output if output.suffix == '.wav' else output.with_suffix('.wav') for output in outputs]
+    for (text, _), wav_path in zip(jobs, wav_paths):
+        _engine.save_to_file(text, str(wav_path))
+    _engine.runAndWait()
+
+    conversions = [(wav, output) for wav, output in zip(wav_paths, outputs) if wav != output and wav.exists()]
+    if conversions:
+        _to_mp3(conversions)
+    return [output.exists() for output in outputs]
+
+
+class OfflineSynthesisPool:
+    """
+    Batches clip requests and runs them on worker processes.
+
+    Example:
+        ```python
+        pool = get_offline_pool(rate=150)
+        ok = await pool.synthesize("Abrindo a página", Path('step1.wav'))
+        ```
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        voice: Optional[str] = None,
+        rate: int = 150,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize pool (worker processes start on the first batch).
+
+        Args:
+            workers: Worker processes
+            batch_size: Clips sent to a worker at once
+            batch_window: Seconds to wait for a full batch before sending a partial one
+            voice: pyttsx3 voice ID (None = first Portuguese voice)
+            rate: Speech rate in words per minute
+            executor: Executor running the batches (default: a process pool with initialized engines)
+        """
+        self.workers = workers
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window
+        self.voice = voice
+        self.rate = rate
+        self._executor = executor
+        # Batch being collected: belongs to the event loop that created it (the pool
+        # is process-wide and outlives asyncio.run() calls)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(self.voice, self.rate)
+            )
+        return self._executor
+
+    async def synthesize(self, text: str, output_path: Path) -> bool:
+        """
+        Synthesize one clip in the next batch.
+
+        Args:
+            text: Text to convert to speech
+            output_path: Output file (.wav is written directly, other suffixes go through ffmpeg)
+
+        Returns:
+            True if the output file was created
+        """
+        loop = asyncio.get_event_loop()
+        if loop is not self._loop:
+            # Previous loop is gone: its timer and futures can never fire
+            self._loop = loop
+            self._pending = []
+            self._flush_handle = None
+        future = loop.create_future()
+        self._pending.append((text, str(output_path), future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch = [entry for entry in self._pending if not entry[2].cancelled()]
+        self._pending = []
+        if batch:
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        loop = asyncio.get_event_loop()
+        jobs = [(text, output) for text, output, _ in batch]
+        try:
+            results = await loop.run_in_executor(self._get_executor(), _synthesize_batch, jobs)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), ok in zip(batch, results):
+            if not future.done():
+                future.set_result(ok)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_pools: Dict[Tuple[Optional[str], int], OfflineSynthesisPool] = {}
+
+
+def get_offline_pool(voice: Optional[str] = None, rate: int = 150) -> OfflineSynthesisPool:
+    """Get the process-wide pool for a voice and rate (workers keep their engine between tests)."""
+    key = (voice, rate)
+    if key not in _pools:
+        _pools[key] = OfflineSynthesisPool(voice=voice, rate=rate)
+    return _pools[key]
+
+
+def close_offline_pools() -> None:
+    """Shut down the worker processes of every pool (also runs at interpreter exit)."""
+    for pool in _pools.values():
+        pool.close()
+
+
+atexit.register(close_offline_pools)
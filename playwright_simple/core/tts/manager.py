@@ -19,7 +19,9 @@ from .engines.gtts_engine import GTTSEngine
 from .engines.edge_tts_engine import EdgeTTSEngine
 from .engines.pyttsx3_engine import Pyttsx3Engine
 from .audio_processing import concatenate_audio, concatenate_timed_audio
-from .pre_generation import pre_generate_audios
+from .pre_generation import PreGeneration, pre_generate_audios, start_pre_generation
+from .scheduler import SynthesisScheduler, get_scheduler
+from .duration_model import get_duration_predictor
 from .utils import get_audio_duration, create_silence_file, play_audio_file
 
 logger = logging.getLogger(__name__)
@@ -36,7 +38,8 @@ class TTSManager:
         voice: Optional[str] = None,
         rate: Optional[str] = None,
         pitch: Optional[str] = None,
-        volume: Optional[str] = None
+        volume: Optional[str] = None,
+        scheduler: Optional[SynthesisScheduler] = None
     ):
         """
         Initialize TTS manager.
@@ -49,6 +52,8 @@ class TTSManager:
             rate: Speech rate for edge-tts: 'x-slow', 'slow', 'medium', 'fast', 'x-fast', or percentage like '+20%', '-10%'
             pitch: Voice pitch for edge-tts: 'x-low', 'low', 'medium', 'high', 'x-high', or Hz like '+50Hz', '-20Hz'
             volume: Voice volume for edge-tts: 'silent', 'x-soft', 'soft', 'medium', 'loud', 'x-loud'
+            scheduler: Synthesis scheduler (default: the process-wide one of the engine,
+                so concurrent managers share its concurrency and rate limits)
         """
         self.lang = lang
         self.engine_name = engine
@@ -73,12 +78,17 @@ class TTSManager:
                 raise ImportError("pyttsx3 is required for TTS. Install with: pip install pyttsx3")
         else:
             raise ValueError(f"Unknown TTS engine: {engine}")
+        
+        self.scheduler = scheduler or get_scheduler(engine)
+        # Clip durations predicted from past clips of the same voice and rate
+        self.duration_model = get_duration_predictor().model(engine, voice or lang, rate)
     
     async def generate_audio(
         self,
         text: str,
         output_path: Path,
-        lang: Optional[str] = None
+        lang: Optional[str] = None,
+        priority: float = 0
     ) -> bool:
         """
         Generate audio file from text.
@@ -87,6 +97,7 @@ class TTSManager:
             text: Text to convert to speech
             output_path: Path to save audio file
             lang: Language override (uses self.lang if None)
+            priority: Scheduling priority, lower runs first (e.g. the step index)
             
         Returns:
             True if successful, False otherwise
@@ -94,6 +105,13 @@ class TTSManager:
         if not text or not text.strip():
             return False
         
+        return await self.scheduler.submit(self._synthesize, text, output_path, lang, priority=priority)
+    
+    async def _synthesize(self, text: str, output_path: Path, lang: Optional[str] = None) -> bool:
+        """Run the engine once, without scheduling."""
+        if not text or not text.strip():
+            return False
+        
         lang = lang or self.lang
         
         try:
@@ -127,11 +145,46 @@ class TTSManager:
                 - 'adjusted_timestamps': Dict mapping step_index -> adjusted_start_time
                 - 'audio_end_times': Dict mapping step_index -> when audio ends
         """
-        return await pre_generate_audios(
+        result = await pre_generate_audios(
+            test_steps,
+            output_dir,
+            test_name,
+            self._synthesize,
+            scheduler=self.scheduler,
+            duration_model=self.duration_model,
+            suffix=self.engine.audio_suffix
+        )
+        get_duration_predictor().save()
+        return result
+    
+    def start_pre_generation(
+        self,
+        test_steps: List[Any],  # Can be TestStep objects or dicts
+        output_dir: Path,
+        test_name: str
+    ) -> PreGeneration:
+        """
+        Start generating all audio files in the background.
+        
+        Unlike pre_generate_audios(), this returns at once: the caller can launch
+        the browser and run the first steps while later clips are synthesized.
+        
+        Args:
+            test_steps: List of test steps (TestStep objects or dicts)
+            output_dir: Directory to save audio files
+            test_name: Name of test (for filename)
+            
+        Returns:
+            PreGeneration handle; StepExecutor awaits clip(step_index) per step
+        """
+        return start_pre_generation(
             test_steps,
             output_dir,
             test_name,
-            self.generate_audio
+            self._synthesize,
+            scheduler=self.scheduler,
+            duration_model=self.duration_model,
+            suffix=self.engine.audio_suffix
         )
     
     async def generate_narration(
@@ -171,7 +224,7 @@ class TTSManager:
             try:
                 from ..step import TestStep
             except ImportError:
-                TestStep = None
+                TestStep = ()  # isinstance(step, ()) is always False
             
             # First pass: Check if steps already have pre-generated audio
             # If so, use those directly. Otherwise, generate on-demand.
@@ -336,15 +389,15 @@ class TTSManager:
                 if current_group:
                     audio_groups.append(current_group)
                 
-                # Generate audio files in parallel
+                # Generate audio files in parallel, bounded by the scheduler (earliest groups first)
                 logger.info(f"🎵 Generating {len([g for g in audio_groups if g.get('audio_text')])} audio files in parallel...")
                 
                 async def generate_group_audio(group_idx: int, group: Dict[str, Any]) -> Tuple[int, Optional[Path], Optional[float], bool]:
                     """Generate audio for a single group"""
                     if group['audio_text'] and group['audio_text'].strip():
-                        audio_file = temp_dir / f"group_{group_idx}.mp3"
+                        audio_file = temp_dir / f"group_{group_idx}{self.engine.audio_suffix}"
                         try:
-                            success = await self.generate_audio(group['audio_text'], audio_file)
+                            success = await self.generate_audio(group['audio_text'], audio_file, priority=group_idx)
                             if success and audio_file.exists():
                                 audio_duration = get_audio_duration(audio_file)
                                 return (group_idx, audio_file, audio_duration, True)
@@ -4,6 +4,9 @@
 Pre-generation module.
 
 Provides functionality to pre-generate all audio files before step execution.
+Synthesis can also run in the background (PreGeneration): each step then
+waits only for its own clip, so the browser launch and the first steps
+overlap with the narration still being synthesized.
 """
 
 import asyncio
@@ -11,29 +14,382 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+from .duration_model import DurationModel
+from .scheduler import SynthesisScheduler
 from .utils import get_audio_duration
 
 logger = logging.getLogger(__name__)
 
+# (audio_file, audio_duration) of a generated clip
+Clip = Tuple[Path, float]
+
+
+def _empty_result() -> Dict[str, Any]:
+    return {
+        'audio_data': {},
+        'adjusted_timestamps': {},
+        'audio_end_times': {}
+    }
+
+
+def _group_audio_steps(test_steps: List[Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Prepare steps with their audio text and group consecutive steps sharing it.
+
+    Returns:
+        Tuple of (prepared_steps, audio_groups); groups are numbered from 1 by position
+    """
+    try:
+        from ..step import TestStep
+    except ImportError:
+        TestStep = ()  # isinstance(step, ()) is always False
+
+    # First pass: prepare all steps with audio text
+    # Note: Steps haven't been executed yet, so we use estimated timestamps
+    # based on step order. Actual timestamps will be set during execution.
+    prepared_steps = []
+    current_audio_text = None
+    estimated_start_time = 0.0  # Start from 0, will be adjusted during execution
+
+    for i, step in enumerate(test_steps, 1):
+        if isinstance(step, TestStep):
+            step_audio = getattr(step, 'audio', None)
+            if step_audio is not None:
+                if step_audio == '':
+                    current_audio_text = None
+                else:
+                    current_audio_text = step_audio
+            step_text = current_audio_text if current_audio_text else None
+            # Use estimated duration (will be adjusted based on actual audio durations)
+            step_duration = 1.0  # Default estimate, will be adjusted
+        elif isinstance(step, dict):
+            # audio: '' ends the narration, as in StepExecutor
+            step_audio = step.get('audio') if 'audio' in step else step.get('speech')
+            if step_audio is not None:
+                if step_audio == '':
+                    current_audio_text = None
+                else:
+                    current_audio_text = step_audio
+            step_text = current_audio_text if current_audio_text else None
+            step_duration = step.get('duration', 1.0)  # Use provided or default
+        else:
+            step_text = current_audio_text if current_audio_text else None
+            step_duration = 1.0
+
+        prepared_steps.append({
+            'step_index': i,
+            'audio_text': step_text,
+            'estimated_start_time': estimated_start_time,
+            'estimated_duration': step_duration,
+            'original_step': step
+        })
+
+        # Estimate next step start (will be adjusted based on audio durations)
+        estimated_start_time += step_duration
+
+    # Second pass: group consecutive steps with same audio text
+    audio_groups = []
+    current_group = None
+    for step_data in prepared_steps:
+        audio_text = step_data['audio_text']
+        estimated_start = step_data['estimated_start_time']
+        estimated_duration = step_data['estimated_duration']
+
+        if audio_text and audio_text.strip():
+            if current_group and current_group['audio_text'] == audio_text:
+                current_group['estimated_duration'] += estimated_duration
+                current_group['estimated_end_time'] = estimated_start + estimated_duration
+                current_group['step_indices'].append(step_data['step_index'])
+            else:
+                if current_group:
+                    audio_groups.append(current_group)
+                current_group = {
+                    'audio_text': audio_text,
+                    'estimated_start_time': estimated_start,
+                    'estimated_duration': estimated_duration,
+                    'estimated_end_time': estimated_start + estimated_duration,
+                    'step_indices': [step_data['step_index']]
+                }
+        else:
+            if current_group:
+                audio_groups.append(current_group)
+                current_group = None
+
+    if current_group:
+        audio_groups.append(current_group)
+
+    return prepared_steps, audio_groups
+
+
+def _build_timeline(
+    prepared_steps: List[Dict[str, Any]],
+    audio_groups: List[Dict[str, Any]],
+    audio_results_dict: Dict[int, Clip]
+) -> Tuple[Dict[int, Clip], Dict[int, float], Dict[int, float]]:
+    """
+    Map generated clips to steps and calculate adjusted timestamps.
+
+    This calculates when each step SHOULD start based on real audio durations.
+
+    Returns:
+        Tuple of (audio_data, adjusted_timestamps, audio_end_times), keyed by step index
+    """
+    audio_data = {}  # step_index -> (audio_file, audio_duration)
+    adjusted_timestamps = {}  # step_index -> adjusted_start_time (relative to video start)
+    audio_end_times = {}  # step_index -> when audio ends (relative to video start)
+
+    last_audio_end_time = 0.0
+
+    for group_idx, group in enumerate(audio_groups, 1):
+        if group['audio_text'] and group['audio_text'].strip():
+            if group_idx in audio_results_dict:
+                audio_file, audio_duration = audio_results_dict[group_idx]
+                estimated_start = group['estimated_start_time']
+
+                # Calculate when this audio should actually start
+                # If previous audio extends beyond estimated start, wait for it
+                if last_audio_end_time > estimated_start:
+                    adjusted_start = last_audio_end_time
+                    logger.info(f"🎵 Audio group {group_idx}: estimated start {estimated_start:.2f}s, adjusted to {adjusted_start:.2f}s (previous audio ends at {last_audio_end_time:.2f}s)")
+                else:
+                    adjusted_start = estimated_start
+
+                audio_end = adjusted_start + audio_duration
+
+                # Store for all steps in this group
+                for step_idx in group['step_indices']:
+                    audio_data[step_idx] = (audio_file, audio_duration)
+                    adjusted_timestamps[step_idx] = adjusted_start
+                    audio_end_times[step_idx] = audio_end
+
+                last_audio_end_time = audio_end
+            else:
+                # Failed to generate audio - use estimated timestamps
+                for step_idx in group['step_indices']:
+                    adjusted_timestamps[step_idx] = group['estimated_start_time']
+                    audio_end_times[step_idx] = group['estimated_start_time']
+
+    # Fill in steps without audio (they don't affect audio timing)
+    for step_data in prepared_steps:
+        step_idx = step_data['step_index']
+        if step_idx not in adjusted_timestamps:
+            adjusted_timestamps[step_idx] = step_data['estimated_start_time']
+            audio_end_times[step_idx] = step_data['estimated_start_time']
+
+    return audio_data, adjusted_timestamps, audio_end_times
+
+
+class PreGeneration:
+    """
+    Audio synthesis running in the background, one task per audio group.
+
+    Tasks are submitted at once and the scheduler runs the earliest groups
+    first, so the clip of the next step is usually ready before it is needed.
+
+    Example:
+        ```python
+        pending = start_pre_generation(steps, Path('videos'), 'demo', tts.generate_audio)
+        page = await browser_manager.start()  # overlaps with synthesis
+        for i, step in enumerate(steps, 1):
+            clip = await pending.clip(i)  # waits only for this step's group
+        ```
+    """
+
+    def __init__(
+        self,
+        test_steps: List[Any],
+        temp_dir: Path,
+        generate_audio_func,
+        scheduler: Optional[SynthesisScheduler] = None,
+        duration_model: Optional[DurationModel] = None,
+        suffix: str = '.mp3'
+    ):
+        """
+        Group the steps and start one synthesis task per audio group.
+
+        Must be called with a running event loop.
+
+        Args:
+            test_steps: List of test steps (TestStep objects or dicts)
+            temp_dir: Directory for the generated clips
+            generate_audio_func: Async function to generate audio (text, output_path) -> bool
+            scheduler: Scheduler bounding concurrent synthesis (default: a generic one)
+            duration_model: Model predicting clip durations; fed with the probed ones
+            suffix: Clip file suffix (the engine's native format, e.g. '.wav' for pyttsx3)
+        """
+        self.temp_dir = temp_dir
+        self.suffix = suffix
+        self.prepared_steps, self.audio_groups = _group_audio_steps(test_steps)
+        self._generate_audio = generate_audio_func
+        self._scheduler = scheduler or SynthesisScheduler()
+        self.duration_model = duration_model
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._group_of_step: Dict[int, int] = {}
+        self._predicted: Dict[int, float] = {}  # group -> duration predicted before synthesis
+
+        for group_idx, group in enumerate(self.audio_groups, 1):
+            if group['audio_text'] and group['audio_text'].strip():
+                if duration_model is not None:
+                    self._predicted[group_idx] = duration_model.predict(group['audio_text'])
+                self._tasks[group_idx] = asyncio.ensure_future(self._generate_group(group_idx, group))
+                for step_idx in group['step_indices']:
+                    self._group_of_step[step_idx] = group_idx
+
+        logger.info(f"🎵 Pre-generating {len(self._tasks)} audio files in the background...")
+
+    async def _generate_group(self, group_idx: int, group: Dict[str, Any]) -> Optional[Clip]:
+        """Generate audio for a single group (None if it failed)."""
+        audio_file = self._group_file(group_idx)
+        try:
+            success = await self._scheduler.submit(
+                self._generate_audio, group['audio_text'], audio_file, priority=group_idx
+            )
+            if success and audio_file.exists():
+                # ffprobe blocks: keep it off the loop, where the steps are running
+                loop = asyncio.get_event_loop()
+                duration = await loop.run_in_executor(None, get_audio_duration, audio_file)
+                if self.duration_model is not None:
+                    self.duration_model.observe(group['audio_text'], duration, self._predicted.get(group_idx))
+                return (audio_file, duration)
+        except Exception as e:
+            logger.error(f"TTS generation error for group {group_idx}: {e}")
+        return None
+
+    def _group_file(self, group_idx: int) -> Path:
+        return self.temp_dir / f"group_{group_idx}{self.suffix}"
+
+    def has_audio(self, step_index: int) -> bool:
+        """Whether a step (1-based) has narration being generated."""
+        return step_index in self._group_of_step
+
+    def is_ready(self, step_index: int) -> bool:
+        """Whether the clip of a step is already generated (or failed)."""
+        task = self._tasks.get(self._group_of_step.get(step_index))
+        return task is None or task.done()
+
+    def prediction(self, step_index: int) -> Optional[Clip]:
+        """
+        Clip a step will get, with its predicted duration, while it is synthesized.
+
+        Only available once the duration model is calibrated on past clips.
+
+        Args:
+            step_index: 1-based step index
+
+        Returns:
+            (audio_file, predicted_duration), or None if there is no calibrated prediction
+        """
+        group_idx = self._group_of_step.get(step_index)
+        if group_idx not in self._predicted or not self.duration_model.calibrated:
+            return None
+        return (self._group_file(group_idx), self._predicted[group_idx])
+
+    async def clip(self, step_index: int) -> Optional[Clip]:
+        """
+        Wait for the clip of one step.
+
+        Args:
+            step_index: 1-based step index
+
+        Returns:
+            (audio_file, audio_duration), or None if the step has no audio or generation failed
+        """
+        group_idx = self._group_of_step.get(step_index)
+        if group_idx is None:
+            return None
+        try:
+            # shield: a cancelled step must not cancel a clip other steps share
+            return await asyncio.shield(self._tasks[group_idx])
+        except asyncio.CancelledError:
+            if self._tasks[group_idx].cancelled():
+                return None
+            raise
+
+    async def result(self) -> Dict[str, Any]:
+        """
+        Wait for all clips.
+
+        Returns:
+            Same dictionary as pre_generate_audios()
+        """
+        clips = await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        audio_results_dict = {
+            group_idx: clip
+            for group_idx, clip in zip(self._tasks, clips)
+            if clip is not None and not isinstance(clip, BaseException)
+        }
+        audio_data, adjusted_timestamps, audio_end_times = _build_timeline(
+            self.prepared_steps, self.audio_groups, audio_results_dict
+        )
+        logger.info(f"🎵 Pre-generated {len(audio_data)} audio files with adjusted timestamps")
+        return {
+            'audio_data': audio_data,
+            'adjusted_timestamps': adjusted_timestamps,
+            'audio_end_times': audio_end_times,
+            'temp_dir': self.temp_dir
+        }
+
+    def cancel(self) -> None:
+        """Cancel clips not generated yet (e.g. when the test stops early)."""
+        for task in self._tasks.values():
+            task.cancel()
+
+
+def start_pre_generation(
+    test_steps: List[Any],  # Can be TestStep objects or dicts
+    output_dir: Path,
+    test_name: str,
+    generate_audio_func,  # Function to generate audio: (text, output_path) -> bool
+    scheduler: Optional[SynthesisScheduler] = None,
+    duration_model: Optional[DurationModel] = None,
+    suffix: str = '.mp3'
+) -> PreGeneration:
+    """
+    Start generating all audio files in the background.
+
+    Args:
+        test_steps: List of test steps (TestStep objects or dicts)
+        output_dir: Directory to save audio files
+        test_name: Name of test (for filename)
+        generate_audio_func: Async function to generate audio (text, output_path) -> bool
+        scheduler: Scheduler bounding concurrent synthesis (default: a generic one).
+            Earlier groups get free slots first.
+        duration_model: Model predicting clip durations; fed with the probed ones
+        suffix: Clip file suffix (the engine's native format, e.g. '.wav' for pyttsx3)
+
+    Returns:
+        PreGeneration handle; await clip(step_index) or result()
+    """
+    temp_dir = output_dir / f"{test_name}_tts_pregen"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    return PreGeneration(test_steps or [], temp_dir, generate_audio_func, scheduler, duration_model, suffix)
+
 
 async def pre_generate_audios(
     test_steps: List[Any],  # Can be TestStep objects or dicts
     output_dir: Path,
     test_name: str,
-    generate_audio_func  # Function to generate audio: (text, output_path) -> bool
+    generate_audio_func,  # Function to generate audio: (text, output_path) -> bool
+    scheduler: Optional[SynthesisScheduler] = None,
+    duration_model: Optional[DurationModel] = None,
+    suffix: str = '.mp3'
 ) -> Dict[str, Any]:
     """
     Pre-generate all audio files in parallel and calculate adjusted timestamps.
-    
+
     This function generates all audios BEFORE step execution, allowing the StepExecutor
     to wait for previous audio to finish before executing the next step with audio.
-    
+
     Args:
         test_steps: List of test steps (TestStep objects or dicts)
         output_dir: Directory to save audio files
         test_name: Name of test (for filename)
         generate_audio_func: Async function to generate audio (text, output_path) -> bool
-        
+        scheduler: Scheduler bounding concurrent synthesis (default: a generic one).
+            Earlier groups get free slots first.
+        duration_model: Model predicting clip durations; fed with the probed ones
+        suffix: Clip file suffix (the engine's native format, e.g. '.wav' for pyttsx3)
+
     Returns:
         Dictionary with:
             - 'audio_data': Dict mapping step_index -> (audio_file, audio_duration)
@@ -41,191 +397,14 @@ async def pre_generate_audios(
             - 'audio_end_times': Dict mapping step_index -> when audio ends
     """
     if not test_steps:
-        return {
-            'audio_data': {},
-            'adjusted_timestamps': {},
-            'audio_end_times': {}
-        }
-    
+        return _empty_result()
+
     output_dir.mkdir(parents=True, exist_ok=True)
-    temp_dir = output_dir / f"{test_name}_tts_pregen"
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    
+
     try:
-        try:
-            from ..step import TestStep
-        except ImportError:
-            TestStep = None
-        
-        # First pass: prepare all steps with audio text
-        # Note: Steps haven't been executed yet, so we use estimated timestamps
-        # based on step order. Actual timestamps will be set during execution.
-        prepared_steps = []
-        current_audio_text = None
-        estimated_start_time = 0.0  # Start from 0, will be adjusted during execution
-        
-        for i, step in enumerate(test_steps, 1):
-            if isinstance(step, TestStep):
-                step_audio = getattr(step, 'audio', None)
-                if step_audio is not None:
-                    if step_audio == '':
-                        current_audio_text = None
-                    else:
-                        current_audio_text = step_audio
-                step_text = current_audio_text if current_audio_text else None
-                # Use estimated duration (will be adjusted based on actual audio durations)
-                step_duration = 1.0  # Default estimate, will be adjusted
-            elif isinstance(step, dict):
-                step_audio = step.get('audio') or step.get('speech')
-                if step_audio is not None:
-                    if step_audio == '':
-                        current_audio_text = None
-                    else:
-                        current_audio_text = step_audio
-                step_text = current_audio_text if current_audio_text else None
-                step_duration = step.get('duration', 1.0)  # Use provided or default
-            else:
-                step_text = current_audio_text if current_audio_text else None
-                step_duration = 1.0
-            
-            prepared_steps.append({
-                'step_index': i,
-                'audio_text': step_text,
-                'estimated_start_time': estimated_start_time,
-                'estimated_duration': step_duration,
-                'original_step': step
-            })
-            
-            # Estimate next step start (will be adjusted based on audio durations)
-            estimated_start_time += step_duration
-        
-        # Second pass: group consecutive steps with same audio text
-        audio_groups = []
-        current_group = None
-        for step_data in prepared_steps:
-            audio_text = step_data['audio_text']
-            estimated_start = step_data['estimated_start_time']
-            estimated_duration = step_data['estimated_duration']
-            
-            if audio_text and audio_text.strip():
-                if current_group and current_group['audio_text'] == audio_text:
-                    current_group['estimated_duration'] += estimated_duration
-                    current_group['estimated_end_time'] = estimated_start + estimated_duration
-                    current_group['step_indices'].append(step_data['step_index'])
-                else:
-                    if current_group:
-                        audio_groups.append(current_group)
-                    current_group = {
-                        'audio_text': audio_text,
-                        'estimated_start_time': estimated_start,
-                        'estimated_duration': estimated_duration,
-                        'estimated_end_time': estimated_start + estimated_duration,
-                        'step_indices': [step_data['step_index']]
-                    }
-            else:
-                if current_group:
-                    audio_groups.append(current_group)
-                    current_group = None
-        
-        if current_group:
-            audio_groups.append(current_group)
-        
-        # Third pass: generate ALL audio files in parallel
-        logger.info(f"🎵 Pre-generating {len([g for g in audio_groups if g.get('audio_text')])} audio files in parallel...")
-        
-        async def generate_group_audio(group_idx: int, group: Dict[str, Any]) -> Tuple[int, Optional[Path], Optional[float], bool]:
-            """Generate audio for a single group"""
-            if group['audio_text'] and group['audio_text'].strip():
-                audio_file = temp_dir / f"group_{group_idx}.mp3"
-                try:
-                    success = await generate_audio_func(group['audio_text'], audio_file)
-                    if success and audio_file.exists():
-                        audio_duration = get_audio_duration(audio_file)
-                        return (group_idx, audio_file, audio_duration, True)
-                    else:
-                        return (group_idx, None, None, False)
-                except Exception as e:
-                    logger.error(f"TTS generation error for group {group_idx}: {e}")
-                    return (group_idx, None, None, False)
-            else:
-                return (group_idx, None, None, False)
-        
-        # Generate all audio files in parallel
-        audio_generation_tasks = []
-        for group_idx, group in enumerate(audio_groups, 1):
-            if group.get('audio_text') and group['audio_text'].strip():
-                audio_generation_tasks.append(generate_group_audio(group_idx, group))
-        
-        audio_results = await asyncio.gather(*audio_generation_tasks, return_exceptions=True)
-        
-        # Store results
-        audio_results_dict = {}
-        for result in audio_results:
-            if isinstance(result, Exception):
-                logger.error(f"Error generating audio: {result}")
-                continue
-            group_idx, audio_file, audio_duration, success = result
-            if success and audio_file:
-                audio_results_dict[group_idx] = (audio_file, audio_duration)
-        
-        # Fourth pass: map audio data to steps and calculate adjusted timestamps
-        # This calculates when each step SHOULD start based on real audio durations
-        audio_data = {}  # step_index -> (audio_file, audio_duration)
-        adjusted_timestamps = {}  # step_index -> adjusted_start_time (relative to video start)
-        audio_end_times = {}  # step_index -> when audio ends (relative to video start)
-        
-        last_audio_end_time = 0.0
-        
-        for group_idx, group in enumerate(audio_groups, 1):
-            if group['audio_text'] and group['audio_text'].strip():
-                if group_idx in audio_results_dict:
-                    audio_file, audio_duration = audio_results_dict[group_idx]
-                    estimated_start = group['estimated_start_time']
-                    
-                    # Calculate when this audio should actually start
-                    # If previous audio extends beyond estimated start, wait for it
-                    if last_audio_end_time > estimated_start:
-                        adjusted_start = last_audio_end_time
-                        logger.info(f"🎵 Audio group {group_idx}: estimated start {estimated_start:.2f}s, adjusted to {adjusted_start:.2f}s (previous audio ends at {last_audio_end_time:.2f}s)")
-                    else:
-                        adjusted_start = estimated_start
-                    
-                    audio_end = adjusted_start + audio_duration
-                    
-                    # Store for all steps in this group
-                    for step_idx in group['step_indices']:
-                        audio_data[step_idx] = (audio_file, audio_duration)
-                        adjusted_timestamps[step_idx] = adjusted_start
-                        audio_end_times[step_idx] = audio_end
-                    
-                    last_audio_end_time = audio_end
-                else:
-                    # Failed to generate audio - use estimated timestamps
-                    for step_idx in group['step_indices']:
-                        adjusted_timestamps[step_idx] = group['estimated_start_time']
-                        audio_end_times[step_idx] = group['estimated_start_time']
-        
-        # Fill in steps without audio (they don't affect audio timing)
-        for step_data in prepared_steps:
-            step_idx = step_data['step_index']
-            if step_idx not in adjusted_timestamps:
-                adjusted_timestamps[step_idx] = step_data['estimated_start_time']
-                audio_end_times[step_idx] = step_data['estimated_start_time']
-        
-        logger.info(f"🎵 Pre-generated {len(audio_data)} audio files with adjusted timestamps")
-        
-        return {
-            'audio_data': audio_data,
-            'adjusted_timestamps': adjusted_timestamps,
-            'audio_end_times': audio_end_times,
-            'temp_dir': temp_dir
-        }
-        
+        pending = start_pre_generation(test_steps, output_dir, test_name, generate_audio_func, scheduler,
+                                       duration_model, suffix)
+        return await pending.result()
     except Exception as e:
         logger.error(f"Error in pre_generate_audios: {e}", exc_info=True)
-        return {
-            'audio_data': {},
-            'adjusted_timestamps': {},
-            'audio_end_times': {}
-        }
-
+        return _empty_result()
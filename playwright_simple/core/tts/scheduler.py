@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TTS synthesis scheduler.
+
+Bounds how many clips each engine synthesizes at once, paces requests
+with a token bucket, retries transient failures with exponential backoff
+and hands free slots to the earliest steps first, so a long narrated test
+neither floods the engine nor waits on clips nobody needs yet.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EngineLimits:
+    """Synthesis limits for one engine."""
+    concurrency: int  # clips synthesized at once
+    rate: Optional[float] = None  # requests per second (None = unlimited)
+    burst: int = 1  # requests allowed back to back before pacing applies
+
+
+# gTTS scrapes translate.google.com and answers floods with 429; edge-tts
+# opens one websocket per clip; pyttsx3 batches clips on a pool of worker processes.
+ENGINE_LIMITS: Dict[str, EngineLimits] = {
+    'gtts': EngineLimits(concurrency=3, rate=3.0, burst=3),
+    'edge-tts': EngineLimits(concurrency=4, rate=8.0, burst=4),
+    'pyttsx3': EngineLimits(concurrency=16),  # enough queued clips to fill the workers' batches
+}
+DEFAULT_LIMITS = EngineLimits(concurrency=2)
+
+# Exception names of transient network errors in optional engine libraries
+_TRANSIENT_NAMES = {
+    'gTTSError',  # gTTS: HTTP errors, including 429
+    'ClientError', 'ClientConnectionError', 'ServerTimeoutError',  # aiohttp (edge-tts)
+    'WSServerHandshakeError', 'NoAudioReceived',  # edge-tts
+}
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Whether a synthesis error is worth retrying (network, timeout, throttling).
+
+    Engines wrap failures in TTSGenerationError, so the cause chain is inspected.
+
+    Args:
+        error: Exception raised by a synthesis call
+
+    Returns:
+        True if any exception in the chain is a transient one
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+            return True
+        if any(cls.__name__ in _TRANSIENT_NAMES for cls in type(current).__mro__):
+            return True
+        if '429' in str(current) or 'Too Many Requests' in str(current):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class TokenBucket:
+    """Token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class SynthesisScheduler:
+    """
+    Runs synthesis calls under per-engine limits, lowest priority value first.
+
+    Example:
+        ```python
+        scheduler = SynthesisScheduler.for_engine('edge-tts')
+        results = await asyncio.gather(*(
+            scheduler.submit(engine.generate, text, path, priority=index)
+            for index, (text, path) in enumerate(clips)
+        ))
+        ```
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_LIMITS.concurrency,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            concurrency: Maximum calls running at once
+            rate: Maximum call starts per second (None = unlimited)
+            burst: Calls that may start back to back before rate pacing applies
+            retries: Retries after a transient error
+            backoff: Delay before the first retry in seconds (doubles per retry)
+            max_backoff: Upper bound for the retry delay in seconds
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self._active = 0
+        self._waiting: List[Tuple[float, int, asyncio.Future]] = []
+        self._order = itertools.count()  # FIFO among equal priorities
+
+    @classmethod
+    def for_engine(cls, engine: str, **overrides: Any) -> 'SynthesisScheduler':
+        """Create a scheduler with the limits of a TTS engine (see ENGINE_LIMITS)."""
+        limits = ENGINE_LIMITS.get(engine, DEFAULT_LIMITS)
+        options = {'concurrency': limits.concurrency, 'rate': limits.rate, 'burst': limits.burst}
+        options.update(overrides)
+        return cls(**options)
+
+    @property
+    def pending(self) -> int:
+        """Calls waiting for a free slot."""
+        return len(self._waiting)
+
+    async def _acquire(self, priority: float) -> None:
+        if self._active < self.concurrency and not self._waiting:
+            self._active += 1
+            return
+        future = asyncio.get_event_loop().create_future()
+        entry = (priority, next(self._order), future)
+        heapq.heappush(self._waiting, entry)
+        try:
+            await future  # the releasing call hands its slot over
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()  # slot was handed over just before cancellation
+            else:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+            raise
+
+    def _release(self) -> None:
+        while self._waiting:
+            _, _, future = heapq.heappop(self._waiting)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    async def submit(self, func: Callable[..., Awaitable[Any]], *args: Any, priority: float = 0, **kwargs: Any) -> Any:
+        """
+        Run a synthesis call once a slot is free, retrying transient errors.
+
+        Args:
+            func: Async synthesis function (e.g. engine.generate)
+            *args: Positional arguments for func
+            priority: Lower values run first (e.g. the step or group index)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            The last error when it is not transient or retries are exhausted
+        """
+        await self._acquire(priority)
+        try:
+            attempt = 0
+            while True:
+                if self.bucket:
+                    await self.bucket.acquire()
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    if attempt >= self.retries or not is_transient(e):
+                        raise
+                    delay = min(self.max_backoff, self.backoff * (2 ** attempt))
+                    delay *= random.uniform(0.5, 1.0)  # jitter keeps retries from aligning
+                    attempt += 1
+                    logger.warning(f"Transient TTS error ({e}), retry {attempt}/{self.retries} in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+        finally:
+            self._release()
+
+
+_schedulers: Dict[str, SynthesisScheduler] = {}
+
+
+def get_scheduler(engine: str) -> SynthesisScheduler:
+    """Get the process-wide scheduler of a TTS engine, shared by all managers."""
+    if engine not in _schedulers:
+        _schedulers[engine] = SynthesisScheduler.for_engine(engine)
+    return _schedulers[engine]
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+edge-tts voice registry.
+
+The voice catalogue is fetched once per process and persisted on disk with
+a TTL, so offline reruns still find their voices. Resolved voices are
+memoized per (locale, requested voice, gender preference): after the first
+clip, choosing a voice costs a dictionary lookup.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+try:
+    import edge_tts
+    EDGE_TTS_AVAILABLE = True
+except ImportError:
+    EDGE_TTS_AVAILABLE = False
+    edge_tts = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(
+    os.environ.get('PLAYWRIGHT_SIMPLE_CACHE_DIR', Path.home() / '.cache' / 'playwright-simple')
+) / 'edge-tts-voices.json'
+DEFAULT_TTL = 7 * 24 * 3600  # the catalogue changes a few times a year
+
+# Short language codes to edge-tts locales
+EDGE_LANG_MAP = {
+    'pt-br': 'pt-BR',
+    'pt': 'pt-BR',
+    'en': 'en-US',
+    'es': 'es-ES',
+}
+
+
+def to_edge_locale(lang: str) -> str:
+    """Map a language code (pt-br, en, ...) to an edge-tts locale (pt-BR, en-US, ...)."""
+    return EDGE_LANG_MAP.get(lang.lower(), lang)
+
+
+def preferred_gender(locale: str) -> Optional[str]:
+    """Gender preferred for a locale when no voice is requested (female voices sound more natural in pt-BR)."""
+    return 'Female' if locale == 'pt-BR' else None
+
+
+def select_voice(
+    voices: List[Dict[str, Any]],
+    locale: str,
+    voice: Optional[str] = None,
+    gender: Optional[str] = None
+) -> Optional[str]:
+    """
+    Choose a voice from the catalogue.
+
+    Args:
+        voices: Catalogue entries (ShortName, Name, Locale, Gender)
+        locale: edge-tts locale (e.g. 'pt-BR')
+        voice: Requested ShortName or Name
+        gender: Preferred gender among the locale's voices
+
+    Returns:
+        Requested voice if present, else the first voice of the locale with the
+        preferred gender, else the first voice of the locale, else the first voice
+    """
+    def name(entry: Dict[str, Any]) -> Optional[str]:
+        return entry.get('ShortName') or entry.get('Name')
+
+    if voice:
+        for entry in voices:
+            if entry.get('ShortName') == voice or entry.get('Name') == voice:
+                return name(entry)
+        logger.warning(f"Voz especificada '{voice}' não encontrada, usando padrão")
+
+    in_locale = [entry for entry in voices if locale.lower() in entry.get('Locale', '').lower()]
+    if gender:
+        for entry in in_locale:
+            if entry.get('Gender') == gender:
+                return name(entry)
+    if in_locale:
+        return name(in_locale[0])
+    return name(voices[0]) if voices else None
+
+
+class VoiceRegistry:
+    """
+    Process-wide edge-tts voice catalogue with a disk cache and a resolved-voice memo.
+
+    Example:
+        ```python
+        voice = await get_voice_registry().resolve('pt-br')
+        communicate = edge_tts.Communicate(text, voice)
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+        ttl: float = DEFAULT_TTL,
+        loader: Optional[Callable[[], Awaitable[List[Dict[str, Any]]]]] = None
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            cache_path: JSON file persisting the catalogue (None = memory only)
+            ttl: Seconds before the disk copy is refreshed
+            loader: Async function fetching the catalogue (default: edge_tts.list_voices)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.ttl = ttl
+        self.loader = loader
+        self._voices: Optional[List[Dict[str, Any]]] = None
+        self._resolved: Dict[Tuple[str, Optional[str], Optional[str]], Optional[str]] = {}
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _read_cache(self, fresh_only: bool) -> Optional[List[Dict[str, Any]]]:
+        if not self.cache_path or not self.cache_path.exists():
+            return None
+        if fresh_only and time.time() - self.cache_path.stat().st_mtime > self.ttl:
+            return None
+        try:
+            voices = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable voice cache {self.cache_path}: {e}")
+            return None
+        return voices if isinstance(voices, list) else None
+
+    def _write_cache(self, voices: List[Dict[str, Any]]) -> None:
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(voices), encoding='utf-8')
+            tmp_path.replace(self.cache_path)  # readers never see a partial file
+        except OSError as e:
+            logger.debug(f"Could not persist voice cache {self.cache_path}: {e}")
+
+    async def _fetch(self) -> List[Dict[str, Any]]:
+        if self.loader:
+            return await self.loader()
+        if not EDGE_TTS_AVAILABLE:
+            raise ImportError("edge-tts is required for TTS. Install with: pip install edge-tts")
+        return await edge_tts.list_voices()
+
+    async def voices(self) -> List[Dict[str, Any]]:
+        """
+        Get the voice catalogue: memory, then a fresh disk copy, then the network.
+
+        A stale disk copy is used when the network fetch fails.
+        """
+        if self._voices is not None:
+            return self._voices
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:  # concurrent clips share one fetch
+            if self._voices is not None:
+                return self._voices
+            voices = self._read_cache(fresh_only=True)
+            if voices is None:
+                try:
+                    voices = await self._fetch()
+                    self._write_cache(voices)
+                except Exception:
+                    voices = self._read_cache(fresh_only=False)
+                    if voices is None:
+                        raise
+                    logger.warning(f"Catálogo de vozes indisponível, usando cache antigo: {self.cache_path}")
+            self._voices = voices
+            return voices
+
+    async def resolve(self, lang: str, voice: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve the voice to use for a language, memoized.
+
+        Args:
+            lang: Language code (pt-br, en, ...) or edge-tts locale
+            voice: Requested ShortName or Name
+
+        Returns:
+            Voice ShortName, or None if the catalogue is empty
+        """
+        locale = to_edge_locale(lang)
+        key = (locale, voice, preferred_gender(locale))
+        if key not in self._resolved:
+            self._resolved[key] = select_voice(await self.voices(), *key)
+        return self._resolved[key]
+
+    def clear(self) -> None:
+        """Forget the in-memory catalogue and resolved voices (the disk copy is kept)."""
+        self._voices = None
+        self._resolved.clear()
+
+
+_global_voice_registry: Optional[VoiceRegistry] = None
+
+
+def get_voice_registry() -> VoiceRegistry:
+    """Get global voice registry instance."""
+    global _global_voice_registry
+    if _global_voice_registry is None:
+        _global_voice_registry = VoiceRegistry()
+    return _global_voice_registry
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Typing strategies for playwright-simple.
+
+Typing character by character only matters when a video is being recorded.
+Other runs can set the value in one round trip (``instant``) or insert it in
+a few chunks (``chunked``). Both fire the ``input``/``change`` events that
+framework listeners (Odoo onchange, React/Owl state) rely on.
+"""
+
+import asyncio
+import logging
+from enum import Enum
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Characters per insert_text call in chunked mode
+CHUNK_SIZE = 8
+# Pause between chunks in chunked mode (seconds)
+CHUNK_DELAY = 0.02
+
+# Sets the value of a field through the native setter (so framework value
+# trackers see the change) and dispatches bubbling input/change events.
+FILL_ELEMENT_SCRIPT = """
+(el, text) => {
+    if (!el) return false;
+    const tag = el.tagName;
+    if (tag === 'INPUT' || tag === 'TEXTAREA') {
+        if (el.readOnly || el.disabled) return false;
+        const proto = tag === 'INPUT' ? HTMLInputElement.prototype : HTMLTextAreaElement.prototype;
+        const setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+        setter.call(el, text);
+    } else if (el.isContentEditable) {
+        el.textContent = text;
+    } else {
+        return false;
+    }
+    el.dispatchEvent(new InputEvent('input', {bubbles: true, inputType: 'insertText', data: text}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+}
+"""
+
+# Same, for the focused element
+FILL_FOCUSED_SCRIPT = f"(text) => ({FILL_ELEMENT_SCRIPT.strip()})(document.activeElement, text)"
+
+
+class TypingMode(str, Enum):
+    """How text is entered into fields."""
+    AUTO = "auto"            # realistic when recording video, instant otherwise
+    INSTANT = "instant"      # set value + synthetic input/change events
+    CHUNKED = "chunked"      # insert_text in small chunks
+    REALISTIC = "realistic"  # char by char (for video)
+
+    @classmethod
+    def parse(cls, value: Union[str, 'TypingMode', None]) -> 'TypingMode':
+        """
+        Get TypingMode from a string (case-insensitive) or None (AUTO).
+
+        Raises:
+            ValueError: If value is not a known typing mode
+        """
+        if value is None or value == '':
+            return cls.AUTO
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(str(value).lower())
+        except ValueError:
+            valid = ', '.join(mode.value for mode in cls)
+            raise ValueError(f"Invalid typing mode: {value!r} (valid: {valid})")
+
+
+def resolve_typing_mode(
+    mode: Union[str, TypingMode, None],
+    recording_video: bool = False
+) -> TypingMode:
+    """
+    Resolve the effective typing mode for an action.
+
+    Args:
+        mode: Requested mode (AUTO/None picks one based on recording_video)
+        recording_video: Whether the run is being recorded to video
+
+    Returns:
+        INSTANT, CHUNKED or REALISTIC
+    """
+    mode = TypingMode.parse(mode)
+    if mode == TypingMode.AUTO:
+        return TypingMode.REALISTIC if recording_video else TypingMode.INSTANT
+    return mode
+
+
+async def type_fast(page, text: str, mode: TypingMode) -> bool:
+    """
+    Enter text into the focused field using a fast strategy.
+
+    The field must already be focused (and its content selected, if it
+    should be replaced).
+
+    Args:
+        page: Playwright Page instance
+        text: Text to enter
+        mode: Effective typing mode (from resolve_typing_mode)
+
+    Returns:
+        True if text was entered, False for REALISTIC (caller types char by char)
+    """
+    if mode == TypingMode.INSTANT:
+        if not await page.evaluate(FILL_FOCUSED_SCRIPT, text):
+            # Not a plain field (custom widget): let the browser insert it
+            await page.keyboard.insert_text(text)
+        return True
+    if mode == TypingMode.CHUNKED:
+        for start in range(0, len(text), CHUNK_SIZE):
+            await page.keyboard.insert_text(text[start:start + CHUNK_SIZE])
+            await asyncio.sleep(CHUNK_DELAY)
+        return True
+    return False
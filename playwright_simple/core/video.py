@@ -88,6 +88,16 @@ class VideoManager:
         if test_name:
             self._recording_contexts[test_name] = context
     
+    def unregister_context(self, test_name: str) -> None:
+        """
+        Forget a context once it is closed (so it can be garbage collected).
+        
+        Args:
+            test_name: Name of test the context was registered for
+        """
+        self._recording_contexts.pop(test_name, None)
+        self._paused_contexts.discard(test_name)
+    
     async def pause(self, test_name: Optional[str] = None) -> None:
         """
         Pause video recording.
@@ -98,6 +98,8 @@ class YAMLConfigManager:
             test.config.video.narration_engine = video_data['narration_engine']
         if 'narration_slow' in video_data:
             test.config.video.narration_slow = bool(video_data['narration_slow'])
+        if 'cursor_overlay' in video_data:
+            test.config.video.cursor_overlay = bool(video_data['cursor_overlay'])
         if 'audio_file' in video_data:
             test.config.video.audio_file = video_data['audio_file']
         if 'audio_lang' in video_data:
@@ -20,6 +20,7 @@ class VideoConfig:
     dir: str = "videos"
     record_per_test: bool = True  # One video per test vs one global video
     pause_on_failure: bool = False
+    cursor_overlay: bool = False  # Draw the cursor in post-production (ffmpeg) instead of injecting it
     speed: float = 1.0  # Video playback speed (1.0 = normal, 2.0 = 2x faster, 0.5 = 2x slower)
     
     # Subtitle settings